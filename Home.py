@@ -103,24 +103,26 @@ def interactive_plot(
         central_wavelength = central_wavelength,
         angular_frequencies = angular_frequencies,
     )   
+    # solve each circuit once, the derived quantities are cached in the results
+    reference_result = reference_HS.solve()
+    new_result = new_HS.solve()
+    reference_internal_source_result = reference_internal_source_HS.solve()
+    internal_source_result = internal_source_HS.solve()
+
     if dB_scale:
         modulus_fig = go.Figure()
-        reference_fields = reference_HS.fields
-        new_fields = new_HS.fields
-        modulus_fig.add_trace(go.Scatter(x=angular_frequencies, y=10*np.log10(np.abs(reference_fields[:, pin])**2), mode='lines', name='reference', line=dict(color="#1f77b4", dash='dot', width=2)))
-        modulus_fig.add_trace(go.Scatter(x=angular_frequencies, y=10*np.log10(np.abs(new_fields[:, pin])**2), mode='lines', name=f'HS signal', line=dict(color="#ff7f0e",  width=2)))
+        modulus_fig.add_trace(go.Scatter(x=angular_frequencies, y=reference_result.intensity_enhancement_dB(pin), mode='lines', name='reference', line=dict(color="#1f77b4", dash='dot', width=2)))
+        modulus_fig.add_trace(go.Scatter(x=angular_frequencies, y=new_result.intensity_enhancement_dB(pin), mode='lines', name=f'HS signal', line=dict(color="#ff7f0e",  width=2)))
         modulus_fig.update_layout(xaxis_title='Angular frequency [rad/s]', yaxis_title='Field enhancement [dB]', autosize=False, width=800, height=500, margin=dict(l=50, r=50, b=100, t=100, pad=4))
     else:
         modulus_fig = go.Figure()
-        reference_fields = reference_HS.fields
-        new_fields = new_HS.fields
-        modulus_fig.add_trace(go.Scatter(x=angular_frequencies, y=np.abs(reference_fields[:, pin]), mode='lines', name='reference', line=dict(color="#1f77b4", dash='dot', width=2)))
-        modulus_fig.add_trace(go.Scatter(x=angular_frequencies, y=np.abs(new_fields[:, pin]), mode='lines', name=f'HS signal', line=dict(color="#ff7f0e",  width=2)))
+        modulus_fig.add_trace(go.Scatter(x=angular_frequencies, y=reference_result.field_enhancement(pin), mode='lines', name='reference', line=dict(color="#1f77b4", dash='dot', width=2)))
+        modulus_fig.add_trace(go.Scatter(x=angular_frequencies, y=new_result.field_enhancement(pin), mode='lines', name=f'HS signal', line=dict(color="#ff7f0e",  width=2)))
         modulus_fig.update_layout(xaxis_title='Angular frequency [rad/s]', yaxis_title='Field enhancement', autosize=False, width=800, height=500, margin=dict(l=50, r=50, b=100, t=100, pad=4))                
 
     # MZ phase difference
-    ref_delta_phi_mz = (np.angle(reference_fields[:, 4]) - np.angle(reference_fields[:, 2])) - (np.angle(reference_fields[:, 5]) - np.angle(reference_fields[:, 3]))
-    new_delta_phi_mz = (np.angle(new_fields[:, 4]) - np.angle(new_fields[:, 2])) - (np.angle(new_fields[:, 5]) - np.angle(new_fields[:, 3]))
+    ref_delta_phi_mz = reference_result.mach_zender_phase_difference()
+    new_delta_phi_mz = new_result.mach_zender_phase_difference()
     mz_phase_fig = go.Figure()
     mz_phase_fig.add_trace(go.Scatter(x=angular_frequencies, y=np.cos(ref_delta_phi_mz), mode='lines', name='reference', line=dict(color="#1f77b4", dash='dot', width=2)))
     mz_phase_fig.add_trace(go.Scatter(x=angular_frequencies, y=np.cos(new_delta_phi_mz), mode='lines', name=f'HS signal', line=dict(color="#ff7f0e",  width=2)))
@@ -130,25 +132,25 @@ def interactive_plot(
     # field intensity
     if dB_scale:
         intensity_fig = go.Figure()
-        intensity_fig.add_trace(go.Scatter(x=angular_frequencies, y=10*np.log10(np.abs(reference_fields[:, pin])**2), mode='lines', name='reference', line=dict(color="#1f77b4", dash='dot', width=2)))
-        intensity_fig.add_trace(go.Scatter(x=angular_frequencies, y=10*np.log10(np.abs(new_fields[:, pin])**2), mode='lines', name=f'HS signal', line=dict(color="#ff7f0e",  width=2)))
+        intensity_fig.add_trace(go.Scatter(x=angular_frequencies, y=reference_result.intensity_enhancement_dB(pin), mode='lines', name='reference', line=dict(color="#1f77b4", dash='dot', width=2)))
+        intensity_fig.add_trace(go.Scatter(x=angular_frequencies, y=new_result.intensity_enhancement_dB(pin), mode='lines', name=f'HS signal', line=dict(color="#ff7f0e",  width=2)))
         intensity_fig.update_layout(xaxis_title='Angular frequency [rad/s]', yaxis_title='Intensity enhancement [dB]', autosize=False, width=800, height=500, margin=dict(l=50, r=50, b=100, t=100, pad=4))
     else:
         intensity_fig = go.Figure()
-        intensity_fig.add_trace(go.Scatter(x=angular_frequencies, y=np.abs(reference_fields[:, pin])**2, mode='lines', name='reference', line=dict(color="#1f77b4", dash='dot', width=2)))
-        intensity_fig.add_trace(go.Scatter(x=angular_frequencies, y=np.abs(new_fields[:, pin])**2, mode='lines', name=f'HS signal', line=dict(color="#ff7f0e",  width=2)))
+        intensity_fig.add_trace(go.Scatter(x=angular_frequencies, y=reference_result.intensity_enhancement(pin), mode='lines', name='reference', line=dict(color="#1f77b4", dash='dot', width=2)))
+        intensity_fig.add_trace(go.Scatter(x=angular_frequencies, y=new_result.intensity_enhancement(pin), mode='lines', name=f'HS signal', line=dict(color="#ff7f0e",  width=2)))
         intensity_fig.update_layout(xaxis_title='Angular frequency [rad/s]', yaxis_title='Intensity enhancement', autosize=False, width=800, height=500, margin=dict(l=50, r=50, b=100, t=100, pad=4))
 
     # field modulus with the internal source
     if dB_scale:
         internal_source_fig = go.Figure()
-        internal_source_fig.add_trace(go.Scatter(x=angular_frequencies, y=10*np.log10(np.abs(reference_internal_source_HS.fields[:, pin])**2), mode='lines', name='reference', line=dict(color="#1f77b4", dash='dot', width=2)))
-        internal_source_fig.add_trace(go.Scatter(x=angular_frequencies, y=10*np.log10(np.abs(internal_source_HS.fields[:, pin])**2), mode='lines', name=f'HS signal', line=dict(color="#ff7f0e",  width=2)))
+        internal_source_fig.add_trace(go.Scatter(x=angular_frequencies, y=reference_internal_source_result.intensity_enhancement_dB(pin), mode='lines', name='reference', line=dict(color="#1f77b4", dash='dot', width=2)))
+        internal_source_fig.add_trace(go.Scatter(x=angular_frequencies, y=internal_source_result.intensity_enhancement_dB(pin), mode='lines', name=f'HS signal', line=dict(color="#ff7f0e",  width=2)))
         internal_source_fig.update_layout(xaxis_title='Angular frequency [rad/s]', yaxis_title='Field enhancement [dB]', autosize=False, width=800, height=500, margin=dict(l=50, r=50, b=100, t=100, pad=4))
     else:
         internal_source_fig = go.Figure()
-        internal_source_fig.add_trace(go.Scatter(x=angular_frequencies, y=np.abs(reference_internal_source_HS.fields[:, pin]), mode='lines', name='reference', line=dict(color="#1f77b4", dash='dot', width=2)))
-        internal_source_fig.add_trace(go.Scatter(x=angular_frequencies, y=np.abs(internal_source_HS.fields[:, pin]), mode='lines', name=f'HS signal', line=dict(color="#ff7f0e",  width=2)))
+        internal_source_fig.add_trace(go.Scatter(x=angular_frequencies, y=reference_internal_source_result.field_enhancement(pin), mode='lines', name='reference', line=dict(color="#1f77b4", dash='dot', width=2)))
+        internal_source_fig.add_trace(go.Scatter(x=angular_frequencies, y=internal_source_result.field_enhancement(pin), mode='lines', name=f'HS signal', line=dict(color="#ff7f0e",  width=2)))
         internal_source_fig.update_layout(xaxis_title='Angular frequency [rad/s]', yaxis_title='Field enhancement', autosize=False, width=800, height=500, margin=dict(l=50, r=50, b=100, t=100, pad=4))
 
     return modulus_fig, intensity_fig, mz_phase_fig, internal_source_fig
@@ -4,11 +4,10 @@ import numpy as np
 import plotly.graph_objects as go
 
 # local imports
-from src.sympy.interferometric_coupler import SymPy_InterferometricCoupler
-from src.sympy.ring_resonator import SymPy_RingResonator
+from src.sympy.runtime import load_circuit
 
-IC = SymPy_InterferometricCoupler()
-ring = SymPy_RingResonator()
+IC = load_circuit("SymPy_InterferometricCoupler")
+ring = load_circuit("SymPy_RingResonator")
 
 st.set_page_config(layout='wide')
 st.title('Interferometric Coupler (DCDR)')
@@ -52,4 +51,8 @@ magnitude_response_plot = ring.plotly_magnitude_response_plot(pin=pin, label='Re
 
 col1, col2 = st.columns(2)
 col1.plotly_chart(pole_zero_plot, use_container_width=False)
-col2.plotly_chart(magnitude_response_plot, use_container_width=True)
\ No newline at end of file
+col2.plotly_chart(magnitude_response_plot, use_container_width=True)
+
+group_delay_plot = IC.plotly_group_delay_plot(pin=pin, label='DCDR', omega=np.linspace(0, 2*np.pi, 10000))
+group_delay_plot = ring.plotly_group_delay_plot(pin=pin, label='Reference Ring Resonator', omega=np.linspace(0, 2*np.pi, 10000), fig=group_delay_plot)
+st.plotly_chart(group_delay_plot, use_container_width=True)
\ No newline at end of file
@@ -4,11 +4,10 @@ import numpy as np
 import plotly.graph_objects as go
 
 # local imports
-from src.sympy.photonic_molecule import SymPy_PhotonicMolecule
-from src.sympy.ring_resonator import SymPy_RingResonator
+from src.sympy.runtime import load_circuit
 
-PM = SymPy_PhotonicMolecule()
-ring = SymPy_RingResonator()
+PM = load_circuit("SymPy_PhotonicMolecule")
+ring = load_circuit("SymPy_RingResonator")
 
 st.set_page_config(layout='wide')
 st.title('Photonic Molecule')
@@ -52,4 +51,8 @@ magnitude_response_plot = ring.plotly_magnitude_response_plot(pin=pin, label='Re
 
 col1, col2 = st.columns(2)
 col1.plotly_chart(pole_zero_plot, use_container_width=False)
-col2.plotly_chart(magnitude_response_plot, use_container_width=True)
\ No newline at end of file
+col2.plotly_chart(magnitude_response_plot, use_container_width=True)
+
+group_delay_plot = PM.plotly_group_delay_plot(pin=pin, label='Photonic Molecule', omega=np.linspace(-np.pi, np.pi, 10000))
+group_delay_plot = ring.plotly_group_delay_plot(pin=pin, label='Reference Ring Resonator', omega=np.linspace(-np.pi, np.pi, 10000), fig=group_delay_plot)
+st.plotly_chart(group_delay_plot, use_container_width=True)
\ No newline at end of file
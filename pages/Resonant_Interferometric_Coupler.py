@@ -4,12 +4,12 @@ import numpy as np
 import plotly.graph_objects as go
 
 # local imports
-from src.sympy.resonant_interferometric_coupler import SymPy_ResonantInterferometricCoupler
-# from src.sympy.resonant_interferometric_coupler import SymPy_ResonantInterferometricCoupler_withAdditionalMZIphase
-from src.sympy.ring_resonator import SymPy_RingResonator
+from src.sympy.runtime import load_circuit
+from src.sympy.maps import extraction_efficiency_map
 
-RIC = SymPy_ResonantInterferometricCoupler()
-ring = SymPy_RingResonator()
+RIC = load_circuit("SymPy_ResonantInterferometricCoupler")
+# RIC = load_circuit("SymPy_ResonantInterferometricCoupler_withAdditionalMZIphase")
+ring = load_circuit("SymPy_RingResonator")
 
 st.set_page_config(layout='wide')
 st.title('Resonant Interferometric Coupler (RIC)')
@@ -90,4 +90,25 @@ pole_zero_plot.update_layout(
 
 col1, col2 = st.columns(2)
 col1.plotly_chart(pole_zero_plot, use_container_width=True)
-col2.plotly_chart(magnitude_response_plot, use_container_width=True)
\ No newline at end of file
+col2.plotly_chart(magnitude_response_plot, use_container_width=True)
+
+group_delay_plot = RIC.plotly_group_delay_plot(pin=pin, label='Resonant Interferometric Coupler', omega=np.linspace(-np.pi, np.pi, 10000))
+if pin <4:
+    group_delay_plot = ring.plotly_group_delay_plot(pin=pin, label='Reference Ring Resonator', omega=np.linspace(-np.pi, np.pi, 10000), fig=group_delay_plot)
+st.plotly_chart(group_delay_plot, use_container_width=True)
+
+if st.sidebar.checkbox(r'Extraction efficiency map over $\kappa_1$, $\kappa_2$'):
+    resolution = st.sidebar.number_input('Map resolution', value=100, min_value=10, max_value=400, step=10)
+    coupling_grid = np.linspace(0.01, 0.99, resolution)
+    efficiency_map = extraction_efficiency_map(
+        RIC, {'cross_coupling_1': coupling_grid, 'cross_coupling_2': coupling_grid})
+    efficiency_map_plot = go.Figure(go.Heatmap(
+        x=coupling_grid, y=coupling_grid, z=efficiency_map.efficiencies.T * 100,
+        zmin=0, zmax=100, colorbar=dict(title='%')))
+    efficiency_map_plot.update_layout(
+        title='Main extraction efficiency',
+        xaxis_title=r'κ₁',
+        yaxis_title=r'κ₂',
+        height=700,
+    )
+    st.plotly_chart(efficiency_map_plot, use_container_width=True)
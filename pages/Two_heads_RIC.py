@@ -4,11 +4,11 @@ import numpy as np
 import plotly.graph_objects as go
 
 # local imports
-from src.sympy.resonant_interferometric_coupler import SymPy_TwoHeaded_ResonantInterferometricCoupler
-from src.sympy.ring_resonator import SymPy_RingResonator
+from src.sympy.runtime import load_circuit
+from src.sympy.maps import extraction_efficiency_map
 
-RIC = SymPy_TwoHeaded_ResonantInterferometricCoupler()
-ring = SymPy_RingResonator()
+RIC = load_circuit("SymPy_TwoHeaded_ResonantInterferometricCoupler")
+ring = load_circuit("SymPy_RingResonator")
 
 st.set_page_config(layout='wide')
 st.title('Resonant Interferometric Coupler (RIC)')
@@ -56,13 +56,13 @@ ring_params = {
 
 RIC.numeric_parameters = ric_params
 ring.numeric_parameters = ring_params
-# omega = np.linspace(0, 2 * np.pi, 10000)
-omega = np.sort(np.concatenate((
-    np.linspace(0, 2 * np.pi, 5000), 
-    np.linspace(np.pi - 0.01, np.pi + 0.01, 5000),
-    np.linspace(np.pi - np.pi/3 - 0.01, np.pi - np.pi/3 + 0.01, 5000), 
-    np.linspace(np.pi + np.pi/3 - 0.01, np.pi + np.pi/3 + 0.01, 5000)
-    )))
+# full turn and zooms around π and π ± π/3, each band evaluated with a chirp-z transform
+bands = [
+    (0, 2 * np.pi, 5000),
+    (np.pi - 0.01, np.pi + 0.01, 5000),
+    (np.pi - np.pi/3 - 0.01, np.pi - np.pi/3 + 0.01, 5000),
+    (np.pi + np.pi/3 - 0.01, np.pi + np.pi/3 + 0.01, 5000),
+]
 
 pole_zero_plot = go.Figure()
 pole_zero_plot = RIC.plotly_pole_zero_plot(pin = pin, fig = pole_zero_plot)
@@ -70,13 +70,13 @@ pole_zero_plot = RIC.plotly_pole_zero_plot(pin = pin, fig = pole_zero_plot)
 magnitude_response_plot = go.Figure()
 magnitude_response_plot = RIC.plotly_magnitude_response_plot(
     pin=pin, label='Resonant Interferometric Coupler', 
-    omega=omega, 
+    bands=bands, 
     fig=magnitude_response_plot
     )
 if pin <4:
     magnitude_response_plot = ring.plotly_magnitude_response_plot(
         pin=pin, label='Reference Ring Resonator', 
-        omega=omega, 
+        bands=bands, 
         fig=magnitude_response_plot, 
         is_reference=True)
 
@@ -105,4 +105,25 @@ st.metric(label='Main extraction efficiency', value=f'{extraction_efficiency*100
 
 col1, col2 = st.columns(2)
 col1.plotly_chart(pole_zero_plot, use_container_width=True)
-col2.plotly_chart(magnitude_response_plot, use_container_width=True)
\ No newline at end of file
+col2.plotly_chart(magnitude_response_plot, use_container_width=True)
+
+group_delay_plot = RIC.plotly_group_delay_plot(pin=pin, label='Resonant Interferometric Coupler', bands=bands)
+if pin <4:
+    group_delay_plot = ring.plotly_group_delay_plot(pin=pin, label='Reference Ring Resonator', bands=bands, fig=group_delay_plot)
+st.plotly_chart(group_delay_plot, use_container_width=True)
+
+if st.sidebar.checkbox(r'Extraction efficiency map over $\kappa_1$, $\kappa_2$'):
+    resolution = st.sidebar.number_input('Map resolution', value=100, min_value=10, max_value=400, step=10)
+    coupling_grid = np.linspace(0.01, 0.99, resolution)
+    efficiency_map = extraction_efficiency_map(
+        RIC, {'cross_coupling_1': coupling_grid, 'cross_coupling_2': coupling_grid})
+    efficiency_map_plot = go.Figure(go.Heatmap(
+        x=coupling_grid, y=coupling_grid, z=efficiency_map.efficiencies.T * 100,
+        zmin=0, zmax=100, colorbar=dict(title='%')))
+    efficiency_map_plot.update_layout(
+        title='Main extraction efficiency',
+        xaxis_title=r'κ₁',
+        yaxis_title=r'κ₂',
+        height=700,
+    )
+    st.plotly_chart(efficiency_map_plot, use_container_width=True)
@@ -1,3 +1,5 @@
 from src.base import Pin, BaseStructure, CompositeStructure, wavelength_to_frequency
+from src.results import SimulationResult
 from src.structures import Waveguide, Source, DirectionalCoupler, RingResonator, AddDropFilter, WaveguideSource
-from src.headless_snowman import HeadlessSnowman, HeadlessSnowmanInternalSource
\ No newline at end of file
+from src.headless_snowman import HeadlessSnowman, HeadlessSnowmanInternalSource
+from src.time_domain import PulsePropagator
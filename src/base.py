@@ -1,16 +1,23 @@
 from abc import ABC, abstractmethod
 from itertools import count
+from functools import lru_cache
 from collections.abc import Sequence
 import numpy as np
 from scipy.constants import c
+from scipy.sparse import csc_matrix
+from scipy.sparse.linalg import spsolve
+
+from src.results import SimulationResult
 
 
 class Pin:
     """ Class for the definition of pins, which are the input and output ports
     of photonic structures. """
+    __slots__ = ("id", "label")
     id_iterator = count()
     unused_ids = []
-    num_pins_created = 0
+    # the count is kept in a list, assigning a class attribute for each pin would slow down the creation of pins
+    _num_pins_created = [0]
 
     def __init__(self, label: str = "label"):
         """ Each pin of each structure should have a unique id. """
@@ -18,7 +25,7 @@ class Pin:
             self.id = Pin.unused_ids.pop(0)
         else:
             self.id = next(Pin.id_iterator)
-        Pin.num_pins_created += 1
+        Pin._num_pins_created[0] += 1
         self.label = label
 
     def __str__(self):
@@ -28,12 +35,18 @@ class Pin:
     def delete(self):
         """ Delete this pin and add its id to the list of unused ids. """
         Pin.unused_ids.append(self.id)
-        Pin.num_pins_created -= 1
+        Pin._num_pins_created[0] -= 1
 
     @classmethod
     def get_num_pins_created(cls):
         """ Get the number of Pin objects that have been created. """
-        return cls.num_pins_created
+        return cls._num_pins_created[0]
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def default_labels(num_pins: int) -> tuple:
+        """ Return the default labels (A0, A1, ...) of the pins of a structure, shared between structures. """
+        return tuple(f"A{i}" for i in range(num_pins))
 
     @classmethod
     def reset_id_iterator(cls):
@@ -43,6 +56,7 @@ class Pin:
 class BaseStructure(ABC):
     """ Abstract base class, the fundamental structures (Waveguide, DirectionalCoupler, Souce),
     i.e. those whose equations cannot be derived from other objects. """
+    __slots__ = ("id", "pins")
     id_iterator = count()
     num_pins = 2  # default number of pins for a structure, overload this in the subclasses
     num_equations = 1
@@ -54,9 +68,9 @@ class BaseStructure(ABC):
         """ Initialize the class. """
         self.id = next(BaseStructure.id_iterator)
 
-        # pins initialization
+        # pins initialization, pins are labelled by their position in the structure as in the diagrams (A0, A1, ...)
         if pins is None:
-            self.pins = [Pin(self) for _ in range(self.num_pins)]
+            self.pins = [Pin(label) for label in Pin.default_labels(self.num_pins)]
         elif len(pins) == self.num_pins:
             self.pins = pins
         else:
@@ -83,7 +97,19 @@ class CompositeStructure(BaseStructure):
     """ This class inherits from PhotonicBaseStructure, it serves to model complex structures, composed
     of many fundanmental structures (DirectionalCoupler, Waveguide, Source)
     """
+    __slots__ = (
+        "effective_refractive_index",
+        "group_refractive_index",
+        "GVD",
+        "loss_dB",
+        "central_wavelength",
+        "angular_frequencies",
+        "_structures",
+        "_pin_table",
+    )
     num_pins = 2  # default number of pins for a structure, overload this in the subclasses
+    # above this number of pins the fields are solved with a sparse factorization at each frequency
+    sparse_solve_threshold = 1000
 
     def __init__(
             self,
@@ -103,13 +129,34 @@ class CompositeStructure(BaseStructure):
         self.GVD = GVD
         self.loss_dB = loss_dB
         self.central_wavelength = central_wavelength
-        # frequencies initialization
+        # frequencies initialization, the array is shared with the substructures instead of being copied
         try:
-            self.angular_frequencies = np.array(angular_frequencies)  # or np.zeros(1)
+            self.angular_frequencies = frequency_array(angular_frequencies)
         except TypeError:
             raise TypeError(f"In {self} angular_frequencies must be a sequence of floats.")
         self.structures = structures or []
 
+    @property
+    def structures(self) -> list[BaseStructure]:
+        """ Return the substructures. The pin table is built again when they are set, not when the list is modified
+        in place. """
+        return self._structures
+
+    @structures.setter
+    def structures(self, structures: Sequence[BaseStructure]):
+        self._structures = structures
+        self._pin_table = None
+
+    def set_angular_frequencies(self, angular_frequencies: Sequence[float]):
+        """ Set the angular frequencies of the structure and of all its substructures, sharing the same array. """
+        self.angular_frequencies = frequency_array(angular_frequencies)
+        self._pin_table = None
+        for structure in self.structures:
+            if isinstance(structure, CompositeStructure):
+                structure.set_angular_frequencies(self.angular_frequencies)
+            elif hasattr(structure, "angular_frequencies"):
+                structure.angular_frequencies = self.angular_frequencies
+
     @property
     def wavevector(self):
         """ Return the wavevector for the structure, expanded to the second order in the angular frequency."""
@@ -137,42 +184,91 @@ class CompositeStructure(BaseStructure):
 
     # TODO: these methods should be moved to the PhotonicCircuit class, where a Source object should be added to the
     #  structure sequence
+    @property
+    def pin_table(self):
+        """ Return the non-zero entries of the coefficient matrix as a table of arrays: the equation (row) indices,
+        the pin ids (column indices) and the coefficients, with shape (num_frequencies, num_entries). The table is
+        flattened from the field_equations of the substructures on the first access and stored, until the
+        substructures or the frequencies are set again. """
+        if self._pin_table is None:
+            rows, columns, entries = [], [], []
+            for i, equation in enumerate(self.field_equations):
+                for pin, coefficient in equation.items():
+                    rows.append(i)
+                    columns.append(pin.id)
+                    entries.append(coefficient)
+            # the scalar and (num_frequencies,) coefficients are broadcast by the assignments
+            coefficients = np.empty((len(entries), len(self.angular_frequencies)), dtype=np.complex128)
+            for i, coefficient in enumerate(entries):
+                coefficients[i] = coefficient
+            self._pin_table = (np.array(rows, dtype=np.intp), np.array(columns, dtype=np.intp),
+                               np.ascontiguousarray(coefficients.T))
+        return self._pin_table
+
     @property
     def coefficient_matrix(self):
         """ Return the coefficient matrix of the system for the structure. To parallelize the computation at 
         different frequencies, the coefficient matrix is an array of dimensions: (num_frequencies, num_pins, num_pins). """
         num_frequencies = len(self.angular_frequencies)
-        coefficient_matrix = 1j * np.zeros((num_frequencies, self.num_pins, self.num_pins))
-        for i, equation in enumerate(self.field_equations):
-            for pin, coefficients in equation.items():
-                coefficient_matrix[:, i, pin.id] += coefficients
+        coefficient_matrix = np.zeros((num_frequencies, self.num_pins, self.num_pins), dtype=np.complex128)
+        rows, columns, coefficients = self.pin_table
+        np.add.at(coefficient_matrix, (slice(None), rows, columns), coefficients)
         return coefficient_matrix
 
     @property
     def fields(self):
         ordinate_vector = np.broadcast_to(np.array(self.ordinate_vector),
                                           (len(self.angular_frequencies), len(self.ordinate_vector)))
-        fields = np.linalg.solve(self.coefficient_matrix, ordinate_vector)
-        # fields = np.linalg.inv(self.coefficient_matrix) @ self.ordinate_vector
+        if self.num_pins > self.sparse_solve_threshold:
+            # the dense coefficient matrix would not fit in memory, the pin table is solved at each frequency
+            rows, columns, coefficients = self.pin_table
+            fields = np.empty(ordinate_vector.shape, dtype=np.complex128)
+            for i, frequency_coefficients in enumerate(coefficients):
+                matrix = csc_matrix((frequency_coefficients, (rows, columns)), shape=(self.num_pins, self.num_pins))
+                fields[i] = spsolve(matrix, ordinate_vector[i])
+            return fields
+        # the ordinate vector is solved as a stack of column vectors, one for each frequency
+        fields = np.linalg.solve(self.coefficient_matrix, ordinate_vector[..., np.newaxis])[..., 0]
         return fields
 
-    @property
+    def solve(self) -> SimulationResult:
+        """ Solve the circuit once and return a SimulationResult, which holds the fields at all the pins and
+        computes the derived quantities (modulus, intensity, phase, ...) lazily. """
+        return SimulationResult(self.angular_frequencies, self.fields, self.pins)
+
+    def solve_at(self, angular_frequencies: Sequence[float]) -> SimulationResult:
+        """ Solve the circuit at the given angular frequencies, restoring the frequency grid of the structure
+        afterwards. """
+        original_angular_frequencies = self.angular_frequencies
+        try:
+            self.set_angular_frequencies(angular_frequencies)
+            return self.solve()
+        finally:
+            self.set_angular_frequencies(original_angular_frequencies)
+
     def field_enhancement(self, pin_id=1):
-        return np.abs(self.fields[:, pin_id])
+        return self.solve().field_enhancement(pin_id)
 
-    @property
     def intensity_enhancement(self, pin_id=1):
-        return np.power(np.abs(self.fields[:, pin_id]), 2)
+        return self.solve().intensity_enhancement(pin_id)
 
-    @property
     def transmission(self, pin_id=2):
-        return np.power(np.abs(self.fields[:, pin_id]), 2)
+        return self.solve().transmission(pin_id)
 
     def __str__(self):
         """ Return a string representation of the Pin object. """
         return f"Structure {self.id}"
 
 
+def frequency_array(angular_frequencies) -> np.ndarray:
+    """ Return the angular frequencies as a 1D array of floats, the array itself if it already is one, so that it is
+    shared instead of copied. """
+    if type(angular_frequencies) is np.ndarray and angular_frequencies.ndim == 1 \
+            and angular_frequencies.dtype == np.float64:
+        return angular_frequencies
+    return np.atleast_1d(np.asarray(angular_frequencies, dtype=float))
+
+
 def wavelength_to_frequency(wavelength):
     return 2 * np.pi / wavelength * c
 
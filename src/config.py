@@ -3,3 +3,4 @@ import os
 SRC_PATH = os.path.dirname(os.path.abspath(__file__))
 SYMPY_PATH = os.path.join(SRC_PATH, "sympy")
 SYMPY_DATA_PATH = os.path.join(SYMPY_PATH, "solutions_data")
+SYMPY_GENERATED_PATH = os.path.join(SYMPY_PATH, "generated")
@@ -0,0 +1,145 @@
+from collections.abc import Callable, Sequence
+import warnings
+import numpy as np
+
+from src.base import CompositeStructure
+
+
+class ResonanceTrack:
+    """ Position, linewidth and peak intensity of a resonance followed along a parameter sweep. """
+
+    def __init__(
+            self,
+            parameter_values: Sequence[float],
+            centers: Sequence[float],
+            linewidths: Sequence[float],
+            peaks: Sequence[float],
+            num_solved_frequencies: int,
+            failed: Sequence[bool] = None,
+    ):
+        """ Initialize the class. """
+        self.parameter_values = np.asarray(parameter_values)
+        self.centers = np.asarray(centers)
+        self.linewidths = np.asarray(linewidths)
+        self.peaks = np.asarray(peaks)
+        self.num_solved_frequencies = num_solved_frequencies
+        # steps where the resonance was not resolved within the retries, their values are nan
+        self.failed = np.zeros(len(self.centers), dtype=bool) if failed is None else np.asarray(failed, dtype=bool)
+
+    def __str__(self):
+        """ Return a string representation of the object. """
+        return f"ResonanceTrack ({len(self.parameter_values)} steps)"
+
+    @property
+    def quality_factors(self) -> np.ndarray:
+        """ Return the loaded quality factors of the resonance, center / FWHM. """
+        return self.centers / self.linewidths
+
+
+def _peak_and_linewidth(angular_frequencies: np.ndarray, intensity: np.ndarray) -> tuple[int, float, float, float]:
+    """ Return the index of the maximum of the intensity, the interpolated center and height of the peak, and its
+    FWHM (nan if one of the half maximum crossings is outside of the window). """
+    peak_index = int(np.argmax(intensity))
+    if 0 < peak_index < len(intensity) - 1:
+        # parabolic interpolation of the peak on three points
+        left, middle, right = intensity[peak_index - 1:peak_index + 2]
+        curvature = left - 2 * middle + right
+        offset = 0.5 * (left - right) / curvature if curvature != 0 else 0
+        step = angular_frequencies[1] - angular_frequencies[0]
+        center = angular_frequencies[peak_index] + offset * step
+        peak = middle - 0.25 * (left - right) * offset
+    else:
+        center, peak = angular_frequencies[peak_index], intensity[peak_index]
+
+    above = intensity > peak / 2
+    left_crossings = np.flatnonzero(~above[:peak_index])
+    right_crossings = np.flatnonzero(~above[peak_index:])
+    if len(left_crossings) == 0 or len(right_crossings) == 0:
+        return peak_index, center, peak, np.nan
+    i = left_crossings[-1]
+    j = peak_index + right_crossings[0]
+    left_x = np.interp(peak / 2, intensity[i:i + 2], angular_frequencies[i:i + 2])
+    right_x = np.interp(peak / 2, intensity[j - 1:j + 1][::-1], angular_frequencies[j - 1:j + 1][::-1])
+    return peak_index, center, peak, right_x - left_x
+
+
+def track_resonance(
+        structure_factory: Callable[[float], CompositeStructure],
+        parameter_values: Sequence[float],
+        initial_frequency: float,
+        initial_window: float,
+        pin=1,
+        num_points: int = 101,
+        window_linewidths: float = 4,
+        max_retries: int = 8,
+) -> ResonanceTrack:
+    """
+    Follows a resonance of the intensity at a pin while a parameter of the structure is swept. At each step the
+    circuit is solved only on a narrow window of num_points frequencies around the position predicted by linear
+    extrapolation of the previous steps, with a width of window_linewidths times the last resolved FWHM. If the peak or its
+    half maximum crossings fall outside of the window, the window is moved or widened and the step is solved again.
+    A step still unresolved after max_retries is recorded as nan, flagged in ResonanceTrack.failed, with a warning,
+    and the next steps are predicted from the resolved ones.
+
+    Args:
+        structure_factory (Callable[[float], CompositeStructure]): Builds the structure for a parameter value, e.g.
+            lambda radius: HeadlessSnowman(main_radius, radius, ...).
+        parameter_values (Sequence[float]): The values of the swept parameter.
+        initial_frequency (float): The approximate angular frequency of the resonance at the first parameter value.
+        initial_window (float): The width of the first window, it should contain the resonance and its FWHM.
+        pin (int or str): The pin at which the intensity is computed.
+        num_points (int): The number of frequencies of each window.
+        window_linewidths (float): The width of the window in units of the FWHM.
+        max_retries (int): The maximum number of times a step is solved again with a moved or widened window.
+
+    Returns:
+        ResonanceTrack: The centers, FWHMs and peak intensities of the resonance at each parameter value.
+    """
+    centers, linewidths, peaks, failed = [], [], [], []
+    # the window of each step starts from the nominal width, set by the last resolved step, so that the widening
+    # of a failed step does not carry over to the next ones
+    center, nominal_window = initial_frequency, initial_window
+    num_solved_frequencies = 0
+    # parameter values and centers of the resolved steps, for the predictor
+    resolved_parameters, resolved_centers = [], []
+    for parameter_value in parameter_values:
+        structure = structure_factory(parameter_value)
+        # secant predictor of the position of the resonance, scaled by the parameter steps
+        if len(resolved_centers) >= 2 and resolved_parameters[-1] != resolved_parameters[-2]:
+            slope = (resolved_centers[-1] - resolved_centers[-2]) / (resolved_parameters[-1] - resolved_parameters[-2])
+            center = resolved_centers[-1] + slope * (parameter_value - resolved_parameters[-1])
+        elif resolved_centers:
+            center = resolved_centers[-1]
+        else:
+            center = initial_frequency
+        window = nominal_window
+        for _ in range(max_retries + 1):
+            angular_frequencies = np.linspace(center - window / 2, center + window / 2, num_points)
+            intensity = structure.solve_at(angular_frequencies).intensity_enhancement(pin)
+            num_solved_frequencies += num_points
+            peak_index, center, peak, linewidth = _peak_and_linewidth(angular_frequencies, intensity)
+            if peak_index in (0, num_points - 1):
+                # the peak is at the edge of the window: move the window towards it
+                continue
+            if np.isnan(linewidth):
+                window *= 2
+                continue
+            # the window is resized to the linewidth, keeping at least a few points across the peak
+            nominal_window = window_linewidths * linewidth
+            break
+        else:
+            warnings.warn(f"The resonance was not resolved at the parameter value {parameter_value:g} after "
+                          f"{max_retries} retries, the step is recorded as nan.")
+            centers.append(np.nan)
+            linewidths.append(np.nan)
+            peaks.append(np.nan)
+            failed.append(True)
+            continue
+        centers.append(center)
+        linewidths.append(linewidth)
+        peaks.append(peak)
+        failed.append(False)
+        resolved_parameters.append(parameter_value)
+        resolved_centers.append(center)
+
+    return ResonanceTrack(parameter_values, centers, linewidths, peaks, num_solved_frequencies, failed)
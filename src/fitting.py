@@ -0,0 +1,313 @@
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from scipy.constants import c
+
+from src.base import BaseStructure, CompositeStructure
+from src.structures import Waveguide, Waveguide_withPhaseDelay, DirectionalCoupler
+
+GLOBAL_PARAMETERS = ("effective_refractive_index", "group_refractive_index", "loss_dB")
+
+
+def _leaves(structure: BaseStructure):
+    """ Yield the fundamental structures of a structure, in the order of its field equations. """
+    if isinstance(structure, CompositeStructure):
+        for substructure in structure.structures:
+            yield from _leaves(substructure)
+    else:
+        yield structure
+
+
+class CompiledCircuit:
+    """ Circuit compiled from a structure for fast repeated evaluation: the coefficient matrix is assembled from
+    the parameters directly, vectorized over many parameter sets, without rebuilding the structure objects, and the
+    Jacobian of the fields with respect to the parameters is computed analytically by implicit differentiation,
+    d fields / d theta = -A^-1 (dA / d theta) fields.
+
+    The parameters are the effective and group index and the loss of all the waveguides, and the cross coupling
+    coefficient of each directional coupler, named cross_coupling_coefficient_<i> in the order of the field
+    equations (e.g. 0 for the input and 1 for the auxiliary coupler of an AddDropFilter). """
+
+    def __init__(self, structure: CompositeStructure):
+        """ Initialize the class, compiling the structure. """
+        self.structure = structure
+        self.angular_frequencies = structure.angular_frequencies
+        self.num_pins = structure.num_pins
+        self.ordinate_vector = np.array(structure.ordinate_vector, dtype=np.complex128)
+
+        # each entry of the coefficient matrix is either a constant, a waveguide propagation or a coupler entry
+        rows, columns, constants = [], [], []
+        self._waveguide_entries, self._waveguides = [], []
+        self._coupler_entries, self._couplers = [], []
+        self.parameters = {name: getattr(structure, name) for name in GLOBAL_PARAMETERS}
+        equation_index = 0
+        for leaf in _leaves(structure):
+            equations = leaf.field_equations
+            if isinstance(leaf, DirectionalCoupler):
+                coupler_index = len(self._couplers)
+                self._couplers.append((np.angle(leaf.kappa), np.angle(leaf.sigma)))
+                self.parameters[f"cross_coupling_coefficient_{coupler_index}"] = np.abs(leaf.kappa)
+                # entries of the coupler equations: sigma, kappa, -conj(kappa), conj(sigma)
+                roles = [("sigma", "kappa", None), ("-conj(kappa)", "conj(sigma)", None)]
+            for i, equation in enumerate(equations):
+                for j, (pin, coefficient) in enumerate(equation.items()):
+                    rows.append(equation_index + i)
+                    columns.append(pin.id)
+                    if isinstance(leaf, Waveguide) and j == 0:
+                        self._waveguide_entries.append(len(constants))
+                        phase_delay = leaf.phase_delay if isinstance(leaf, Waveguide_withPhaseDelay) else 0
+                        self._waveguides.append((leaf.length, leaf.central_frequency, leaf.GVD, phase_delay))
+                        constants.append(0)
+                    elif isinstance(leaf, DirectionalCoupler) and roles[i][j] is not None:
+                        self._coupler_entries.append((len(constants), coupler_index, roles[i][j]))
+                        constants.append(0)
+                    else:
+                        constants.append(complex(np.broadcast_to(coefficient, (1,))[0]))
+            equation_index += len(equations)
+        self.rows = np.array(rows, dtype=np.intp)
+        self.columns = np.array(columns, dtype=np.intp)
+        self.constants = np.array(constants, dtype=np.complex128)
+        # one-hot scatter matrix from the entries to the flattened coefficient matrix, summing repeated entries
+        self._scatter = np.zeros((len(constants), self.num_pins * self.num_pins))
+        self._scatter[np.arange(len(constants)), self.rows * self.num_pins + self.columns] = 1
+
+    def __str__(self):
+        """ Return a string representation of the object. """
+        return f"CompiledCircuit of {self.structure}"
+
+    @property
+    def parameter_names(self) -> list[str]:
+        """ Return the names of the parameters of the circuit. """
+        return list(self.parameters)
+
+    def _entries(self, parameters: dict, derivatives: Sequence[str]) -> tuple[np.ndarray, dict]:
+        """ Return the entries of the coefficient matrix, with dimensions (num_sets, num_frequencies, num_entries),
+        and their derivatives with respect to the given parameters. The parameters are arrays of shape (num_sets,). """
+        num_sets = len(next(iter(parameters.values())))
+        num_frequencies = len(self.angular_frequencies)
+        entries = np.broadcast_to(self.constants, (num_sets, num_frequencies, len(self.constants))).copy()
+        entry_derivatives = {name: np.zeros_like(entries) for name in derivatives}
+
+        n_eff = parameters["effective_refractive_index"][:, np.newaxis]
+        n_g = parameters["group_refractive_index"][:, np.newaxis]
+        loss_dB = parameters["loss_dB"][:, np.newaxis]
+        for entry, (length, central_frequency, GVD, phase_delay) in zip(self._waveguide_entries, self._waveguides):
+            detuning = self.angular_frequencies - central_frequency
+            wavevector = n_eff * central_frequency / c + n_g * detuning / c + 1 / 2 * GVD * np.power(detuning, 2)
+            value = -np.exp(-loss_dB * np.log(10) / 20 * length) * np.exp(1j * (wavevector * length + phase_delay))
+            entries[..., entry] = value
+            partials = {
+                "effective_refractive_index": 1j * length * central_frequency / c,
+                "group_refractive_index": 1j * length * detuning / c,
+                "loss_dB": -np.log(10) / 20 * length,
+            }
+            for name in derivatives:
+                if name in partials:
+                    entry_derivatives[name][..., entry] = value * partials[name]
+
+        for entry, coupler_index, role in self._coupler_entries:
+            name = f"cross_coupling_coefficient_{coupler_index}"
+            cross_coupling_phase, self_coupling_phase = self._couplers[coupler_index]
+            k = parameters[name][:, np.newaxis]
+            self_coupling = np.sqrt(1 - np.power(k, 2))
+            value, derivative = {
+                "sigma": (self_coupling * np.exp(1j * self_coupling_phase),
+                          -k / self_coupling * np.exp(1j * self_coupling_phase)),
+                "kappa": (k * np.exp(1j * cross_coupling_phase), np.exp(1j * cross_coupling_phase) + 0 * k),
+                "-conj(kappa)": (-k * np.exp(-1j * cross_coupling_phase), -np.exp(-1j * cross_coupling_phase) + 0 * k),
+                "conj(sigma)": (self_coupling * np.exp(-1j * self_coupling_phase),
+                                -k / self_coupling * np.exp(-1j * self_coupling_phase)),
+            }[role]
+            entries[..., entry] = value
+            if name in entry_derivatives:
+                entry_derivatives[name][..., entry] = derivative
+        return entries, entry_derivatives
+
+    def _assemble(self, entries: np.ndarray) -> np.ndarray:
+        """ Assemble the coefficient matrices, with dimensions (num_sets, num_frequencies, num_pins, num_pins). """
+        return (entries @ self._scatter).reshape(entries.shape[:2] + (self.num_pins, self.num_pins))
+
+    def fields(self, parameters: dict = None, derivatives: Sequence[str] = ()) -> tuple[np.ndarray, dict]:
+        """
+        Returns the fields for many parameter sets at once, and their derivatives.
+
+        Args:
+            parameters (dict): Arrays of shape (num_sets,) for some of the parameters, the others are taken from the
+                compiled structure.
+            derivatives (Sequence[str]): The parameters with respect to which the fields are differentiated.
+
+        Returns:
+            np.ndarray: The fields, with dimensions (num_sets, num_frequencies, num_pins).
+            dict: The derivatives of the fields, with the same dimensions, for each parameter in derivatives.
+        """
+        parameters = parameters or {}
+        num_sets = len(next(iter(parameters.values()))) if parameters else 1
+        parameters = {name: np.broadcast_to(np.asarray(parameters.get(name, default), dtype=float), (num_sets,))
+                      for name, default in self.parameters.items()}
+        entries, entry_derivatives = self._entries(parameters, derivatives)
+        matrix = self._assemble(entries)
+        fields = np.linalg.solve(matrix, np.broadcast_to(self.ordinate_vector, matrix.shape[:-1])[..., np.newaxis])
+        if not derivatives:
+            return fields[..., 0], {}
+        # implicit differentiation, all the parameters are solved as right hand sides of the same system
+        right_hand_sides = np.concatenate([-self._assemble(entry_derivatives[name]) @ fields for name in derivatives],
+                                          axis=-1)
+        field_derivatives = np.linalg.solve(matrix, right_hand_sides)
+        fields = fields[..., 0]
+        return fields, {name: field_derivatives[..., i] for i, name in enumerate(derivatives)}
+
+
+class FitResult:
+    """ Parameter estimates of a batch of traces, with dimensions (num_traces, num_parameters), their standard
+    errors from the covariance of the least squares problem, and the residual sum of squares of each trace. A trace
+    has converged when the cost, the step or the gradient met the tolerance, and stalled when the damping blew up
+    before. The parameters that the trace cannot identify, because the Jacobian is rank deficient along them (e.g.
+    two parameters only appearing as a product), are flagged in non_identifiable, with infinite standard errors. """
+
+    def __init__(
+            self,
+            parameter_names: Sequence[str],
+            estimates: np.ndarray,
+            standard_errors: np.ndarray,
+            residual_sum_of_squares: np.ndarray,
+            converged: np.ndarray,
+            stalled: np.ndarray = None,
+            non_identifiable: np.ndarray = None,
+    ):
+        """ Initialize the class. """
+        self.parameter_names = list(parameter_names)
+        self.estimates = estimates
+        self.standard_errors = standard_errors
+        self.residual_sum_of_squares = residual_sum_of_squares
+        self.converged = converged
+        self.stalled = np.zeros_like(converged) if stalled is None else stalled
+        self.non_identifiable = np.zeros(np.shape(estimates), dtype=bool) if non_identifiable is None \
+            else non_identifiable
+
+    def __str__(self):
+        """ Return a string representation of the object. """
+        return f"FitResult ({len(self.estimates)} traces, {len(self.parameter_names)} parameters)"
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """ Return the estimates of a parameter for all the traces. """
+        return self.estimates[:, self.parameter_names.index(name)]
+
+
+def fit_transmission(
+        circuit: CompiledCircuit,
+        traces: np.ndarray,
+        free_parameters: Sequence[str],
+        pin=2,
+        initial_parameters: dict = None,
+        max_iterations: int = 50,
+        tolerance: float = 1e-8,
+        chunk_size: int = 16,
+        max_workers: int = None,
+        rank_tolerance: float = 1e-10,
+) -> FitResult:
+    """
+    Fits the intensity |E|^2 at a pin of a compiled circuit to measured traces sampled at the angular frequencies of
+    the circuit, with a Levenberg-Marquardt iteration batched over the traces and analytic Jacobians. The traces are
+    processed in chunks of chunk_size, on a pool of max_workers threads.
+
+    The phase-like parameters (effective and group index) make the problem multimodal: their initial values should
+    place the model resonances within a linewidth of the measured ones.
+
+    Args:
+        circuit (CompiledCircuit): The circuit, its parameters are the defaults of the fixed parameters.
+        traces (np.ndarray): The measured intensities, with shape (num_traces, num_frequencies).
+        free_parameters (Sequence[str]): The names of the fitted parameters.
+        pin (int): The pin of the measured intensity, by default the through port of rings and add-drop filters.
+        initial_parameters (dict): Initial values, scalars or arrays of shape (num_traces,), of the free parameters.
+        max_iterations (int): The maximum number of iterations.
+        tolerance (float): The relative decrease of the residual sum of squares (or the square of the relative step,
+            or of the cosine between the residuals and the columns of the Jacobian) below which a trace has converged.
+        chunk_size (int): The number of traces fitted together.
+        max_workers (int): The number of threads, None for the default of ThreadPoolExecutor.
+        rank_tolerance (float): The singular value of the normal matrix, with its columns scaled to a unit diagonal,
+            relative to the largest one, below which a direction of the parameters is not identifiable.
+
+    Returns:
+        FitResult: The estimates, their standard errors, the residuals, the convergence of each trace and the
+            parameters it cannot identify.
+    """
+    traces = np.atleast_2d(traces)
+    num_traces, num_frequencies = traces.shape
+    free_parameters = list(free_parameters)
+    initial_parameters = initial_parameters or {}
+    initial = np.stack([
+        np.broadcast_to(np.asarray(initial_parameters.get(name, circuit.parameters[name]), dtype=float), (num_traces,))
+        for name in free_parameters
+    ], axis=-1)
+
+    def model(values):
+        parameters = {name: values[:, i] for i, name in enumerate(free_parameters)}
+        fields, field_derivatives = circuit.fields(parameters, free_parameters)
+        intensity = np.square(np.abs(fields[..., pin]))
+        jacobian = np.stack([
+            2 * np.real(np.conj(fields[..., pin]) * field_derivatives[name][..., pin]) for name in free_parameters
+        ], axis=-1)
+        return intensity, jacobian
+
+    def fit_chunk(chunk):
+        data = traces[chunk]
+        values = initial[chunk].copy()
+        damping = np.full(len(data), 1e-3)
+        converged = np.zeros(len(data), dtype=bool)
+        # traces whose damping blew up without meeting the tolerance, no longer updated
+        stalled = np.zeros(len(data), dtype=bool)
+        intensity, jacobian = model(values)
+        residuals = intensity - data
+        cost = np.sum(np.square(residuals), axis=-1)
+        for _ in range(max_iterations):
+            normal_matrix = np.einsum("tfi,tfj->tij", jacobian, jacobian)
+            gradient = np.einsum("tfi,tf->ti", jacobian, residuals)
+            scaling = np.einsum("tii->ti", normal_matrix)
+            # a trace at an optimum cannot decrease its cost, its residuals are orthogonal to the Jacobian
+            with np.errstate(divide="ignore", invalid="ignore"):
+                cosines = np.where(scaling > 0, np.abs(gradient) / np.sqrt(scaling * cost[:, np.newaxis]), 0)
+            converged |= ~stalled & ((cost == 0) | np.all(cosines <= np.sqrt(tolerance), axis=-1))
+            if np.all(converged | stalled):
+                break
+            damped = normal_matrix + damping[:, np.newaxis, np.newaxis] * np.apply_along_axis(np.diag, -1, scaling)
+            step = -np.linalg.solve(damped, gradient[..., np.newaxis])[..., 0]
+            step[converged | stalled] = 0
+            new_values = values + step
+            new_intensity, new_jacobian = model(new_values)
+            new_residuals = new_intensity - data
+            new_cost = np.sum(np.square(new_residuals), axis=-1)
+            improved = (new_cost < cost) & ~converged & ~stalled
+            small_step = np.all(np.abs(step) <= np.sqrt(tolerance) * np.abs(values), axis=-1)
+            converged |= improved & (((cost - new_cost) <= tolerance * cost) | small_step)
+            values[improved] = new_values[improved]
+            intensity[improved], jacobian[improved] = new_intensity[improved], new_jacobian[improved]
+            residuals[improved], cost[improved] = new_residuals[improved], new_cost[improved]
+            damping = np.where(improved, damping / 10, damping * 10)
+            stalled |= (damping > 1e12) & ~converged
+            if np.all(converged | stalled):
+                break
+
+        # covariance of the estimates from the Jacobian at the optimum, the normal matrix being scaled to a unit
+        # diagonal so that the rank test does not depend on the units of the parameters
+        normal_matrix = np.einsum("tfi,tfj->tij", jacobian, jacobian)
+        scaling = np.sqrt(np.einsum("tii->ti", normal_matrix))
+        scaling = np.where(scaling > 0, scaling, 1)
+        scaled_matrix = normal_matrix / (scaling[:, :, np.newaxis] * scaling[:, np.newaxis, :])
+        singular_values, vectors = np.linalg.eigh(scaled_matrix)
+        null = singular_values <= rank_tolerance * singular_values[:, -1:]
+        # a parameter is not identifiable if it has a component along a direction of (numerically) zero singular value
+        loadings = np.einsum("tij,tj->ti", np.square(vectors), null)
+        non_identifiable = loadings > np.sqrt(rank_tolerance)
+        inverse_values = np.where(null, 0, 1 / np.where(null, 1, singular_values))
+        covariance = np.einsum("tij,tj,tkj->tik", vectors, inverse_values, vectors)
+        variance = cost / max(num_frequencies - len(free_parameters), 1)
+        standard_errors = np.sqrt(np.abs(np.einsum("tii->ti", covariance)) * variance[:, np.newaxis]) / scaling
+        standard_errors[non_identifiable] = np.inf
+        return values, standard_errors, cost, converged, stalled, non_identifiable
+
+    chunks = [np.arange(start, min(start + chunk_size, num_traces)) for start in range(0, num_traces, chunk_size)]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(fit_chunk, chunks))
+    estimates, standard_errors, cost, converged, stalled, non_identifiable = (
+        np.concatenate(arrays) for arrays in zip(*results))
+    return FitResult(free_parameters, estimates, standard_errors, cost, converged, stalled, non_identifiable)
@@ -6,6 +6,15 @@ from scipy.constants import c
 
 
 class HeadlessSnowman(CompositeStructure):
+    __slots__ = (
+        "main_radius",
+        "auxiliary_radius",
+        "mach_zender_length",
+        "MZI_phase_delay",
+        "input_cross_coupling_coefficient",
+        "through_cross_coupling_coefficient",
+        "ring_cross_coupling_coefficient",
+    )
     num_pins = 12
     num_equations = 12
 
@@ -87,6 +96,15 @@ class HeadlessSnowman(CompositeStructure):
 
 
 class HeadlessSnowmanInternalSource(CompositeStructure):
+    __slots__ = (
+        "main_radius",
+        "auxiliary_radius",
+        "mach_zender_length",
+        "MZI_phase_delay",
+        "input_cross_coupling_coefficient",
+        "through_cross_coupling_coefficient",
+        "ring_cross_coupling_coefficient",
+    )
     num_pins = 12
     num_equations = 12
 
@@ -0,0 +1,159 @@
+from collections.abc import Sequence
+import numpy as np
+
+
+class SpectralMetrics:
+    """ Per-resonance metrics of a stack of spectra. Each array has dimensions (num_designs, max_num_resonances),
+    the resonances of each design are sorted by frequency and the missing entries are nan. """
+
+    def __init__(
+            self,
+            centers: np.ndarray,
+            linewidths: np.ndarray,
+            peaks: np.ndarray,
+            extinction_ratios: np.ndarray,
+            num_resonances: np.ndarray,
+    ):
+        """ Initialize the class. """
+        self.centers = centers
+        self.linewidths = linewidths
+        self.peaks = peaks
+        self.extinction_ratios = extinction_ratios
+        self.num_resonances = num_resonances
+
+    def __str__(self):
+        """ Return a string representation of the object. """
+        return f"SpectralMetrics ({len(self.num_resonances)} designs, up to {self.centers.shape[1]} resonances)"
+
+    @property
+    def quality_factors(self) -> np.ndarray:
+        """ Return the loaded quality factors, center / FWHM. """
+        return self.centers / self.linewidths
+
+    @property
+    def free_spectral_ranges(self) -> np.ndarray:
+        """ Return the distance of each resonance from the next one (nan for the last resonance of each design). """
+        free_spectral_ranges = np.full_like(self.centers, np.nan)
+        free_spectral_ranges[:, :-1] = np.diff(self.centers, axis=1)
+        return free_spectral_ranges
+
+    @property
+    def extinction_ratios_dB(self) -> np.ndarray:
+        """ Return the extinction ratios in dB. """
+        return 10 * np.log10(self.extinction_ratios)
+
+
+def spectral_metrics(
+        frequencies: Sequence[float],
+        spectra: np.ndarray,
+        dips: bool = False,
+        relative_height: float = 0.1,
+) -> SpectralMetrics:
+    """
+    Computes the center, FWHM, peak value and extinction ratio of all the resonances of a stack of spectra at
+    once. Peaks are detected as local maxima, centers and heights are refined by parabolic interpolation and the
+    half maximum crossings are linearly interpolated. All the steps are vectorized over designs and resonances.
+
+    The spectra can be the fields of the numeric engine (e.g. SimulationResult.fields[:, pin] of several designs,
+    stacked) or the magnitude response of the SymPy engine: complex spectra are converted to intensities |E|^2,
+    real spectra are used as they are.
+
+    Args:
+        frequencies (Sequence[float]): The uniformly spaced frequency axis, with shape (num_frequencies,).
+        spectra (np.ndarray): The spectra, with shape (num_designs, num_frequencies) or (num_frequencies,).
+        dips (bool): Whether the resonances are dips (e.g. through port transmission) instead of peaks. The FWHM of a
+            dip is measured at half of its depth below the maximum of the spectrum.
+        relative_height (float): Resonances whose height (or depth) is below this fraction of the highest one of
+            the same design are discarded.
+
+    Returns:
+        SpectralMetrics: The metrics of the resonances of each design.
+    """
+    frequencies = np.asarray(frequencies, dtype=float)
+    spectra = np.atleast_2d(spectra)
+    if np.iscomplexobj(spectra):
+        spectra = np.square(np.abs(spectra))
+    num_designs, num_frequencies = spectra.shape
+    # the resonances are always analyzed as peaks of the signal
+    signal = np.max(spectra, axis=1, keepdims=True) - spectra if dips else spectra
+
+    # local maxima above the relative height threshold
+    is_peak = np.zeros(spectra.shape, dtype=bool)
+    is_peak[:, 1:-1] = (signal[:, 1:-1] > signal[:, :-2]) & (signal[:, 1:-1] >= signal[:, 2:])
+    is_peak &= signal > relative_height * np.max(signal, axis=1, keepdims=True)
+    rows, peak_indices = np.nonzero(is_peak)
+    flat_peaks = rows * num_frequencies + peak_indices
+
+    # parabolic interpolation of the centers and heights
+    left, middle, right = signal[rows, peak_indices - 1], signal[rows, peak_indices], signal[rows, peak_indices + 1]
+    curvature = left - 2 * middle + right
+    offsets = np.divide(0.5 * (left - right), curvature, out=np.zeros_like(curvature), where=curvature != 0)
+    step = frequencies[1] - frequencies[0]
+    centers = frequencies[peak_indices] + offsets * step
+    heights = middle - 0.25 * (left - right) * offsets
+    half_heights = heights / 2
+
+    # each frequency is assigned to the segment before its next peak and after its previous peak in the same row
+    flat_signal = signal.reshape(-1)
+    flat_spectra = spectra.reshape(-1)
+    positions = np.arange(flat_signal.size)
+    position_rows = positions // num_frequencies
+    next_peak = np.searchsorted(flat_peaks, positions, side="left")
+    previous_peak = np.searchsorted(flat_peaks, positions, side="right") - 1
+    num_peaks = len(flat_peaks)
+    before = next_peak < num_peaks
+    before[before] &= rows[next_peak[before]] == position_rows[before]
+    after = previous_peak >= 0
+    after[after] &= rows[previous_peak[after]] == position_rows[after]
+
+    # half maximum crossings: last point below half height before the peak, first one after the peak
+    left_crossings = np.full(num_peaks, -1)
+    below = before.copy()
+    below[before] = flat_signal[before] < half_heights[next_peak[before]]
+    np.maximum.at(left_crossings, next_peak[below], positions[below])
+    right_crossings = np.full(num_peaks, flat_signal.size)
+    below = after.copy()
+    below[after] = flat_signal[after] < half_heights[previous_peak[after]]
+    np.minimum.at(right_crossings, previous_peak[below], positions[below])
+
+    linewidths = np.full(num_peaks, np.nan)
+    valid = (left_crossings >= 0) & (right_crossings < flat_signal.size)
+    i, j = left_crossings[valid], right_crossings[valid]
+    fraction_left = (half_heights[valid] - flat_signal[i]) / (flat_signal[i + 1] - flat_signal[i])
+    fraction_right = (half_heights[valid] - flat_signal[j]) / (flat_signal[j - 1] - flat_signal[j])
+    left_x = frequencies[i % num_frequencies] + fraction_left * step
+    right_x = frequencies[j % num_frequencies] - fraction_right * step
+    linewidths[valid] = right_x - left_x
+
+    # extinction ratio between the resonance and the opposite extreme of the spectrum around it
+    neighbourhood = np.concatenate((next_peak[before], previous_peak[after]))
+    neighbourhood_positions = np.concatenate((positions[before], positions[after]))
+    if dips:
+        baselines = np.zeros(num_peaks)
+        np.maximum.at(baselines, neighbourhood, flat_spectra[neighbourhood_positions])
+        extinction_ratios = baselines / flat_spectra[flat_peaks]
+        peaks = flat_spectra[flat_peaks]
+    else:
+        baselines = np.full(num_peaks, np.inf)
+        np.minimum.at(baselines, neighbourhood, flat_spectra[neighbourhood_positions])
+        extinction_ratios = heights / baselines
+        peaks = heights
+
+    # scatter the resonances in arrays padded with nan
+    num_resonances = np.bincount(rows, minlength=num_designs)
+    first_resonance = np.concatenate(([0], np.cumsum(num_resonances)[:-1]))
+    columns = np.arange(num_peaks) - first_resonance[rows]
+    max_num_resonances = int(num_resonances.max(initial=0))
+
+    def padded(values):
+        array = np.full((num_designs, max_num_resonances), np.nan)
+        array[rows, columns] = values
+        return array
+
+    return SpectralMetrics(
+        centers=padded(centers),
+        linewidths=padded(linewidths),
+        peaks=padded(peaks),
+        extinction_ratios=padded(extinction_ratios),
+        num_resonances=num_resonances,
+    )
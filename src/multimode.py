@@ -0,0 +1,333 @@
+from collections.abc import Sequence
+import numpy as np
+from scipy.constants import c
+from scipy.sparse.csgraph import connected_components
+
+from src.base import BaseStructure, CompositeStructure, Pin, wavelength_to_frequency
+from src.structures import Waveguide, DirectionalCoupler
+
+
+class MultimodeWaveguide(Waveguide):
+    """ Waveguide supporting num_modes modes (e.g. TE and TM), with an effective and group index for each mode.
+    An optional mode conversion matrix (num_modes, num_modes) is applied at the output, e.g. for polarization
+    rotation. Its coefficients are (num_frequencies, num_modes, num_modes) blocks. """
+    __slots__ = ("mode_conversion",)
+    num_pins = 2
+    num_equations = 1
+
+    def __init__(
+            self,
+            length: float = 0,
+            effective_refractive_index: Sequence[float] = (1, 1),
+            group_refractive_index: Sequence[float] = (1, 1),
+            GVD: float = 0,
+            loss_dB: float = 10,  # dB/m
+            central_wavelength: float = 1550e-9,
+            angular_frequencies: Sequence[float] = [wavelength_to_frequency(1550e-9)],
+            mode_conversion: np.ndarray = None,
+            pins: Sequence[Pin] = None
+    ):
+        super().__init__(length, np.asarray(effective_refractive_index), np.asarray(group_refractive_index), GVD,
+                         loss_dB, central_wavelength, angular_frequencies, pins)
+        self.mode_conversion = mode_conversion
+
+    @property
+    def wavevector(self):
+        """ Return the wavevector of each mode, with dimensions (num_frequencies, num_modes). """
+        detuning = self.angular_frequencies[:, np.newaxis] - self.central_frequency
+        zero_order_term = self.effective_refractive_index * self.central_frequency / c
+        first_order_term = self.group_refractive_index * detuning / c
+        second_order_term = 1 / 2 * self.GVD * np.power(detuning, 2)
+        return zero_order_term + first_order_term + second_order_term
+
+    @property
+    def field_equations(self):
+        loss_amplitude_coefficient = np.exp(-self.loss_dB * np.log(10) / 20 * self.length)
+        propagation = loss_amplitude_coefficient * np.exp(1j * self.wavevector * self.length)
+        num_modes = propagation.shape[-1]
+        transmission = propagation[..., np.newaxis] * np.eye(num_modes)
+        if self.mode_conversion is not None:
+            transmission = self.mode_conversion @ transmission
+        equations = [{
+            self.pins[0]: -transmission,
+            self.pins[1]: np.eye(num_modes),
+        }]
+        return equations
+
+    def __str__(self):
+        """ Return a string representation of the object. """
+        return f"MultimodeWaveguide {self.id}"
+
+
+class MultimodeDirectionalCoupler(DirectionalCoupler):
+    """ Directional coupler with a cross coupling coefficient for each mode, the modes are not mixed: its
+    coefficients are diagonal (num_modes, num_modes) blocks. """
+    __slots__ = ()
+    num_pins = 4
+    num_equations = 2
+
+    def __init__(
+            self,
+            cross_coupling_coefficient: Sequence[float] = (np.sqrt(3 / 4), np.sqrt(3 / 4)),
+            self_coupling_phase: float = 0,
+            cross_coupling_phase: float = np.pi / 2,
+            pins: Sequence[Pin] = None
+    ):
+        super().__init__(np.asarray(cross_coupling_coefficient), self_coupling_phase, cross_coupling_phase, pins)
+
+    def __str__(self):
+        """ Return a string representation of the object. """
+        return f"MultimodeDirectionalCoupler {self.id}"
+
+    @property
+    def field_equations(self):
+        identity = np.eye(len(self.kappa))
+        equations = [{
+            self.pins[0]: np.diag(self.sigma),
+            self.pins[1]: np.diag(self.kappa),
+            self.pins[2]: -identity
+        }, {
+            self.pins[0]: -np.diag(np.conj(self.kappa)),
+            self.pins[1]: np.diag(np.conj(self.sigma)),
+            self.pins[3]: -identity
+        }]
+        return equations
+
+
+class MultimodeSource(BaseStructure):
+    """ Source with an amplitude for each mode. """
+    __slots__ = ("amplitudes",)
+    num_pins = 1
+    num_equations = 1
+
+    def __init__(self, amplitudes: Sequence[complex] = (1, 0), pins: Sequence[Pin] = None):
+        super().__init__(pins=pins)
+        self.amplitudes = np.asarray(amplitudes, dtype=np.complex128)
+
+    def __str__(self):
+        """ Return a string representation of the object. """
+        return f"MultimodeSource {self.id}"
+
+    @property
+    def field_equations(self):
+        equations = [{self.pins[0]: 1}]
+        return equations
+
+    @property
+    def ordinate_vector(self):
+        """ Return the ordinate vector for a MultimodeSource. """
+        return [self.amplitudes]
+
+
+def _block_conditioning(block: np.ndarray, num_samples: int = 64) -> float:
+    """ Return the smallest ratio of the extreme singular values of a batch of blocks, 0 for a singular block,
+    estimated on num_samples blocks evenly spread over the batch. """
+    block = block.reshape(-1, *block.shape[-2:])
+    block = block[np.unique(np.linspace(0, len(block) - 1, num_samples).astype(int))]
+    singular_values = np.linalg.svd(block, compute_uv=False)
+    return float(np.min(singular_values[..., -1] / np.maximum(singular_values[..., 0], np.finfo(float).tiny)))
+
+
+def _block_elimination(
+        rows: np.ndarray,
+        columns: np.ndarray,
+        blocks: np.ndarray,
+        ordinate: np.ndarray,
+        num_pins: int,
+) -> np.ndarray:
+    """ Solve the block-sparse system sum_j A_ij x_j = b_i by Gaussian elimination over the pin graph: at each step
+    the sparsest remaining equation eliminates its best conditioned pin from the equations that contain it, with
+    (m, m) block operations only, and the pins are then found by back substitution.
+
+    Args:
+        rows (np.ndarray): The equation index of each non-zero block.
+        columns (np.ndarray): The pin index of each non-zero block.
+        blocks (np.ndarray): The blocks, with dimensions (..., num_entries, m, m), the leading dimensions (e.g. the
+            frequencies) being solved as a batch.
+        ordinate (np.ndarray): The right-hand sides b_i, with dimensions (..., num_equations, m).
+        num_pins (int): The number of pins.
+
+    Returns:
+        np.ndarray: The solution, with dimensions (..., num_pins, m).
+    """
+    num_equations = ordinate.shape[-2]
+    equations = [{} for _ in range(num_equations)]
+    for entry, (row, column) in enumerate(zip(rows, columns)):
+        block = blocks[..., entry, :, :]
+        equations[row][column] = equations[row][column] + block if column in equations[row] else block
+    right_hand_sides = [ordinate[..., row, :, np.newaxis] for row in range(num_equations)]
+
+    remaining, eliminated = set(range(num_equations)), []
+    while remaining:
+        # the sparsest equation limits the fill-in, its best conditioned block is the pivot
+        row = min(remaining, key=lambda i: (len(equations[i]), i))
+        remaining.remove(row)
+        if not equations[row]:
+            raise np.linalg.LinAlgError("Singular matrix: an equation has no pin left to eliminate.")
+        pin = next(iter(equations[row])) if len(equations[row]) == 1 else \
+            max(equations[row], key=lambda j: _block_conditioning(equations[row][j]))
+        pivot = equations[row].pop(pin)
+        normalized = {j: np.linalg.solve(pivot, block) for j, block in equations[row].items()}
+        right_hand_side = np.linalg.solve(pivot, right_hand_sides[row])
+        eliminated.append((pin, normalized, right_hand_side))
+        for other in remaining:
+            if pin in equations[other]:
+                factor = equations[other].pop(pin)
+                for j, block in normalized.items():
+                    update = factor @ block
+                    equations[other][j] = equations[other][j] - update if j in equations[other] else -update
+                right_hand_sides[other] = right_hand_sides[other] - factor @ right_hand_side
+
+    fields = np.zeros(ordinate.shape[:-2] + (num_pins, ordinate.shape[-1], 1), dtype=np.complex128)
+    for pin, normalized, right_hand_side in reversed(eliminated):
+        fields[..., pin, :, :] = right_hand_side - sum(
+            (block @ fields[..., j, :, :] for j, block in normalized.items()), np.zeros_like(right_hand_side))
+    return fields[..., 0]
+
+
+class MultimodeCompositeStructure(CompositeStructure):
+    """ Composite structure whose pins carry num_modes mode amplitudes. The coefficients of the field equations of
+    the substructures are either scalars (or (num_frequencies,) arrays), multiplying the identity, or
+    (..., num_modes, num_modes) blocks; the entries of the ordinate vector are scalars, applied to all the modes,
+    or (num_modes,) vectors.
+
+    The system is not solved as a dense (num_pins * num_modes)^2 system: the modes are split in the groups that
+    are coupled by some off-diagonal block entry, and the system of each group is solved by block elimination over
+    the pin graph (see _block_elimination), with (group_size, group_size) block operations batched over the
+    frequencies. With mode conversion all the modes form one group and the cost per frequency is that of the block
+    operations, proportional to num_modes^3 times the number of non-zero blocks including the fill-in, instead of
+    (num_pins * num_modes)^3. """
+    __slots__ = ("num_modes",)
+    num_pins = 2
+
+    def __init__(
+            self,
+            num_modes: int = 2,
+            effective_refractive_index: Sequence[float] = (1, 1),
+            group_refractive_index: Sequence[float] = (1, 1),
+            GVD: float = 0,
+            loss_dB: float = 10,  # dB/m
+            central_wavelength: float = 1550e-9,
+            pins: Sequence[Pin] = None,
+            angular_frequencies: Sequence[float] = None,
+            structures: Sequence[BaseStructure] = None,
+    ):
+        """ Initialize the class. """
+        super().__init__(effective_refractive_index, group_refractive_index, GVD, loss_dB, central_wavelength,
+                         pins, angular_frequencies, structures)
+        self.num_modes = num_modes
+
+    @property
+    def block_table(self):
+        """ Return the non-zero entries of the coefficient matrix as (num_modes, num_modes) blocks: the equation
+        indices, the pin ids and the blocks, with dimensions (num_frequencies, num_entries, num_modes, num_modes). """
+        num_frequencies = len(self.angular_frequencies)
+        identity = np.eye(self.num_modes)
+        rows, columns, blocks = [], [], []
+        for i, equation in enumerate(self.field_equations):
+            for pin, coefficient in equation.items():
+                coefficient = np.asarray(coefficient)
+                if coefficient.ndim < 2:
+                    coefficient = coefficient[..., np.newaxis, np.newaxis] * identity
+                rows.append(i)
+                columns.append(pin.id)
+                blocks.append(np.broadcast_to(coefficient, (num_frequencies, self.num_modes, self.num_modes)))
+        return np.array(rows, dtype=np.intp), np.array(columns, dtype=np.intp), np.stack(blocks, axis=1)
+
+    @property
+    def block_ordinate_vector(self):
+        """ Return the ordinate vector with dimensions (num_equations, num_modes). """
+        return np.stack([np.broadcast_to(value, (self.num_modes,)) for value in self.ordinate_vector])
+
+    @staticmethod
+    def _mode_groups(blocks: np.ndarray) -> list[np.ndarray]:
+        """ Return the groups of modes coupled by the off-diagonal entries of the blocks. """
+        coupling = np.any(blocks != 0, axis=(0, 1))
+        num_groups, labels = connected_components(coupling, directed=False)
+        return [np.flatnonzero(labels == group) for group in range(num_groups)]
+
+    @property
+    def mode_groups(self) -> list[np.ndarray]:
+        """ Return the groups of modes coupled by the off-diagonal entries of the blocks. """
+        return self._mode_groups(self.block_table[2])
+
+    @property
+    def coefficient_matrix(self):
+        """ Return the dense coefficient matrix with dimensions (num_frequencies, num_pins * num_modes,
+        num_pins * num_modes), where the modes of each pin are contiguous. It is not used to solve the system. """
+        rows, columns, blocks = self.block_table
+        num_frequencies = len(self.angular_frequencies)
+        coefficient_matrix = np.zeros((self.num_pins, self.num_pins, num_frequencies, self.num_modes, self.num_modes),
+                                      dtype=np.complex128)
+        np.add.at(coefficient_matrix, (rows, columns), np.moveaxis(blocks, 1, 0))
+        coefficient_matrix = coefficient_matrix.transpose(2, 0, 3, 1, 4)
+        return coefficient_matrix.reshape(num_frequencies, self.num_pins * self.num_modes, -1)
+
+    @property
+    def fields(self):
+        """ Return the fields with dimensions (num_frequencies, num_pins, num_modes). """
+        rows, columns, blocks = self.block_table
+        ordinate_vector = self.block_ordinate_vector
+        num_frequencies = len(self.angular_frequencies)
+        fields = np.zeros((num_frequencies, self.num_pins, self.num_modes), dtype=np.complex128)
+
+        # groups of the same size are solved together, as a batch over the frequencies and the groups
+        groups_by_size = {}
+        for modes in self._mode_groups(blocks):
+            groups_by_size.setdefault(len(modes), []).append(modes)
+        for group_size, groups in groups_by_size.items():
+            modes = np.array(groups)  # (num_groups, group_size)
+            group_blocks = np.moveaxis(blocks[:, :, modes[:, :, np.newaxis], modes[:, np.newaxis, :]], 2, 1)
+            ordinate = np.broadcast_to(ordinate_vector[:, modes].transpose(1, 0, 2),
+                                       (num_frequencies, len(groups), len(ordinate_vector), group_size))
+            solution = _block_elimination(rows, columns, group_blocks, ordinate, self.num_pins)
+            fields[:, :, modes] = solution.transpose(0, 2, 1, 3)
+        return fields
+
+    def __str__(self):
+        """ Return a string representation of the object. """
+        return f"MultimodeStructure {self.id}"
+
+
+class MultimodeRingResonator(MultimodeCompositeStructure):
+    """ Ring resonator for num_modes modes, e.g. a polarization-diverse ring with a cross coupling coefficient and
+    effective indices for TE and TM, and an optional mode conversion matrix along the ring. """
+    __slots__ = ("radius", "cross_coupling_coefficient")
+    num_pins = 4
+    num_equations = 3
+
+    def __init__(
+            self,
+            radius: float = 1e-6,
+            cross_coupling_coefficient: Sequence[float] = (np.sqrt(3 / 4), np.sqrt(3 / 4)),
+            effective_refractive_index: Sequence[float] = (1, 1),
+            group_refractive_index: Sequence[float] = (1, 1),
+            GVD: float = 0,
+            loss_dB: float = 10,  # dB/m
+            central_wavelength: float = 1550e-9,
+            angular_frequencies: Sequence[float] = [c * 1e6],
+            mode_conversion: np.ndarray = None,
+            pins: Sequence[Pin] = None
+    ):
+        super().__init__(len(cross_coupling_coefficient), effective_refractive_index, group_refractive_index, GVD,
+                         loss_dB, central_wavelength, pins, angular_frequencies)
+        self.radius = radius
+        self.cross_coupling_coefficient = cross_coupling_coefficient
+        self.structures = [
+            MultimodeDirectionalCoupler(self.cross_coupling_coefficient, pins=self.pins),
+            MultimodeWaveguide(
+                length=2 * np.pi * self.radius,
+                effective_refractive_index=self.effective_refractive_index,
+                group_refractive_index=self.group_refractive_index,
+                GVD=self.GVD,
+                loss_dB=self.loss_dB,
+                central_wavelength=self.central_wavelength,
+                angular_frequencies=self.angular_frequencies,
+                mode_conversion=mode_conversion,
+                pins=[self.pins[3], self.pins[1]]
+            )
+        ]
+
+    def __str__(self):
+        """ Return a string representation of the object. """
+        return f"MultimodeRingResonator {self.id}"
@@ -0,0 +1,245 @@
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import os
+import pickle
+import numpy as np
+from scipy.optimize import differential_evolution, minimize
+
+from src.base import CompositeStructure
+from src.headless_snowman import HeadlessSnowman
+from src.results import SimulationResult
+
+
+def field_enhancement_objective(
+        result: SimulationResult,
+        target_frequency: float,
+        exclusion_width: float,
+        pin=1,
+        suppression_weight: float = 1,
+) -> float:
+    """ Objective to be minimized: minus the intensity at the pin at the target frequency, plus suppression_weight
+    times the highest intensity outside of the exclusion window centred at the target frequency, to suppress the
+    neighbouring resonances. Use functools.partial to fix the arguments other than the result. """
+    intensity = result.intensity_enhancement(pin)
+    angular_frequencies = result.angular_frequencies
+    target = intensity[np.argmin(np.abs(angular_frequencies - target_frequency))]
+    outside = np.abs(angular_frequencies - target_frequency) > exclusion_width / 2
+    neighbours = np.max(intensity[outside]) if np.any(outside) else 0
+    return -target + suppression_weight * neighbours
+
+
+def _objective_identifier(objective: Callable) -> tuple:
+    """ Return an identifier of an objective: the module and qualified name of the function, and the arguments bound
+    to it by functools.partial, as strings. """
+    bound_arguments = []
+    while isinstance(objective, partial):
+        bound_arguments.append((repr(objective.args), repr(sorted(objective.keywords.items()))))
+        objective = objective.func
+    name = getattr(objective, "__qualname__", type(objective).__qualname__)
+    return getattr(objective, "__module__", type(objective).__module__), name, tuple(bound_arguments)
+
+
+def _evaluate_design(
+        structure_class: type,
+        parameters: dict,
+        angular_frequencies: np.ndarray,
+        objective: Callable[[SimulationResult], float],
+) -> float:
+    """ Build and solve a design, returning its objective. """
+    structure = structure_class(angular_frequencies=angular_frequencies, **parameters)
+    return float(objective(structure.solve()))
+
+
+class OptimizationResult:
+    """ Best design found by a DesignOptimizer, with the number of evaluated and cached designs. """
+
+    def __init__(self, parameters: dict, objective: float, num_evaluations: int, num_cache_hits: int):
+        """ Initialize the class. """
+        self.parameters = parameters
+        self.objective = objective
+        self.num_evaluations = num_evaluations
+        self.num_cache_hits = num_cache_hits
+
+    def __str__(self):
+        """ Return a string representation of the object. """
+        return f"OptimizationResult (objective {self.objective:.4g}, {self.num_evaluations} evaluations)"
+
+
+class DesignOptimizer:
+    """ Optimizer of the parameters of a structure (by default a HeadlessSnowman) for a user-defined objective of
+    its SimulationResult, to be minimized. The candidate designs of the global strategy (differential evolution) are
+    evaluated concurrently on a pool of processes, the local strategy (Nelder-Mead) refines the best design.
+
+    Every evaluated design is memoized, keyed by its parameter values, the fixed parameters and the frequency grid, so
+    that repeated candidates cost nothing; if cache_path is given the memo is also stored on disk, after every
+    generation and at the end of optimize(), and restarts reuse the designs evaluated before. The file records the
+    objective (its function and the arguments bound by functools.partial), a file written for another objective is
+    refused.
+    The objective must be picklable (a module-level function or a functools.partial of one) when max_workers != 1. """
+
+    def __init__(
+            self,
+            objective: Callable[[SimulationResult], float],
+            bounds: dict,
+            angular_frequencies: Sequence[float],
+            fixed_parameters: dict = None,
+            structure_class: type[CompositeStructure] = HeadlessSnowman,
+            max_workers: int = None,
+            cache_path: str = None,
+    ):
+        """
+        Args:
+            objective (Callable[[SimulationResult], float]): The objective to be minimized.
+            bounds (dict): The (lower, upper) bounds of the optimized parameters, e.g. {"auxiliary_radius": (5e-6, 50e-6)}.
+            angular_frequencies (Sequence[float]): The angular frequencies at which the designs are solved.
+            fixed_parameters (dict): The other parameters of the structure.
+            structure_class (type[CompositeStructure]): The class of the structure.
+            max_workers (int): The number of worker processes, 1 to evaluate in this process.
+            cache_path (str): The path of the pickle file storing the evaluated designs.
+        """
+        self.objective = objective
+        self.parameter_names = list(bounds)
+        self.bounds = [bounds[name] for name in self.parameter_names]
+        self.angular_frequencies = np.asarray(angular_frequencies, dtype=float)
+        self.fixed_parameters = fixed_parameters or {}
+        self.structure_class = structure_class
+        self.max_workers = max_workers
+        self.cache_path = cache_path
+        self.num_evaluations = 0
+        self.num_cache_hits = 0
+        self.cache = {}
+        self._objective_identifier = _objective_identifier(objective)
+        self._executor = None
+        # during optimize() the memo is written once per generation instead of after every batch
+        self._deferred_saving = False
+        self._num_unsaved = 0
+        if cache_path is not None and os.path.exists(cache_path):
+            with open(cache_path, 'rb') as f:
+                stored = pickle.load(f)
+            if not isinstance(stored, dict) or stored.get("objective") != self._objective_identifier:
+                raise ValueError(f"In {self} the cache {cache_path} was written for another objective, use a "
+                                 f"different cache_path.")
+            self.cache = stored["designs"]
+
+    def __str__(self):
+        """ Return a string representation of the object. """
+        return f"DesignOptimizer of {self.structure_class.__name__} ({len(self.cache)} cached designs)"
+
+    def _key(self, values: Sequence[float]) -> tuple:
+        """ Return the memo key of a design: its parameters, to 12 significant digits, and the frequency grid. """
+        parameters = self.parameters(float(f"{value:.12g}") for value in values)
+        grid = (self.angular_frequencies[0], self.angular_frequencies[-1], len(self.angular_frequencies))
+        return self.structure_class.__name__, tuple(sorted(parameters.items())), grid
+
+    def parameters(self, values: Sequence[float]) -> dict:
+        """ Return the full parameters of the structure for the values of the optimized parameters. """
+        return {**self.fixed_parameters, **dict(zip(self.parameter_names, (float(value) for value in values)))}
+
+    def _save_cache(self):
+        """ Write the memo to disk atomically, replacing the previous file, if designs were added since the last
+        write. """
+        if self.cache_path is None or self._num_unsaved == 0:
+            return
+        temporary_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        with open(temporary_path, 'wb') as f:
+            pickle.dump({"objective": self._objective_identifier, "designs": self.cache}, f)
+        os.replace(temporary_path, self.cache_path)
+        self._num_unsaved = 0
+
+    def evaluate(self, designs: Sequence[Sequence[float]]) -> np.ndarray:
+        """ Return the objectives of a batch of designs. The ones that are not memoized are evaluated concurrently
+        during optimize(), in this process otherwise. """
+        keys = [self._key(values) for values in designs]
+        missing = list(dict.fromkeys(key for key in keys if key not in self.cache))
+        self.num_cache_hits += len(keys) - len(missing)
+        if missing:
+            arguments = [(self.structure_class, dict(key[1]), self.angular_frequencies, self.objective)
+                         for key in missing]
+            if self._executor is None or len(missing) == 1:
+                objectives = [_evaluate_design(*argument) for argument in arguments]
+            else:
+                objectives = list(self._executor.map(_evaluate_design, *zip(*arguments)))
+            self.cache.update(zip(missing, objectives))
+            self.num_evaluations += len(missing)
+            self._num_unsaved += len(missing)
+            if not self._deferred_saving:
+                self._save_cache()
+        return np.array([self.cache[key] for key in keys])
+
+    def _map(self, function: Callable, designs) -> list:
+        """ Map used by differential evolution to evaluate a population in parallel. """
+        return list(self.evaluate(list(designs)))
+
+    def optimize(
+            self,
+            strategy: str = "global+local",
+            initial_design: Sequence[float] = None,
+            max_iterations: int = 100,
+            population_size: int = 15,
+            seed: int = None,
+    ) -> OptimizationResult:
+        """
+        Searches the design minimizing the objective.
+
+        Args:
+            strategy (str): "global" (differential evolution), "local" (Nelder-Mead from the initial design) or
+                "global+local" (Nelder-Mead from the best design of differential evolution).
+            initial_design (Sequence[float]): The starting values of the local strategy, by default the centre of the
+                bounds.
+            max_iterations (int): The maximum number of generations of the global strategy and of iterations (times
+                the number of parameters) of the local one.
+            population_size (int): The population size multiplier of differential evolution.
+            seed (int): The seed of differential evolution.
+
+        Returns:
+            OptimizationResult: The best design and its objective.
+        """
+        if strategy not in ("global", "local", "global+local"):
+            raise ValueError(f"In {self} strategy must be 'global', 'local' or 'global+local', got {strategy!r}.")
+        best = np.mean(self.bounds, axis=1) if initial_design is None else np.asarray(initial_design, dtype=float)
+        if "global" in strategy and self.max_workers != 1:
+            # the pool of worker processes is kept alive for all the generations
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        self._deferred_saving = True
+        try:
+            best = self._optimize(strategy, best, max_iterations, population_size, seed)
+        finally:
+            self._deferred_saving = False
+            self._save_cache()
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+        return OptimizationResult(
+            parameters=self.parameters(best),
+            objective=float(self.evaluate([best])[0]),
+            num_evaluations=self.num_evaluations,
+            num_cache_hits=self.num_cache_hits,
+        )
+
+    def _optimize(self, strategy: str, best: np.ndarray, max_iterations: int, population_size: int,
+                  seed: int) -> np.ndarray:
+        """ Run the global and/or local strategy from the design best, returning the best design found. """
+        if "global" in strategy:
+            global_result = differential_evolution(
+                lambda values: self.evaluate([values])[0],
+                self.bounds,
+                maxiter=max_iterations,
+                popsize=population_size,
+                polish=False,
+                updating="deferred",
+                workers=self._map,
+                seed=seed,
+                callback=lambda intermediate_result: self._save_cache(),
+            )
+            best = global_result.x
+        if "local" in strategy:
+            local_result = minimize(
+                lambda values: self.evaluate([values])[0],
+                best,
+                method="Nelder-Mead",
+                bounds=self.bounds,
+                options={"maxiter": max_iterations * len(self.parameter_names)},
+            )
+            best = local_result.x
+        return best
@@ -0,0 +1,123 @@
+from collections.abc import Sequence
+import numpy as np
+from scipy.constants import c
+
+from src.base import CompositeStructure, wavelength_to_frequency
+from src.structures import Waveguide
+
+
+def horner(coefficients: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """ Evaluate the polynomials sum_n coefficients[..., n] x^n with Horner's rule, vectorized over x and over the
+    leading dimensions of the coefficients. The result has dimensions (len(x), *coefficients.shape[:-1]). """
+    x = np.asarray(x)[(...,) + (np.newaxis,) * (coefficients.ndim - 1)]
+    result = np.zeros(x.shape[:1] + coefficients.shape[:-1], dtype=np.complex128)
+    for coefficient in np.moveaxis(coefficients, -1, 0)[::-1]:
+        result = result * x + coefficient
+    return result
+
+
+def _waveguides(structure: CompositeStructure):
+    """ Yield all the waveguides of a structure, recursively. """
+    for substructure in structure.structures:
+        if isinstance(substructure, CompositeStructure):
+            yield from _waveguides(substructure)
+        elif isinstance(substructure, Waveguide):
+            yield substructure
+
+
+class RationalTransferFunction:
+    """ Closed-form transfer functions H(z) = N(z^-1) / D(z^-1) of the fields at some pins of a structure whose
+    waveguide lengths are integer multiples of a unit length. The delay variable is
+    z^-1 = exp(i n_g (omega - omega_c) unit_length / c), the propagation delay of the unit length, and the phase
+    accumulated at the central frequency is included in the coefficients. The numerator and denominator are shared
+    by all the pins, the numerators have dimensions (num_pins, degree + 1). """
+
+    def __init__(
+            self,
+            numerators: np.ndarray,
+            denominator: np.ndarray,
+            unit_delay: float,
+            central_frequency: float,
+            pins: Sequence = (1,),
+    ):
+        """ Initialize the class. """
+        self.numerators = numerators
+        self.denominator = denominator
+        self.unit_delay = unit_delay
+        self.central_frequency = central_frequency
+        self.pins = list(pins)
+
+    def __str__(self):
+        """ Return a string representation of the object. """
+        return f"RationalTransferFunction (degree {len(self.denominator) - 1}, {len(self.pins)} pins)"
+
+    def delay_variable(self, angular_frequencies: Sequence[float]) -> np.ndarray:
+        """ Return z^-1 at the given angular frequencies. """
+        return np.exp(1j * self.unit_delay * (np.asarray(angular_frequencies) - self.central_frequency))
+
+    def __call__(self, angular_frequencies: Sequence[float]) -> np.ndarray:
+        """ Evaluate the fields at the pins with Horner's rule, with dimensions (num_frequencies, num_pins). """
+        inverse_z = self.delay_variable(angular_frequencies)
+        return horner(self.numerators, inverse_z) / horner(self.denominator, inverse_z)[:, np.newaxis]
+
+
+def rational_transfer_function(
+        structure: CompositeStructure,
+        unit_length: float,
+        pins: Sequence = (1,),
+        tolerance: float = 1e-6,
+) -> RationalTransferFunction:
+    """
+    Derives the closed-form rational transfer functions of the fields at some pins of a structure. The waveguide
+    lengths must be integer multiples of unit_length (up to tolerance), with the same group index and no GVD, so that
+    the coefficient matrix is a polynomial matrix in z^-1 of degree at most the total number of unit delays.
+
+    The fields are N_k(z^-1) / D(z^-1) by Cramer's rule, with D = det(A): D and N_k = D * fields_k are evaluated
+    by solving the circuit on the roots of unity of the delay variable and interpolated with an FFT.
+
+    Args:
+        structure (CompositeStructure): The structure.
+        unit_length (float): The length corresponding to one unit delay z^-1.
+        pins (Sequence): The pins (ids or labels) of the transfer functions.
+        tolerance (float): The tolerance on the ratio between the waveguide lengths and the unit length.
+
+    Returns:
+        RationalTransferFunction: The numerator and denominator polynomial coefficients in z^-1.
+    """
+    waveguides = list(_waveguides(structure))
+    group_indices = {waveguide.group_refractive_index for waveguide in waveguides}
+    if len(group_indices) > 1:
+        raise ValueError(f"In {structure} all the waveguides must have the same group index, got {group_indices}.")
+    if any(waveguide.GVD != 0 for waveguide in waveguides):
+        raise ValueError(f"In {structure} the waveguides must have no GVD to be represented as delays.")
+    delays = np.array([waveguide.length / unit_length for waveguide in waveguides])
+    if np.any(np.abs(delays - np.round(delays)) > tolerance):
+        raise ValueError(f"In {structure} the waveguide lengths must be integer multiples of {unit_length}.")
+    degree = int(np.sum(np.round(delays)))
+    group_index = group_indices.pop() if group_indices else structure.group_refractive_index
+
+    # the circuit is solved on the roots of unity of the delay variable z^-1
+    unit_delay = group_index * unit_length / c
+    central_frequency = wavelength_to_frequency(structure.central_wavelength)
+    num_points = degree + 1
+    angular_frequencies = central_frequency + 2 * np.pi * np.arange(num_points) / num_points / unit_delay
+    original_angular_frequencies = structure.angular_frequencies
+    try:
+        structure.set_angular_frequencies(angular_frequencies)
+        determinants = np.linalg.det(structure.coefficient_matrix)
+        result = structure.solve()
+    finally:
+        structure.set_angular_frequencies(original_angular_frequencies)
+    fields = np.stack([result[pin] for pin in pins])
+
+    # the polynomials sampled at z^-1 = exp(2 pi i k / num_points) are interpolated by an FFT
+    denominator = np.fft.fft(determinants) / num_points
+    numerators = np.fft.fft(determinants * fields, axis=-1) / num_points
+    normalization = denominator[0] if denominator[0] != 0 else 1
+    return RationalTransferFunction(
+        numerators=numerators / normalization,
+        denominator=denominator / normalization,
+        unit_delay=unit_delay,
+        central_frequency=central_frequency,
+        pins=pins,
+    )
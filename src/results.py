@@ -0,0 +1,79 @@
+from collections.abc import Sequence
+import numpy as np
+
+
+class SimulationResult:
+    """ Result of the solution of a CompositeStructure: it holds the complex field array once, with dimensions
+    (num_frequencies, num_pins), and computes the derived quantities lazily, caching them for each pin.
+    Pins can be addressed by their id, by their label (e.g. "A1") or by the Pin object itself. """
+
+    def __init__(
+            self,
+            angular_frequencies: Sequence[float],
+            fields: np.ndarray,
+            pins: Sequence = None,
+    ):
+        """ Initialize the class. """
+        self.angular_frequencies = np.asarray(angular_frequencies)
+        self.fields = fields
+        self.fields.setflags(write=False)
+        self.pin_labels = {pin.label: pin.id for pin in pins} if pins is not None else {}
+        self._cache = {}
+
+    def __str__(self):
+        """ Return a string representation of the object. """
+        return f"SimulationResult ({self.fields.shape[0]} frequencies, {self.fields.shape[1]} pins)"
+
+    def pin_index(self, pin) -> int:
+        """ Return the column of the field array corresponding to a pin id, label or Pin object. """
+        if isinstance(pin, str):
+            try:
+                return self.pin_labels[pin]
+            except KeyError:
+                raise KeyError(f"In {self} there is no pin labelled {pin!r}.")
+        if isinstance(pin, (int, np.integer)):
+            return int(pin)
+        return pin.id
+
+    def _cached(self, quantity: str, pin, compute):
+        """ Return the cached value of a derived quantity at a pin, computing it on the first call. """
+        key = (quantity, self.pin_index(pin))
+        if key not in self._cache:
+            value = compute(key[1])
+            value.setflags(write=False)
+            self._cache[key] = value
+        return self._cache[key]
+
+    def __getitem__(self, pin) -> np.ndarray:
+        """ Return the complex field at a pin, as a view of the field array. """
+        return self.fields[:, self.pin_index(pin)]
+
+    def field_enhancement(self, pin=1) -> np.ndarray:
+        """ Return the modulus of the field |E| at a pin. """
+        return self._cached("field_enhancement", pin, lambda i: np.abs(self.fields[:, i]))
+
+    def intensity_enhancement(self, pin=1) -> np.ndarray:
+        """ Return the intensity |E|^2 at a pin. """
+        return self._cached("intensity_enhancement", pin, lambda i: np.square(self.field_enhancement(i)))
+
+    def intensity_enhancement_dB(self, pin=1) -> np.ndarray:
+        """ Return the intensity at a pin in dB, 10 log10(|E|^2). """
+        return self._cached("intensity_enhancement_dB", pin, lambda i: 10 * np.log10(self.intensity_enhancement(i)))
+
+    def transmission(self, pin=2) -> np.ndarray:
+        """ Return the transmission |E|^2 at a pin, by default the through port. """
+        return self.intensity_enhancement(pin)
+
+    def phase(self, pin=1) -> np.ndarray:
+        """ Return the phase of the field at a pin, wrapped in (-pi, pi]. """
+        return self._cached("phase", pin, lambda i: np.angle(self.fields[:, i]))
+
+    def unwrapped_phase(self, pin=1) -> np.ndarray:
+        """ Return the phase of the field at a pin, unwrapped along the frequency axis. """
+        return self._cached("unwrapped_phase", pin, lambda i: np.unwrap(self.phase(i)))
+
+    def mach_zender_phase_difference(self, arm_input="A2", arm_output="A4", reference_input="A3",
+                                     reference_output="A5") -> np.ndarray:
+        """ Return the phase difference accumulated between the two arms of the Mach Zender, i.e. the phase delay
+        of the external arm (A2 -> A4) minus the phase delay of the main ring arm (A3 -> A5). """
+        return (self.phase(arm_output) - self.phase(arm_input)) - (self.phase(reference_output) - self.phase(reference_input))
@@ -1,10 +1,20 @@
-from src.base import BaseStructure, CompositeStructure, Pin, wavelength_to_frequency
+from src.base import BaseStructure, CompositeStructure, Pin, frequency_array, wavelength_to_frequency
 from collections.abc import Sequence
 import numpy as np
 from scipy.constants import c
 
 
 class Waveguide(BaseStructure):
+    __slots__ = (
+        "length",
+        "effective_refractive_index",
+        "group_refractive_index",
+        "GVD",
+        "loss_dB",
+        "central_wavelength",
+        "angular_frequencies",
+        "central_frequency",
+    )
     num_pins = 2
     num_equations = 1
 
@@ -26,7 +36,8 @@ class Waveguide(BaseStructure):
         self.GVD = GVD
         self.loss_dB = loss_dB
         self.central_wavelength = central_wavelength
-        self.angular_frequencies = np.array(angular_frequencies)
+        # shared reference to the frequency array of the parent structure, not a copy
+        self.angular_frequencies = frequency_array(angular_frequencies)
         self.central_frequency = 2 * np.pi / central_wavelength * c
 
     @property
@@ -53,6 +64,7 @@ class Waveguide(BaseStructure):
 
 
 class Waveguide_withPhaseDelay(Waveguide):
+    __slots__ = ("phase_delay",)
     num_pins = 2
     num_equations = 1
 
@@ -87,6 +99,7 @@ class Waveguide_withPhaseDelay(Waveguide):
 
 # TODO: refactor the Source class, input fields in more than one pin: input of a vector of amplitudes, phases, and pins
 class Source(BaseStructure):
+    __slots__ = ("amplitude",)
     num_pins = 1
     num_equations = 1
 
@@ -110,6 +123,7 @@ class Source(BaseStructure):
     
 
 class WaveguideSource(Waveguide):
+    __slots__ = ("source_amplitude",)
     num_pins = 2
     num_equations = 1
 
@@ -148,6 +162,7 @@ class WaveguideSource(Waveguide):
 
 
 class DirectionalCoupler(BaseStructure):
+    __slots__ = ("kappa", "sigma")
     num_pins = 4
     num_equations = 2
 
@@ -181,6 +196,7 @@ class DirectionalCoupler(BaseStructure):
 
 
 class RingResonator(CompositeStructure):
+    __slots__ = ("radius", "cross_coupling_coefficient")
     num_pins = 4
     num_equations = 3
 
@@ -220,6 +236,7 @@ class RingResonator(CompositeStructure):
 
 
 class AddDropFilter(CompositeStructure):
+    __slots__ = ("radius", "input_cross_coupling_coefficient", "auxiliary_cross_coupling_coefficient")
     num_pins = 8
     num_equations = 6
 
@@ -272,6 +289,12 @@ class AddDropFilter(CompositeStructure):
 
 
 class AddDropFilterInternalSource(CompositeStructure):
+    __slots__ = (
+        "source_amplitude",
+        "radius",
+        "input_cross_coupling_coefficient",
+        "auxiliary_cross_coupling_coefficient",
+    )
     num_pins = 8
     num_equations = 6
 
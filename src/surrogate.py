@@ -0,0 +1,157 @@
+from collections.abc import Sequence
+import numpy as np
+
+from src.base import CompositeStructure
+
+
+def vector_fitting(
+        s: np.ndarray,
+        responses: np.ndarray,
+        initial_poles: np.ndarray,
+        num_iterations: int = 10,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """ Fit a pole-residue model H(s) = sum_k r_k / (s - a_k) + d to the responses sampled at the points s, with
+    the poles shared between all the responses (Gustavsen and Semlyen's vector fitting).
+
+    Args:
+        s (np.ndarray): The sample points, with shape (num_samples,).
+        responses (np.ndarray): The sampled responses, with shape (num_samples, num_responses).
+        initial_poles (np.ndarray): The starting poles, with shape (num_poles,).
+        num_iterations (int): The number of pole relocation iterations.
+
+    Returns:
+        np.ndarray: The poles, with shape (num_poles,).
+        np.ndarray: The residues, with shape (num_poles, num_responses).
+        np.ndarray: The constant terms, with shape (num_responses,).
+    """
+    poles = np.asarray(initial_poles, dtype=np.complex128)
+    num_samples, num_responses = responses.shape
+    num_poles = len(poles)
+    for _ in range(num_iterations):
+        # pole relocation: solve sigma(s) H(s) = p(s) for the residues of sigma, with sigma(s) = 1 + sum_k c_k / (s - a_k)
+        partial_fractions = 1 / (s[:, np.newaxis] - poles)
+        system = np.zeros((num_samples * num_responses, num_responses * (num_poles + 1) + num_poles), dtype=np.complex128)
+        for j in range(num_responses):
+            rows = slice(j * num_samples, (j + 1) * num_samples)
+            columns = slice(j * (num_poles + 1), (j + 1) * (num_poles + 1))
+            system[rows, columns] = np.hstack((partial_fractions, np.ones((num_samples, 1))))
+            system[rows, -num_poles:] = -responses[:, j, np.newaxis] * partial_fractions
+        solution = np.linalg.lstsq(system, responses.T.reshape(-1), rcond=None)[0]
+        sigma_residues = solution[-num_poles:]
+        # the new poles are the zeros of sigma
+        poles = np.linalg.eigvals(np.diag(poles) - np.outer(np.ones(num_poles), sigma_residues))
+
+    residues, constants = fit_residues(s, responses, poles)
+    return poles, residues, constants
+
+
+def fit_residues(s: np.ndarray, responses: np.ndarray, poles: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """ Return the residues and the constant terms of the pole-residue model with fixed poles, by least squares. """
+    system = np.hstack((1 / (s[:, np.newaxis] - poles), np.ones((len(s), 1))))
+    solution = np.linalg.lstsq(system, responses, rcond=None)[0]
+    return solution[:-1], solution[-1]
+
+
+class RationalSurrogate:
+    """ Rational surrogate model of the fields of a CompositeStructure at some pins, fitted by vector fitting on
+    a modest number of samples of the angular frequency band. Once fitted, the surrogate evaluates the fields at
+    any frequency in the band without solving the circuit.
+
+    The error bound is the maximum error on a set of validation frequencies (between the fitting samples), relative
+    to the maximum of the response. When it exceeds the tolerance, or when the surrogate is evaluated outside of
+    the fitted band, the model is refitted with more poles and samples. """
+
+    def __init__(
+            self,
+            structure: CompositeStructure,
+            pins: Sequence = (1,),
+            band: tuple[float, float] = None,
+            num_poles: int = 20,
+            num_samples: int = 400,
+            tolerance: float = 1e-3,
+            num_iterations: int = 10,
+            max_refits: int = 4,
+    ):
+        """ Initialize the class and fit the surrogate. The band defaults to the frequency range of the structure. """
+        self.structure = structure
+        self.pins = list(pins)
+        if band is None:
+            band = (np.min(structure.angular_frequencies), np.max(structure.angular_frequencies))
+        if not band[1] > band[0]:
+            raise ValueError(f"In RationalSurrogate of {structure} the band must have a non-zero width, got "
+                             f"({band[0]:g}, {band[1]:g}): provide a band or more than one angular frequency.")
+        self.band = band
+        self.num_poles = num_poles
+        self.num_samples = num_samples
+        self.tolerance = tolerance
+        self.num_iterations = num_iterations
+        self.max_refits = max_refits
+        self.error_bound = np.inf
+        # the counts of the last model within the tolerance, from which the refits start
+        self._accepted_counts = (num_poles, num_samples)
+        self.fit()
+
+    def __str__(self):
+        """ Return a string representation of the object. """
+        return f"RationalSurrogate of {self.structure} ({self.num_poles} poles, error bound {self.error_bound:.1e})"
+
+    def _normalized(self, angular_frequencies: np.ndarray) -> np.ndarray:
+        """ Map the angular frequencies of the band to the segment [-1j, 1j] of the imaginary axis. """
+        center = (self.band[0] + self.band[1]) / 2
+        half_width = (self.band[1] - self.band[0]) / 2
+        return 1j * (np.asarray(angular_frequencies) - center) / half_width
+
+    def _sample(self, angular_frequencies: np.ndarray) -> np.ndarray:
+        """ Solve the circuit at the given angular frequencies and return the fields at the pins. """
+        result = self.structure.solve_at(angular_frequencies)
+        return np.stack([result[pin] for pin in self.pins], axis=-1)
+
+    def fit(self, num_doublings: int = 0):
+        """ Fit the pole-residue model, starting from the counts of poles and samples of the last model within the
+        tolerance times 2 ** num_doublings, and refitting with twice the poles and samples until the error bound on
+        the validation frequencies is within the tolerance, or max_refits is reached. """
+        self.num_poles, self.num_samples = (count * 2 ** num_doublings for count in self._accepted_counts)
+        for attempt in range(self.max_refits + 1):
+            angular_frequencies = np.linspace(self.band[0], self.band[1], self.num_samples)
+            s = self._normalized(angular_frequencies)
+            responses = self._sample(angular_frequencies)
+
+            # starting poles: weakly damped complex poles spread along the band
+            imaginary_parts = np.linspace(-1, 1, self.num_poles)
+            initial_poles = -1e-2 * (imaginary_parts[1] - imaginary_parts[0]) + 1j * imaginary_parts
+            self.poles, self.residues, self.constants = vector_fitting(s, responses, initial_poles, self.num_iterations)
+
+            # validation on the midpoints of the fitting samples
+            validation_frequencies = (angular_frequencies[1:] + angular_frequencies[:-1]) / 2
+            errors = np.abs(self(validation_frequencies, refit=False) - self._sample(validation_frequencies))
+            self.error_bound = np.max(errors) / np.max(np.abs(responses))
+            if self.error_bound <= self.tolerance:
+                self._accepted_counts = (self.num_poles, self.num_samples)
+                break
+            # the counts are only doubled for another fit, so that they always describe the stored model
+            if attempt < self.max_refits:
+                self.num_poles *= 2
+                self.num_samples *= 2
+        return self
+
+    def validate(self, angular_frequencies: Sequence[float]) -> float:
+        """ Compare the surrogate with the circuit solution at the given angular frequencies, update the error bound,
+        and refit the model if the error exceeds the tolerance. Return the error bound. """
+        angular_frequencies = np.atleast_1d(np.asarray(angular_frequencies, dtype=float))
+        responses = self._sample(angular_frequencies)
+        errors = np.abs(self(angular_frequencies, refit=False) - responses)
+        self.error_bound = max(self.error_bound, np.max(errors) / np.max(np.abs(responses)))
+        if self.error_bound > self.tolerance:
+            # the accepted counts reproduce the current model, the refit starts from twice them
+            self.fit(num_doublings=1)
+        return self.error_bound
+
+    def __call__(self, angular_frequencies: Sequence[float], refit: bool = True) -> np.ndarray:
+        """ Evaluate the surrogate fields at the pins, with shape (num_frequencies, num_pins). If refit is True and
+        some frequencies fall outside of the fitted band, the band is extended and the model is refitted. """
+        angular_frequencies = np.atleast_1d(np.asarray(angular_frequencies, dtype=float))
+        if refit and (angular_frequencies.min() < self.band[0] or angular_frequencies.max() > self.band[1]):
+            self.band = (min(self.band[0], angular_frequencies.min()), max(self.band[1], angular_frequencies.max()))
+            self.fit()
+        s = self._normalized(angular_frequencies)
+        return (1 / (s[:, np.newaxis] - self.poles)) @ self.residues + self.constants
@@ -1,32 +1,40 @@
 # third party imports
-import numpy as np
-import plotly.graph_objects as go
 import os
 import pickle
-from abc import ABC, abstractmethod
-from scipy.signal import find_peaks
+import hashlib
+import tempfile
+import numpy as np
+from collections import OrderedDict
+from abc import abstractmethod
 
 # local imports
-from sympy import symbols, linsolve, together, lambdify
-from src.sympy.utils import pole_zero_plot, compute_fwhm
+from sympy import symbols, linsolve, together, lambdify, fraction, Pow, srepr
+from src.sympy.numeric import NumericCircuit
+from src.sympy.signal_flow import signal_flow_solutions
 from src.config import SYMPY_DATA_PATH
 
 # type hinting
 from sympy.core.expr import Expr
 from sympy.physics.control.lti import TransferFunction
-from typing import Any
-from numpy import ndarray, dtype, floating
-from numpy._typing import _64Bit
-
-class SymPy_PhotonicCircuit(ABC):
-    num_pins = 1
+from typing import Callable
+
+class SymPy_PhotonicCircuit(NumericCircuit):
+    # derivation engine of the solutions: "signal_flow" (structured elimination) or "linsolve"
+    derivation = "signal_flow"
+    # solutions and compiled kernels shared by all the instances, keyed by the content hash of the equations
+    _solution_keys: dict[type, str] = {}
+    _solutions: dict[str, list[Expr]] = {}
+    _kernels: dict[tuple, Callable] = {}
+    _sensitivity_kernels: dict[tuple, Callable] = {}
+    _delay_parameters: dict[type, list[str]] = {}
+    # kernels specialized to integer delays, keyed by (solution_key, pin, part, delays), least recently used first
+    _specialized_kernels: OrderedDict[tuple, Callable] = OrderedDict()
+    kernel_cache_size = 128
 
     def __init__(self, numeric_parameters=None):
-        if numeric_parameters is None:
-            numeric_parameters = {}
+        super().__init__(numeric_parameters=numeric_parameters)
         self.z = symbols("z")
         self.pins = [symbols("A_{}".format(i)) for i in range(self.num_pins)]
-        self._numeric_parameters = numeric_parameters
 
     @property
     @abstractmethod
@@ -34,14 +42,8 @@ class SymPy_PhotonicCircuit(ABC):
         return {"unitary_loss_coefficient": symbols(r"\gamma")}
 
     @property
-    def numeric_parameters(self) -> dict:
-        return self._numeric_parameters
-
-    @numeric_parameters.setter
-    def numeric_parameters(self, value: dict):
-        if not set(value.keys()) == set(self.parameter_symbols.keys()):
-            raise ValueError("Keys of numeric_parameters must match keys of parameter_symbols")
-        self._numeric_parameters = value
+    def parameter_names(self) -> list[str]:
+        return list(self.parameter_symbols)
 
     @property
     @abstractmethod
@@ -51,36 +53,114 @@ class SymPy_PhotonicCircuit(ABC):
         """
         pass
 
+    @property
+    def solution_key(self) -> str:
+        """
+        Returns the hash of the equations and pin symbols, the key of the cached solutions and kernels. It is computed
+        once per class, a class redefined with other equations (e.g. a reloaded module) gets a new key.
+        """
+        cls = self.__class__
+        if cls not in SymPy_PhotonicCircuit._solution_keys:
+            content = srepr(self.equations) + srepr(self.pins)
+            SymPy_PhotonicCircuit._solution_keys[cls] = hashlib.sha256(content.encode()).hexdigest()[:16]
+        return SymPy_PhotonicCircuit._solution_keys[cls]
+
     @property
     def solutions(self) -> list[Expr]:
         """
-        This property represents the solutions of the system of equations defined in the `equations` method. 
-        The solutions are stored in a pickle file named after the class and located in the `SYMPY_DATA_PATH` directory.
-        
-        If the pickle file already exists, the solutions are loaded from the file. 
-        If the file does not exist, the solutions are computed using the `linsolve` function from sympy, 
-        and then saved to the pickle file for future use.
-        
+        This property represents the solutions of the system of equations defined in the `equations` method.
+
+        The solutions are cached in two tiers, both keyed by the hash of the equations and pin symbols (solution_key),
+        so that editing the equations never serves stale solutions:
+        - in-process, shared by all the instances, so that the pickle file is read once per process;
+        - on disk, in a pickle file named <ClassName>-<solution_key>.pkl in the `SYMPY_DATA_PATH` directory, written
+          atomically (temporary file and rename), so that concurrent workers never read a partial file.
+        If neither exists, the solutions are derived by structured elimination on the signal-flow graph of the
+        equations (see `signal_flow_solutions`), or with the `linsolve` function from sympy if the derivation class
+        attribute is "linsolve" or the equations do not define each pin explicitly. A legacy file named
+        after the class only is reused, and migrated, if its solutions satisfy the current equations.
+
         Returns:
             list[Expr]: A list of sympy expressions representing the solutions of the system of equations.
         """
+        key = self.solution_key
+        if key in SymPy_PhotonicCircuit._solutions:
+            return SymPy_PhotonicCircuit._solutions[key]
+
         directory = SYMPY_DATA_PATH
-        filename = os.path.join(directory, f'{self.__class__.__name__}.pkl')
-        solutions = list()
-        if not os.path.exists(directory):
-            os.makedirs(directory)
+        filename = os.path.join(directory, f'{self.__class__.__name__}-{key}.pkl')
+        legacy_filename = os.path.join(directory, f'{self.__class__.__name__}.pkl')
+        solutions = None
         if os.path.exists(filename):
             with open(filename, 'rb') as f:
                 solutions = pickle.load(f)
-                # print(f"Loading {filename}")
         else:
-            solution_set = together(linsolve(self.equations, self.pins))
-            solutions = list(solution_set)[0]
-            with open(filename, 'wb') as f:
-                pickle.dump(solutions, f)
-            # print(f"Saving {filename}")
+            if os.path.exists(legacy_filename):
+                with open(legacy_filename, 'rb') as f:
+                    solutions = pickle.load(f)
+                if not self._satisfies_equations(solutions):
+                    solutions = None
+            if solutions is None:
+                solutions = self._derive_solutions()
+            self._save_solutions(filename, solutions)
+        SymPy_PhotonicCircuit._solutions[key] = solutions
         return solutions
 
+    def _derive_solutions(self) -> list[Expr]:
+        """
+        Derives the solutions of the equations with the derivation engine of the class.
+        """
+        if self.derivation == "signal_flow":
+            try:
+                return signal_flow_solutions(self.equations, self.pins)
+            except ValueError:
+                pass
+        elif self.derivation != "linsolve":
+            raise ValueError(f"Unknown derivation {self.derivation!r}, must be 'signal_flow' or 'linsolve'")
+        solution_set = together(linsolve(self.equations, self.pins))
+        return list(solution_set)[0]
+
+    @staticmethod
+    def _save_solutions(filename: str, solutions: list[Expr]):
+        """
+        Writes the solutions atomically: concurrent writers of the same file all write identical content, and readers
+        see either no file or a complete one.
+        """
+        directory = os.path.dirname(filename)
+        os.makedirs(directory, exist_ok=True)
+        file_descriptor, temporary_filename = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'wb') as f:
+                pickle.dump(solutions, f)
+            os.replace(temporary_filename, filename)
+        except BaseException:
+            os.remove(temporary_filename)
+            raise
+
+    def _satisfies_equations(
+            self,
+            solutions: list[Expr],
+            tolerance: float = 1e-9,
+    ) -> bool:
+        """
+        Checks that the solutions satisfy the equations at random values of z and of the parameters (integer values
+        for the delays).
+        """
+        if len(solutions) != len(self.pins):
+            return False
+        rng = np.random.default_rng(0)
+        delay_parameters = self.delay_parameters
+        values = {symbol: int(rng.integers(1, 4)) if key in delay_parameters else rng.uniform(0.1, 0.9)
+                  for key, symbol in self.parameter_symbols.items()}
+        values[self.z] = 1.3 * np.exp(0.4j)
+        values.update({pin: solution.subs(values) for pin, solution in zip(self.pins, solutions)})
+        for equation in self.equations:
+            residual = complex((equation.lhs - equation.rhs).subs(values).evalf())
+            scale = max(abs(complex(equation.lhs.subs(values).evalf())), 1)
+            if not np.isfinite(residual) or abs(residual) > tolerance * scale:
+                return False
+        return True
+
     def solution(
             self,
             pin
@@ -107,139 +187,126 @@ class SymPy_PhotonicCircuit(ABC):
         substitution_table = {self.parameter_symbols[k]: v for k, v in self.numeric_parameters.items()}
         return self.solution(pin).subs(substitution_table)
 
-    def numeric_lambda_solution(
-            self,
-            pin
-    ) -> Any:
-
-        # check if numeric parameters are set
-        if not self.numeric_parameters:
-            raise ValueError("Numeric parameters must be set before calling numeric_solution_lambdified")
-        return lambdify(self.z, self.numeric_solution(pin))
-
-    def transfer_function(
+    def kernel(
             self,
             pin
-    ) -> TransferFunction:
+    ) -> Callable:
+        """
+        Returns the solution for a given pin compiled into a numeric kernel, with common subexpression elimination.
+        The kernel is compiled once per pin and per solution_key and cached in-process.
 
-        # check if numeric parameters are set
-        if not self.numeric_parameters:
-            raise ValueError("Numeric parameters must be set before calling transfer_function")
-        return TransferFunction.from_rational_expression(self.numeric_solution(pin), self.z)
+        Args:
+            pin (int): The pin for which the kernel is returned.
 
-    def plotly_pole_zero_plot(
-            self,
-            pin: int,
-            fig: go.Figure = go.Figure(),
-    ) -> go.Figure:
+        Returns:
+            Callable: The function kernel(z, *parameters) of z and of the parameters in the order of
+                parameter_symbols. All the arguments can be arrays, broadcast against each other.
+        """
+        key = (self.solution_key, pin)
+        if key not in SymPy_PhotonicCircuit._kernels:
+            arguments = [self.z, *self.parameter_symbols.values()]
+            SymPy_PhotonicCircuit._kernels[key] = lambdify(arguments, self.solution(pin), modules="numpy", cse=True)
+        return SymPy_PhotonicCircuit._kernels[key]
 
-        # check if numeric parameters are set
-        if not self.numeric_parameters:
-            raise ValueError("Numeric parameters must be set before calling plotly_pole_zero_plot")
-
-        # plot
-        omega = np.linspace(0, 2 * np.pi, 5000)
-        pole_zero_plot(self.transfer_function(pin), fig=fig, show=False)
-        fig.add_trace(
-            go.Scatter(x=np.cos(omega), y=np.sin(omega), mode='lines', name='unit circle', line=dict(color='black')))
-
-        # set layout
-        fig.update_layout(
-            title='Pole-zero plot',
-            xaxis_title="Real Axis",
-            yaxis_title="Imaginary Axis",
-            autosize=False,
-            width=900,
-            height=900,
-            margin=dict(l=50, r=50, b=100, t=100, pad=4),
-        )
-
-        return fig
-
-    def plotly_magnitude_response_plot(
+    def sensitivity_expressions(
             self,
-            pin: int,
-            label: str = None,
-            omega: np.ndarray[Any, np.dtype[np.float64]] = np.linspace(0, 2 * np.pi, 10000),
-            fig: go.Figure = go.Figure(),
-    ) -> go.Figure:
-
-        # check if numeric parameters are set
-        if not self.numeric_parameters:
-            raise ValueError("Numeric parameters must be set before calling magnitude_response_plot")
-
-        # plot
-        magnitude_response_lambda = self.numeric_lambda_solution(pin)
-        magnitude_response = np.abs(magnitude_response_lambda(np.exp(1j * omega)))
-
-        # add trace
-        fig.add_trace(go.Scatter(x=omega, y=magnitude_response, mode='lines', name=label))
-
-        # set layout
-        fig.update_layout(
-            title='Magnitude response',
-            xaxis_title="Normalized ω [rad/s]",
-            yaxis_title=f"H_{pin}(ω)",
-            autosize=False,
-            width=1200,
-            height=900,
-            margin=dict(l=50, r=50, b=100, t=100, pad=4),
-        )
-
-        return fig
+            pin
+    ) -> list[Expr]:
+        """
+        Returns the numerator N and denominator D of the solution for a given pin, followed by their derivatives with
+        respect to the continuous parameters: [N, D, ∂N/∂θ_1, ..., ∂N/∂θ_P, ∂D/∂θ_1, ..., ∂D/∂θ_P]. Differentiating
+        the two polynomials rather than the fraction keeps the expressions compact and shares their subexpressions.
+        """
+        numerator, denominator = fraction(self.solution(pin))
+        variables = [self.parameter_symbols[key] for key in self.continuous_parameters]
+        return [numerator, denominator, *(numerator.diff(variable) for variable in variables),
+                *(denominator.diff(variable) for variable in variables)]
 
-    def magnitude_response_data(
+    def sensitivity_kernel(
             self,
-            pin: int,
-            omega: np.ndarray[Any, np.dtype[np.float64]] = np.linspace(0, 2 * np.pi, 10000)
-    ) -> tuple[ndarray[Any, dtype[floating[_64Bit]]], Any]:
+            pin
+    ) -> Callable:
         """
-        Returns the magnitude response data for a given pin.
-        
+        Returns the sensitivity expressions for a given pin compiled into one numeric kernel, with common
+        subexpression elimination across all of them. The kernel is compiled once per pin and per solution_key and
+        cached in-process.
+
         Args:
-            pin (int): The pin for which the magnitude response data is returned.
-            omega (np.ndarray[Any, np.dtype[np.float64]]): The angular frequency vector.
-            
-        Returns:
-            np.ndarray[Any, np.dtype[np.float64]]: The angular frequency vector.
-            np.ndarray[Any, np.dtype[np.float64]]: The magnitude response vector.
-            """
+            pin (int): The pin for which the kernel is returned.
 
-        # check if numeric parameters are set
-        if not self.numeric_parameters:
-            raise ValueError("Numeric parameters must be set before calling magnitude_response_data")
+        Returns:
+            Callable: The function kernel(z, *parameters) of z and of the parameters in the order of
+                parameter_symbols, returning the list of sensitivity_expressions.
+        """
+        key = (self.solution_key, pin)
+        if key not in SymPy_PhotonicCircuit._sensitivity_kernels:
+            arguments = [self.z, *self.parameter_symbols.values()]
+            SymPy_PhotonicCircuit._sensitivity_kernels[key] = lambdify(
+                arguments, self.sensitivity_expressions(pin), modules="numpy", cse=True)
+        return SymPy_PhotonicCircuit._sensitivity_kernels[key]
 
-        magnitude_response_lambda = self.numeric_lambda_solution(pin)
-        magnitude_response = np.abs(magnitude_response_lambda(np.exp(1j * omega)))
-        return omega, magnitude_response
-    
     @property
-    def _intrinsic_fwhm(self) -> float:
-        """
-        Returns the intrinsic FWHM of the magnitude response of the first pin.
+    def delay_parameters(self) -> list[str]:
         """
-        if not self.numeric_parameters:
-            raise ValueError("Numeric parameters must be set before calling intrinsic_fwhm")
-        gamma = self.numeric_parameters["unitary_loss_coefficient"]
-        return 2 * (1 - gamma)
-    
-    @property
-    def main_extraction_efficiency(self) -> float:
+        Returns the names of the integer delay parameters, the exponents of (γ z^-1) in the equations.
         """
-        Returns the extraction efficiency of the main resonance.
+        cls = self.__class__
+        if cls not in SymPy_PhotonicCircuit._delay_parameters:
+            exponents = set()
+            for equation in self.equations:
+                for power in equation.atoms(Pow):
+                    exponents |= power.exp.free_symbols
+            SymPy_PhotonicCircuit._delay_parameters[cls] = [
+                key for key, symbol in self.parameter_symbols.items() if symbol in exponents]
+        return SymPy_PhotonicCircuit._delay_parameters[cls]
+
+    def specialized_kernel(
+            self,
+            pin,
+            delays: tuple[int, ...],
+            part: str = "solution"
+    ) -> Callable:
         """
-        omega, magnitude_response = self.magnitude_response_data(1)
-        intensity_response = np.square(magnitude_response)
-        peak_indices, _ = find_peaks(intensity_response)
-        peak_index = min(peak_indices, key=lambda x: np.abs(omega[x] - np.pi))
-        peak_heigth = intensity_response[peak_index]    
-        peak_fwhm = compute_fwhm(peak_index, peak_heigth, omega, intensity_response)
+        Returns the solution for a given pin with the delay parameters replaced by integers, compiled into a kernel
+        of z and of the continuous parameters. The degree of the polynomials only depends on the delays, so one kernel
+        is compiled per delay configuration, and kept in a bounded cache shared by all the instances: the
+        kernel_cache_size most recently used kernels are kept, the least recently used ones are evicted.
 
-        return 1 - self._intrinsic_fwhm / peak_fwhm
+        Args:
+            pin (int): The pin for which the kernel is returned.
+            delays (tuple[int, ...]): The values of the delay parameters, in the order of delay_parameters.
+            part (str): "solution" for the solution, "fraction" for the list [numerator, denominator] of its fraction.
 
-    
-    def __str__(self):
-        return f"{self.__class__.__name__} object"
+        Returns:
+            Callable: The function kernel(z, *parameters) of z and of the continuous parameters in the order of
+                continuous_parameters, broadcast against each other.
+        """
+        delays = tuple(int(delay) for delay in delays)
+        key = (self.solution_key, pin, part, delays)
+        cache = SymPy_PhotonicCircuit._specialized_kernels
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        if part not in ("solution", "fraction"):
+            raise ValueError(f"Unknown part {part!r}, must be 'solution' or 'fraction'")
+        symbols_table = self.parameter_symbols
+        substitution_table = {symbols_table[name]: delay for name, delay in zip(self.delay_parameters, delays)}
+        if part == "solution":
+            expressions = self.solution(pin).xreplace(substitution_table)
+        else:
+            expressions = [expression.xreplace(substitution_table) for expression in fraction(self.solution(pin))]
+        arguments = [self.z, *(symbols_table[name] for name in self.continuous_parameters)]
+        cache[key] = lambdify(arguments, expressions, modules="numpy", cse=True)
+        while len(cache) > self.kernel_cache_size:
+            cache.popitem(last=False)
+        return cache[key]
 
-    def __repr__(self):
-        return f"{self.__class__.__name__} object"
+    def transfer_function(
+            self,
+            pin
+    ) -> TransferFunction:
+
+        # check if numeric parameters are set
+        if not self.numeric_parameters:
+            raise ValueError("Numeric parameters must be set before calling transfer_function")
+        return TransferFunction.from_rational_expression(self.numeric_solution(pin), self.z)
@@ -0,0 +1,122 @@
+""" Generation of the NumPy modules of src/sympy/generated from the solutions of the SymPy circuits. """
+# third party imports
+import importlib.util
+import inspect
+import os
+import tempfile
+from sympy import Symbol, cse, fraction, numbered_symbols
+from sympy.printing.numpy import NumPyPrinter
+
+# local imports
+from src.config import SYMPY_GENERATED_PATH, SYMPY_PATH
+from src.sympy.base import SymPy_PhotonicCircuit
+from src.sympy.runtime import source_fingerprint
+
+# type hinting
+from sympy.core.expr import Expr
+
+
+def _function_source(
+        name: str,
+        arguments: list[str],
+        expressions: Expr | list[Expr],
+) -> str:
+    """
+    Returns the source of a function of the arguments returning the expressions, after common subexpression
+    elimination. A list of expressions is returned as a list.
+    """
+    is_list = isinstance(expressions, (list, tuple))
+    replacements, reduced = cse(list(expressions) if is_list else [expressions], symbols=numbered_symbols("_x"))
+    printer = NumPyPrinter()
+    lines = [f"def {name}({', '.join(arguments)}):"]
+    lines += [f"    {symbol} = {printer.doprint(expression)}" for symbol, expression in replacements]
+    returned = [printer.doprint(expression) for expression in reduced]
+    lines.append(f"    return [{', '.join(returned)}]" if is_list else f"    return {returned[0]}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_source(circuit_class: type[SymPy_PhotonicCircuit]) -> str:
+    """
+    Returns the source of the generated module of a circuit: its description (CIRCUIT, SOLUTION_KEY, NUM_PINS,
+    PARAMETERS, DELAY_PARAMETERS), the module defining the circuit relative to src/sympy and its fingerprint
+    (SOURCE_FILE, SOURCE_HASH), the functions solution_<pin>(z, *parameters) and fraction_<pin>(z, *parameters),
+    the latter returning [numerator, denominator], and sensitivity_<pin>(z, *parameters), returning the
+    sensitivity_expressions, gathered in the SOLUTIONS, FRACTIONS and SENSITIVITIES tuples, and
+    intrinsic_fwhm(*parameters). The parameters are named and ordered as in parameter_symbols.
+    """
+    circuit = circuit_class()
+    names = list(circuit.parameter_symbols)
+    source_file = os.path.relpath(inspect.getsourcefile(circuit_class), SYMPY_PATH)
+    # the symbols are renamed to valid identifiers, the parameter names
+    renaming = {circuit.z: Symbol("z"), **{symbol: Symbol(name) for name, symbol in circuit.parameter_symbols.items()}}
+    arguments = ["z", *names]
+
+    functions, solutions, fractions, sensitivities = [], [], [], []
+    for pin in range(circuit.num_pins):
+        solution = circuit.solution(pin).xreplace(renaming)
+        functions.append(_function_source(f"solution_{pin}", arguments, solution))
+        functions.append(_function_source(f"fraction_{pin}", arguments, list(fraction(solution))))
+        expressions = [expression.xreplace(renaming) for expression in circuit.sensitivity_expressions(pin)]
+        functions.append(_function_source(f"sensitivity_{pin}", arguments, expressions))
+        solutions.append(f"solution_{pin}")
+        fractions.append(f"fraction_{pin}")
+        sensitivities.append(f"sensitivity_{pin}")
+
+    # the intrinsic FWHM is obtained by evaluating the property on the symbols
+    circuit.numeric_parameters = {name: Symbol(name) for name in names}
+    functions.append(_function_source("intrinsic_fwhm", names, circuit._intrinsic_fwhm))
+
+    header = [
+        '"""',
+        f"Generated by src.sympy.codegen from the solutions of {circuit_class.__name__}, do not edit.",
+        f"Regenerate with: python -m src.sympy.warmup {circuit_class.__name__}",
+        '"""',
+        "import numpy",
+        "",
+        f"CIRCUIT = {circuit_class.__name__!r}",
+        f"SOLUTION_KEY = {circuit.solution_key!r}",
+        f"NUM_PINS = {circuit.num_pins}",
+        f"PARAMETERS = {names!r}",
+        f"DELAY_PARAMETERS = {circuit.delay_parameters!r}",
+        f"SOURCE_FILE = {source_file!r}",
+        f"SOURCE_HASH = {source_fingerprint(source_file)!r}",
+        "",
+        "",
+    ]
+    footer = [
+        f"SOLUTIONS = ({', '.join(solutions)},)",
+        f"FRACTIONS = ({', '.join(fractions)},)",
+        f"SENSITIVITIES = ({', '.join(sensitivities)},)",
+    ]
+    return "\n".join(header) + "\n" + "\n\n".join(functions) + "\n\n" + "\n".join(footer) + "\n"
+
+
+def generate_module(
+        circuit_class: type[SymPy_PhotonicCircuit],
+        directory: str = SYMPY_GENERATED_PATH,
+) -> str:
+    """
+    Writes the generated module of a circuit, <ClassName>.py, to the directory. The file is written to a temporary
+    file and moved in place, so that concurrent writers and readers never see a partial module, and the bytecode of
+    the previous module is removed, as a module regenerated within the same second may have the same size and
+    timestamp.
+
+    Returns:
+        str: The path of the module.
+    """
+    source = generate_source(circuit_class)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{circuit_class.__name__}.py")
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "w") as file:
+            file.write(source)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+    try:
+        os.remove(importlib.util.cache_from_source(path))
+    except FileNotFoundError:
+        pass
+    return path
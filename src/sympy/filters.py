@@ -0,0 +1,97 @@
+# third party imports
+import numpy as np
+from scipy.signal import sosfilt
+
+# local imports
+from src.sympy.utils import polynomial_roots
+
+
+def polynomial_sos(
+        numerator: np.ndarray,
+        denominator: np.ndarray,
+) -> np.ndarray:
+    """
+    Returns the second-order sections of the transfer function sum_n b_n z^-n / sum_n a_n z^-n, with a_0 = 1.
+
+    Every section b_0 + b_1 z^-1 + b_2 z^-2 / (1 + a_1 z^-1 + a_2 z^-2) holds two factors (1 - p z^-1) of the
+    denominator and two factors (1 - q z^-1) or z^-1 of the numerator, so that no high-order polynomial is ever
+    evaluated. The coefficients are complex, as the circuits are not real filters: the poles are not in conjugate
+    pairs, and the sections are formed by taking the poles closest to the unit circle first, each with its two nearest
+    zeros, the remaining numerator factors (pure delays, or zeros beyond the number of poles) filling the sections last.
+
+    Args:
+        numerator (np.ndarray): The numerator coefficients b_n.
+        denominator (np.ndarray): The denominator coefficients a_n, with a_0 = 1.
+
+    Returns:
+        np.ndarray: The sections, with dimensions (num_sections, 6), in the layout of scipy.signal.sosfilt.
+    """
+    numerator = np.asarray(numerator, dtype=complex)
+    denominator = np.asarray(denominator, dtype=complex)
+    nonzero = np.flatnonzero(numerator)
+    if len(nonzero) == 0:
+        return np.array([[0, 0, 0, 1, 0, 0]], dtype=complex)
+
+    # b(z^-1) = b_d z^-d prod_i (1 - q_i z^-1) and a(z^-1) = prod_i (1 - p_i z^-1), the roots in z^-1 being 1/q_i, 1/p_i
+    delay, gain = nonzero[0], numerator[nonzero[0]]
+    zeros = list(polynomial_roots(np.trim_zeros(numerator[delay:], 'b')[::-1]))
+    zeros = [1 / root for root in zeros if root != 0]
+    poles = [1 / root for root in polynomial_roots(np.trim_zeros(denominator, 'b')[::-1]) if root != 0]
+    num_sections = max(int(np.ceil(max(len(zeros) + delay, len(poles)) / 2)), 1)
+
+    poles.sort(key=lambda pole: -np.abs(pole))
+    section_poles = [poles[2 * i:2 * i + 2] for i in range(num_sections)]
+    section_zeros = [[] for _ in range(num_sections)]
+    for i, pair in enumerate(section_poles):
+        for pole in pair:
+            if zeros:
+                nearest = int(np.argmin(np.abs(np.array(zeros) - pole)))
+                section_zeros[i].append(zeros.pop(nearest))
+    # leftover zeros, then the delays, fill the free numerator slots
+    factors = [np.array([1, -zero]) for zero in zeros] + [np.array([0, 1])] * delay
+    sos = np.zeros((num_sections, 6), dtype=complex)
+    for i in range(num_sections):
+        numerator_section = np.array([1], dtype=complex)
+        for zero in section_zeros[i]:
+            numerator_section = np.convolve(numerator_section, [1, -zero])
+        while len(numerator_section) < 3 and factors:
+            numerator_section = np.convolve(numerator_section, factors.pop())
+        denominator_section = np.array([1], dtype=complex)
+        for pole in section_poles[i]:
+            denominator_section = np.convolve(denominator_section, [1, -pole])
+        sos[i, :len(numerator_section)] = numerator_section
+        sos[i, 3:3 + len(denominator_section)] = denominator_section
+    if factors:
+        raise ValueError("The numerator has more factors than the sections can hold")
+    sos[0, :3] *= gain
+    return sos
+
+
+class StreamingIIRFilter:
+    """ Streaming realization of a transfer function as a cascade of second-order sections: process() filters
+    blocks of samples of an arbitrarily long stream, carrying the state of the sections from one block to the
+    next, so that the concatenated outputs equal the output of the whole stream filtered at once. """
+
+    def __init__(self, sos: np.ndarray):
+        """ Initialize the class. """
+        self.sos = np.asarray(sos, dtype=complex)
+        self.state = np.zeros((len(self.sos), 2), dtype=complex)
+
+    def __str__(self):
+        """ Return a string representation of the object. """
+        return f"StreamingIIRFilter ({len(self.sos)} second-order sections)"
+
+    def process(self, block) -> np.ndarray:
+        """ Filter a block of samples, with the state left by the previous blocks. """
+        output, self.state = sosfilt(self.sos, np.asarray(block, dtype=complex), zi=self.state)
+        return output
+
+    def reset(self):
+        """ Clear the state, as before the first block. """
+        self.state = np.zeros_like(self.state)
+
+    def impulse_response(self, length: int) -> np.ndarray:
+        """ Return the first length samples of the impulse response, without affecting the state. """
+        impulse = np.zeros(length, dtype=complex)
+        impulse[0] = 1
+        return sosfilt(self.sos, impulse)
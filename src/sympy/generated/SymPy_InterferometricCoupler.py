@@ -0,0 +1,312 @@
+"""
+Generated by src.sympy.codegen from the solutions of SymPy_InterferometricCoupler, do not edit.
+Regenerate with: python -m src.sympy.warmup SymPy_InterferometricCoupler
+"""
+import numpy
+
+CIRCUIT = 'SymPy_InterferometricCoupler'
+SOLUTION_KEY = '956f948c681b85f3'
+NUM_PINS = 8
+PARAMETERS = ['m', 'n', 'p', 'cross_coupling_1', 'cross_coupling_2', 'self_coupling_1', 'self_coupling_2', 'unitary_loss_coefficient']
+DELAY_PARAMETERS = ['m', 'n', 'p']
+SOURCE_FILE = 'interferometric_coupler.py'
+SOURCE_HASH = 'a0760e1db52d595d'
+
+
+def solution_0(z, m, n, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    return 1
+
+
+def fraction_0(z, m, n, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    return [1, 1]
+
+
+def sensitivity_0(z, m, n, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    return [1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+
+
+def solution_1(z, m, n, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m
+    _x2 = _x0**n
+    _x3 = _x0**p*cross_coupling_2
+    return 1j*_x1*(-_x2*cross_coupling_1*self_coupling_2 - _x3*self_coupling_1)/(_x1*_x2*self_coupling_1*self_coupling_2 - _x1*_x3*cross_coupling_1 - 1)
+
+
+def fraction_1(z, m, n, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m
+    _x2 = _x0**n
+    _x3 = _x0**p*cross_coupling_2
+    return [1j*_x1*(-_x2*cross_coupling_1*self_coupling_2 - _x3*self_coupling_1), _x1*_x2*self_coupling_1*self_coupling_2 - _x1*_x3*cross_coupling_1 - 1]
+
+
+def sensitivity_1(z, m, n, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n
+    _x2 = _x1*self_coupling_2
+    _x3 = _x2*cross_coupling_1
+    _x4 = _x0**p
+    _x5 = _x4*cross_coupling_2
+    _x6 = _x5*self_coupling_1
+    _x7 = _x0**m
+    _x8 = 1j*_x7
+    _x9 = _x8*(-_x3 - _x6)
+    _x10 = _x5*_x7
+    _x11 = _x10*cross_coupling_1
+    _x12 = unitary_loss_coefficient**(-1.0)
+    _x13 = _x12*m
+    _x14 = _x12*p
+    return [_x9, _x1*_x7*self_coupling_1*self_coupling_2 - _x11 - 1, -_x2*_x8, -_x4*_x8*self_coupling_1, -_x5*_x8, -_x1*_x8*cross_coupling_1, _x13*_x9 + _x8*(-_x12*_x3*n - _x14*_x6), -_x10, -_x4*_x7*cross_coupling_1, _x2*_x7, _x1*_x7*self_coupling_1, _x1*_x12*_x7*m*self_coupling_1*self_coupling_2 + _x1*_x12*_x7*n*self_coupling_1*self_coupling_2 - _x11*_x13 - _x11*_x14]
+
+
+def solution_2(z, m, n, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m
+    _x2 = _x0**n
+    _x3 = _x1*_x2*self_coupling_2
+    return (_x3*cross_coupling_1**2 + _x3*self_coupling_1**2 - self_coupling_1)/(-_x0**p*_x1*cross_coupling_1*cross_coupling_2 + _x1*_x2*self_coupling_1*self_coupling_2 - 1)
+
+
+def fraction_2(z, m, n, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m
+    _x2 = _x0**n
+    _x3 = _x1*_x2*self_coupling_2
+    return [_x3*cross_coupling_1**2 + _x3*self_coupling_1**2 - self_coupling_1, -_x0**p*_x1*cross_coupling_1*cross_coupling_2 + _x1*_x2*self_coupling_1*self_coupling_2 - 1]
+
+
+def sensitivity_2(z, m, n, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m
+    _x2 = _x0**n
+    _x3 = _x1*_x2
+    _x4 = _x3*cross_coupling_1**2
+    _x5 = _x4*self_coupling_2
+    _x6 = _x3*self_coupling_1**2
+    _x7 = _x6*self_coupling_2
+    _x8 = _x0**p*_x1
+    _x9 = _x8*cross_coupling_2
+    _x10 = _x9*cross_coupling_1
+    _x11 = _x3*self_coupling_2
+    _x12 = unitary_loss_coefficient**(-1.0)
+    _x13 = _x12*m
+    _x14 = _x12*n
+    return [_x5 + _x7 - self_coupling_1, _x1*_x2*self_coupling_1*self_coupling_2 - _x10 - 1, 2*_x11*cross_coupling_1, 0, 2*_x11*self_coupling_1 - 1, _x4 + _x6, _x13*_x5 + _x13*_x7 + _x14*_x5 + _x14*_x7, -_x9, -_x8*cross_coupling_1, _x11, _x3*self_coupling_1, _x1*_x12*_x2*m*self_coupling_1*self_coupling_2 + _x1*_x12*_x2*n*self_coupling_1*self_coupling_2 - _x10*_x12*p - _x10*_x13]
+
+
+def solution_3(z, m, n, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m
+    _x2 = _x0**p*_x1*cross_coupling_2
+    return 1j*(-_x2*cross_coupling_1**2 - _x2*self_coupling_1**2 - cross_coupling_1)/(_x0**n*_x1*self_coupling_1*self_coupling_2 - _x2*cross_coupling_1 - 1)
+
+
+def fraction_3(z, m, n, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m
+    _x2 = _x0**p*_x1*cross_coupling_2
+    return [1j*(-_x2*cross_coupling_1**2 - _x2*self_coupling_1**2 - cross_coupling_1), _x0**n*_x1*self_coupling_1*self_coupling_2 - _x2*cross_coupling_1 - 1]
+
+
+def sensitivity_3(z, m, n, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m
+    _x2 = _x0**p*_x1
+    _x3 = _x2*cross_coupling_1**2
+    _x4 = _x3*cross_coupling_2
+    _x5 = _x2*self_coupling_1**2
+    _x6 = _x5*cross_coupling_2
+    _x7 = _x2*cross_coupling_2
+    _x8 = _x7*cross_coupling_1
+    _x9 = _x0**n
+    _x10 = unitary_loss_coefficient**(-1.0)
+    _x11 = _x10*m
+    _x12 = _x10*p
+    _x13 = _x1*_x9
+    return [1j*(-_x4 - _x6 - cross_coupling_1), _x1*_x9*self_coupling_1*self_coupling_2 - _x8 - 1, 1j*(-2*_x8 - 1), 1j*(-_x3 - _x5), -2*1j*_x7*self_coupling_1, 0, 1j*(-_x11*_x4 - _x11*_x6 - _x12*_x4 - _x12*_x6), -_x7, -_x2*cross_coupling_1, _x13*self_coupling_2, _x13*self_coupling_1, _x1*_x10*_x9*m*self_coupling_1*self_coupling_2 + _x1*_x10*_x9*n*self_coupling_1*self_coupling_2 - _x11*_x8 - _x12*_x8]
+
+
+def solution_4(z, m, n, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x0**m
+    _x3 = _x0**n
+    _x4 = _x2*_x3*self_coupling_2
+    return _x1*(_x4*cross_coupling_1**2 + _x4*self_coupling_1**2 - self_coupling_1)/(-_x1*_x2*cross_coupling_1*cross_coupling_2 + _x2*_x3*self_coupling_1*self_coupling_2 - 1)
+
+
+def fraction_4(z, m, n, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x0**m
+    _x3 = _x0**n
+    _x4 = _x2*_x3*self_coupling_2
+    return [_x1*(_x4*cross_coupling_1**2 + _x4*self_coupling_1**2 - self_coupling_1), -_x1*_x2*cross_coupling_1*cross_coupling_2 + _x2*_x3*self_coupling_1*self_coupling_2 - 1]
+
+
+def sensitivity_4(z, m, n, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x0**m
+    _x3 = _x0**n
+    _x4 = _x2*_x3
+    _x5 = _x4*cross_coupling_1**2
+    _x6 = _x5*self_coupling_2
+    _x7 = _x4*self_coupling_1**2
+    _x8 = _x7*self_coupling_2
+    _x9 = _x1*(_x6 + _x8 - self_coupling_1)
+    _x10 = _x1*_x2
+    _x11 = _x10*cross_coupling_2
+    _x12 = _x11*cross_coupling_1
+    _x13 = _x4*self_coupling_2
+    _x14 = unitary_loss_coefficient**(-1.0)
+    _x15 = _x14*p
+    _x16 = _x14*m
+    _x17 = _x14*n
+    return [_x9, -_x12 + _x2*_x3*self_coupling_1*self_coupling_2 - 1, 2*_x1*_x13*cross_coupling_1, 0, _x1*(2*_x13*self_coupling_1 - 1), _x1*(_x5 + _x7), _x1*(_x16*_x6 + _x16*_x8 + _x17*_x6 + _x17*_x8) + _x15*_x9, -_x11, -_x10*cross_coupling_1, _x13, _x4*self_coupling_1, -_x12*_x15 - _x12*_x16 + _x14*_x2*_x3*m*self_coupling_1*self_coupling_2 + _x14*_x2*_x3*n*self_coupling_1*self_coupling_2]
+
+
+def solution_5(z, m, n, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n
+    _x2 = _x0**m
+    _x3 = _x0**p*_x2*cross_coupling_2
+    return 1j*_x1*(-_x3*cross_coupling_1**2 - _x3*self_coupling_1**2 - cross_coupling_1)/(_x1*_x2*self_coupling_1*self_coupling_2 - _x3*cross_coupling_1 - 1)
+
+
+def fraction_5(z, m, n, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n
+    _x2 = _x0**m
+    _x3 = _x0**p*_x2*cross_coupling_2
+    return [1j*_x1*(-_x3*cross_coupling_1**2 - _x3*self_coupling_1**2 - cross_coupling_1), _x1*_x2*self_coupling_1*self_coupling_2 - _x3*cross_coupling_1 - 1]
+
+
+def sensitivity_5(z, m, n, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m
+    _x2 = _x0**p*_x1
+    _x3 = _x2*cross_coupling_1**2
+    _x4 = _x3*cross_coupling_2
+    _x5 = _x2*self_coupling_1**2
+    _x6 = _x5*cross_coupling_2
+    _x7 = _x0**n
+    _x8 = 1j*_x7
+    _x9 = _x8*(-_x4 - _x6 - cross_coupling_1)
+    _x10 = _x2*cross_coupling_2
+    _x11 = _x10*cross_coupling_1
+    _x12 = unitary_loss_coefficient**(-1.0)
+    _x13 = _x12*m
+    _x14 = _x12*p
+    _x15 = _x1*_x7
+    return [_x9, _x1*_x7*self_coupling_1*self_coupling_2 - _x11 - 1, _x8*(-2*_x11 - 1), _x8*(-_x3 - _x5), -2*_x10*_x8*self_coupling_1, 0, _x12*_x9*n + _x8*(-_x13*_x4 - _x13*_x6 - _x14*_x4 - _x14*_x6), -_x10, -_x2*cross_coupling_1, _x15*self_coupling_2, _x15*self_coupling_1, _x1*_x12*_x7*m*self_coupling_1*self_coupling_2 + _x1*_x12*_x7*n*self_coupling_1*self_coupling_2 - _x11*_x13 - _x11*_x14]
+
+
+def solution_6(z, m, n, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x0**m
+    _x3 = cross_coupling_1*cross_coupling_2
+    _x4 = _x0**n
+    _x5 = cross_coupling_2**2
+    _x6 = _x1*_x2*_x4
+    _x7 = _x6*cross_coupling_1**2
+    _x8 = self_coupling_2**2
+    _x9 = _x6*self_coupling_1**2
+    return (-_x1*self_coupling_1*self_coupling_2 + _x3*_x4 + _x5*_x7 + _x5*_x9 + _x7*_x8 + _x8*_x9)/(-_x1*_x2*_x3 + _x2*_x4*self_coupling_1*self_coupling_2 - 1)
+
+
+def fraction_6(z, m, n, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n
+    _x2 = cross_coupling_1*cross_coupling_2
+    _x3 = _x0**p
+    _x4 = cross_coupling_2**2
+    _x5 = _x0**m
+    _x6 = _x1*_x3*_x5
+    _x7 = _x6*cross_coupling_1**2
+    _x8 = self_coupling_2**2
+    _x9 = _x6*self_coupling_1**2
+    return [_x1*_x2 - _x3*self_coupling_1*self_coupling_2 + _x4*_x7 + _x4*_x9 + _x7*_x8 + _x8*_x9, _x1*_x5*self_coupling_1*self_coupling_2 - _x2*_x3*_x5 - 1]
+
+
+def sensitivity_6(z, m, n, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n
+    _x2 = _x1*cross_coupling_2
+    _x3 = _x2*cross_coupling_1
+    _x4 = _x0**p
+    _x5 = _x4*self_coupling_2
+    _x6 = _x5*self_coupling_1
+    _x7 = cross_coupling_2**2
+    _x8 = cross_coupling_1**2
+    _x9 = _x0**m
+    _x10 = _x4*_x9
+    _x11 = _x1*_x10
+    _x12 = _x11*_x8
+    _x13 = _x12*_x7
+    _x14 = self_coupling_2**2
+    _x15 = _x12*_x14
+    _x16 = self_coupling_1**2
+    _x17 = _x11*_x16
+    _x18 = _x17*_x7
+    _x19 = _x14*_x17
+    _x20 = _x10*cross_coupling_2
+    _x21 = _x20*cross_coupling_1
+    _x22 = _x1*cross_coupling_1
+    _x23 = 2*_x10
+    _x24 = _x22*_x23
+    _x25 = _x2*_x23
+    _x26 = _x4*self_coupling_1
+    _x27 = _x1*_x9
+    _x28 = 2*_x27
+    _x29 = _x26*_x28
+    _x30 = _x28*_x5
+    _x31 = unitary_loss_coefficient**(-1.0)
+    _x32 = _x31*n
+    _x33 = _x31*p
+    _x34 = _x31*m
+    return [_x13 + _x15 + _x18 + _x19 + _x3 - _x6, _x1*_x9*self_coupling_1*self_coupling_2 - _x21 - 1, _x14*_x24 + _x2 + _x24*_x7, _x16*_x25 + _x22 + _x25*_x8, _x14*_x29 + _x29*_x7 - _x5, _x16*_x30 - _x26 + _x30*_x8, _x13*_x32 + _x13*_x33 + _x13*_x34 + _x15*_x32 + _x15*_x33 + _x15*_x34 + _x18*_x32 + _x18*_x33 + _x18*_x34 + _x19*_x32 + _x19*_x33 + _x19*_x34 + _x3*_x32 - _x33*_x6, -_x20, -_x10*cross_coupling_1, _x27*self_coupling_2, _x27*self_coupling_1, _x1*_x31*_x9*m*self_coupling_1*self_coupling_2 + _x1*_x31*_x9*n*self_coupling_1*self_coupling_2 - _x21*_x33 - _x21*_x34]
+
+
+def solution_7(z, m, n, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n
+    _x2 = _x0**p*cross_coupling_2
+    _x3 = _x0**m
+    return 1j*(-_x1*cross_coupling_1*self_coupling_2 - _x2*self_coupling_1)/(_x1*_x3*self_coupling_1*self_coupling_2 - _x2*_x3*cross_coupling_1 - 1)
+
+
+def fraction_7(z, m, n, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n
+    _x2 = _x0**p*cross_coupling_2
+    _x3 = _x0**m
+    return [1j*(-_x1*cross_coupling_1*self_coupling_2 - _x2*self_coupling_1), _x1*_x3*self_coupling_1*self_coupling_2 - _x2*_x3*cross_coupling_1 - 1]
+
+
+def sensitivity_7(z, m, n, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n
+    _x2 = _x1*self_coupling_2
+    _x3 = _x2*cross_coupling_1
+    _x4 = _x0**p
+    _x5 = _x4*self_coupling_1
+    _x6 = _x5*cross_coupling_2
+    _x7 = _x0**m
+    _x8 = _x4*cross_coupling_2
+    _x9 = _x7*_x8
+    _x10 = _x9*cross_coupling_1
+    _x11 = unitary_loss_coefficient**(-1.0)
+    _x12 = _x11*p
+    return [1j*(-_x3 - _x6), _x1*_x7*self_coupling_1*self_coupling_2 - _x10 - 1, -1j*_x2, -1j*_x5, -1j*_x8, -1j*_x1*cross_coupling_1, 1j*(-_x11*_x3*n - _x12*_x6), -_x9, -_x4*_x7*cross_coupling_1, _x2*_x7, _x1*_x7*self_coupling_1, _x1*_x11*_x7*m*self_coupling_1*self_coupling_2 + _x1*_x11*_x7*n*self_coupling_1*self_coupling_2 - _x10*_x11*m - _x10*_x12]
+
+
+def intrinsic_fwhm(m, n, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    return 2 - 2*unitary_loss_coefficient
+
+
+SOLUTIONS = (solution_0, solution_1, solution_2, solution_3, solution_4, solution_5, solution_6, solution_7,)
+FRACTIONS = (fraction_0, fraction_1, fraction_2, fraction_3, fraction_4, fraction_5, fraction_6, fraction_7,)
+SENSITIVITIES = (sensitivity_0, sensitivity_1, sensitivity_2, sensitivity_3, sensitivity_4, sensitivity_5, sensitivity_6, sensitivity_7,)
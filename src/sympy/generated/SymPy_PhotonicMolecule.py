@@ -0,0 +1,386 @@
+"""
+Generated by src.sympy.codegen from the solutions of SymPy_PhotonicMolecule, do not edit.
+Regenerate with: python -m src.sympy.warmup SymPy_PhotonicMolecule
+"""
+import numpy
+
+CIRCUIT = 'SymPy_PhotonicMolecule'
+SOLUTION_KEY = 'ea56f881b2953678'
+NUM_PINS = 8
+PARAMETERS = ['m_1', 'm_2', 'p', 'cross_coupling_1', 'cross_coupling_2', 'self_coupling_1', 'self_coupling_2', 'unitary_loss_coefficient']
+DELAY_PARAMETERS = ['m_1', 'm_2', 'p']
+SOURCE_FILE = 'photonic_molecule.py'
+SOURCE_HASH = '3e15cfd837354aad'
+
+
+def solution_0(z, m_1, m_2, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    return 1
+
+
+def fraction_0(z, m_1, m_2, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    return [1, 1]
+
+
+def sensitivity_0(z, m_1, m_2, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    return [1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+
+
+def solution_1(z, m_1, m_2, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x0**m_1*_x0**m_2
+    _x3 = _x2*self_coupling_1
+    _x4 = _x1*cross_coupling_2**2
+    _x5 = _x1*self_coupling_2**2
+    return 1j*_x2*cross_coupling_1*(-_x4 - _x5 + self_coupling_2)/(-_x1*self_coupling_2 + _x3*_x4 + _x3*_x5 - _x3*self_coupling_2 + 1)
+
+
+def fraction_1(z, m_1, m_2, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x1*cross_coupling_2**2
+    _x3 = _x1*self_coupling_2**2
+    _x4 = _x0**m_1*_x0**m_2
+    _x5 = _x4*self_coupling_1
+    return [1j*_x4*cross_coupling_1*(-_x2 - _x3 + self_coupling_2), -_x1*self_coupling_2 + _x2*_x5 + _x3*_x5 - _x5*self_coupling_2 + 1]
+
+
+def sensitivity_1(z, m_1, m_2, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x1*cross_coupling_2**2
+    _x3 = _x1*self_coupling_2**2
+    _x4 = _x0**m_1
+    _x5 = _x0**m_2
+    _x6 = _x4*_x5
+    _x7 = 1j*_x6
+    _x8 = _x7*(-_x2 - _x3 + self_coupling_2)
+    _x9 = _x8*cross_coupling_1
+    _x10 = _x1*self_coupling_2
+    _x11 = _x6*self_coupling_2
+    _x12 = _x11*self_coupling_1
+    _x13 = _x6*self_coupling_1
+    _x14 = _x13*_x2
+    _x15 = _x13*_x3
+    _x16 = _x7*cross_coupling_1
+    _x17 = 2*_x1*cross_coupling_2
+    _x18 = unitary_loss_coefficient**(-1.0)
+    _x19 = _x18*_x9
+    _x20 = _x18*p
+    _x21 = _x2*_x20
+    _x22 = _x20*_x3
+    _x23 = _x12*_x18
+    _x24 = _x18*m_1
+    _x25 = _x18*m_2
+    return [_x9, -_x10 - _x12 + _x14 + _x15 + 1, _x8, -_x16*_x17, 0, _x16*(1 - 2*_x10), _x16*(-_x21 - _x22) + _x19*m_1 + _x19*m_2, 0, _x13*_x17, -_x11 + _x2*_x6 + _x3*_x6, 2*_x1*_x4*_x5*self_coupling_1*self_coupling_2 - _x1 - _x13, -_x10*_x20 + _x13*_x21 + _x13*_x22 + _x14*_x24 + _x14*_x25 + _x15*_x24 + _x15*_x25 - _x23*m_1 - _x23*m_2]
+
+
+def solution_2(z, m_1, m_2, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x1*self_coupling_2
+    _x3 = _x0**m_1*_x0**m_2
+    _x4 = _x3*self_coupling_2
+    _x5 = cross_coupling_2**2
+    _x6 = _x1*_x3
+    _x7 = _x6*self_coupling_1
+    _x8 = self_coupling_2**2
+    _x9 = cross_coupling_1**2
+    _x10 = self_coupling_1**2
+    _x11 = _x6*_x9
+    _x12 = _x10*_x6
+    return (-_x10*_x4 + _x11*_x5 + _x11*_x8 + _x12*_x5 + _x12*_x8 - _x2*self_coupling_1 - _x4*_x9 + self_coupling_1)/(-_x2 - _x4*self_coupling_1 + _x5*_x7 + _x7*_x8 + 1)
+
+
+def fraction_2(z, m_1, m_2, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x1*self_coupling_2
+    _x3 = cross_coupling_1**2
+    _x4 = _x0**m_1*_x0**m_2
+    _x5 = _x4*self_coupling_2
+    _x6 = self_coupling_1**2
+    _x7 = cross_coupling_2**2
+    _x8 = _x1*_x4
+    _x9 = _x3*_x8
+    _x10 = self_coupling_2**2
+    _x11 = _x6*_x8
+    _x12 = _x8*self_coupling_1
+    return [_x10*_x11 + _x10*_x9 + _x11*_x7 - _x2*self_coupling_1 - _x3*_x5 - _x5*_x6 + _x7*_x9 + self_coupling_1, _x10*_x12 + _x12*_x7 - _x2 - _x5*self_coupling_1 + 1]
+
+
+def sensitivity_2(z, m_1, m_2, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x1*self_coupling_2
+    _x3 = _x2*self_coupling_1
+    _x4 = cross_coupling_1**2
+    _x5 = _x0**m_1
+    _x6 = _x0**m_2
+    _x7 = _x5*_x6
+    _x8 = _x4*_x7
+    _x9 = _x8*self_coupling_2
+    _x10 = self_coupling_1**2
+    _x11 = _x10*_x7
+    _x12 = _x11*self_coupling_2
+    _x13 = cross_coupling_2**2
+    _x14 = _x1*_x8
+    _x15 = _x13*_x14
+    _x16 = self_coupling_2**2
+    _x17 = _x14*_x16
+    _x18 = _x1*_x11
+    _x19 = _x13*_x18
+    _x20 = _x16*_x18
+    _x21 = _x7*self_coupling_2
+    _x22 = _x21*self_coupling_1
+    _x23 = _x1*self_coupling_1
+    _x24 = _x23*_x7
+    _x25 = _x13*_x24
+    _x26 = _x16*_x24
+    _x27 = 1 - _x2
+    _x28 = 2*cross_coupling_1
+    _x29 = _x1*_x7
+    _x30 = _x13*_x29
+    _x31 = _x16*_x29
+    _x32 = 2*cross_coupling_2
+    _x33 = unitary_loss_coefficient**(-1.0)
+    _x34 = _x33*p
+    _x35 = _x33*m_1
+    _x36 = _x33*m_2
+    return [-_x12 + _x15 + _x17 + _x19 + _x20 - _x3 - _x9 + self_coupling_1, -_x22 + _x25 + _x26 + _x27, -_x21*_x28 + _x28*_x30 + _x28*_x31, _x14*_x32 + _x18*_x32, -2*_x22 + 2*_x25 + 2*_x26 + _x27, 2*_x1*_x10*_x5*_x6*self_coupling_2 + 2*_x1*_x4*_x5*_x6*self_coupling_2 - _x11 - _x23 - _x8, -_x12*_x35 - _x12*_x36 + _x15*_x34 + _x15*_x35 + _x15*_x36 + _x17*_x34 + _x17*_x35 + _x17*_x36 + _x19*_x34 + _x19*_x35 + _x19*_x36 + _x20*_x34 + _x20*_x35 + _x20*_x36 - _x3*_x34 - _x35*_x9 - _x36*_x9, 0, _x24*_x32, -_x21 + _x30 + _x31, 2*_x1*_x5*_x6*self_coupling_1*self_coupling_2 - _x1 - _x7*self_coupling_1, -_x2*_x34 - _x22*_x35 - _x22*_x36 + _x25*_x34 + _x25*_x35 + _x25*_x36 + _x26*_x34 + _x26*_x35 + _x26*_x36]
+
+
+def solution_3(z, m_1, m_2, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x1*self_coupling_2
+    _x3 = _x0**m_1*_x0**m_2*self_coupling_1
+    _x4 = _x1*_x3
+    return 1j*cross_coupling_1*(1 - _x2)/(-_x2 - _x3*self_coupling_2 + _x4*cross_coupling_2**2 + _x4*self_coupling_2**2 + 1)
+
+
+def fraction_3(z, m_1, m_2, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x1*self_coupling_2
+    _x3 = _x0**m_1*_x0**m_2*self_coupling_1
+    _x4 = _x1*_x3
+    return [1j*cross_coupling_1*(1 - _x2), -_x2 - _x3*self_coupling_2 + _x4*cross_coupling_2**2 + _x4*self_coupling_2**2 + 1]
+
+
+def sensitivity_3(z, m_1, m_2, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x1*self_coupling_2
+    _x3 = 1j*(1 - _x2)
+    _x4 = _x0**m_1
+    _x5 = _x0**m_2
+    _x6 = _x4*_x5
+    _x7 = _x6*self_coupling_2
+    _x8 = _x7*self_coupling_1
+    _x9 = cross_coupling_2**2
+    _x10 = _x6*self_coupling_1
+    _x11 = _x1*_x10
+    _x12 = _x11*_x9
+    _x13 = self_coupling_2**2
+    _x14 = _x11*_x13
+    _x15 = 1j*cross_coupling_1
+    _x16 = unitary_loss_coefficient**(-1.0)
+    _x17 = _x16*p
+    _x18 = _x17*_x2
+    _x19 = _x1*_x6
+    _x20 = _x16*_x8
+    _x21 = _x16*m_1
+    _x22 = _x16*m_2
+    return [_x3*cross_coupling_1, _x12 + _x14 - _x2 - _x8 + 1, _x3, 0, 0, -_x1*_x15, -_x15*_x18, 0, 2*_x11*cross_coupling_2, _x13*_x19 + _x19*_x9 - _x7, 2*_x1*_x4*_x5*self_coupling_1*self_coupling_2 - _x1 - _x10, _x12*_x17 + _x12*_x21 + _x12*_x22 + _x14*_x17 + _x14*_x21 + _x14*_x22 - _x18 - _x20*m_1 - _x20*m_2]
+
+
+def solution_4(z, m_1, m_2, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x0**p
+    _x3 = _x0**m_1*_x1*self_coupling_1
+    _x4 = _x2*_x3
+    return -_x1*_x2*cross_coupling_1*cross_coupling_2/(-_x2*self_coupling_2 - _x3*self_coupling_2 + _x4*cross_coupling_2**2 + _x4*self_coupling_2**2 + 1)
+
+
+def fraction_4(z, m_1, m_2, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x0**m_2
+    _x3 = _x1*_x2
+    _x4 = _x0**m_1*self_coupling_1
+    _x5 = _x3*_x4
+    return [-_x3*cross_coupling_1*cross_coupling_2, -_x1*self_coupling_2 - _x2*_x4*self_coupling_2 + _x5*cross_coupling_2**2 + _x5*self_coupling_2**2 + 1]
+
+
+def sensitivity_4(z, m_1, m_2, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x0**m_2
+    _x3 = _x1*_x2
+    _x4 = _x3*cross_coupling_2
+    _x5 = _x4*cross_coupling_1
+    _x6 = _x1*self_coupling_2
+    _x7 = _x0**m_1
+    _x8 = _x2*_x7
+    _x9 = _x8*self_coupling_2
+    _x10 = _x9*self_coupling_1
+    _x11 = _x3*_x7
+    _x12 = _x11*cross_coupling_2**2
+    _x13 = _x12*self_coupling_1
+    _x14 = _x11*self_coupling_2**2
+    _x15 = _x14*self_coupling_1
+    _x16 = unitary_loss_coefficient**(-1.0)
+    _x17 = _x16*m_2
+    _x18 = _x16*p
+    _x19 = _x16*m_1
+    return [-_x5, -_x10 + _x13 + _x15 - _x6 + 1, -_x4, -_x3*cross_coupling_1, 0, 0, -_x17*_x5 - _x18*_x5, 0, 2*_x4*_x7*self_coupling_1, _x12 + _x14 - _x9, 2*_x1*_x2*_x7*self_coupling_1*self_coupling_2 - _x1 - _x8*self_coupling_1, -_x10*_x17 - _x10*_x19 + _x13*_x17 + _x13*_x18 + _x13*_x19 + _x15*_x17 + _x15*_x18 + _x15*_x19 - _x18*_x6]
+
+
+def solution_5(z, m_1, m_2, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x0**p
+    _x3 = _x2*self_coupling_2
+    _x4 = _x0**m_1*_x1*self_coupling_1
+    _x5 = _x2*_x4
+    return 1j*_x1*cross_coupling_1*(1 - _x3)/(-_x3 - _x4*self_coupling_2 + _x5*cross_coupling_2**2 + _x5*self_coupling_2**2 + 1)
+
+
+def fraction_5(z, m_1, m_2, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x0**p
+    _x3 = _x2*self_coupling_2
+    _x4 = _x0**m_1*_x1*self_coupling_1
+    _x5 = _x2*_x4
+    return [1j*_x1*cross_coupling_1*(1 - _x3), -_x3 - _x4*self_coupling_2 + _x5*cross_coupling_2**2 + _x5*self_coupling_2**2 + 1]
+
+
+def sensitivity_5(z, m_1, m_2, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x1*self_coupling_2
+    _x3 = _x0**m_2
+    _x4 = 1j*_x3
+    _x5 = _x4*(1 - _x2)
+    _x6 = _x5*cross_coupling_1
+    _x7 = _x0**m_1
+    _x8 = _x3*_x7
+    _x9 = _x8*self_coupling_2
+    _x10 = _x9*self_coupling_1
+    _x11 = cross_coupling_2**2
+    _x12 = _x8*self_coupling_1
+    _x13 = _x1*_x12
+    _x14 = _x11*_x13
+    _x15 = self_coupling_2**2
+    _x16 = _x13*_x15
+    _x17 = _x4*cross_coupling_1
+    _x18 = unitary_loss_coefficient**(-1.0)
+    _x19 = _x18*p
+    _x20 = _x19*_x2
+    _x21 = _x18*m_2
+    _x22 = _x1*_x8
+    _x23 = _x18*m_1
+    return [_x6, -_x10 + _x14 + _x16 - _x2 + 1, _x5, 0, 0, -_x1*_x17, -_x17*_x20 + _x21*_x6, 0, 2*_x13*cross_coupling_2, _x11*_x22 + _x15*_x22 - _x9, 2*_x1*_x3*_x7*self_coupling_1*self_coupling_2 - _x1 - _x12, -_x10*_x21 - _x10*_x23 + _x14*_x19 + _x14*_x21 + _x14*_x23 + _x16*_x19 + _x16*_x21 + _x16*_x23 - _x20]
+
+
+def solution_6(z, m_1, m_2, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x0**p
+    _x3 = _x0**m_1*_x1*self_coupling_1
+    _x4 = _x2*_x3
+    return -_x1*cross_coupling_1*cross_coupling_2/(-_x2*self_coupling_2 - _x3*self_coupling_2 + _x4*cross_coupling_2**2 + _x4*self_coupling_2**2 + 1)
+
+
+def fraction_6(z, m_1, m_2, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x0**p
+    _x3 = _x0**m_1*_x1*self_coupling_1
+    _x4 = _x2*_x3
+    return [-_x1*cross_coupling_1*cross_coupling_2, -_x2*self_coupling_2 - _x3*self_coupling_2 + _x4*cross_coupling_2**2 + _x4*self_coupling_2**2 + 1]
+
+
+def sensitivity_6(z, m_1, m_2, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x1*cross_coupling_2
+    _x3 = _x2*cross_coupling_1
+    _x4 = _x0**p
+    _x5 = _x4*self_coupling_2
+    _x6 = _x0**m_1
+    _x7 = _x1*_x6
+    _x8 = _x7*self_coupling_2
+    _x9 = _x8*self_coupling_1
+    _x10 = cross_coupling_2**2
+    _x11 = _x7*self_coupling_1
+    _x12 = _x11*_x4
+    _x13 = _x10*_x12
+    _x14 = self_coupling_2**2
+    _x15 = _x12*_x14
+    _x16 = unitary_loss_coefficient**(-1.0)
+    _x17 = _x16*m_2
+    _x18 = _x4*_x7
+    _x19 = _x16*p
+    _x20 = _x16*m_1
+    return [-_x3, _x13 + _x15 - _x5 - _x9 + 1, -_x2, -_x1*cross_coupling_1, 0, 0, -_x17*_x3, 0, 2*_x2*_x4*_x6*self_coupling_1, _x10*_x18 + _x14*_x18 - _x8, 2*_x1*_x4*_x6*self_coupling_1*self_coupling_2 - _x11 - _x4, _x13*_x17 + _x13*_x19 + _x13*_x20 + _x15*_x17 + _x15*_x19 + _x15*_x20 - _x17*_x9 - _x19*_x5 - _x20*_x9]
+
+
+def solution_7(z, m_1, m_2, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x0**p
+    _x3 = _x2*cross_coupling_2**2
+    _x4 = _x2*self_coupling_2**2
+    _x5 = _x0**m_1*_x1*self_coupling_1
+    return 1j*_x1*cross_coupling_1*(-_x3 - _x4 + self_coupling_2)/(-_x2*self_coupling_2 + _x3*_x5 + _x4*_x5 - _x5*self_coupling_2 + 1)
+
+
+def fraction_7(z, m_1, m_2, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x0**p
+    _x3 = _x2*cross_coupling_2**2
+    _x4 = _x2*self_coupling_2**2
+    _x5 = _x0**m_1*_x1*self_coupling_1
+    return [1j*_x1*cross_coupling_1*(-_x3 - _x4 + self_coupling_2), -_x2*self_coupling_2 + _x3*_x5 + _x4*_x5 - _x5*self_coupling_2 + 1]
+
+
+def sensitivity_7(z, m_1, m_2, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x1*cross_coupling_2**2
+    _x3 = _x1*self_coupling_2**2
+    _x4 = _x0**m_2
+    _x5 = 1j*_x4
+    _x6 = _x5*(-_x2 - _x3 + self_coupling_2)
+    _x7 = _x6*cross_coupling_1
+    _x8 = _x1*self_coupling_2
+    _x9 = _x0**m_1
+    _x10 = _x4*_x9
+    _x11 = _x10*self_coupling_2
+    _x12 = _x11*self_coupling_1
+    _x13 = _x10*self_coupling_1
+    _x14 = _x13*_x2
+    _x15 = _x13*_x3
+    _x16 = _x5*cross_coupling_1
+    _x17 = 2*_x1*cross_coupling_2
+    _x18 = unitary_loss_coefficient**(-1.0)
+    _x19 = _x18*m_2
+    _x20 = _x18*p
+    _x21 = _x2*_x20
+    _x22 = _x20*_x3
+    _x23 = _x18*m_1
+    return [_x7, -_x12 + _x14 + _x15 - _x8 + 1, _x6, -_x16*_x17, 0, _x16*(1 - 2*_x8), _x16*(-_x21 - _x22) + _x19*_x7, 0, _x13*_x17, _x10*_x2 + _x10*_x3 - _x11, 2*_x1*_x4*_x9*self_coupling_1*self_coupling_2 - _x1 - _x13, -_x12*_x19 - _x12*_x23 + _x13*_x21 + _x13*_x22 + _x14*_x19 + _x14*_x23 + _x15*_x19 + _x15*_x23 - _x20*_x8]
+
+
+def intrinsic_fwhm(m_1, m_2, p, cross_coupling_1, cross_coupling_2, self_coupling_1, self_coupling_2, unitary_loss_coefficient):
+    return 2 - 2*unitary_loss_coefficient
+
+
+SOLUTIONS = (solution_0, solution_1, solution_2, solution_3, solution_4, solution_5, solution_6, solution_7,)
+FRACTIONS = (fraction_0, fraction_1, fraction_2, fraction_3, fraction_4, fraction_5, fraction_6, fraction_7,)
+SENSITIVITIES = (sensitivity_0, sensitivity_1, sensitivity_2, sensitivity_3, sensitivity_4, sensitivity_5, sensitivity_6, sensitivity_7,)
@@ -0,0 +1,1005 @@
+"""
+Generated by src.sympy.codegen from the solutions of SymPy_ResonantInterferometricCoupler, do not edit.
+Regenerate with: python -m src.sympy.warmup SymPy_ResonantInterferometricCoupler
+"""
+import numpy
+
+CIRCUIT = 'SymPy_ResonantInterferometricCoupler'
+SOLUTION_KEY = '283253acd196b99b'
+NUM_PINS = 12
+PARAMETERS = ['m_1', 'm_2', 'n_1', 'n_2', 'p', 'cross_coupling_1', 'cross_coupling_2', 'cross_coupling_a', 'self_coupling_1', 'self_coupling_2', 'self_coupling_a', 'unitary_loss_coefficient']
+DELAY_PARAMETERS = ['m_1', 'm_2', 'n_1', 'n_2', 'p']
+SOURCE_FILE = 'resonant_interferometric_coupler.py'
+SOURCE_HASH = '1ec2de7695fd68ce'
+
+
+def solution_0(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    return 1
+
+
+def fraction_0(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    return [1, 1]
+
+
+def sensitivity_0(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    return [1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+
+
+def solution_1(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_1
+    _x2 = _x0**m_2
+    _x3 = _x0**p
+    _x4 = _x3*self_coupling_a
+    _x5 = _x2*self_coupling_2
+    _x6 = _x0**n_1
+    _x7 = _x0**n_2
+    _x8 = cross_coupling_a**2
+    _x9 = _x3*_x6*_x7*cross_coupling_2
+    _x10 = _x9*self_coupling_1
+    _x11 = self_coupling_a**2
+    _x12 = _x1*_x9*cross_coupling_1
+    return 1j*_x1*(-_x10*_x11 - _x10*_x8 + _x2*cross_coupling_1*self_coupling_2 - _x4*_x5*cross_coupling_1 + _x6*_x7*cross_coupling_2*self_coupling_1*self_coupling_a)/(_x1*_x2*_x3*self_coupling_1*self_coupling_2*self_coupling_a - _x1*_x5*self_coupling_1 + _x1*_x6*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a - _x11*_x12 - _x12*_x8 - _x4 + 1)
+
+
+def fraction_1(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_1
+    _x2 = _x0**m_2
+    _x3 = _x0**p
+    _x4 = _x3*self_coupling_a
+    _x5 = _x2*self_coupling_2
+    _x6 = _x0**n_1
+    _x7 = _x0**n_2
+    _x8 = cross_coupling_a**2
+    _x9 = _x6*_x7*cross_coupling_2
+    _x10 = _x3*_x9*self_coupling_1
+    _x11 = self_coupling_a**2
+    _x12 = _x1*_x3*_x9*cross_coupling_1
+    return [1j*_x1*(-_x10*_x11 - _x10*_x8 + _x2*cross_coupling_1*self_coupling_2 - _x4*_x5*cross_coupling_1 + _x6*_x7*cross_coupling_2*self_coupling_1*self_coupling_a), _x1*_x2*_x3*self_coupling_1*self_coupling_2*self_coupling_a - _x1*_x5*self_coupling_1 + _x1*_x6*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a - _x11*_x12 - _x12*_x8 - _x4 + 1]
+
+
+def sensitivity_1(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x0**p
+    _x3 = _x2*self_coupling_a
+    _x4 = _x1*self_coupling_2
+    _x5 = _x4*cross_coupling_1
+    _x6 = _x0**n_1
+    _x7 = _x0**n_2
+    _x8 = _x6*_x7
+    _x9 = _x8*self_coupling_1
+    _x10 = _x9*cross_coupling_2
+    _x11 = cross_coupling_a**2
+    _x12 = _x11*_x2
+    _x13 = _x10*_x12
+    _x14 = self_coupling_a**2
+    _x15 = _x14*_x2
+    _x16 = _x10*_x15
+    _x17 = _x0**m_1
+    _x18 = 1j*_x17
+    _x19 = _x18*(_x1*cross_coupling_1*self_coupling_2 - _x13 - _x16 - _x3*_x5 + _x6*_x7*cross_coupling_2*self_coupling_1*self_coupling_a)
+    _x20 = _x17*_x4
+    _x21 = _x20*self_coupling_1
+    _x22 = _x8*cross_coupling_2
+    _x23 = _x12*_x22
+    _x24 = _x17*cross_coupling_1
+    _x25 = _x23*_x24
+    _x26 = _x15*_x22
+    _x27 = _x24*_x26
+    _x28 = _x2*_x9
+    _x29 = 2*_x2*cross_coupling_a
+    _x30 = 2*_x3
+    _x31 = unitary_loss_coefficient**(-1.0)
+    _x32 = _x31*m_1
+    _x33 = _x3*_x31
+    _x34 = _x33*p
+    _x35 = _x31*n_1
+    _x36 = _x31*n_2
+    _x37 = _x31*p
+    _x38 = _x24*_x8
+    _x39 = _x22*_x24
+    _x40 = _x1*_x17*self_coupling_1
+    return [_x19, _x1*_x17*_x2*self_coupling_1*self_coupling_2*self_coupling_a + _x17*_x6*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a - _x21 - _x25 - _x27 - _x3 + 1, _x18*(_x1*self_coupling_2 - _x3*_x4), _x18*(-_x11*_x28 - _x14*_x28 + _x6*_x7*self_coupling_1*self_coupling_a), -_x10*_x18*_x29, _x18*(-_x23 - _x26 + _x6*_x7*cross_coupling_2*self_coupling_a), _x18*(-_x1*_x3*cross_coupling_1 + _x1*cross_coupling_1), _x18*(-_x10*_x30 - _x2*_x5 + _x6*_x7*cross_coupling_2*self_coupling_1), _x18*(_x1*_x31*cross_coupling_1*m_2*self_coupling_2 - _x13*_x35 - _x13*_x36 - _x13*_x37 - _x16*_x35 - _x16*_x36 - _x16*_x37 + _x31*_x6*_x7*cross_coupling_2*n_1*self_coupling_1*self_coupling_a + _x31*_x6*_x7*cross_coupling_2*n_2*self_coupling_1*self_coupling_a - _x33*_x5*m_2 - _x34*_x5) + _x19*_x32, -_x17*_x23 - _x17*_x26 + _x17*_x6*_x7*cross_coupling_2*self_coupling_a, -_x12*_x38 - _x15*_x38 + _x17*_x6*_x7*cross_coupling_1*self_coupling_a, -_x29*_x39, _x20*_x3 - _x20, _x3*_x40 - _x40, _x1*_x17*_x2*self_coupling_1*self_coupling_2 + _x17*_x6*_x7*cross_coupling_1*cross_coupling_2 - _x2 - _x30*_x39, _x1*_x17*_x2*_x31*m_1*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x17*_x2*_x31*m_2*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x17*_x2*_x31*p*self_coupling_1*self_coupling_2*self_coupling_a + _x17*_x31*_x6*_x7*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x17*_x31*_x6*_x7*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x17*_x31*_x6*_x7*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a - _x21*_x31*m_2 - _x21*_x32 - _x25*_x32 - _x25*_x35 - _x25*_x36 - _x25*_x37 - _x27*_x32 - _x27*_x35 - _x27*_x36 - _x27*_x37 - _x34]
+
+
+def solution_2(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x1*self_coupling_a
+    _x3 = _x0**m_1
+    _x4 = _x0**m_2
+    _x5 = _x3*_x4*self_coupling_2
+    _x6 = _x5*cross_coupling_1**2
+    _x7 = _x5*self_coupling_1**2
+    _x8 = _x0**n_1
+    _x9 = _x0**n_2
+    _x10 = _x1*_x3*_x8*_x9*cross_coupling_1*cross_coupling_2
+    return (_x2*_x6 + _x2*_x7 - _x2*self_coupling_1 - _x6 - _x7 + self_coupling_1)/(_x1*_x3*_x4*self_coupling_1*self_coupling_2*self_coupling_a - _x10*cross_coupling_a**2 - _x10*self_coupling_a**2 - _x2 + _x3*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a - _x5*self_coupling_1 + 1)
+
+
+def fraction_2(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x1*self_coupling_a
+    _x3 = _x0**m_1
+    _x4 = _x0**m_2
+    _x5 = _x3*_x4*self_coupling_2
+    _x6 = _x5*cross_coupling_1**2
+    _x7 = _x5*self_coupling_1**2
+    _x8 = _x0**n_1
+    _x9 = _x0**n_2
+    _x10 = _x1*_x3*_x8*_x9*cross_coupling_1*cross_coupling_2
+    return [_x2*_x6 + _x2*_x7 - _x2*self_coupling_1 - _x6 - _x7 + self_coupling_1, _x1*_x3*_x4*self_coupling_1*self_coupling_2*self_coupling_a - _x10*cross_coupling_a**2 - _x10*self_coupling_a**2 - _x2 + _x3*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a - _x5*self_coupling_1 + 1]
+
+
+def sensitivity_2(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x1*self_coupling_a
+    _x3 = _x2*self_coupling_1
+    _x4 = _x0**m_1
+    _x5 = _x0**m_2
+    _x6 = _x4*_x5
+    _x7 = _x6*cross_coupling_1**2
+    _x8 = _x7*self_coupling_2
+    _x9 = _x6*self_coupling_1**2
+    _x10 = _x9*self_coupling_2
+    _x11 = _x2*_x8
+    _x12 = _x10*_x2
+    _x13 = _x6*self_coupling_2
+    _x14 = _x13*self_coupling_1
+    _x15 = _x0**n_1
+    _x16 = _x0**n_2
+    _x17 = _x15*_x16*_x4
+    _x18 = _x17*cross_coupling_2
+    _x19 = _x18*cross_coupling_1
+    _x20 = cross_coupling_a**2
+    _x21 = _x1*_x20
+    _x22 = _x19*_x21
+    _x23 = self_coupling_a**2
+    _x24 = _x1*_x23
+    _x25 = _x19*_x24
+    _x26 = 2*_x13
+    _x27 = _x26*cross_coupling_1
+    _x28 = unitary_loss_coefficient**(-1.0)
+    _x29 = _x28*p
+    _x30 = _x28*m_1
+    _x31 = _x28*m_2
+    _x32 = _x2*_x29
+    _x33 = _x1*_x18
+    _x34 = _x17*cross_coupling_1
+    _x35 = 2*_x19
+    _x36 = _x28*n_1
+    _x37 = _x28*n_2
+    return [-_x10 + _x11 + _x12 - _x3 - _x8 + self_coupling_1, _x1*_x4*_x5*self_coupling_1*self_coupling_2*self_coupling_a - _x14 + _x15*_x16*_x4*cross_coupling_1*cross_coupling_2*self_coupling_a - _x2 - _x22 - _x25 + 1, _x2*_x27 - _x27, 0, 0, -2*_x14 - _x2 + _x26*_x3 + 1, _x2*_x7 + _x2*_x9 - _x7 - _x9, _x1*_x10 + _x1*_x8 - _x1*self_coupling_1, -_x10*_x30 - _x10*_x31 + _x10*_x32 + _x11*_x30 + _x11*_x31 + _x12*_x30 + _x12*_x31 - _x29*_x3 - _x30*_x8 - _x31*_x8 + _x32*_x8, _x15*_x16*_x4*cross_coupling_2*self_coupling_a - _x20*_x33 - _x23*_x33, _x15*_x16*_x4*cross_coupling_1*self_coupling_a - _x21*_x34 - _x24*_x34, -_x1*_x35*cross_coupling_a, _x13*_x2 - _x13, _x3*_x6 - _x6*self_coupling_1, _x1*_x4*_x5*self_coupling_1*self_coupling_2 - _x1 + _x15*_x16*_x4*cross_coupling_1*cross_coupling_2 - _x2*_x35, _x1*_x28*_x4*_x5*m_1*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x28*_x4*_x5*m_2*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x28*_x4*_x5*p*self_coupling_1*self_coupling_2*self_coupling_a - _x14*_x30 - _x14*_x31 + _x15*_x16*_x28*_x4*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x15*_x16*_x28*_x4*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x15*_x16*_x28*_x4*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a - _x22*_x29 - _x22*_x30 - _x22*_x36 - _x22*_x37 - _x25*_x29 - _x25*_x30 - _x25*_x36 - _x25*_x37 - _x32]
+
+
+def solution_3(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x1*self_coupling_a
+    _x3 = _x0**m_1
+    _x4 = _x0**m_2
+    _x5 = _x0**n_1
+    _x6 = _x0**n_2
+    _x7 = cross_coupling_a**2
+    _x8 = _x1*_x3*_x5*_x6*cross_coupling_2
+    _x9 = _x8*cross_coupling_1
+    _x10 = self_coupling_a**2
+    _x11 = cross_coupling_1**2
+    _x12 = self_coupling_1**2
+    _x13 = _x11*_x8
+    _x14 = _x12*_x8
+    return 1j*(-_x10*_x13 - _x10*_x14 + _x11*_x3*_x5*_x6*cross_coupling_2*self_coupling_a + _x12*_x3*_x5*_x6*cross_coupling_2*self_coupling_a - _x13*_x7 - _x14*_x7 - _x2*cross_coupling_1 + cross_coupling_1)/(_x1*_x3*_x4*self_coupling_1*self_coupling_2*self_coupling_a - _x10*_x9 - _x2 - _x3*_x4*self_coupling_1*self_coupling_2 + _x3*_x5*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a - _x7*_x9 + 1)
+
+
+def fraction_3(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x1*self_coupling_a
+    _x3 = cross_coupling_1**2
+    _x4 = _x0**m_1
+    _x5 = _x0**n_1
+    _x6 = _x0**n_2
+    _x7 = self_coupling_1**2
+    _x8 = cross_coupling_a**2
+    _x9 = _x1*_x4*_x5*_x6*cross_coupling_2
+    _x10 = _x3*_x9
+    _x11 = self_coupling_a**2
+    _x12 = _x7*_x9
+    _x13 = _x0**m_2
+    _x14 = _x9*cross_coupling_1
+    return [1j*(-_x10*_x11 - _x10*_x8 - _x11*_x12 - _x12*_x8 - _x2*cross_coupling_1 + _x3*_x4*_x5*_x6*cross_coupling_2*self_coupling_a + _x4*_x5*_x6*_x7*cross_coupling_2*self_coupling_a + cross_coupling_1), _x1*_x13*_x4*self_coupling_1*self_coupling_2*self_coupling_a - _x11*_x14 - _x13*_x4*self_coupling_1*self_coupling_2 - _x14*_x8 - _x2 + _x4*_x5*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a + 1]
+
+
+def sensitivity_3(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x1*self_coupling_a
+    _x3 = _x2*cross_coupling_1
+    _x4 = cross_coupling_1**2
+    _x5 = _x0**m_1
+    _x6 = _x0**n_1
+    _x7 = _x0**n_2
+    _x8 = self_coupling_1**2
+    _x9 = cross_coupling_a**2
+    _x10 = _x5*_x6*_x7
+    _x11 = _x10*cross_coupling_2
+    _x12 = _x11*_x4
+    _x13 = _x1*_x12
+    _x14 = _x13*_x9
+    _x15 = self_coupling_a**2
+    _x16 = _x13*_x15
+    _x17 = _x11*_x8
+    _x18 = _x1*_x17
+    _x19 = _x18*_x9
+    _x20 = _x15*_x18
+    _x21 = _x0**m_2
+    _x22 = _x21*_x5
+    _x23 = _x22*self_coupling_2
+    _x24 = _x23*self_coupling_1
+    _x25 = _x1*cross_coupling_1
+    _x26 = _x11*_x25
+    _x27 = _x26*_x9
+    _x28 = _x15*_x26
+    _x29 = _x2 - 1
+    _x30 = _x1*_x10
+    _x31 = _x30*_x4
+    _x32 = _x30*_x8
+    _x33 = 2*cross_coupling_a
+    _x34 = _x1*_x11
+    _x35 = _x34*_x9
+    _x36 = 2*self_coupling_1
+    _x37 = _x15*_x34
+    _x38 = 2*_x2
+    _x39 = unitary_loss_coefficient**(-1.0)
+    _x40 = _x39*p
+    _x41 = _x39*m_1
+    _x42 = _x39*n_1
+    _x43 = _x39*n_2
+    _x44 = _x10*_x25
+    _x45 = _x22*self_coupling_1
+    _x46 = _x24*_x39
+    return [1j*(-_x14 - _x16 - _x19 - _x20 - _x3 + _x4*_x5*_x6*_x7*cross_coupling_2*self_coupling_a + _x5*_x6*_x7*_x8*cross_coupling_2*self_coupling_a + cross_coupling_1), _x1*_x21*_x5*self_coupling_1*self_coupling_2*self_coupling_a - _x24 - _x27 - _x28 - _x29 + _x5*_x6*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a, 1j*(-2*_x27 - 2*_x28 - _x29 + 2*_x5*_x6*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a), 1j*(-_x15*_x31 - _x15*_x32 - _x31*_x9 - _x32*_x9 + _x4*_x5*_x6*_x7*self_coupling_a + _x5*_x6*_x7*_x8*self_coupling_a), 1j*(-_x13*_x33 - _x18*_x33), 1j*(-_x35*_x36 - _x36*_x37 + 2*_x5*_x6*_x7*cross_coupling_2*self_coupling_1*self_coupling_a), 0, 1j*(-_x12*_x38 - _x17*_x38 - _x25 + _x4*_x5*_x6*_x7*cross_coupling_2 + _x5*_x6*_x7*_x8*cross_coupling_2), 1j*(-_x14*_x40 - _x14*_x41 - _x14*_x42 - _x14*_x43 - _x16*_x40 - _x16*_x41 - _x16*_x42 - _x16*_x43 - _x19*_x40 - _x19*_x41 - _x19*_x42 - _x19*_x43 - _x20*_x40 - _x20*_x41 - _x20*_x42 - _x20*_x43 - _x3*_x40 + _x39*_x4*_x5*_x6*_x7*cross_coupling_2*m_1*self_coupling_a + _x39*_x4*_x5*_x6*_x7*cross_coupling_2*n_1*self_coupling_a + _x39*_x4*_x5*_x6*_x7*cross_coupling_2*n_2*self_coupling_a + _x39*_x5*_x6*_x7*_x8*cross_coupling_2*m_1*self_coupling_a + _x39*_x5*_x6*_x7*_x8*cross_coupling_2*n_1*self_coupling_a + _x39*_x5*_x6*_x7*_x8*cross_coupling_2*n_2*self_coupling_a), -_x35 - _x37 + _x5*_x6*_x7*cross_coupling_2*self_coupling_a, -_x15*_x44 - _x44*_x9 + _x5*_x6*_x7*cross_coupling_1*self_coupling_a, -_x26*_x33, _x2*_x23 - _x23, _x2*_x45 - _x45, _x1*_x21*_x5*self_coupling_1*self_coupling_2 - _x1 - 2*_x11*_x3 + _x5*_x6*_x7*cross_coupling_1*cross_coupling_2, _x1*_x21*_x39*_x5*m_1*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x21*_x39*_x5*m_2*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x21*_x39*_x5*p*self_coupling_1*self_coupling_2*self_coupling_a - _x2*_x40 - _x27*_x40 - _x27*_x41 - _x27*_x42 - _x27*_x43 - _x28*_x40 - _x28*_x41 - _x28*_x42 - _x28*_x43 + _x39*_x5*_x6*_x7*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x39*_x5*_x6*_x7*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x39*_x5*_x6*_x7*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a - _x46*m_1 - _x46*m_2]
+
+
+def solution_4(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x0**m_1
+    _x3 = _x0**m_2
+    _x4 = _x2*_x3*self_coupling_2
+    _x5 = _x0**n_1
+    _x6 = _x0**n_2
+    _x7 = cross_coupling_a**2
+    _x8 = _x5*_x6
+    _x9 = _x1*_x2*_x8*cross_coupling_1*cross_coupling_2
+    _x10 = self_coupling_a**2
+    _x11 = _x1*self_coupling_1
+    _x12 = cross_coupling_1**2
+    _x13 = _x4*self_coupling_a
+    _x14 = self_coupling_1**2
+    _x15 = _x1*_x4
+    _x16 = _x12*_x15
+    _x17 = _x14*_x15
+    return _x8*(-_x10*_x11 + _x10*_x16 + _x10*_x17 - _x11*_x7 - _x12*_x13 - _x13*_x14 + _x16*_x7 + _x17*_x7 + self_coupling_1*self_coupling_a)/(_x1*_x2*_x3*self_coupling_1*self_coupling_2*self_coupling_a - _x1*self_coupling_a - _x10*_x9 + _x2*_x5*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a - _x4*self_coupling_1 - _x7*_x9 + 1)
+
+
+def fraction_4(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = cross_coupling_a**2
+    _x1 = unitary_loss_coefficient/z
+    _x2 = _x1**p
+    _x3 = _x2*self_coupling_1
+    _x4 = self_coupling_a**2
+    _x5 = cross_coupling_1**2
+    _x6 = _x1**m_1
+    _x7 = _x1**m_2
+    _x8 = _x6*_x7*self_coupling_2
+    _x9 = _x8*self_coupling_a
+    _x10 = self_coupling_1**2
+    _x11 = _x2*_x8
+    _x12 = _x11*_x5
+    _x13 = _x10*_x11
+    _x14 = _x1**n_1
+    _x15 = _x1**n_2
+    _x16 = _x14*_x15
+    _x17 = _x16*_x2*_x6*cross_coupling_1*cross_coupling_2
+    return [_x16*(_x0*_x12 + _x0*_x13 - _x0*_x3 - _x10*_x9 + _x12*_x4 + _x13*_x4 - _x3*_x4 - _x5*_x9 + self_coupling_1*self_coupling_a), -_x0*_x17 + _x14*_x15*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a - _x17*_x4 + _x2*_x6*_x7*self_coupling_1*self_coupling_2*self_coupling_a - _x2*self_coupling_a - _x8*self_coupling_1 + 1]
+
+
+def sensitivity_4(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = self_coupling_1*self_coupling_a
+    _x1 = unitary_loss_coefficient/z
+    _x2 = _x1**p
+    _x3 = _x2*cross_coupling_a**2
+    _x4 = _x3*self_coupling_1
+    _x5 = _x2*self_coupling_a**2
+    _x6 = _x5*self_coupling_1
+    _x7 = cross_coupling_1**2
+    _x8 = _x1**m_1
+    _x9 = _x1**m_2
+    _x10 = _x8*_x9
+    _x11 = _x10*self_coupling_2
+    _x12 = _x11*_x7
+    _x13 = _x12*self_coupling_a
+    _x14 = self_coupling_1**2
+    _x15 = _x11*_x14
+    _x16 = _x15*self_coupling_a
+    _x17 = _x12*_x3
+    _x18 = _x12*_x5
+    _x19 = _x15*_x3
+    _x20 = _x15*_x5
+    _x21 = _x1**n_1
+    _x22 = _x1**n_2
+    _x23 = _x21*_x22
+    _x24 = _x23*(_x0 - _x13 - _x16 + _x17 + _x18 + _x19 + _x20 - _x4 - _x6)
+    _x25 = _x2*self_coupling_a
+    _x26 = _x11*self_coupling_1
+    _x27 = _x23*_x8
+    _x28 = _x27*cross_coupling_2
+    _x29 = _x28*cross_coupling_1
+    _x30 = _x29*_x3
+    _x31 = _x29*_x5
+    _x32 = 2*_x11
+    _x33 = _x32*cross_coupling_1
+    _x34 = 2*_x2
+    _x35 = _x34*cross_coupling_a
+    _x36 = _x10*self_coupling_a
+    _x37 = _x10*_x7
+    _x38 = _x10*_x14
+    _x39 = 2*_x25
+    _x40 = unitary_loss_coefficient**(-1.0)
+    _x41 = _x24*_x40
+    _x42 = _x40*p
+    _x43 = _x40*m_1
+    _x44 = _x40*m_2
+    _x45 = _x27*cross_coupling_1
+    _x46 = _x26*_x40
+    _x47 = _x40*n_1
+    _x48 = _x40*n_2
+    return [_x24, _x2*_x8*_x9*self_coupling_1*self_coupling_2*self_coupling_a + _x21*_x22*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a - _x25 - _x26 - _x30 - _x31 + 1, _x23*(_x3*_x33 + _x33*_x5 - _x33*self_coupling_a), 0, _x23*(_x12*_x35 + _x15*_x35 - _x35*self_coupling_1), _x23*(-_x0*_x32 - _x3 + _x32*_x4 + _x32*_x6 - _x5 + self_coupling_a), _x23*(-_x14*_x36 + _x3*_x37 + _x3*_x38 - _x36*_x7 + _x37*_x5 + _x38*_x5), _x23*(-_x0*_x34 + _x12*_x39 - _x12 + _x15*_x39 - _x15 + self_coupling_1), _x23*(-_x13*_x43 - _x13*_x44 - _x16*_x43 - _x16*_x44 + _x17*_x42 + _x17*_x43 + _x17*_x44 + _x18*_x42 + _x18*_x43 + _x18*_x44 + _x19*_x42 + _x19*_x43 + _x19*_x44 + _x20*_x42 + _x20*_x43 + _x20*_x44 - _x4*_x42 - _x42*_x6) + _x41*n_1 + _x41*n_2, _x21*_x22*_x8*cross_coupling_2*self_coupling_a - _x28*_x3 - _x28*_x5, _x21*_x22*_x8*cross_coupling_1*self_coupling_a - _x3*_x45 - _x45*_x5, -_x29*_x35, _x11*_x25 - _x11, _x0*_x10*_x2 - _x10*self_coupling_1, _x2*_x8*_x9*self_coupling_1*self_coupling_2 - _x2 + _x21*_x22*_x8*cross_coupling_1*cross_coupling_2 - _x29*_x39, _x2*_x40*_x8*_x9*m_1*self_coupling_1*self_coupling_2*self_coupling_a + _x2*_x40*_x8*_x9*m_2*self_coupling_1*self_coupling_2*self_coupling_a + _x2*_x40*_x8*_x9*p*self_coupling_1*self_coupling_2*self_coupling_a + _x21*_x22*_x40*_x8*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x21*_x22*_x40*_x8*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x21*_x22*_x40*_x8*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a - _x25*_x42 - _x30*_x42 - _x30*_x43 - _x30*_x47 - _x30*_x48 - _x31*_x42 - _x31*_x43 - _x31*_x47 - _x31*_x48 - _x46*m_1 - _x46*m_2]
+
+
+def solution_5(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x0**p
+    _x3 = _x2*self_coupling_a
+    _x4 = _x0**m_1
+    _x5 = _x0**n_1
+    _x6 = _x0**n_2
+    _x7 = cross_coupling_a**2
+    _x8 = _x2*_x4*_x5*_x6*cross_coupling_2
+    _x9 = _x8*cross_coupling_1
+    _x10 = self_coupling_a**2
+    _x11 = cross_coupling_1**2
+    _x12 = self_coupling_1**2
+    _x13 = _x11*_x8
+    _x14 = _x12*_x8
+    return 1j*_x1*(-_x10*_x13 - _x10*_x14 + _x11*_x4*_x5*_x6*cross_coupling_2*self_coupling_a + _x12*_x4*_x5*_x6*cross_coupling_2*self_coupling_a - _x13*_x7 - _x14*_x7 - _x3*cross_coupling_1 + cross_coupling_1)/(_x1*_x2*_x4*self_coupling_1*self_coupling_2*self_coupling_a - _x1*_x4*self_coupling_1*self_coupling_2 - _x10*_x9 - _x3 + _x4*_x5*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a - _x7*_x9 + 1)
+
+
+def fraction_5(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x0**p
+    _x3 = _x2*self_coupling_a
+    _x4 = cross_coupling_1**2
+    _x5 = _x0**m_1
+    _x6 = _x0**n_1
+    _x7 = _x0**n_2
+    _x8 = self_coupling_1**2
+    _x9 = cross_coupling_a**2
+    _x10 = _x2*_x5*_x6*_x7*cross_coupling_2
+    _x11 = _x10*_x4
+    _x12 = self_coupling_a**2
+    _x13 = _x10*_x8
+    _x14 = _x10*cross_coupling_1
+    return [1j*_x1*(-_x11*_x12 - _x11*_x9 - _x12*_x13 - _x13*_x9 - _x3*cross_coupling_1 + _x4*_x5*_x6*_x7*cross_coupling_2*self_coupling_a + _x5*_x6*_x7*_x8*cross_coupling_2*self_coupling_a + cross_coupling_1), _x1*_x2*_x5*self_coupling_1*self_coupling_2*self_coupling_a - _x1*_x5*self_coupling_1*self_coupling_2 - _x12*_x14 - _x14*_x9 - _x3 + _x5*_x6*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a + 1]
+
+
+def sensitivity_5(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x1*self_coupling_a
+    _x3 = _x2*cross_coupling_1
+    _x4 = cross_coupling_1**2
+    _x5 = _x0**m_1
+    _x6 = _x0**n_1
+    _x7 = _x0**n_2
+    _x8 = self_coupling_1**2
+    _x9 = cross_coupling_a**2
+    _x10 = _x5*_x6*_x7
+    _x11 = _x10*cross_coupling_2
+    _x12 = _x11*_x4
+    _x13 = _x1*_x12
+    _x14 = _x13*_x9
+    _x15 = self_coupling_a**2
+    _x16 = _x13*_x15
+    _x17 = _x11*_x8
+    _x18 = _x1*_x17
+    _x19 = _x18*_x9
+    _x20 = _x15*_x18
+    _x21 = _x0**m_2
+    _x22 = 1j*_x21
+    _x23 = _x22*(-_x14 - _x16 - _x19 - _x20 - _x3 + _x4*_x5*_x6*_x7*cross_coupling_2*self_coupling_a + _x5*_x6*_x7*_x8*cross_coupling_2*self_coupling_a + cross_coupling_1)
+    _x24 = _x21*_x5
+    _x25 = _x24*self_coupling_2
+    _x26 = _x25*self_coupling_1
+    _x27 = _x1*cross_coupling_1
+    _x28 = _x11*_x27
+    _x29 = _x28*_x9
+    _x30 = _x15*_x28
+    _x31 = _x2 - 1
+    _x32 = _x1*_x10
+    _x33 = _x32*_x4
+    _x34 = _x32*_x8
+    _x35 = 2*cross_coupling_a
+    _x36 = _x1*_x11
+    _x37 = _x36*_x9
+    _x38 = 2*self_coupling_1
+    _x39 = _x15*_x36
+    _x40 = 2*_x2
+    _x41 = unitary_loss_coefficient**(-1.0)
+    _x42 = _x41*m_2
+    _x43 = _x41*p
+    _x44 = _x41*m_1
+    _x45 = _x41*n_1
+    _x46 = _x41*n_2
+    _x47 = _x10*_x27
+    _x48 = _x24*self_coupling_1
+    return [_x23, _x1*_x21*_x5*self_coupling_1*self_coupling_2*self_coupling_a - _x26 - _x29 - _x30 - _x31 + _x5*_x6*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a, _x22*(-2*_x29 - 2*_x30 - _x31 + 2*_x5*_x6*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a), _x22*(-_x15*_x33 - _x15*_x34 - _x33*_x9 - _x34*_x9 + _x4*_x5*_x6*_x7*self_coupling_a + _x5*_x6*_x7*_x8*self_coupling_a), _x22*(-_x13*_x35 - _x18*_x35), _x22*(-_x37*_x38 - _x38*_x39 + 2*_x5*_x6*_x7*cross_coupling_2*self_coupling_1*self_coupling_a), 0, _x22*(-_x12*_x40 - _x17*_x40 - _x27 + _x4*_x5*_x6*_x7*cross_coupling_2 + _x5*_x6*_x7*_x8*cross_coupling_2), _x22*(-_x14*_x43 - _x14*_x44 - _x14*_x45 - _x14*_x46 - _x16*_x43 - _x16*_x44 - _x16*_x45 - _x16*_x46 - _x19*_x43 - _x19*_x44 - _x19*_x45 - _x19*_x46 - _x20*_x43 - _x20*_x44 - _x20*_x45 - _x20*_x46 - _x3*_x43 + _x4*_x41*_x5*_x6*_x7*cross_coupling_2*m_1*self_coupling_a + _x4*_x41*_x5*_x6*_x7*cross_coupling_2*n_1*self_coupling_a + _x4*_x41*_x5*_x6*_x7*cross_coupling_2*n_2*self_coupling_a + _x41*_x5*_x6*_x7*_x8*cross_coupling_2*m_1*self_coupling_a + _x41*_x5*_x6*_x7*_x8*cross_coupling_2*n_1*self_coupling_a + _x41*_x5*_x6*_x7*_x8*cross_coupling_2*n_2*self_coupling_a) + _x23*_x42, -_x37 - _x39 + _x5*_x6*_x7*cross_coupling_2*self_coupling_a, -_x15*_x47 - _x47*_x9 + _x5*_x6*_x7*cross_coupling_1*self_coupling_a, -_x28*_x35, _x2*_x25 - _x25, _x2*_x48 - _x48, _x1*_x21*_x5*self_coupling_1*self_coupling_2 - _x1 - 2*_x11*_x3 + _x5*_x6*_x7*cross_coupling_1*cross_coupling_2, _x1*_x21*_x41*_x5*m_1*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x21*_x41*_x5*m_2*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x21*_x41*_x5*p*self_coupling_1*self_coupling_2*self_coupling_a - _x2*_x43 - _x26*_x42 - _x26*_x44 - _x29*_x43 - _x29*_x44 - _x29*_x45 - _x29*_x46 - _x30*_x43 - _x30*_x44 - _x30*_x45 - _x30*_x46 + _x41*_x5*_x6*_x7*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x41*_x5*_x6*_x7*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x41*_x5*_x6*_x7*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a]
+
+
+def solution_6(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x1*self_coupling_a
+    _x3 = self_coupling_1*self_coupling_2
+    _x4 = _x0**m_2
+    _x5 = _x0**m_1
+    _x6 = _x4*_x5
+    _x7 = _x0**n_1
+    _x8 = _x0**n_2
+    _x9 = cross_coupling_a**2
+    _x10 = cross_coupling_1*cross_coupling_2
+    _x11 = _x7*_x8
+    _x12 = _x1*_x11
+    _x13 = _x10*_x12*_x5
+    _x14 = self_coupling_a**2
+    _x15 = _x10*_x4
+    _x16 = _x11*self_coupling_a
+    _x17 = _x12*_x3
+    _x18 = cross_coupling_2**2
+    _x19 = cross_coupling_1**2
+    _x20 = _x16*_x6
+    _x21 = _x19*_x20
+    _x22 = self_coupling_2**2
+    _x23 = self_coupling_1**2
+    _x24 = _x20*_x23
+    _x25 = _x12*_x6
+    _x26 = _x19*_x25
+    _x27 = _x18*_x26
+    _x28 = _x22*_x26
+    _x29 = _x23*_x25
+    _x30 = _x18*_x29
+    _x31 = _x22*_x29
+    return (-_x14*_x17 + _x14*_x27 + _x14*_x28 + _x14*_x30 + _x14*_x31 + _x15*_x2 - _x15 + _x16*_x3 - _x17*_x9 - _x18*_x21 - _x18*_x24 - _x21*_x22 - _x22*_x24 + _x27*_x9 + _x28*_x9 + _x30*_x9 + _x31*_x9)/(_x1*_x4*_x5*self_coupling_1*self_coupling_2*self_coupling_a - _x13*_x14 - _x13*_x9 - _x2 - _x3*_x6 + _x5*_x7*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a + 1)
+
+
+def fraction_6(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = cross_coupling_1*cross_coupling_2
+    _x3 = _x1*_x2
+    _x4 = _x0**p
+    _x5 = _x4*self_coupling_a
+    _x6 = self_coupling_1*self_coupling_2
+    _x7 = _x0**n_1
+    _x8 = _x0**n_2
+    _x9 = _x7*_x8
+    _x10 = _x6*_x9
+    _x11 = cross_coupling_a**2
+    _x12 = _x10*_x4
+    _x13 = self_coupling_a**2
+    _x14 = cross_coupling_2**2
+    _x15 = cross_coupling_1**2
+    _x16 = _x0**m_1
+    _x17 = _x1*_x16
+    _x18 = _x17*_x9*self_coupling_a
+    _x19 = _x15*_x18
+    _x20 = self_coupling_2**2
+    _x21 = self_coupling_1**2
+    _x22 = _x18*_x21
+    _x23 = _x4*_x9
+    _x24 = _x17*_x23
+    _x25 = _x15*_x24
+    _x26 = _x14*_x25
+    _x27 = _x20*_x25
+    _x28 = _x21*_x24
+    _x29 = _x14*_x28
+    _x30 = _x20*_x28
+    _x31 = _x16*_x2*_x23
+    return [_x10*self_coupling_a - _x11*_x12 + _x11*_x26 + _x11*_x27 + _x11*_x29 + _x11*_x30 - _x12*_x13 + _x13*_x26 + _x13*_x27 + _x13*_x29 + _x13*_x30 - _x14*_x19 - _x14*_x22 - _x19*_x20 - _x20*_x22 + _x3*_x5 - _x3, _x1*_x16*_x4*self_coupling_1*self_coupling_2*self_coupling_a - _x11*_x31 - _x13*_x31 + _x16*_x7*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a - _x17*_x6 - _x5 + 1]
+
+
+def sensitivity_6(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x1*cross_coupling_2
+    _x3 = _x2*cross_coupling_1
+    _x4 = _x0**p
+    _x5 = _x4*self_coupling_a
+    _x6 = _x0**n_1
+    _x7 = _x0**n_2
+    _x8 = _x6*_x7
+    _x9 = _x8*self_coupling_a
+    _x10 = _x9*self_coupling_2
+    _x11 = _x10*self_coupling_1
+    _x12 = _x8*self_coupling_2
+    _x13 = _x12*self_coupling_1
+    _x14 = cross_coupling_a**2
+    _x15 = _x14*_x4
+    _x16 = _x13*_x15
+    _x17 = self_coupling_a**2
+    _x18 = _x17*_x4
+    _x19 = _x13*_x18
+    _x20 = cross_coupling_2**2
+    _x21 = cross_coupling_1**2
+    _x22 = _x0**m_1
+    _x23 = _x1*_x22
+    _x24 = _x23*_x9
+    _x25 = _x21*_x24
+    _x26 = _x20*_x25
+    _x27 = self_coupling_2**2
+    _x28 = _x25*_x27
+    _x29 = self_coupling_1**2
+    _x30 = _x24*_x29
+    _x31 = _x20*_x30
+    _x32 = _x27*_x30
+    _x33 = _x23*_x8
+    _x34 = _x21*_x33
+    _x35 = _x20*_x34
+    _x36 = _x15*_x35
+    _x37 = _x18*_x35
+    _x38 = _x27*_x34
+    _x39 = _x15*_x38
+    _x40 = _x18*_x38
+    _x41 = _x29*_x33
+    _x42 = _x20*_x41
+    _x43 = _x15*_x42
+    _x44 = _x18*_x42
+    _x45 = _x27*_x41
+    _x46 = _x15*_x45
+    _x47 = _x18*_x45
+    _x48 = _x23*self_coupling_2
+    _x49 = _x48*self_coupling_1
+    _x50 = _x22*_x8
+    _x51 = _x50*cross_coupling_2
+    _x52 = _x51*cross_coupling_1
+    _x53 = _x15*_x52
+    _x54 = _x18*_x52
+    _x55 = _x1*cross_coupling_1
+    _x56 = 2*_x22*_x9
+    _x57 = _x55*_x56
+    _x58 = 2*_x50
+    _x59 = _x55*_x58
+    _x60 = _x15*_x20
+    _x61 = _x18*_x59
+    _x62 = _x15*_x27
+    _x63 = _x2*_x56
+    _x64 = _x2*_x58
+    _x65 = _x15*_x21
+    _x66 = _x18*_x64
+    _x67 = _x15*_x29
+    _x68 = 2*_x13
+    _x69 = _x4*cross_coupling_a
+    _x70 = 2*_x69
+    _x71 = _x12*_x4
+    _x72 = _x23*self_coupling_1
+    _x73 = 2*_x9
+    _x74 = _x72*_x73
+    _x75 = 2*_x8
+    _x76 = _x72*_x75
+    _x77 = _x18*_x76
+    _x78 = _x8*self_coupling_1
+    _x79 = _x48*_x73
+    _x80 = _x48*_x75
+    _x81 = _x18*_x80
+    _x82 = 2*_x5
+    _x83 = unitary_loss_coefficient**(-1.0)
+    _x84 = _x83*m_2
+    _x85 = _x5*_x83
+    _x86 = _x85*p
+    _x87 = _x11*_x83
+    _x88 = _x83*n_1
+    _x89 = _x83*n_2
+    _x90 = _x83*p
+    _x91 = _x83*m_1
+    _x92 = _x50*cross_coupling_1
+    _x93 = 2*_x52
+    return [_x11 - _x16 - _x19 - _x26 - _x28 + _x3*_x5 - _x3 - _x31 - _x32 + _x36 + _x37 + _x39 + _x40 + _x43 + _x44 + _x46 + _x47, _x1*_x22*_x4*self_coupling_1*self_coupling_2*self_coupling_a + _x22*_x6*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a - _x49 - _x5 - _x53 - _x54 + 1, _x2*_x5 - _x2 - _x20*_x57 + _x20*_x61 - _x27*_x57 + _x27*_x61 + _x59*_x60 + _x59*_x62, -_x21*_x63 + _x21*_x66 - _x29*_x63 + _x29*_x66 + _x5*_x55 - _x55 + _x64*_x65 + _x64*_x67, _x35*_x70 + _x38*_x70 + _x42*_x70 + _x45*_x70 - _x68*_x69, _x10 - _x14*_x71 - _x17*_x71 - _x20*_x74 + _x20*_x77 - _x27*_x74 + _x27*_x77 + _x60*_x76 + _x62*_x76, -_x15*_x78 - _x18*_x78 - _x21*_x79 + _x21*_x81 - _x29*_x79 + _x29*_x81 + _x65*_x80 + _x67*_x80 + _x9*self_coupling_1, _x13 + _x3*_x4 + _x35*_x82 - _x35 + _x38*_x82 - _x38 + _x42*_x82 - _x42 + _x45*_x82 - _x45 - _x5*_x68, -_x16*_x88 - _x16*_x89 - _x16*_x90 - _x19*_x88 - _x19*_x89 - _x19*_x90 - _x26*_x84 - _x26*_x88 - _x26*_x89 - _x26*_x91 - _x28*_x84 - _x28*_x88 - _x28*_x89 - _x28*_x91 - _x3*_x84 + _x3*_x85*m_2 + _x3*_x86 - _x31*_x84 - _x31*_x88 - _x31*_x89 - _x31*_x91 - _x32*_x84 - _x32*_x88 - _x32*_x89 - _x32*_x91 + _x36*_x84 + _x36*_x88 + _x36*_x89 + _x36*_x90 + _x36*_x91 + _x37*_x84 + _x37*_x88 + _x37*_x89 + _x37*_x90 + _x37*_x91 + _x39*_x84 + _x39*_x88 + _x39*_x89 + _x39*_x90 + _x39*_x91 + _x40*_x84 + _x40*_x88 + _x40*_x89 + _x40*_x90 + _x40*_x91 + _x43*_x84 + _x43*_x88 + _x43*_x89 + _x43*_x90 + _x43*_x91 + _x44*_x84 + _x44*_x88 + _x44*_x89 + _x44*_x90 + _x44*_x91 + _x46*_x84 + _x46*_x88 + _x46*_x89 + _x46*_x90 + _x46*_x91 + _x47*_x84 + _x47*_x88 + _x47*_x89 + _x47*_x90 + _x47*_x91 + _x87*n_1 + _x87*n_2, -_x15*_x51 - _x18*_x51 + _x22*_x6*_x7*cross_coupling_2*self_coupling_a, -_x15*_x92 - _x18*_x92 + _x22*_x6*_x7*cross_coupling_1*self_coupling_a, -_x69*_x93, _x48*_x5 - _x48, _x5*_x72 - _x72, _x1*_x22*_x4*self_coupling_1*self_coupling_2 + _x22*_x6*_x7*cross_coupling_1*cross_coupling_2 - _x4 - _x5*_x93, _x1*_x22*_x4*_x83*m_1*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x22*_x4*_x83*m_2*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x22*_x4*_x83*p*self_coupling_1*self_coupling_2*self_coupling_a + _x22*_x6*_x7*_x83*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x22*_x6*_x7*_x83*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x22*_x6*_x7*_x83*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a - _x49*_x84 - _x49*_x91 - _x53*_x88 - _x53*_x89 - _x53*_x90 - _x53*_x91 - _x54*_x88 - _x54*_x89 - _x54*_x90 - _x54*_x91 - _x86]
+
+
+def solution_7(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x0**p
+    _x3 = _x2*self_coupling_a
+    _x4 = _x1*self_coupling_2
+    _x5 = _x0**n_1
+    _x6 = _x0**n_2
+    _x7 = cross_coupling_a**2
+    _x8 = _x2*_x5*_x6*cross_coupling_2
+    _x9 = _x8*self_coupling_1
+    _x10 = self_coupling_a**2
+    _x11 = _x0**m_1
+    _x12 = _x11*_x8*cross_coupling_1
+    return 1j*(_x1*cross_coupling_1*self_coupling_2 - _x10*_x9 - _x3*_x4*cross_coupling_1 + _x5*_x6*cross_coupling_2*self_coupling_1*self_coupling_a - _x7*_x9)/(_x1*_x11*_x2*self_coupling_1*self_coupling_2*self_coupling_a - _x10*_x12 - _x11*_x4*self_coupling_1 + _x11*_x5*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a - _x12*_x7 - _x3 + 1)
+
+
+def fraction_7(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x0**p
+    _x3 = _x2*self_coupling_a
+    _x4 = _x1*self_coupling_2
+    _x5 = _x0**n_1
+    _x6 = _x0**n_2
+    _x7 = cross_coupling_a**2
+    _x8 = _x5*_x6*cross_coupling_2
+    _x9 = _x2*_x8*self_coupling_1
+    _x10 = self_coupling_a**2
+    _x11 = _x0**m_1
+    _x12 = _x11*_x2*_x8*cross_coupling_1
+    return [1j*(_x1*cross_coupling_1*self_coupling_2 - _x10*_x9 - _x3*_x4*cross_coupling_1 + _x5*_x6*cross_coupling_2*self_coupling_1*self_coupling_a - _x7*_x9), _x1*_x11*_x2*self_coupling_1*self_coupling_2*self_coupling_a - _x10*_x12 - _x11*_x4*self_coupling_1 + _x11*_x5*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a - _x12*_x7 - _x3 + 1]
+
+
+def sensitivity_7(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x0**p
+    _x3 = _x2*self_coupling_a
+    _x4 = _x1*self_coupling_2
+    _x5 = _x4*cross_coupling_1
+    _x6 = _x0**n_1
+    _x7 = _x0**n_2
+    _x8 = _x6*_x7
+    _x9 = _x8*self_coupling_1
+    _x10 = _x9*cross_coupling_2
+    _x11 = cross_coupling_a**2
+    _x12 = _x11*_x2
+    _x13 = _x10*_x12
+    _x14 = self_coupling_a**2
+    _x15 = _x14*_x2
+    _x16 = _x10*_x15
+    _x17 = _x0**m_1
+    _x18 = _x17*_x4
+    _x19 = _x18*self_coupling_1
+    _x20 = _x8*cross_coupling_2
+    _x21 = _x12*_x20
+    _x22 = _x17*cross_coupling_1
+    _x23 = _x21*_x22
+    _x24 = _x15*_x20
+    _x25 = _x22*_x24
+    _x26 = _x2*_x9
+    _x27 = 2*_x10
+    _x28 = _x2*cross_coupling_a
+    _x29 = unitary_loss_coefficient**(-1.0)
+    _x30 = _x29*_x3
+    _x31 = _x30*p
+    _x32 = _x29*n_1
+    _x33 = _x29*n_2
+    _x34 = _x29*p
+    _x35 = _x22*_x8
+    _x36 = 2*_x20*_x22
+    _x37 = _x1*_x17*self_coupling_1
+    _x38 = _x29*m_1
+    return [1j*(_x1*cross_coupling_1*self_coupling_2 - _x13 - _x16 - _x3*_x5 + _x6*_x7*cross_coupling_2*self_coupling_1*self_coupling_a), _x1*_x17*_x2*self_coupling_1*self_coupling_2*self_coupling_a + _x17*_x6*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a - _x19 - _x23 - _x25 - _x3 + 1, 1j*(_x1*self_coupling_2 - _x3*_x4), 1j*(-_x11*_x26 - _x14*_x26 + _x6*_x7*self_coupling_1*self_coupling_a), -1j*_x27*_x28, 1j*(-_x21 - _x24 + _x6*_x7*cross_coupling_2*self_coupling_a), 1j*(-_x1*_x3*cross_coupling_1 + _x1*cross_coupling_1), 1j*(-_x2*_x5 - _x27*_x3 + _x6*_x7*cross_coupling_2*self_coupling_1), 1j*(_x1*_x29*cross_coupling_1*m_2*self_coupling_2 - _x13*_x32 - _x13*_x33 - _x13*_x34 - _x16*_x32 - _x16*_x33 - _x16*_x34 + _x29*_x6*_x7*cross_coupling_2*n_1*self_coupling_1*self_coupling_a + _x29*_x6*_x7*cross_coupling_2*n_2*self_coupling_1*self_coupling_a - _x30*_x5*m_2 - _x31*_x5), -_x17*_x21 - _x17*_x24 + _x17*_x6*_x7*cross_coupling_2*self_coupling_a, -_x12*_x35 - _x15*_x35 + _x17*_x6*_x7*cross_coupling_1*self_coupling_a, -_x28*_x36, _x18*_x3 - _x18, _x3*_x37 - _x37, _x1*_x17*_x2*self_coupling_1*self_coupling_2 + _x17*_x6*_x7*cross_coupling_1*cross_coupling_2 - _x2 - _x3*_x36, _x1*_x17*_x2*_x29*m_1*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x17*_x2*_x29*m_2*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x17*_x2*_x29*p*self_coupling_1*self_coupling_2*self_coupling_a + _x17*_x29*_x6*_x7*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x17*_x29*_x6*_x7*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x17*_x29*_x6*_x7*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a - _x19*_x29*m_2 - _x19*_x38 - _x23*_x32 - _x23*_x33 - _x23*_x34 - _x23*_x38 - _x25*_x32 - _x25*_x33 - _x25*_x34 - _x25*_x38 - _x31]
+
+
+def solution_8(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n_1
+    _x2 = _x0**p
+    _x3 = _x2*self_coupling_a
+    _x4 = _x0**m_1
+    _x5 = _x0**m_2
+    _x6 = _x4*_x5*self_coupling_2
+    _x7 = _x6*cross_coupling_1**2
+    _x8 = _x6*self_coupling_1**2
+    _x9 = _x0**n_2
+    _x10 = _x1*_x2*_x4*_x9*cross_coupling_1*cross_coupling_2
+    return _x1*(_x3*_x7 + _x3*_x8 - _x3*self_coupling_1 - _x7 - _x8 + self_coupling_1)/(_x1*_x4*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a - _x10*cross_coupling_a**2 - _x10*self_coupling_a**2 + _x2*_x4*_x5*self_coupling_1*self_coupling_2*self_coupling_a - _x3 - _x6*self_coupling_1 + 1)
+
+
+def fraction_8(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n_1
+    _x2 = _x0**p
+    _x3 = _x2*self_coupling_a
+    _x4 = _x0**m_1
+    _x5 = _x0**m_2
+    _x6 = _x4*_x5*self_coupling_2
+    _x7 = _x6*cross_coupling_1**2
+    _x8 = _x6*self_coupling_1**2
+    _x9 = _x0**n_2
+    _x10 = _x1*_x2*_x4*_x9*cross_coupling_1*cross_coupling_2
+    return [_x1*(_x3*_x7 + _x3*_x8 - _x3*self_coupling_1 - _x7 - _x8 + self_coupling_1), _x1*_x4*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a - _x10*cross_coupling_a**2 - _x10*self_coupling_a**2 + _x2*_x4*_x5*self_coupling_1*self_coupling_2*self_coupling_a - _x3 - _x6*self_coupling_1 + 1]
+
+
+def sensitivity_8(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n_1
+    _x2 = _x0**p
+    _x3 = _x2*self_coupling_a
+    _x4 = _x3*self_coupling_1
+    _x5 = _x0**m_1
+    _x6 = _x0**m_2
+    _x7 = _x5*_x6
+    _x8 = _x7*cross_coupling_1**2
+    _x9 = _x8*self_coupling_2
+    _x10 = _x7*self_coupling_1**2
+    _x11 = _x10*self_coupling_2
+    _x12 = _x3*_x9
+    _x13 = _x11*_x3
+    _x14 = _x1*(-_x11 + _x12 + _x13 - _x4 - _x9 + self_coupling_1)
+    _x15 = _x7*self_coupling_2
+    _x16 = _x15*self_coupling_1
+    _x17 = _x0**n_2
+    _x18 = _x1*_x17*_x5
+    _x19 = _x18*cross_coupling_2
+    _x20 = _x19*cross_coupling_1
+    _x21 = cross_coupling_a**2
+    _x22 = _x2*_x21
+    _x23 = _x20*_x22
+    _x24 = self_coupling_a**2
+    _x25 = _x2*_x24
+    _x26 = _x20*_x25
+    _x27 = 2*_x15
+    _x28 = _x27*cross_coupling_1
+    _x29 = unitary_loss_coefficient**(-1.0)
+    _x30 = _x29*n_1
+    _x31 = _x29*p
+    _x32 = _x29*m_1
+    _x33 = _x29*m_2
+    _x34 = _x3*_x31
+    _x35 = _x19*_x2
+    _x36 = _x18*cross_coupling_1
+    _x37 = 2*_x20
+    _x38 = _x29*n_2
+    return [_x14, _x1*_x17*_x5*cross_coupling_1*cross_coupling_2*self_coupling_a - _x16 + _x2*_x5*_x6*self_coupling_1*self_coupling_2*self_coupling_a - _x23 - _x26 - _x3 + 1, _x1*(_x28*_x3 - _x28), 0, 0, _x1*(-2*_x16 + _x27*_x4 - _x3 + 1), _x1*(_x10*_x3 - _x10 + _x3*_x8 - _x8), _x1*(_x11*_x2 + _x2*_x9 - _x2*self_coupling_1), _x1*(-_x11*_x32 - _x11*_x33 + _x11*_x34 + _x12*_x32 + _x12*_x33 + _x13*_x32 + _x13*_x33 - _x31*_x4 - _x32*_x9 - _x33*_x9 + _x34*_x9) + _x14*_x30, _x1*_x17*_x5*cross_coupling_2*self_coupling_a - _x21*_x35 - _x24*_x35, _x1*_x17*_x5*cross_coupling_1*self_coupling_a - _x22*_x36 - _x25*_x36, -_x2*_x37*cross_coupling_a, _x15*_x3 - _x15, _x4*_x7 - _x7*self_coupling_1, _x1*_x17*_x5*cross_coupling_1*cross_coupling_2 + _x2*_x5*_x6*self_coupling_1*self_coupling_2 - _x2 - _x3*_x37, _x1*_x17*_x29*_x5*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x1*_x17*_x29*_x5*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x1*_x17*_x29*_x5*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a - _x16*_x32 - _x16*_x33 + _x2*_x29*_x5*_x6*m_1*self_coupling_1*self_coupling_2*self_coupling_a + _x2*_x29*_x5*_x6*m_2*self_coupling_1*self_coupling_2*self_coupling_a + _x2*_x29*_x5*_x6*p*self_coupling_1*self_coupling_2*self_coupling_a - _x23*_x30 - _x23*_x31 - _x23*_x32 - _x23*_x38 - _x26*_x30 - _x26*_x31 - _x26*_x32 - _x26*_x38 - _x34]
+
+
+def solution_9(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n_1
+    _x2 = _x0**p
+    _x3 = _x0**m_1
+    _x4 = _x0**m_2
+    _x5 = _x3*_x4*self_coupling_2
+    _x6 = _x0**n_2
+    _x7 = _x1*_x2*_x3*_x6*cross_coupling_1*cross_coupling_2
+    return 1j*_x1*_x2*cross_coupling_a*(-_x5*cross_coupling_1**2 - _x5*self_coupling_1**2 + self_coupling_1)/(_x1*_x3*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a + _x2*_x3*_x4*self_coupling_1*self_coupling_2*self_coupling_a - _x2*self_coupling_a - _x5*self_coupling_1 - _x7*cross_coupling_a**2 - _x7*self_coupling_a**2 + 1)
+
+
+def fraction_9(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_1
+    _x2 = _x0**m_2
+    _x3 = _x1*_x2*self_coupling_2
+    _x4 = _x0**p
+    _x5 = _x0**n_1
+    _x6 = _x4*_x5
+    _x7 = _x0**n_2
+    _x8 = _x1*_x6*_x7*cross_coupling_1*cross_coupling_2
+    return [1j*_x6*cross_coupling_a*(-_x3*cross_coupling_1**2 - _x3*self_coupling_1**2 + self_coupling_1), _x1*_x2*_x4*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x5*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a - _x3*self_coupling_1 - _x4*self_coupling_a - _x8*cross_coupling_a**2 - _x8*self_coupling_a**2 + 1]
+
+
+def sensitivity_9(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_1
+    _x2 = _x0**m_2
+    _x3 = _x1*_x2
+    _x4 = _x3*cross_coupling_1**2
+    _x5 = _x4*self_coupling_2
+    _x6 = _x3*self_coupling_1**2
+    _x7 = _x6*self_coupling_2
+    _x8 = _x0**p
+    _x9 = _x0**n_1
+    _x10 = _x8*_x9
+    _x11 = 1j*_x10
+    _x12 = _x11*(-_x5 - _x7 + self_coupling_1)
+    _x13 = _x12*cross_coupling_a
+    _x14 = _x8*self_coupling_a
+    _x15 = _x3*self_coupling_2
+    _x16 = _x15*self_coupling_1
+    _x17 = _x0**n_2
+    _x18 = cross_coupling_a**2
+    _x19 = _x1*_x17
+    _x20 = _x19*cross_coupling_2
+    _x21 = _x20*cross_coupling_1
+    _x22 = _x10*_x21
+    _x23 = _x18*_x22
+    _x24 = self_coupling_a**2
+    _x25 = _x22*_x24
+    _x26 = _x11*cross_coupling_a
+    _x27 = unitary_loss_coefficient**(-1.0)
+    _x28 = _x27*n_1
+    _x29 = _x27*p
+    _x30 = _x27*m_1
+    _x31 = _x27*m_2
+    _x32 = _x10*_x20
+    _x33 = _x10*_x19*cross_coupling_1
+    _x34 = _x3*self_coupling_1
+    _x35 = _x27*n_2
+    return [_x13, _x1*_x17*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x1*_x2*_x8*self_coupling_1*self_coupling_2*self_coupling_a - _x14 - _x16 - _x23 - _x25 + 1, -2*_x15*_x26*cross_coupling_1, 0, _x12, _x26*(1 - 2*_x16), _x26*(-_x4 - _x6), 0, _x13*_x28 + _x13*_x29 + _x26*(-_x30*_x5 - _x30*_x7 - _x31*_x5 - _x31*_x7), _x1*_x17*_x9*cross_coupling_2*self_coupling_a - _x18*_x32 - _x24*_x32, _x1*_x17*_x9*cross_coupling_1*self_coupling_a - _x18*_x33 - _x24*_x33, -2*_x22*cross_coupling_a, _x14*_x15 - _x15, _x14*_x34 - _x34, _x1*_x17*_x9*cross_coupling_1*cross_coupling_2 + _x1*_x2*_x8*self_coupling_1*self_coupling_2 - 2*_x14*_x21*_x9 - _x8, _x1*_x17*_x27*_x9*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x1*_x17*_x27*_x9*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x1*_x17*_x27*_x9*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x1*_x2*_x27*_x8*m_1*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x2*_x27*_x8*m_2*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x2*_x27*_x8*p*self_coupling_1*self_coupling_2*self_coupling_a - _x14*_x29 - _x16*_x30 - _x16*_x31 - _x23*_x28 - _x23*_x29 - _x23*_x30 - _x23*_x35 - _x25*_x28 - _x25*_x29 - _x25*_x30 - _x25*_x35]
+
+
+def solution_10(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n_1
+    _x2 = _x0**p
+    _x3 = _x0**m_1
+    _x4 = _x0**m_2
+    _x5 = _x3*_x4*self_coupling_2
+    _x6 = _x0**n_2
+    _x7 = cross_coupling_a**2
+    _x8 = _x1*_x2*_x3*_x6*cross_coupling_1*cross_coupling_2
+    _x9 = self_coupling_a**2
+    _x10 = _x2*self_coupling_1
+    _x11 = cross_coupling_1**2
+    _x12 = _x5*self_coupling_a
+    _x13 = self_coupling_1**2
+    _x14 = _x2*_x5
+    _x15 = _x11*_x14
+    _x16 = _x13*_x14
+    return _x1*(-_x10*_x7 - _x10*_x9 - _x11*_x12 - _x12*_x13 + _x15*_x7 + _x15*_x9 + _x16*_x7 + _x16*_x9 + self_coupling_1*self_coupling_a)/(_x1*_x3*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a + _x2*_x3*_x4*self_coupling_1*self_coupling_2*self_coupling_a - _x2*self_coupling_a - _x5*self_coupling_1 - _x7*_x8 - _x8*_x9 + 1)
+
+
+def fraction_10(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n_1
+    _x2 = cross_coupling_a**2
+    _x3 = _x0**p
+    _x4 = _x3*self_coupling_1
+    _x5 = self_coupling_a**2
+    _x6 = cross_coupling_1**2
+    _x7 = _x0**m_1
+    _x8 = _x0**m_2
+    _x9 = _x7*_x8*self_coupling_2
+    _x10 = _x9*self_coupling_a
+    _x11 = self_coupling_1**2
+    _x12 = _x3*_x9
+    _x13 = _x12*_x6
+    _x14 = _x11*_x12
+    _x15 = _x0**n_2
+    _x16 = _x1*_x15*_x3*_x7*cross_coupling_1*cross_coupling_2
+    return [_x1*(-_x10*_x11 - _x10*_x6 + _x13*_x2 + _x13*_x5 + _x14*_x2 + _x14*_x5 - _x2*_x4 - _x4*_x5 + self_coupling_1*self_coupling_a), _x1*_x15*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a - _x16*_x2 - _x16*_x5 + _x3*_x7*_x8*self_coupling_1*self_coupling_2*self_coupling_a - _x3*self_coupling_a - _x9*self_coupling_1 + 1]
+
+
+def sensitivity_10(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n_1
+    _x2 = self_coupling_1*self_coupling_a
+    _x3 = _x0**p
+    _x4 = _x3*cross_coupling_a**2
+    _x5 = _x4*self_coupling_1
+    _x6 = _x3*self_coupling_a**2
+    _x7 = _x6*self_coupling_1
+    _x8 = cross_coupling_1**2
+    _x9 = _x0**m_1
+    _x10 = _x0**m_2
+    _x11 = _x10*_x9
+    _x12 = _x11*self_coupling_2
+    _x13 = _x12*_x8
+    _x14 = _x13*self_coupling_a
+    _x15 = self_coupling_1**2
+    _x16 = _x12*_x15
+    _x17 = _x16*self_coupling_a
+    _x18 = _x13*_x4
+    _x19 = _x13*_x6
+    _x20 = _x16*_x4
+    _x21 = _x16*_x6
+    _x22 = _x1*(-_x14 - _x17 + _x18 + _x19 + _x2 + _x20 + _x21 - _x5 - _x7)
+    _x23 = _x3*self_coupling_a
+    _x24 = _x12*self_coupling_1
+    _x25 = _x0**n_2
+    _x26 = _x1*_x25*_x9
+    _x27 = _x26*cross_coupling_2
+    _x28 = _x27*cross_coupling_1
+    _x29 = _x28*_x4
+    _x30 = _x28*_x6
+    _x31 = 2*_x12
+    _x32 = _x31*cross_coupling_1
+    _x33 = 2*_x3
+    _x34 = _x33*cross_coupling_a
+    _x35 = _x11*self_coupling_a
+    _x36 = _x11*_x8
+    _x37 = _x11*_x15
+    _x38 = 2*_x23
+    _x39 = unitary_loss_coefficient**(-1.0)
+    _x40 = _x39*n_1
+    _x41 = _x39*p
+    _x42 = _x39*m_1
+    _x43 = _x39*m_2
+    _x44 = _x26*cross_coupling_1
+    _x45 = _x24*_x39
+    _x46 = _x39*n_2
+    return [_x22, _x1*_x25*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x10*_x3*_x9*self_coupling_1*self_coupling_2*self_coupling_a - _x23 - _x24 - _x29 - _x30 + 1, _x1*(_x32*_x4 + _x32*_x6 - _x32*self_coupling_a), 0, _x1*(_x13*_x34 + _x16*_x34 - _x34*self_coupling_1), _x1*(-_x2*_x31 + _x31*_x5 + _x31*_x7 - _x4 - _x6 + self_coupling_a), _x1*(-_x15*_x35 - _x35*_x8 + _x36*_x4 + _x36*_x6 + _x37*_x4 + _x37*_x6), _x1*(_x13*_x38 - _x13 + _x16*_x38 - _x16 - _x2*_x33 + self_coupling_1), _x1*(-_x14*_x42 - _x14*_x43 - _x17*_x42 - _x17*_x43 + _x18*_x41 + _x18*_x42 + _x18*_x43 + _x19*_x41 + _x19*_x42 + _x19*_x43 + _x20*_x41 + _x20*_x42 + _x20*_x43 + _x21*_x41 + _x21*_x42 + _x21*_x43 - _x41*_x5 - _x41*_x7) + _x22*_x40, _x1*_x25*_x9*cross_coupling_2*self_coupling_a - _x27*_x4 - _x27*_x6, _x1*_x25*_x9*cross_coupling_1*self_coupling_a - _x4*_x44 - _x44*_x6, -_x28*_x34, _x12*_x23 - _x12, _x11*_x2*_x3 - _x11*self_coupling_1, _x1*_x25*_x9*cross_coupling_1*cross_coupling_2 + _x10*_x3*_x9*self_coupling_1*self_coupling_2 - _x28*_x38 - _x3, _x1*_x25*_x39*_x9*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x1*_x25*_x39*_x9*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x1*_x25*_x39*_x9*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x10*_x3*_x39*_x9*m_1*self_coupling_1*self_coupling_2*self_coupling_a + _x10*_x3*_x39*_x9*m_2*self_coupling_1*self_coupling_2*self_coupling_a + _x10*_x3*_x39*_x9*p*self_coupling_1*self_coupling_2*self_coupling_a - _x23*_x41 - _x29*_x40 - _x29*_x41 - _x29*_x42 - _x29*_x46 - _x30*_x40 - _x30*_x41 - _x30*_x42 - _x30*_x46 - _x45*m_1 - _x45*m_2]
+
+
+def solution_11(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n_1
+    _x2 = _x0**m_1
+    _x3 = _x0**m_2
+    _x4 = _x2*_x3*self_coupling_2
+    _x5 = _x0**p
+    _x6 = _x0**n_2
+    _x7 = _x1*_x2*_x5*_x6*cross_coupling_1*cross_coupling_2
+    return 1j*_x1*cross_coupling_a*(-_x4*cross_coupling_1**2 - _x4*self_coupling_1**2 + self_coupling_1)/(_x1*_x2*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a + _x2*_x3*_x5*self_coupling_1*self_coupling_2*self_coupling_a - _x4*self_coupling_1 - _x5*self_coupling_a - _x7*cross_coupling_a**2 - _x7*self_coupling_a**2 + 1)
+
+
+def fraction_11(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n_1
+    _x2 = _x0**m_1
+    _x3 = _x0**m_2
+    _x4 = _x2*_x3*self_coupling_2
+    _x5 = _x0**p
+    _x6 = _x0**n_2
+    _x7 = _x1*_x2*_x5*_x6*cross_coupling_1*cross_coupling_2
+    return [1j*_x1*cross_coupling_a*(-_x4*cross_coupling_1**2 - _x4*self_coupling_1**2 + self_coupling_1), _x1*_x2*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a + _x2*_x3*_x5*self_coupling_1*self_coupling_2*self_coupling_a - _x4*self_coupling_1 - _x5*self_coupling_a - _x7*cross_coupling_a**2 - _x7*self_coupling_a**2 + 1]
+
+
+def sensitivity_11(z, m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_1
+    _x2 = _x0**m_2
+    _x3 = _x1*_x2
+    _x4 = _x3*cross_coupling_1**2
+    _x5 = _x4*self_coupling_2
+    _x6 = _x3*self_coupling_1**2
+    _x7 = _x6*self_coupling_2
+    _x8 = _x0**n_1
+    _x9 = 1j*_x8
+    _x10 = _x9*(-_x5 - _x7 + self_coupling_1)
+    _x11 = _x10*cross_coupling_a
+    _x12 = _x0**p
+    _x13 = _x12*self_coupling_a
+    _x14 = _x3*self_coupling_2
+    _x15 = _x14*self_coupling_1
+    _x16 = _x0**n_2
+    _x17 = _x1*_x16*_x8
+    _x18 = _x17*cross_coupling_2
+    _x19 = _x18*cross_coupling_1
+    _x20 = cross_coupling_a**2
+    _x21 = _x12*_x20
+    _x22 = _x19*_x21
+    _x23 = self_coupling_a**2
+    _x24 = _x12*_x23
+    _x25 = _x19*_x24
+    _x26 = _x9*cross_coupling_a
+    _x27 = unitary_loss_coefficient**(-1.0)
+    _x28 = _x27*n_1
+    _x29 = _x27*m_1
+    _x30 = _x27*m_2
+    _x31 = _x12*_x18
+    _x32 = _x17*cross_coupling_1
+    _x33 = 2*_x19
+    _x34 = _x3*self_coupling_1
+    _x35 = _x27*n_2
+    _x36 = _x27*p
+    return [_x11, _x1*_x12*_x2*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x16*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a - _x13 - _x15 - _x22 - _x25 + 1, -2*_x14*_x26*cross_coupling_1, 0, _x10, _x26*(1 - 2*_x15), _x26*(-_x4 - _x6), 0, _x11*_x28 + _x26*(-_x29*_x5 - _x29*_x7 - _x30*_x5 - _x30*_x7), _x1*_x16*_x8*cross_coupling_2*self_coupling_a - _x20*_x31 - _x23*_x31, _x1*_x16*_x8*cross_coupling_1*self_coupling_a - _x21*_x32 - _x24*_x32, -_x12*_x33*cross_coupling_a, _x13*_x14 - _x14, _x13*_x34 - _x34, _x1*_x12*_x2*self_coupling_1*self_coupling_2 + _x1*_x16*_x8*cross_coupling_1*cross_coupling_2 - _x12 - _x13*_x33, _x1*_x12*_x2*_x27*m_1*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x12*_x2*_x27*m_2*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x12*_x2*_x27*p*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x16*_x27*_x8*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x1*_x16*_x27*_x8*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x1*_x16*_x27*_x8*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a - _x13*_x27*p - _x15*_x29 - _x15*_x30 - _x22*_x28 - _x22*_x29 - _x22*_x35 - _x22*_x36 - _x25*_x28 - _x25*_x29 - _x25*_x35 - _x25*_x36]
+
+
+def intrinsic_fwhm(m_1, m_2, n_1, n_2, p, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    return 2 - 2*unitary_loss_coefficient
+
+
+SOLUTIONS = (solution_0, solution_1, solution_2, solution_3, solution_4, solution_5, solution_6, solution_7, solution_8, solution_9, solution_10, solution_11,)
+FRACTIONS = (fraction_0, fraction_1, fraction_2, fraction_3, fraction_4, fraction_5, fraction_6, fraction_7, fraction_8, fraction_9, fraction_10, fraction_11,)
+SENSITIVITIES = (sensitivity_0, sensitivity_1, sensitivity_2, sensitivity_3, sensitivity_4, sensitivity_5, sensitivity_6, sensitivity_7, sensitivity_8, sensitivity_9, sensitivity_10, sensitivity_11,)
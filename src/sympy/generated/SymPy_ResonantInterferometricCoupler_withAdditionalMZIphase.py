@@ -0,0 +1,1042 @@
+"""
+Generated by src.sympy.codegen from the solutions of SymPy_ResonantInterferometricCoupler_withAdditionalMZIphase, do not edit.
+Regenerate with: python -m src.sympy.warmup SymPy_ResonantInterferometricCoupler_withAdditionalMZIphase
+"""
+import numpy
+
+CIRCUIT = 'SymPy_ResonantInterferometricCoupler_withAdditionalMZIphase'
+SOLUTION_KEY = 'f414f341b4ac4f98'
+NUM_PINS = 12
+PARAMETERS = ['m_1', 'm_2', 'n_1', 'n_2', 'p', 'additional_MZI_phase', 'cross_coupling_1', 'cross_coupling_2', 'cross_coupling_a', 'self_coupling_1', 'self_coupling_2', 'self_coupling_a', 'unitary_loss_coefficient']
+DELAY_PARAMETERS = ['m_1', 'm_2', 'n_1', 'n_2', 'p']
+SOURCE_FILE = 'resonant_interferometric_coupler.py'
+SOURCE_HASH = '1ec2de7695fd68ce'
+
+
+def solution_0(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    return 1
+
+
+def fraction_0(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    return [1, 1]
+
+
+def sensitivity_0(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    return [1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+
+
+def solution_1(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_1
+    _x2 = _x0**m_2
+    _x3 = _x0**p
+    _x4 = _x3*self_coupling_a
+    _x5 = _x2*self_coupling_2
+    _x6 = numpy.exp(1j*additional_MZI_phase)
+    _x7 = _x0**n_1
+    _x8 = _x0**n_2
+    _x9 = cross_coupling_a**2
+    _x10 = _x3*_x6*_x7*_x8*cross_coupling_2
+    _x11 = _x10*self_coupling_1
+    _x12 = self_coupling_a**2
+    _x13 = _x1*_x10*cross_coupling_1
+    return 1j*_x1*(-_x11*_x12 - _x11*_x9 + _x2*cross_coupling_1*self_coupling_2 - _x4*_x5*cross_coupling_1 + _x6*_x7*_x8*cross_coupling_2*self_coupling_1*self_coupling_a)/(_x1*_x2*_x3*self_coupling_1*self_coupling_2*self_coupling_a - _x1*_x5*self_coupling_1 + _x1*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a - _x12*_x13 - _x13*_x9 - _x4 + 1)
+
+
+def fraction_1(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_1
+    _x2 = _x0**m_2
+    _x3 = _x0**p
+    _x4 = _x3*self_coupling_a
+    _x5 = _x2*self_coupling_2
+    _x6 = numpy.exp(1j*additional_MZI_phase)
+    _x7 = _x0**n_1
+    _x8 = _x0**n_2
+    _x9 = cross_coupling_a**2
+    _x10 = _x6*_x7*_x8*cross_coupling_2
+    _x11 = _x10*_x3*self_coupling_1
+    _x12 = self_coupling_a**2
+    _x13 = _x1*_x10*_x3*cross_coupling_1
+    return [1j*_x1*(-_x11*_x12 - _x11*_x9 + _x2*cross_coupling_1*self_coupling_2 - _x4*_x5*cross_coupling_1 + _x6*_x7*_x8*cross_coupling_2*self_coupling_1*self_coupling_a), _x1*_x2*_x3*self_coupling_1*self_coupling_2*self_coupling_a - _x1*_x5*self_coupling_1 + _x1*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a - _x12*_x13 - _x13*_x9 - _x4 + 1]
+
+
+def sensitivity_1(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x0**p
+    _x3 = _x2*self_coupling_a
+    _x4 = _x1*self_coupling_2
+    _x5 = _x4*cross_coupling_1
+    _x6 = numpy.exp(1j*additional_MZI_phase)
+    _x7 = _x0**n_1
+    _x8 = _x0**n_2
+    _x9 = _x6*_x7*_x8
+    _x10 = _x9*self_coupling_1
+    _x11 = _x10*cross_coupling_2
+    _x12 = cross_coupling_a**2
+    _x13 = _x12*_x2
+    _x14 = _x11*_x13
+    _x15 = self_coupling_a**2
+    _x16 = _x15*_x2
+    _x17 = _x11*_x16
+    _x18 = _x0**m_1
+    _x19 = 1j*_x18
+    _x20 = _x19*(_x1*cross_coupling_1*self_coupling_2 - _x14 - _x17 - _x3*_x5 + _x6*_x7*_x8*cross_coupling_2*self_coupling_1*self_coupling_a)
+    _x21 = _x18*_x4
+    _x22 = _x21*self_coupling_1
+    _x23 = _x9*cross_coupling_2
+    _x24 = _x13*_x23
+    _x25 = _x18*cross_coupling_1
+    _x26 = _x24*_x25
+    _x27 = _x16*_x23
+    _x28 = _x25*_x27
+    _x29 = _x10*_x2
+    _x30 = 2*_x2*cross_coupling_a
+    _x31 = 2*_x3
+    _x32 = unitary_loss_coefficient**(-1.0)
+    _x33 = _x32*m_1
+    _x34 = _x3*_x32
+    _x35 = _x34*p
+    _x36 = _x32*n_1
+    _x37 = _x32*n_2
+    _x38 = _x32*p
+    _x39 = _x19*cross_coupling_1
+    _x40 = _x25*_x9
+    _x41 = _x23*_x25
+    _x42 = _x1*_x18*self_coupling_1
+    return [_x20, _x1*_x18*_x2*self_coupling_1*self_coupling_2*self_coupling_a + _x18*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a - _x22 - _x26 - _x28 - _x3 + 1, _x19*(-1j*_x14 - 1j*_x17 + 1j*_x6*_x7*_x8*cross_coupling_2*self_coupling_1*self_coupling_a), _x19*(_x1*self_coupling_2 - _x3*_x4), _x19*(-_x12*_x29 - _x15*_x29 + _x6*_x7*_x8*self_coupling_1*self_coupling_a), -_x11*_x19*_x30, _x19*(-_x24 - _x27 + _x6*_x7*_x8*cross_coupling_2*self_coupling_a), _x19*(-_x1*_x3*cross_coupling_1 + _x1*cross_coupling_1), _x19*(-_x11*_x31 - _x2*_x5 + _x6*_x7*_x8*cross_coupling_2*self_coupling_1), _x19*(_x1*_x32*cross_coupling_1*m_2*self_coupling_2 - _x14*_x36 - _x14*_x37 - _x14*_x38 - _x17*_x36 - _x17*_x37 - _x17*_x38 + _x32*_x6*_x7*_x8*cross_coupling_2*n_1*self_coupling_1*self_coupling_a + _x32*_x6*_x7*_x8*cross_coupling_2*n_2*self_coupling_1*self_coupling_a - _x34*_x5*m_2 - _x35*_x5) + _x20*_x33, 1j*_x18*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a - _x24*_x39 - _x27*_x39, -_x18*_x24 - _x18*_x27 + _x18*_x6*_x7*_x8*cross_coupling_2*self_coupling_a, -_x13*_x40 - _x16*_x40 + _x18*_x6*_x7*_x8*cross_coupling_1*self_coupling_a, -_x30*_x41, _x21*_x3 - _x21, _x3*_x42 - _x42, _x1*_x18*_x2*self_coupling_1*self_coupling_2 + _x18*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2 - _x2 - _x31*_x41, _x1*_x18*_x2*_x32*m_1*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x18*_x2*_x32*m_2*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x18*_x2*_x32*p*self_coupling_1*self_coupling_2*self_coupling_a + _x18*_x32*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x18*_x32*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x18*_x32*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a - _x22*_x32*m_2 - _x22*_x33 - _x26*_x33 - _x26*_x36 - _x26*_x37 - _x26*_x38 - _x28*_x33 - _x28*_x36 - _x28*_x37 - _x28*_x38 - _x35]
+
+
+def solution_2(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x1*self_coupling_a
+    _x3 = _x0**m_1
+    _x4 = _x0**m_2
+    _x5 = _x3*_x4*self_coupling_2
+    _x6 = _x5*cross_coupling_1**2
+    _x7 = _x5*self_coupling_1**2
+    _x8 = numpy.exp(1j*additional_MZI_phase)
+    _x9 = _x0**n_1
+    _x10 = _x0**n_2
+    _x11 = _x1*_x10*_x3*_x8*_x9*cross_coupling_1*cross_coupling_2
+    return (_x2*_x6 + _x2*_x7 - _x2*self_coupling_1 - _x6 - _x7 + self_coupling_1)/(_x1*_x3*_x4*self_coupling_1*self_coupling_2*self_coupling_a + _x10*_x3*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a - _x11*cross_coupling_a**2 - _x11*self_coupling_a**2 - _x2 - _x5*self_coupling_1 + 1)
+
+
+def fraction_2(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x1*self_coupling_a
+    _x3 = _x0**m_1
+    _x4 = _x0**m_2
+    _x5 = _x3*_x4*self_coupling_2
+    _x6 = _x5*cross_coupling_1**2
+    _x7 = _x5*self_coupling_1**2
+    _x8 = numpy.exp(1j*additional_MZI_phase)
+    _x9 = _x0**n_1
+    _x10 = _x0**n_2
+    _x11 = _x1*_x10*_x3*_x8*_x9*cross_coupling_1*cross_coupling_2
+    return [_x2*_x6 + _x2*_x7 - _x2*self_coupling_1 - _x6 - _x7 + self_coupling_1, _x1*_x3*_x4*self_coupling_1*self_coupling_2*self_coupling_a + _x10*_x3*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a - _x11*cross_coupling_a**2 - _x11*self_coupling_a**2 - _x2 - _x5*self_coupling_1 + 1]
+
+
+def sensitivity_2(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x1*self_coupling_a
+    _x3 = _x2*self_coupling_1
+    _x4 = _x0**m_1
+    _x5 = _x0**m_2
+    _x6 = _x4*_x5
+    _x7 = _x6*cross_coupling_1**2
+    _x8 = _x7*self_coupling_2
+    _x9 = _x6*self_coupling_1**2
+    _x10 = _x9*self_coupling_2
+    _x11 = _x2*_x8
+    _x12 = _x10*_x2
+    _x13 = _x6*self_coupling_2
+    _x14 = _x13*self_coupling_1
+    _x15 = numpy.exp(1j*additional_MZI_phase)
+    _x16 = _x0**n_1
+    _x17 = _x0**n_2
+    _x18 = _x15*_x16*_x17*_x4
+    _x19 = _x18*cross_coupling_2
+    _x20 = _x19*cross_coupling_1
+    _x21 = cross_coupling_a**2
+    _x22 = _x1*_x21
+    _x23 = _x20*_x22
+    _x24 = self_coupling_a**2
+    _x25 = _x1*_x24
+    _x26 = _x20*_x25
+    _x27 = 2*_x13
+    _x28 = _x27*cross_coupling_1
+    _x29 = unitary_loss_coefficient**(-1.0)
+    _x30 = _x29*p
+    _x31 = _x29*m_1
+    _x32 = _x29*m_2
+    _x33 = _x2*_x30
+    _x34 = _x1*_x19
+    _x35 = _x18*cross_coupling_1
+    _x36 = 2*_x20
+    _x37 = _x29*n_1
+    _x38 = _x29*n_2
+    return [-_x10 + _x11 + _x12 - _x3 - _x8 + self_coupling_1, _x1*_x4*_x5*self_coupling_1*self_coupling_2*self_coupling_a - _x14 + _x15*_x16*_x17*_x4*cross_coupling_1*cross_coupling_2*self_coupling_a - _x2 - _x23 - _x26 + 1, 0, _x2*_x28 - _x28, 0, 0, -2*_x14 - _x2 + _x27*_x3 + 1, _x2*_x7 + _x2*_x9 - _x7 - _x9, _x1*_x10 + _x1*_x8 - _x1*self_coupling_1, -_x10*_x31 - _x10*_x32 + _x10*_x33 + _x11*_x31 + _x11*_x32 + _x12*_x31 + _x12*_x32 - _x3*_x30 - _x31*_x8 - _x32*_x8 + _x33*_x8, 1j*_x15*_x16*_x17*_x4*cross_coupling_1*cross_coupling_2*self_coupling_a - 1j*_x23 - 1j*_x26, _x15*_x16*_x17*_x4*cross_coupling_2*self_coupling_a - _x21*_x34 - _x24*_x34, _x15*_x16*_x17*_x4*cross_coupling_1*self_coupling_a - _x22*_x35 - _x25*_x35, -_x1*_x36*cross_coupling_a, _x13*_x2 - _x13, _x3*_x6 - _x6*self_coupling_1, _x1*_x4*_x5*self_coupling_1*self_coupling_2 - _x1 + _x15*_x16*_x17*_x4*cross_coupling_1*cross_coupling_2 - _x2*_x36, _x1*_x29*_x4*_x5*m_1*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x29*_x4*_x5*m_2*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x29*_x4*_x5*p*self_coupling_1*self_coupling_2*self_coupling_a - _x14*_x31 - _x14*_x32 + _x15*_x16*_x17*_x29*_x4*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x15*_x16*_x17*_x29*_x4*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x15*_x16*_x17*_x29*_x4*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a - _x23*_x30 - _x23*_x31 - _x23*_x37 - _x23*_x38 - _x26*_x30 - _x26*_x31 - _x26*_x37 - _x26*_x38 - _x33]
+
+
+def solution_3(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x1*self_coupling_a
+    _x3 = _x0**m_1
+    _x4 = _x0**m_2
+    _x5 = numpy.exp(1j*additional_MZI_phase)
+    _x6 = _x0**n_1
+    _x7 = _x0**n_2
+    _x8 = cross_coupling_a**2
+    _x9 = _x1*_x3*_x5*_x6*_x7*cross_coupling_2
+    _x10 = _x9*cross_coupling_1
+    _x11 = self_coupling_a**2
+    _x12 = cross_coupling_1**2
+    _x13 = self_coupling_1**2
+    _x14 = _x12*_x9
+    _x15 = _x13*_x9
+    return 1j*(-_x11*_x14 - _x11*_x15 + _x12*_x3*_x5*_x6*_x7*cross_coupling_2*self_coupling_a + _x13*_x3*_x5*_x6*_x7*cross_coupling_2*self_coupling_a - _x14*_x8 - _x15*_x8 - _x2*cross_coupling_1 + cross_coupling_1)/(_x1*_x3*_x4*self_coupling_1*self_coupling_2*self_coupling_a - _x10*_x11 - _x10*_x8 - _x2 - _x3*_x4*self_coupling_1*self_coupling_2 + _x3*_x5*_x6*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a + 1)
+
+
+def fraction_3(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x1*self_coupling_a
+    _x3 = cross_coupling_1**2
+    _x4 = numpy.exp(1j*additional_MZI_phase)
+    _x5 = _x0**m_1
+    _x6 = _x0**n_1
+    _x7 = _x0**n_2
+    _x8 = self_coupling_1**2
+    _x9 = cross_coupling_a**2
+    _x10 = _x1*_x4*_x5*_x6*_x7*cross_coupling_2
+    _x11 = _x10*_x3
+    _x12 = self_coupling_a**2
+    _x13 = _x10*_x8
+    _x14 = _x0**m_2
+    _x15 = _x10*cross_coupling_1
+    return [1j*(-_x11*_x12 - _x11*_x9 - _x12*_x13 - _x13*_x9 - _x2*cross_coupling_1 + _x3*_x4*_x5*_x6*_x7*cross_coupling_2*self_coupling_a + _x4*_x5*_x6*_x7*_x8*cross_coupling_2*self_coupling_a + cross_coupling_1), _x1*_x14*_x5*self_coupling_1*self_coupling_2*self_coupling_a - _x12*_x15 - _x14*_x5*self_coupling_1*self_coupling_2 - _x15*_x9 - _x2 + _x4*_x5*_x6*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a + 1]
+
+
+def sensitivity_3(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x1*self_coupling_a
+    _x3 = _x2*cross_coupling_1
+    _x4 = cross_coupling_1**2
+    _x5 = numpy.exp(1j*additional_MZI_phase)
+    _x6 = _x0**m_1
+    _x7 = _x0**n_1
+    _x8 = _x0**n_2
+    _x9 = self_coupling_1**2
+    _x10 = cross_coupling_a**2
+    _x11 = _x5*_x6*_x7*_x8
+    _x12 = _x11*cross_coupling_2
+    _x13 = _x12*_x4
+    _x14 = _x1*_x13
+    _x15 = _x10*_x14
+    _x16 = self_coupling_a**2
+    _x17 = _x14*_x16
+    _x18 = _x12*_x9
+    _x19 = _x1*_x18
+    _x20 = _x10*_x19
+    _x21 = _x16*_x19
+    _x22 = _x0**m_2
+    _x23 = _x22*_x6
+    _x24 = _x23*self_coupling_2
+    _x25 = _x24*self_coupling_1
+    _x26 = _x1*cross_coupling_1
+    _x27 = _x12*_x26
+    _x28 = _x10*_x27
+    _x29 = _x16*_x27
+    _x30 = _x2 - 1
+    _x31 = _x1*_x11
+    _x32 = _x31*_x4
+    _x33 = _x31*_x9
+    _x34 = 2*cross_coupling_a
+    _x35 = _x1*_x12
+    _x36 = _x10*_x35
+    _x37 = 2*self_coupling_1
+    _x38 = _x16*_x35
+    _x39 = 2*_x2
+    _x40 = unitary_loss_coefficient**(-1.0)
+    _x41 = _x40*p
+    _x42 = _x40*m_1
+    _x43 = _x40*n_1
+    _x44 = _x40*n_2
+    _x45 = _x11*_x26
+    _x46 = _x23*self_coupling_1
+    _x47 = _x25*_x40
+    return [1j*(-_x15 - _x17 - _x20 - _x21 - _x3 + _x4*_x5*_x6*_x7*_x8*cross_coupling_2*self_coupling_a + _x5*_x6*_x7*_x8*_x9*cross_coupling_2*self_coupling_a + cross_coupling_1), _x1*_x22*_x6*self_coupling_1*self_coupling_2*self_coupling_a - _x25 - _x28 - _x29 - _x30 + _x5*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a, 1j*(-1j*_x15 - 1j*_x17 - 1j*_x20 - 1j*_x21 + 1j*_x4*_x5*_x6*_x7*_x8*cross_coupling_2*self_coupling_a + 1j*_x5*_x6*_x7*_x8*_x9*cross_coupling_2*self_coupling_a), 1j*(-2*_x28 - 2*_x29 - _x30 + 2*_x5*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a), 1j*(-_x10*_x32 - _x10*_x33 - _x16*_x32 - _x16*_x33 + _x4*_x5*_x6*_x7*_x8*self_coupling_a + _x5*_x6*_x7*_x8*_x9*self_coupling_a), 1j*(-_x14*_x34 - _x19*_x34), 1j*(-_x36*_x37 - _x37*_x38 + 2*_x5*_x6*_x7*_x8*cross_coupling_2*self_coupling_1*self_coupling_a), 0, 1j*(-_x13*_x39 - _x18*_x39 - _x26 + _x4*_x5*_x6*_x7*_x8*cross_coupling_2 + _x5*_x6*_x7*_x8*_x9*cross_coupling_2), 1j*(-_x15*_x41 - _x15*_x42 - _x15*_x43 - _x15*_x44 - _x17*_x41 - _x17*_x42 - _x17*_x43 - _x17*_x44 - _x20*_x41 - _x20*_x42 - _x20*_x43 - _x20*_x44 - _x21*_x41 - _x21*_x42 - _x21*_x43 - _x21*_x44 - _x3*_x41 + _x4*_x40*_x5*_x6*_x7*_x8*cross_coupling_2*m_1*self_coupling_a + _x4*_x40*_x5*_x6*_x7*_x8*cross_coupling_2*n_1*self_coupling_a + _x4*_x40*_x5*_x6*_x7*_x8*cross_coupling_2*n_2*self_coupling_a + _x40*_x5*_x6*_x7*_x8*_x9*cross_coupling_2*m_1*self_coupling_a + _x40*_x5*_x6*_x7*_x8*_x9*cross_coupling_2*n_1*self_coupling_a + _x40*_x5*_x6*_x7*_x8*_x9*cross_coupling_2*n_2*self_coupling_a), -1j*_x28 - 1j*_x29 + 1j*_x5*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a, -_x36 - _x38 + _x5*_x6*_x7*_x8*cross_coupling_2*self_coupling_a, -_x10*_x45 - _x16*_x45 + _x5*_x6*_x7*_x8*cross_coupling_1*self_coupling_a, -_x27*_x34, _x2*_x24 - _x24, _x2*_x46 - _x46, _x1*_x22*_x6*self_coupling_1*self_coupling_2 - _x1 - 2*_x12*_x3 + _x5*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2, _x1*_x22*_x40*_x6*m_1*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x22*_x40*_x6*m_2*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x22*_x40*_x6*p*self_coupling_1*self_coupling_2*self_coupling_a - _x2*_x41 - _x28*_x41 - _x28*_x42 - _x28*_x43 - _x28*_x44 - _x29*_x41 - _x29*_x42 - _x29*_x43 - _x29*_x44 + _x40*_x5*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x40*_x5*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x40*_x5*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a - _x47*m_1 - _x47*m_2]
+
+
+def solution_4(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x0**m_1
+    _x3 = _x0**m_2
+    _x4 = _x2*_x3*self_coupling_2
+    _x5 = numpy.exp(1j*additional_MZI_phase)
+    _x6 = _x0**n_1
+    _x7 = _x0**n_2
+    _x8 = cross_coupling_a**2
+    _x9 = _x5*_x6*_x7
+    _x10 = _x1*_x2*_x9*cross_coupling_1*cross_coupling_2
+    _x11 = self_coupling_a**2
+    _x12 = _x1*self_coupling_1
+    _x13 = cross_coupling_1**2
+    _x14 = _x4*self_coupling_a
+    _x15 = self_coupling_1**2
+    _x16 = _x1*_x4
+    _x17 = _x13*_x16
+    _x18 = _x15*_x16
+    return _x9*(-_x11*_x12 + _x11*_x17 + _x11*_x18 - _x12*_x8 - _x13*_x14 - _x14*_x15 + _x17*_x8 + _x18*_x8 + self_coupling_1*self_coupling_a)/(_x1*_x2*_x3*self_coupling_1*self_coupling_2*self_coupling_a - _x1*self_coupling_a - _x10*_x11 - _x10*_x8 + _x2*_x5*_x6*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a - _x4*self_coupling_1 + 1)
+
+
+def fraction_4(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = cross_coupling_a**2
+    _x1 = unitary_loss_coefficient/z
+    _x2 = _x1**p
+    _x3 = _x2*self_coupling_1
+    _x4 = self_coupling_a**2
+    _x5 = cross_coupling_1**2
+    _x6 = _x1**m_1
+    _x7 = _x1**m_2
+    _x8 = _x6*_x7*self_coupling_2
+    _x9 = _x8*self_coupling_a
+    _x10 = self_coupling_1**2
+    _x11 = _x2*_x8
+    _x12 = _x11*_x5
+    _x13 = _x10*_x11
+    _x14 = _x1**n_1
+    _x15 = _x1**n_2
+    _x16 = numpy.exp(1j*additional_MZI_phase)
+    _x17 = _x14*_x15*_x16
+    _x18 = _x17*_x2*_x6*cross_coupling_1*cross_coupling_2
+    return [_x17*(_x0*_x12 + _x0*_x13 - _x0*_x3 - _x10*_x9 + _x12*_x4 + _x13*_x4 - _x3*_x4 - _x5*_x9 + self_coupling_1*self_coupling_a), -_x0*_x18 + _x14*_x15*_x16*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a - _x18*_x4 + _x2*_x6*_x7*self_coupling_1*self_coupling_2*self_coupling_a - _x2*self_coupling_a - _x8*self_coupling_1 + 1]
+
+
+def sensitivity_4(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = self_coupling_1*self_coupling_a
+    _x1 = unitary_loss_coefficient/z
+    _x2 = _x1**p
+    _x3 = _x2*cross_coupling_a**2
+    _x4 = _x3*self_coupling_1
+    _x5 = _x2*self_coupling_a**2
+    _x6 = _x5*self_coupling_1
+    _x7 = cross_coupling_1**2
+    _x8 = _x1**m_1
+    _x9 = _x1**m_2
+    _x10 = _x8*_x9
+    _x11 = _x10*self_coupling_2
+    _x12 = _x11*_x7
+    _x13 = _x12*self_coupling_a
+    _x14 = self_coupling_1**2
+    _x15 = _x11*_x14
+    _x16 = _x15*self_coupling_a
+    _x17 = _x12*_x3
+    _x18 = _x12*_x5
+    _x19 = _x15*_x3
+    _x20 = _x15*_x5
+    _x21 = _x1**n_1
+    _x22 = _x1**n_2
+    _x23 = numpy.exp(1j*additional_MZI_phase)
+    _x24 = _x21*_x22*_x23
+    _x25 = _x24*(_x0 - _x13 - _x16 + _x17 + _x18 + _x19 + _x20 - _x4 - _x6)
+    _x26 = _x2*self_coupling_a
+    _x27 = _x11*self_coupling_1
+    _x28 = _x24*_x8
+    _x29 = _x28*cross_coupling_2
+    _x30 = _x29*cross_coupling_1
+    _x31 = _x3*_x30
+    _x32 = _x30*_x5
+    _x33 = 2*_x11
+    _x34 = _x33*cross_coupling_1
+    _x35 = 2*_x2
+    _x36 = _x35*cross_coupling_a
+    _x37 = _x10*self_coupling_a
+    _x38 = _x10*_x7
+    _x39 = _x10*_x14
+    _x40 = 2*_x26
+    _x41 = unitary_loss_coefficient**(-1.0)
+    _x42 = _x25*_x41
+    _x43 = _x41*p
+    _x44 = _x41*m_1
+    _x45 = _x41*m_2
+    _x46 = _x28*cross_coupling_1
+    _x47 = _x27*_x41
+    _x48 = _x41*n_1
+    _x49 = _x41*n_2
+    return [_x25, _x2*_x8*_x9*self_coupling_1*self_coupling_2*self_coupling_a + _x21*_x22*_x23*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a - _x26 - _x27 - _x31 - _x32 + 1, 1j*_x25, _x24*(_x3*_x34 - _x33*cross_coupling_1*self_coupling_a + _x34*_x5), 0, _x24*(_x12*_x36 + _x15*_x36 - _x36*self_coupling_1), _x24*(-_x0*_x33 - _x3 + _x33*_x4 + _x33*_x6 - _x5 + self_coupling_a), _x24*(-_x14*_x37 + _x3*_x38 + _x3*_x39 - _x37*_x7 + _x38*_x5 + _x39*_x5), _x24*(-_x0*_x35 + _x12*_x40 - _x12 + _x15*_x40 - _x15 + self_coupling_1), _x24*(-_x13*_x44 - _x13*_x45 - _x16*_x44 - _x16*_x45 + _x17*_x43 + _x17*_x44 + _x17*_x45 + _x18*_x43 + _x18*_x44 + _x18*_x45 + _x19*_x43 + _x19*_x44 + _x19*_x45 + _x20*_x43 + _x20*_x44 + _x20*_x45 - _x4*_x43 - _x43*_x6) + _x42*n_1 + _x42*n_2, 1j*_x21*_x22*_x23*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a - 1j*_x31 - 1j*_x32, _x21*_x22*_x23*_x8*cross_coupling_2*self_coupling_a - _x29*_x3 - _x29*_x5, _x21*_x22*_x23*_x8*cross_coupling_1*self_coupling_a - _x3*_x46 - _x46*_x5, -_x30*_x36, _x11*_x26 - _x11, _x0*_x10*_x2 - _x10*self_coupling_1, _x2*_x8*_x9*self_coupling_1*self_coupling_2 - _x2 + _x21*_x22*_x23*_x8*cross_coupling_1*cross_coupling_2 - _x30*_x40, _x2*_x41*_x8*_x9*m_1*self_coupling_1*self_coupling_2*self_coupling_a + _x2*_x41*_x8*_x9*m_2*self_coupling_1*self_coupling_2*self_coupling_a + _x2*_x41*_x8*_x9*p*self_coupling_1*self_coupling_2*self_coupling_a + _x21*_x22*_x23*_x41*_x8*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x21*_x22*_x23*_x41*_x8*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x21*_x22*_x23*_x41*_x8*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a - _x26*_x43 - _x31*_x43 - _x31*_x44 - _x31*_x48 - _x31*_x49 - _x32*_x43 - _x32*_x44 - _x32*_x48 - _x32*_x49 - _x47*m_1 - _x47*m_2]
+
+
+def solution_5(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x0**p
+    _x3 = _x2*self_coupling_a
+    _x4 = _x0**m_1
+    _x5 = numpy.exp(1j*additional_MZI_phase)
+    _x6 = _x0**n_1
+    _x7 = _x0**n_2
+    _x8 = cross_coupling_a**2
+    _x9 = _x2*_x4*_x5*_x6*_x7*cross_coupling_2
+    _x10 = _x9*cross_coupling_1
+    _x11 = self_coupling_a**2
+    _x12 = cross_coupling_1**2
+    _x13 = self_coupling_1**2
+    _x14 = _x12*_x9
+    _x15 = _x13*_x9
+    return 1j*_x1*(-_x11*_x14 - _x11*_x15 + _x12*_x4*_x5*_x6*_x7*cross_coupling_2*self_coupling_a + _x13*_x4*_x5*_x6*_x7*cross_coupling_2*self_coupling_a - _x14*_x8 - _x15*_x8 - _x3*cross_coupling_1 + cross_coupling_1)/(_x1*_x2*_x4*self_coupling_1*self_coupling_2*self_coupling_a - _x1*_x4*self_coupling_1*self_coupling_2 - _x10*_x11 - _x10*_x8 - _x3 + _x4*_x5*_x6*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a + 1)
+
+
+def fraction_5(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x0**p
+    _x3 = _x2*self_coupling_a
+    _x4 = cross_coupling_1**2
+    _x5 = numpy.exp(1j*additional_MZI_phase)
+    _x6 = _x0**m_1
+    _x7 = _x0**n_1
+    _x8 = _x0**n_2
+    _x9 = self_coupling_1**2
+    _x10 = cross_coupling_a**2
+    _x11 = _x2*_x5*_x6*_x7*_x8*cross_coupling_2
+    _x12 = _x11*_x4
+    _x13 = self_coupling_a**2
+    _x14 = _x11*_x9
+    _x15 = _x11*cross_coupling_1
+    return [1j*_x1*(-_x10*_x12 - _x10*_x14 - _x12*_x13 - _x13*_x14 - _x3*cross_coupling_1 + _x4*_x5*_x6*_x7*_x8*cross_coupling_2*self_coupling_a + _x5*_x6*_x7*_x8*_x9*cross_coupling_2*self_coupling_a + cross_coupling_1), _x1*_x2*_x6*self_coupling_1*self_coupling_2*self_coupling_a - _x1*_x6*self_coupling_1*self_coupling_2 - _x10*_x15 - _x13*_x15 - _x3 + _x5*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a + 1]
+
+
+def sensitivity_5(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x1*self_coupling_a
+    _x3 = _x2*cross_coupling_1
+    _x4 = cross_coupling_1**2
+    _x5 = numpy.exp(1j*additional_MZI_phase)
+    _x6 = _x0**m_1
+    _x7 = _x0**n_1
+    _x8 = _x0**n_2
+    _x9 = self_coupling_1**2
+    _x10 = cross_coupling_a**2
+    _x11 = _x5*_x6*_x7*_x8
+    _x12 = _x11*cross_coupling_2
+    _x13 = _x12*_x4
+    _x14 = _x1*_x13
+    _x15 = _x10*_x14
+    _x16 = self_coupling_a**2
+    _x17 = _x14*_x16
+    _x18 = _x12*_x9
+    _x19 = _x1*_x18
+    _x20 = _x10*_x19
+    _x21 = _x16*_x19
+    _x22 = _x0**m_2
+    _x23 = 1j*_x22
+    _x24 = _x23*(-_x15 - _x17 - _x20 - _x21 - _x3 + _x4*_x5*_x6*_x7*_x8*cross_coupling_2*self_coupling_a + _x5*_x6*_x7*_x8*_x9*cross_coupling_2*self_coupling_a + cross_coupling_1)
+    _x25 = _x22*_x6
+    _x26 = _x25*self_coupling_2
+    _x27 = _x26*self_coupling_1
+    _x28 = _x1*cross_coupling_1
+    _x29 = _x12*_x28
+    _x30 = _x10*_x29
+    _x31 = _x16*_x29
+    _x32 = _x2 - 1
+    _x33 = _x1*_x11
+    _x34 = _x33*_x4
+    _x35 = _x33*_x9
+    _x36 = 2*cross_coupling_a
+    _x37 = _x1*_x12
+    _x38 = _x10*_x37
+    _x39 = 2*self_coupling_1
+    _x40 = _x16*_x37
+    _x41 = 2*_x2
+    _x42 = unitary_loss_coefficient**(-1.0)
+    _x43 = _x42*m_2
+    _x44 = _x42*p
+    _x45 = _x42*m_1
+    _x46 = _x42*n_1
+    _x47 = _x42*n_2
+    _x48 = _x11*_x28
+    _x49 = _x25*self_coupling_1
+    return [_x24, _x1*_x22*_x6*self_coupling_1*self_coupling_2*self_coupling_a - _x27 - _x30 - _x31 - _x32 + _x5*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a, _x23*(-1j*_x15 - 1j*_x17 - 1j*_x20 - 1j*_x21 + 1j*_x4*_x5*_x6*_x7*_x8*cross_coupling_2*self_coupling_a + 1j*_x5*_x6*_x7*_x8*_x9*cross_coupling_2*self_coupling_a), _x23*(-2*_x30 - 2*_x31 - _x32 + 2*_x5*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a), _x23*(-_x10*_x34 - _x10*_x35 - _x16*_x34 - _x16*_x35 + _x4*_x5*_x6*_x7*_x8*self_coupling_a + _x5*_x6*_x7*_x8*_x9*self_coupling_a), _x23*(-_x14*_x36 - _x19*_x36), _x23*(-_x38*_x39 - _x39*_x40 + 2*_x5*_x6*_x7*_x8*cross_coupling_2*self_coupling_1*self_coupling_a), 0, _x23*(-_x13*_x41 - _x18*_x41 - _x28 + _x4*_x5*_x6*_x7*_x8*cross_coupling_2 + _x5*_x6*_x7*_x8*_x9*cross_coupling_2), _x23*(-_x15*_x44 - _x15*_x45 - _x15*_x46 - _x15*_x47 - _x17*_x44 - _x17*_x45 - _x17*_x46 - _x17*_x47 - _x20*_x44 - _x20*_x45 - _x20*_x46 - _x20*_x47 - _x21*_x44 - _x21*_x45 - _x21*_x46 - _x21*_x47 - _x3*_x44 + _x4*_x42*_x5*_x6*_x7*_x8*cross_coupling_2*m_1*self_coupling_a + _x4*_x42*_x5*_x6*_x7*_x8*cross_coupling_2*n_1*self_coupling_a + _x4*_x42*_x5*_x6*_x7*_x8*cross_coupling_2*n_2*self_coupling_a + _x42*_x5*_x6*_x7*_x8*_x9*cross_coupling_2*m_1*self_coupling_a + _x42*_x5*_x6*_x7*_x8*_x9*cross_coupling_2*n_1*self_coupling_a + _x42*_x5*_x6*_x7*_x8*_x9*cross_coupling_2*n_2*self_coupling_a) + _x24*_x43, -1j*_x30 - 1j*_x31 + 1j*_x5*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a, -_x38 - _x40 + _x5*_x6*_x7*_x8*cross_coupling_2*self_coupling_a, -_x10*_x48 - _x16*_x48 + _x5*_x6*_x7*_x8*cross_coupling_1*self_coupling_a, -_x29*_x36, _x2*_x26 - _x26, _x2*_x49 - _x49, _x1*_x22*_x6*self_coupling_1*self_coupling_2 - _x1 - 2*_x12*_x3 + _x5*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2, _x1*_x22*_x42*_x6*m_1*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x22*_x42*_x6*m_2*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x22*_x42*_x6*p*self_coupling_1*self_coupling_2*self_coupling_a - _x2*_x44 - _x27*_x43 - _x27*_x45 - _x30*_x44 - _x30*_x45 - _x30*_x46 - _x30*_x47 - _x31*_x44 - _x31*_x45 - _x31*_x46 - _x31*_x47 + _x42*_x5*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x42*_x5*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x42*_x5*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a]
+
+
+def solution_6(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x1*self_coupling_a
+    _x3 = self_coupling_1*self_coupling_2
+    _x4 = _x0**m_2
+    _x5 = _x0**m_1
+    _x6 = _x4*_x5
+    _x7 = numpy.exp(1j*additional_MZI_phase)
+    _x8 = _x0**n_1
+    _x9 = _x0**n_2
+    _x10 = cross_coupling_a**2
+    _x11 = cross_coupling_1*cross_coupling_2
+    _x12 = _x7*_x8*_x9
+    _x13 = _x1*_x12
+    _x14 = _x11*_x13*_x5
+    _x15 = self_coupling_a**2
+    _x16 = _x11*_x4
+    _x17 = _x12*self_coupling_a
+    _x18 = _x13*_x3
+    _x19 = cross_coupling_2**2
+    _x20 = cross_coupling_1**2
+    _x21 = _x17*_x6
+    _x22 = _x20*_x21
+    _x23 = self_coupling_2**2
+    _x24 = self_coupling_1**2
+    _x25 = _x21*_x24
+    _x26 = _x13*_x6
+    _x27 = _x20*_x26
+    _x28 = _x19*_x27
+    _x29 = _x23*_x27
+    _x30 = _x24*_x26
+    _x31 = _x19*_x30
+    _x32 = _x23*_x30
+    return (-_x10*_x18 + _x10*_x28 + _x10*_x29 + _x10*_x31 + _x10*_x32 - _x15*_x18 + _x15*_x28 + _x15*_x29 + _x15*_x31 + _x15*_x32 + _x16*_x2 - _x16 + _x17*_x3 - _x19*_x22 - _x19*_x25 - _x22*_x23 - _x23*_x25)/(_x1*_x4*_x5*self_coupling_1*self_coupling_2*self_coupling_a - _x10*_x14 - _x14*_x15 - _x2 - _x3*_x6 + _x5*_x7*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + 1)
+
+
+def fraction_6(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = cross_coupling_1*cross_coupling_2
+    _x3 = _x1*_x2
+    _x4 = _x0**p
+    _x5 = _x4*self_coupling_a
+    _x6 = self_coupling_1*self_coupling_2
+    _x7 = _x0**n_1
+    _x8 = _x0**n_2
+    _x9 = numpy.exp(1j*additional_MZI_phase)
+    _x10 = _x7*_x8*_x9
+    _x11 = _x10*_x6
+    _x12 = cross_coupling_a**2
+    _x13 = _x11*_x4
+    _x14 = self_coupling_a**2
+    _x15 = cross_coupling_2**2
+    _x16 = cross_coupling_1**2
+    _x17 = _x0**m_1
+    _x18 = _x1*_x17
+    _x19 = _x10*_x18*self_coupling_a
+    _x20 = _x16*_x19
+    _x21 = self_coupling_2**2
+    _x22 = self_coupling_1**2
+    _x23 = _x19*_x22
+    _x24 = _x10*_x4
+    _x25 = _x18*_x24
+    _x26 = _x16*_x25
+    _x27 = _x15*_x26
+    _x28 = _x21*_x26
+    _x29 = _x22*_x25
+    _x30 = _x15*_x29
+    _x31 = _x21*_x29
+    _x32 = _x17*_x2*_x24
+    return [_x11*self_coupling_a - _x12*_x13 + _x12*_x27 + _x12*_x28 + _x12*_x30 + _x12*_x31 - _x13*_x14 + _x14*_x27 + _x14*_x28 + _x14*_x30 + _x14*_x31 - _x15*_x20 - _x15*_x23 - _x20*_x21 - _x21*_x23 + _x3*_x5 - _x3, _x1*_x17*_x4*self_coupling_1*self_coupling_2*self_coupling_a - _x12*_x32 - _x14*_x32 + _x17*_x7*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a - _x18*_x6 - _x5 + 1]
+
+
+def sensitivity_6(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x1*cross_coupling_2
+    _x3 = _x2*cross_coupling_1
+    _x4 = _x0**p
+    _x5 = _x4*self_coupling_a
+    _x6 = _x0**n_1
+    _x7 = _x0**n_2
+    _x8 = numpy.exp(1j*additional_MZI_phase)
+    _x9 = _x6*_x7*_x8
+    _x10 = _x9*self_coupling_a
+    _x11 = _x10*self_coupling_2
+    _x12 = _x11*self_coupling_1
+    _x13 = _x9*self_coupling_2
+    _x14 = _x13*self_coupling_1
+    _x15 = cross_coupling_a**2
+    _x16 = _x15*_x4
+    _x17 = _x14*_x16
+    _x18 = self_coupling_a**2
+    _x19 = _x18*_x4
+    _x20 = _x14*_x19
+    _x21 = cross_coupling_2**2
+    _x22 = cross_coupling_1**2
+    _x23 = _x0**m_1
+    _x24 = _x1*_x23
+    _x25 = _x10*_x24
+    _x26 = _x22*_x25
+    _x27 = _x21*_x26
+    _x28 = self_coupling_2**2
+    _x29 = _x26*_x28
+    _x30 = self_coupling_1**2
+    _x31 = _x25*_x30
+    _x32 = _x21*_x31
+    _x33 = _x28*_x31
+    _x34 = _x24*_x9
+    _x35 = _x22*_x34
+    _x36 = _x21*_x35
+    _x37 = _x16*_x36
+    _x38 = _x19*_x36
+    _x39 = _x28*_x35
+    _x40 = _x16*_x39
+    _x41 = _x19*_x39
+    _x42 = _x30*_x34
+    _x43 = _x21*_x42
+    _x44 = _x16*_x43
+    _x45 = _x19*_x43
+    _x46 = _x28*_x42
+    _x47 = _x16*_x46
+    _x48 = _x19*_x46
+    _x49 = _x24*self_coupling_2
+    _x50 = _x49*self_coupling_1
+    _x51 = _x23*_x9
+    _x52 = _x51*cross_coupling_2
+    _x53 = _x52*cross_coupling_1
+    _x54 = _x16*_x53
+    _x55 = _x19*_x53
+    _x56 = _x1*cross_coupling_1
+    _x57 = 2*_x10*_x23
+    _x58 = _x56*_x57
+    _x59 = 2*_x51
+    _x60 = _x56*_x59
+    _x61 = _x16*_x21
+    _x62 = _x19*_x60
+    _x63 = _x16*_x28
+    _x64 = _x2*_x57
+    _x65 = _x2*_x59
+    _x66 = _x16*_x22
+    _x67 = _x19*_x65
+    _x68 = _x16*_x30
+    _x69 = 2*_x14
+    _x70 = _x4*cross_coupling_a
+    _x71 = 2*_x70
+    _x72 = _x13*_x4
+    _x73 = _x24*self_coupling_1
+    _x74 = 2*_x10
+    _x75 = _x73*_x74
+    _x76 = 2*_x9
+    _x77 = _x73*_x76
+    _x78 = _x19*_x77
+    _x79 = _x9*self_coupling_1
+    _x80 = _x49*_x74
+    _x81 = _x49*_x76
+    _x82 = _x19*_x81
+    _x83 = 2*_x5
+    _x84 = unitary_loss_coefficient**(-1.0)
+    _x85 = _x84*m_2
+    _x86 = _x5*_x84
+    _x87 = _x86*p
+    _x88 = _x12*_x84
+    _x89 = _x84*n_1
+    _x90 = _x84*n_2
+    _x91 = _x84*p
+    _x92 = _x84*m_1
+    _x93 = _x51*cross_coupling_1
+    _x94 = 2*_x53
+    return [_x12 - _x17 - _x20 - _x27 - _x29 + _x3*_x5 - _x3 - _x32 - _x33 + _x37 + _x38 + _x40 + _x41 + _x44 + _x45 + _x47 + _x48, _x1*_x23*_x4*self_coupling_1*self_coupling_2*self_coupling_a + _x23*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a - _x5 - _x50 - _x54 - _x55 + 1, 1j*_x12 - 1j*_x17 - 1j*_x20 - 1j*_x27 - 1j*_x29 - 1j*_x32 - 1j*_x33 + 1j*_x37 + 1j*_x38 + 1j*_x40 + 1j*_x41 + 1j*_x44 + 1j*_x45 + 1j*_x47 + 1j*_x48, _x2*_x5 - _x2 - _x21*_x58 + _x21*_x62 - _x28*_x58 + _x28*_x62 + _x60*_x61 + _x60*_x63, -_x22*_x64 + _x22*_x67 - _x30*_x64 + _x30*_x67 + _x5*_x56 - _x56 + _x65*_x66 + _x65*_x68, _x36*_x71 + _x39*_x71 + _x43*_x71 + _x46*_x71 - _x69*_x70, _x11 - _x15*_x72 - _x18*_x72 - _x21*_x75 + _x21*_x78 - _x28*_x75 + _x28*_x78 + _x61*_x77 + _x63*_x77, _x10*self_coupling_1 - _x16*_x79 - _x19*_x79 - _x22*_x80 + _x22*_x82 - _x30*_x80 + _x30*_x82 + _x66*_x81 + _x68*_x81, _x14 + _x3*_x4 + _x36*_x83 - _x36 + _x39*_x83 - _x39 + _x43*_x83 - _x43 + _x46*_x83 - _x46 - _x5*_x69, -_x17*_x89 - _x17*_x90 - _x17*_x91 - _x20*_x89 - _x20*_x90 - _x20*_x91 - _x27*_x85 - _x27*_x89 - _x27*_x90 - _x27*_x92 - _x29*_x85 - _x29*_x89 - _x29*_x90 - _x29*_x92 - _x3*_x85 + _x3*_x86*m_2 + _x3*_x87 - _x32*_x85 - _x32*_x89 - _x32*_x90 - _x32*_x92 - _x33*_x85 - _x33*_x89 - _x33*_x90 - _x33*_x92 + _x37*_x85 + _x37*_x89 + _x37*_x90 + _x37*_x91 + _x37*_x92 + _x38*_x85 + _x38*_x89 + _x38*_x90 + _x38*_x91 + _x38*_x92 + _x40*_x85 + _x40*_x89 + _x40*_x90 + _x40*_x91 + _x40*_x92 + _x41*_x85 + _x41*_x89 + _x41*_x90 + _x41*_x91 + _x41*_x92 + _x44*_x85 + _x44*_x89 + _x44*_x90 + _x44*_x91 + _x44*_x92 + _x45*_x85 + _x45*_x89 + _x45*_x90 + _x45*_x91 + _x45*_x92 + _x47*_x85 + _x47*_x89 + _x47*_x90 + _x47*_x91 + _x47*_x92 + _x48*_x85 + _x48*_x89 + _x48*_x90 + _x48*_x91 + _x48*_x92 + _x88*n_1 + _x88*n_2, 1j*_x23*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a - 1j*_x54 - 1j*_x55, -_x16*_x52 - _x19*_x52 + _x23*_x6*_x7*_x8*cross_coupling_2*self_coupling_a, -_x16*_x93 - _x19*_x93 + _x23*_x6*_x7*_x8*cross_coupling_1*self_coupling_a, -_x70*_x94, _x49*_x5 - _x49, _x5*_x73 - _x73, _x1*_x23*_x4*self_coupling_1*self_coupling_2 + _x23*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2 - _x4 - _x5*_x94, _x1*_x23*_x4*_x84*m_1*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x23*_x4*_x84*m_2*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x23*_x4*_x84*p*self_coupling_1*self_coupling_2*self_coupling_a + _x23*_x6*_x7*_x8*_x84*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x23*_x6*_x7*_x8*_x84*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x23*_x6*_x7*_x8*_x84*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a - _x50*_x84*m_1 - _x50*_x85 - _x54*_x89 - _x54*_x90 - _x54*_x91 - _x54*_x92 - _x55*_x89 - _x55*_x90 - _x55*_x91 - _x55*_x92 - _x87]
+
+
+def solution_7(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x0**p
+    _x3 = _x2*self_coupling_a
+    _x4 = _x1*self_coupling_2
+    _x5 = numpy.exp(1j*additional_MZI_phase)
+    _x6 = _x0**n_1
+    _x7 = _x0**n_2
+    _x8 = cross_coupling_a**2
+    _x9 = _x2*_x5*_x6*_x7*cross_coupling_2
+    _x10 = _x9*self_coupling_1
+    _x11 = self_coupling_a**2
+    _x12 = _x0**m_1
+    _x13 = _x12*_x9*cross_coupling_1
+    return 1j*(_x1*cross_coupling_1*self_coupling_2 - _x10*_x11 - _x10*_x8 - _x3*_x4*cross_coupling_1 + _x5*_x6*_x7*cross_coupling_2*self_coupling_1*self_coupling_a)/(_x1*_x12*_x2*self_coupling_1*self_coupling_2*self_coupling_a - _x11*_x13 - _x12*_x4*self_coupling_1 + _x12*_x5*_x6*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a - _x13*_x8 - _x3 + 1)
+
+
+def fraction_7(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x0**p
+    _x3 = _x2*self_coupling_a
+    _x4 = _x1*self_coupling_2
+    _x5 = numpy.exp(1j*additional_MZI_phase)
+    _x6 = _x0**n_1
+    _x7 = _x0**n_2
+    _x8 = cross_coupling_a**2
+    _x9 = _x5*_x6*_x7*cross_coupling_2
+    _x10 = _x2*_x9*self_coupling_1
+    _x11 = self_coupling_a**2
+    _x12 = _x0**m_1
+    _x13 = _x12*_x2*_x9*cross_coupling_1
+    return [1j*(_x1*cross_coupling_1*self_coupling_2 - _x10*_x11 - _x10*_x8 - _x3*_x4*cross_coupling_1 + _x5*_x6*_x7*cross_coupling_2*self_coupling_1*self_coupling_a), _x1*_x12*_x2*self_coupling_1*self_coupling_2*self_coupling_a - _x11*_x13 - _x12*_x4*self_coupling_1 + _x12*_x5*_x6*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a - _x13*_x8 - _x3 + 1]
+
+
+def sensitivity_7(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x0**p
+    _x3 = _x2*self_coupling_a
+    _x4 = _x1*self_coupling_2
+    _x5 = _x4*cross_coupling_1
+    _x6 = numpy.exp(1j*additional_MZI_phase)
+    _x7 = _x0**n_1
+    _x8 = _x0**n_2
+    _x9 = _x6*_x7*_x8
+    _x10 = _x9*self_coupling_1
+    _x11 = _x10*cross_coupling_2
+    _x12 = cross_coupling_a**2
+    _x13 = _x12*_x2
+    _x14 = _x11*_x13
+    _x15 = self_coupling_a**2
+    _x16 = _x15*_x2
+    _x17 = _x11*_x16
+    _x18 = _x0**m_1
+    _x19 = _x18*_x4
+    _x20 = _x19*self_coupling_1
+    _x21 = _x9*cross_coupling_2
+    _x22 = _x13*_x21
+    _x23 = _x18*cross_coupling_1
+    _x24 = _x22*_x23
+    _x25 = _x16*_x21
+    _x26 = _x23*_x25
+    _x27 = _x10*_x2
+    _x28 = 2*_x11
+    _x29 = _x2*cross_coupling_a
+    _x30 = unitary_loss_coefficient**(-1.0)
+    _x31 = _x3*_x30
+    _x32 = _x31*p
+    _x33 = _x30*n_1
+    _x34 = _x30*n_2
+    _x35 = _x30*p
+    _x36 = _x23*_x9
+    _x37 = 2*_x21*_x23
+    _x38 = _x1*_x18*self_coupling_1
+    _x39 = _x30*m_1
+    return [1j*(_x1*cross_coupling_1*self_coupling_2 - _x14 - _x17 - _x3*_x5 + _x6*_x7*_x8*cross_coupling_2*self_coupling_1*self_coupling_a), _x1*_x18*_x2*self_coupling_1*self_coupling_2*self_coupling_a + _x18*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a - _x20 - _x24 - _x26 - _x3 + 1, 1j*(-1j*_x14 - 1j*_x17 + 1j*_x6*_x7*_x8*cross_coupling_2*self_coupling_1*self_coupling_a), 1j*(_x1*self_coupling_2 - _x3*_x4), 1j*(-_x12*_x27 - _x15*_x27 + _x6*_x7*_x8*self_coupling_1*self_coupling_a), -1j*_x28*_x29, 1j*(-_x22 - _x25 + _x6*_x7*_x8*cross_coupling_2*self_coupling_a), 1j*(-_x1*_x3*cross_coupling_1 + _x1*cross_coupling_1), 1j*(-_x2*_x5 - _x28*_x3 + _x6*_x7*_x8*cross_coupling_2*self_coupling_1), 1j*(_x1*_x30*cross_coupling_1*m_2*self_coupling_2 - _x14*_x33 - _x14*_x34 - _x14*_x35 - _x17*_x33 - _x17*_x34 - _x17*_x35 + _x30*_x6*_x7*_x8*cross_coupling_2*n_1*self_coupling_1*self_coupling_a + _x30*_x6*_x7*_x8*cross_coupling_2*n_2*self_coupling_1*self_coupling_a - _x31*_x5*m_2 - _x32*_x5), 1j*_x18*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a - 1j*_x24 - 1j*_x26, -_x18*_x22 - _x18*_x25 + _x18*_x6*_x7*_x8*cross_coupling_2*self_coupling_a, -_x13*_x36 - _x16*_x36 + _x18*_x6*_x7*_x8*cross_coupling_1*self_coupling_a, -_x29*_x37, _x19*_x3 - _x19, _x3*_x38 - _x38, _x1*_x18*_x2*self_coupling_1*self_coupling_2 + _x18*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2 - _x2 - _x3*_x37, _x1*_x18*_x2*_x30*m_1*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x18*_x2*_x30*m_2*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x18*_x2*_x30*p*self_coupling_1*self_coupling_2*self_coupling_a + _x18*_x30*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x18*_x30*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x18*_x30*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a - _x20*_x30*m_1 - _x20*_x30*m_2 - _x24*_x33 - _x24*_x34 - _x24*_x35 - _x24*_x39 - _x26*_x33 - _x26*_x34 - _x26*_x35 - _x26*_x39 - _x32]
+
+
+def solution_8(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n_1
+    _x2 = _x0**p
+    _x3 = _x2*self_coupling_a
+    _x4 = _x0**m_1
+    _x5 = _x0**m_2
+    _x6 = _x4*_x5*self_coupling_2
+    _x7 = _x6*cross_coupling_1**2
+    _x8 = _x6*self_coupling_1**2
+    _x9 = numpy.exp(1j*additional_MZI_phase)
+    _x10 = _x0**n_2
+    _x11 = _x1*_x10*_x2*_x4*_x9*cross_coupling_1*cross_coupling_2
+    return _x1*(_x3*_x7 + _x3*_x8 - _x3*self_coupling_1 - _x7 - _x8 + self_coupling_1)/(_x1*_x10*_x4*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a - _x11*cross_coupling_a**2 - _x11*self_coupling_a**2 + _x2*_x4*_x5*self_coupling_1*self_coupling_2*self_coupling_a - _x3 - _x6*self_coupling_1 + 1)
+
+
+def fraction_8(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n_1
+    _x2 = _x0**p
+    _x3 = _x2*self_coupling_a
+    _x4 = _x0**m_1
+    _x5 = _x0**m_2
+    _x6 = _x4*_x5*self_coupling_2
+    _x7 = _x6*cross_coupling_1**2
+    _x8 = _x6*self_coupling_1**2
+    _x9 = numpy.exp(1j*additional_MZI_phase)
+    _x10 = _x0**n_2
+    _x11 = _x1*_x10*_x2*_x4*_x9*cross_coupling_1*cross_coupling_2
+    return [_x1*(_x3*_x7 + _x3*_x8 - _x3*self_coupling_1 - _x7 - _x8 + self_coupling_1), _x1*_x10*_x4*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a - _x11*cross_coupling_a**2 - _x11*self_coupling_a**2 + _x2*_x4*_x5*self_coupling_1*self_coupling_2*self_coupling_a - _x3 - _x6*self_coupling_1 + 1]
+
+
+def sensitivity_8(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n_1
+    _x2 = _x0**p
+    _x3 = _x2*self_coupling_a
+    _x4 = _x3*self_coupling_1
+    _x5 = _x0**m_1
+    _x6 = _x0**m_2
+    _x7 = _x5*_x6
+    _x8 = _x7*cross_coupling_1**2
+    _x9 = _x8*self_coupling_2
+    _x10 = _x7*self_coupling_1**2
+    _x11 = _x10*self_coupling_2
+    _x12 = _x3*_x9
+    _x13 = _x11*_x3
+    _x14 = _x1*(-_x11 + _x12 + _x13 - _x4 - _x9 + self_coupling_1)
+    _x15 = _x7*self_coupling_2
+    _x16 = _x15*self_coupling_1
+    _x17 = numpy.exp(1j*additional_MZI_phase)
+    _x18 = _x0**n_2
+    _x19 = _x1*_x17*_x18*_x5
+    _x20 = _x19*cross_coupling_2
+    _x21 = _x20*cross_coupling_1
+    _x22 = cross_coupling_a**2
+    _x23 = _x2*_x22
+    _x24 = _x21*_x23
+    _x25 = self_coupling_a**2
+    _x26 = _x2*_x25
+    _x27 = _x21*_x26
+    _x28 = 2*_x15
+    _x29 = _x28*cross_coupling_1
+    _x30 = unitary_loss_coefficient**(-1.0)
+    _x31 = _x30*n_1
+    _x32 = _x30*p
+    _x33 = _x30*m_1
+    _x34 = _x30*m_2
+    _x35 = _x3*_x32
+    _x36 = _x2*_x20
+    _x37 = _x19*cross_coupling_1
+    _x38 = 2*_x21
+    _x39 = _x30*n_2
+    return [_x14, _x1*_x17*_x18*_x5*cross_coupling_1*cross_coupling_2*self_coupling_a - _x16 + _x2*_x5*_x6*self_coupling_1*self_coupling_2*self_coupling_a - _x24 - _x27 - _x3 + 1, 0, _x1*(_x29*_x3 - _x29), 0, 0, _x1*(-2*_x16 + _x28*_x4 - _x3 + 1), _x1*(_x10*_x3 - _x10 + _x3*_x8 - _x8), _x1*(_x11*_x2 + _x2*_x9 - _x2*self_coupling_1), _x1*(-_x11*_x33 - _x11*_x34 + _x11*_x35 + _x12*_x33 + _x12*_x34 + _x13*_x33 + _x13*_x34 - _x32*_x4 - _x33*_x9 - _x34*_x9 + _x35*_x9) + _x14*_x31, 1j*_x1*_x17*_x18*_x5*cross_coupling_1*cross_coupling_2*self_coupling_a - 1j*_x24 - 1j*_x27, _x1*_x17*_x18*_x5*cross_coupling_2*self_coupling_a - _x22*_x36 - _x25*_x36, _x1*_x17*_x18*_x5*cross_coupling_1*self_coupling_a - _x23*_x37 - _x26*_x37, -_x2*_x38*cross_coupling_a, _x15*_x3 - _x15, _x4*_x7 - _x7*self_coupling_1, _x1*_x17*_x18*_x5*cross_coupling_1*cross_coupling_2 + _x2*_x5*_x6*self_coupling_1*self_coupling_2 - _x2 - _x3*_x38, _x1*_x17*_x18*_x30*_x5*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x1*_x17*_x18*_x30*_x5*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x1*_x17*_x18*_x30*_x5*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a - _x16*_x33 - _x16*_x34 + _x2*_x30*_x5*_x6*m_1*self_coupling_1*self_coupling_2*self_coupling_a + _x2*_x30*_x5*_x6*m_2*self_coupling_1*self_coupling_2*self_coupling_a + _x2*_x30*_x5*_x6*p*self_coupling_1*self_coupling_2*self_coupling_a - _x24*_x31 - _x24*_x32 - _x24*_x33 - _x24*_x39 - _x27*_x31 - _x27*_x32 - _x27*_x33 - _x27*_x39 - _x35]
+
+
+def solution_9(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p
+    _x2 = _x0**m_1
+    _x3 = _x0**m_2
+    _x4 = _x2*_x3*self_coupling_2
+    _x5 = numpy.exp(1j*additional_MZI_phase)
+    _x6 = _x0**n_1
+    _x7 = _x0**n_2
+    _x8 = _x1*_x6
+    _x9 = _x2*_x5*_x7*_x8*cross_coupling_1*cross_coupling_2
+    return 1j*_x8*cross_coupling_a*(-_x4*cross_coupling_1**2 - _x4*self_coupling_1**2 + self_coupling_1)/(_x1*_x2*_x3*self_coupling_1*self_coupling_2*self_coupling_a - _x1*self_coupling_a + _x2*_x5*_x6*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a - _x4*self_coupling_1 - _x9*cross_coupling_a**2 - _x9*self_coupling_a**2 + 1)
+
+
+def fraction_9(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_1
+    _x2 = _x0**m_2
+    _x3 = _x1*_x2*self_coupling_2
+    _x4 = _x0**p
+    _x5 = _x0**n_1
+    _x6 = _x4*_x5
+    _x7 = numpy.exp(1j*additional_MZI_phase)
+    _x8 = _x0**n_2
+    _x9 = _x1*_x6*_x7*_x8*cross_coupling_1*cross_coupling_2
+    return [1j*_x6*cross_coupling_a*(-_x3*cross_coupling_1**2 - _x3*self_coupling_1**2 + self_coupling_1), _x1*_x2*_x4*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x5*_x7*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a - _x3*self_coupling_1 - _x4*self_coupling_a - _x9*cross_coupling_a**2 - _x9*self_coupling_a**2 + 1]
+
+
+def sensitivity_9(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_1
+    _x2 = _x0**m_2
+    _x3 = _x1*_x2
+    _x4 = _x3*cross_coupling_1**2
+    _x5 = _x4*self_coupling_2
+    _x6 = _x3*self_coupling_1**2
+    _x7 = _x6*self_coupling_2
+    _x8 = _x0**p
+    _x9 = _x0**n_1
+    _x10 = _x8*_x9
+    _x11 = 1j*_x10
+    _x12 = _x11*(-_x5 - _x7 + self_coupling_1)
+    _x13 = _x12*cross_coupling_a
+    _x14 = _x8*self_coupling_a
+    _x15 = _x3*self_coupling_2
+    _x16 = _x15*self_coupling_1
+    _x17 = numpy.exp(1j*additional_MZI_phase)
+    _x18 = _x0**n_2
+    _x19 = cross_coupling_a**2
+    _x20 = _x1*_x17*_x18
+    _x21 = _x20*cross_coupling_2
+    _x22 = _x21*cross_coupling_1
+    _x23 = _x10*_x22
+    _x24 = _x19*_x23
+    _x25 = self_coupling_a**2
+    _x26 = _x23*_x25
+    _x27 = _x11*cross_coupling_a
+    _x28 = unitary_loss_coefficient**(-1.0)
+    _x29 = _x28*n_1
+    _x30 = _x28*p
+    _x31 = _x28*m_1
+    _x32 = _x28*m_2
+    _x33 = _x11*_x22
+    _x34 = _x10*_x21
+    _x35 = _x10*_x20*cross_coupling_1
+    _x36 = _x3*self_coupling_1
+    _x37 = _x28*n_2
+    return [_x13, _x1*_x17*_x18*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x1*_x2*_x8*self_coupling_1*self_coupling_2*self_coupling_a - _x14 - _x16 - _x24 - _x26 + 1, 0, -2*_x15*_x27*cross_coupling_1, 0, _x12, _x27*(1 - 2*_x16), _x27*(-_x4 - _x6), 0, _x13*_x29 + _x13*_x30 + _x27*(-_x31*_x5 - _x31*_x7 - _x32*_x5 - _x32*_x7), 1j*_x1*_x17*_x18*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a - _x19*_x33 - _x25*_x33, _x1*_x17*_x18*_x9*cross_coupling_2*self_coupling_a - _x19*_x34 - _x25*_x34, _x1*_x17*_x18*_x9*cross_coupling_1*self_coupling_a - _x19*_x35 - _x25*_x35, -2*_x23*cross_coupling_a, _x14*_x15 - _x15, _x14*_x36 - _x36, _x1*_x17*_x18*_x9*cross_coupling_1*cross_coupling_2 + _x1*_x2*_x8*self_coupling_1*self_coupling_2 - 2*_x14*_x22*_x9 - _x8, _x1*_x17*_x18*_x28*_x9*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x1*_x17*_x18*_x28*_x9*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x1*_x17*_x18*_x28*_x9*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x1*_x2*_x28*_x8*m_1*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x2*_x28*_x8*m_2*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x2*_x28*_x8*p*self_coupling_1*self_coupling_2*self_coupling_a - _x14*_x30 - _x16*_x31 - _x16*_x32 - _x24*_x29 - _x24*_x30 - _x24*_x31 - _x24*_x37 - _x26*_x29 - _x26*_x30 - _x26*_x31 - _x26*_x37]
+
+
+def solution_10(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n_1
+    _x2 = _x0**p
+    _x3 = _x0**m_1
+    _x4 = _x0**m_2
+    _x5 = _x3*_x4*self_coupling_2
+    _x6 = numpy.exp(1j*additional_MZI_phase)
+    _x7 = _x0**n_2
+    _x8 = cross_coupling_a**2
+    _x9 = _x1*_x2*_x3*_x6*_x7*cross_coupling_1*cross_coupling_2
+    _x10 = self_coupling_a**2
+    _x11 = _x2*self_coupling_1
+    _x12 = cross_coupling_1**2
+    _x13 = _x5*self_coupling_a
+    _x14 = self_coupling_1**2
+    _x15 = _x2*_x5
+    _x16 = _x12*_x15
+    _x17 = _x14*_x15
+    return _x1*(-_x10*_x11 + _x10*_x16 + _x10*_x17 - _x11*_x8 - _x12*_x13 - _x13*_x14 + _x16*_x8 + _x17*_x8 + self_coupling_1*self_coupling_a)/(_x1*_x3*_x6*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a - _x10*_x9 + _x2*_x3*_x4*self_coupling_1*self_coupling_2*self_coupling_a - _x2*self_coupling_a - _x5*self_coupling_1 - _x8*_x9 + 1)
+
+
+def fraction_10(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n_1
+    _x2 = cross_coupling_a**2
+    _x3 = _x0**p
+    _x4 = _x3*self_coupling_1
+    _x5 = self_coupling_a**2
+    _x6 = cross_coupling_1**2
+    _x7 = _x0**m_1
+    _x8 = _x0**m_2
+    _x9 = _x7*_x8*self_coupling_2
+    _x10 = _x9*self_coupling_a
+    _x11 = self_coupling_1**2
+    _x12 = _x3*_x9
+    _x13 = _x12*_x6
+    _x14 = _x11*_x12
+    _x15 = numpy.exp(1j*additional_MZI_phase)
+    _x16 = _x0**n_2
+    _x17 = _x1*_x15*_x16*_x3*_x7*cross_coupling_1*cross_coupling_2
+    return [_x1*(-_x10*_x11 - _x10*_x6 + _x13*_x2 + _x13*_x5 + _x14*_x2 + _x14*_x5 - _x2*_x4 - _x4*_x5 + self_coupling_1*self_coupling_a), _x1*_x15*_x16*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a - _x17*_x2 - _x17*_x5 + _x3*_x7*_x8*self_coupling_1*self_coupling_2*self_coupling_a - _x3*self_coupling_a - _x9*self_coupling_1 + 1]
+
+
+def sensitivity_10(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n_1
+    _x2 = self_coupling_1*self_coupling_a
+    _x3 = _x0**p
+    _x4 = _x3*cross_coupling_a**2
+    _x5 = _x4*self_coupling_1
+    _x6 = _x3*self_coupling_a**2
+    _x7 = _x6*self_coupling_1
+    _x8 = cross_coupling_1**2
+    _x9 = _x0**m_1
+    _x10 = _x0**m_2
+    _x11 = _x10*_x9
+    _x12 = _x11*self_coupling_2
+    _x13 = _x12*_x8
+    _x14 = _x13*self_coupling_a
+    _x15 = self_coupling_1**2
+    _x16 = _x12*_x15
+    _x17 = _x16*self_coupling_a
+    _x18 = _x13*_x4
+    _x19 = _x13*_x6
+    _x20 = _x16*_x4
+    _x21 = _x16*_x6
+    _x22 = _x1*(-_x14 - _x17 + _x18 + _x19 + _x2 + _x20 + _x21 - _x5 - _x7)
+    _x23 = _x3*self_coupling_a
+    _x24 = _x12*self_coupling_1
+    _x25 = numpy.exp(1j*additional_MZI_phase)
+    _x26 = _x0**n_2
+    _x27 = _x1*_x25*_x26*_x9
+    _x28 = _x27*cross_coupling_2
+    _x29 = _x28*cross_coupling_1
+    _x30 = _x29*_x4
+    _x31 = _x29*_x6
+    _x32 = 2*_x12
+    _x33 = _x32*cross_coupling_1
+    _x34 = 2*_x3
+    _x35 = _x34*cross_coupling_a
+    _x36 = _x11*self_coupling_a
+    _x37 = _x11*_x8
+    _x38 = _x11*_x15
+    _x39 = 2*_x23
+    _x40 = unitary_loss_coefficient**(-1.0)
+    _x41 = _x40*n_1
+    _x42 = _x40*p
+    _x43 = _x40*m_1
+    _x44 = _x40*m_2
+    _x45 = _x27*cross_coupling_1
+    _x46 = _x24*_x40
+    _x47 = _x40*n_2
+    return [_x22, _x1*_x25*_x26*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x10*_x3*_x9*self_coupling_1*self_coupling_2*self_coupling_a - _x23 - _x24 - _x30 - _x31 + 1, 0, _x1*(-_x32*cross_coupling_1*self_coupling_a + _x33*_x4 + _x33*_x6), 0, _x1*(_x13*_x35 + _x16*_x35 - _x35*self_coupling_1), _x1*(-_x2*_x32 + _x32*_x5 + _x32*_x7 - _x4 - _x6 + self_coupling_a), _x1*(-_x15*_x36 - _x36*_x8 + _x37*_x4 + _x37*_x6 + _x38*_x4 + _x38*_x6), _x1*(_x13*_x39 - _x13 + _x16*_x39 - _x16 - _x2*_x34 + self_coupling_1), _x1*(-_x14*_x43 - _x14*_x44 - _x17*_x43 - _x17*_x44 + _x18*_x42 + _x18*_x43 + _x18*_x44 + _x19*_x42 + _x19*_x43 + _x19*_x44 + _x20*_x42 + _x20*_x43 + _x20*_x44 + _x21*_x42 + _x21*_x43 + _x21*_x44 - _x42*_x5 - _x42*_x7) + _x22*_x41, 1j*_x1*_x25*_x26*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a - 1j*_x30 - 1j*_x31, _x1*_x25*_x26*_x9*cross_coupling_2*self_coupling_a - _x28*_x4 - _x28*_x6, _x1*_x25*_x26*_x9*cross_coupling_1*self_coupling_a - _x4*_x45 - _x45*_x6, -_x29*_x35, _x12*_x23 - _x12, _x11*_x2*_x3 - _x11*self_coupling_1, _x1*_x25*_x26*_x9*cross_coupling_1*cross_coupling_2 + _x10*_x3*_x9*self_coupling_1*self_coupling_2 - _x29*_x39 - _x3, _x1*_x25*_x26*_x40*_x9*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x1*_x25*_x26*_x40*_x9*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x1*_x25*_x26*_x40*_x9*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x10*_x3*_x40*_x9*m_1*self_coupling_1*self_coupling_2*self_coupling_a + _x10*_x3*_x40*_x9*m_2*self_coupling_1*self_coupling_2*self_coupling_a + _x10*_x3*_x40*_x9*p*self_coupling_1*self_coupling_2*self_coupling_a - _x23*_x42 - _x30*_x41 - _x30*_x42 - _x30*_x43 - _x30*_x47 - _x31*_x41 - _x31*_x42 - _x31*_x43 - _x31*_x47 - _x46*m_1 - _x46*m_2]
+
+
+def solution_11(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n_1
+    _x2 = _x0**m_1
+    _x3 = _x0**m_2
+    _x4 = _x2*_x3*self_coupling_2
+    _x5 = _x0**p
+    _x6 = numpy.exp(1j*additional_MZI_phase)
+    _x7 = _x0**n_2
+    _x8 = _x1*_x2*_x5*_x6*_x7*cross_coupling_1*cross_coupling_2
+    return 1j*_x1*cross_coupling_a*(-_x4*cross_coupling_1**2 - _x4*self_coupling_1**2 + self_coupling_1)/(_x1*_x2*_x6*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a + _x2*_x3*_x5*self_coupling_1*self_coupling_2*self_coupling_a - _x4*self_coupling_1 - _x5*self_coupling_a - _x8*cross_coupling_a**2 - _x8*self_coupling_a**2 + 1)
+
+
+def fraction_11(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n_1
+    _x2 = _x0**m_1
+    _x3 = _x0**m_2
+    _x4 = _x2*_x3*self_coupling_2
+    _x5 = _x0**p
+    _x6 = numpy.exp(1j*additional_MZI_phase)
+    _x7 = _x0**n_2
+    _x8 = _x1*_x2*_x5*_x6*_x7*cross_coupling_1*cross_coupling_2
+    return [1j*_x1*cross_coupling_a*(-_x4*cross_coupling_1**2 - _x4*self_coupling_1**2 + self_coupling_1), _x1*_x2*_x6*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a + _x2*_x3*_x5*self_coupling_1*self_coupling_2*self_coupling_a - _x4*self_coupling_1 - _x5*self_coupling_a - _x8*cross_coupling_a**2 - _x8*self_coupling_a**2 + 1]
+
+
+def sensitivity_11(z, m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_1
+    _x2 = _x0**m_2
+    _x3 = _x1*_x2
+    _x4 = _x3*cross_coupling_1**2
+    _x5 = _x4*self_coupling_2
+    _x6 = _x3*self_coupling_1**2
+    _x7 = _x6*self_coupling_2
+    _x8 = _x0**n_1
+    _x9 = 1j*_x8
+    _x10 = _x9*(-_x5 - _x7 + self_coupling_1)
+    _x11 = _x10*cross_coupling_a
+    _x12 = _x0**p
+    _x13 = _x12*self_coupling_a
+    _x14 = _x3*self_coupling_2
+    _x15 = _x14*self_coupling_1
+    _x16 = numpy.exp(1j*additional_MZI_phase)
+    _x17 = _x0**n_2
+    _x18 = _x1*_x16*_x17*_x8
+    _x19 = _x18*cross_coupling_2
+    _x20 = _x19*cross_coupling_1
+    _x21 = cross_coupling_a**2
+    _x22 = _x12*_x21
+    _x23 = _x20*_x22
+    _x24 = self_coupling_a**2
+    _x25 = _x12*_x24
+    _x26 = _x20*_x25
+    _x27 = _x9*cross_coupling_a
+    _x28 = unitary_loss_coefficient**(-1.0)
+    _x29 = _x28*n_1
+    _x30 = _x28*m_1
+    _x31 = _x28*m_2
+    _x32 = _x1*_x16*_x17*_x9*cross_coupling_1*cross_coupling_2
+    _x33 = _x12*_x19
+    _x34 = _x18*cross_coupling_1
+    _x35 = 2*_x20
+    _x36 = _x3*self_coupling_1
+    _x37 = _x28*n_2
+    _x38 = _x28*p
+    return [_x11, _x1*_x12*_x2*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x16*_x17*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a - _x13 - _x15 - _x23 - _x26 + 1, 0, -2*_x14*_x27*cross_coupling_1, 0, _x10, _x27*(1 - 2*_x15), _x27*(-_x4 - _x6), 0, _x11*_x29 + _x27*(-_x30*_x5 - _x30*_x7 - _x31*_x5 - _x31*_x7), 1j*_x1*_x16*_x17*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a - _x22*_x32 - _x25*_x32, _x1*_x16*_x17*_x8*cross_coupling_2*self_coupling_a - _x21*_x33 - _x24*_x33, _x1*_x16*_x17*_x8*cross_coupling_1*self_coupling_a - _x22*_x34 - _x25*_x34, -_x12*_x35*cross_coupling_a, _x13*_x14 - _x14, _x13*_x36 - _x36, _x1*_x12*_x2*self_coupling_1*self_coupling_2 + _x1*_x16*_x17*_x8*cross_coupling_1*cross_coupling_2 - _x12 - _x13*_x35, _x1*_x12*_x2*_x28*m_1*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x12*_x2*_x28*m_2*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x12*_x2*_x28*p*self_coupling_1*self_coupling_2*self_coupling_a + _x1*_x16*_x17*_x28*_x8*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x1*_x16*_x17*_x28*_x8*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x1*_x16*_x17*_x28*_x8*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a - _x13*_x28*p - _x15*_x30 - _x15*_x31 - _x23*_x29 - _x23*_x30 - _x23*_x37 - _x23*_x38 - _x26*_x29 - _x26*_x30 - _x26*_x37 - _x26*_x38]
+
+
+def intrinsic_fwhm(m_1, m_2, n_1, n_2, p, additional_MZI_phase, cross_coupling_1, cross_coupling_2, cross_coupling_a, self_coupling_1, self_coupling_2, self_coupling_a, unitary_loss_coefficient):
+    return 2 - 2*unitary_loss_coefficient
+
+
+SOLUTIONS = (solution_0, solution_1, solution_2, solution_3, solution_4, solution_5, solution_6, solution_7, solution_8, solution_9, solution_10, solution_11,)
+FRACTIONS = (fraction_0, fraction_1, fraction_2, fraction_3, fraction_4, fraction_5, fraction_6, fraction_7, fraction_8, fraction_9, fraction_10, fraction_11,)
+SENSITIVITIES = (sensitivity_0, sensitivity_1, sensitivity_2, sensitivity_3, sensitivity_4, sensitivity_5, sensitivity_6, sensitivity_7, sensitivity_8, sensitivity_9, sensitivity_10, sensitivity_11,)
@@ -0,0 +1,86 @@
+"""
+Generated by src.sympy.codegen from the solutions of SymPy_RingResonator, do not edit.
+Regenerate with: python -m src.sympy.warmup SymPy_RingResonator
+"""
+import numpy
+
+CIRCUIT = 'SymPy_RingResonator'
+SOLUTION_KEY = '2d86487f20565dec'
+NUM_PINS = 4
+PARAMETERS = ['l', 'cross_coupling_1', 'self_coupling_1', 'unitary_loss_coefficient']
+DELAY_PARAMETERS = ['l']
+SOURCE_FILE = 'ring_resonator.py'
+SOURCE_HASH = 'a40af8ba89e3cd37'
+
+
+def solution_0(z, l, cross_coupling_1, self_coupling_1, unitary_loss_coefficient):
+    return 1
+
+
+def fraction_0(z, l, cross_coupling_1, self_coupling_1, unitary_loss_coefficient):
+    return [1, 1]
+
+
+def sensitivity_0(z, l, cross_coupling_1, self_coupling_1, unitary_loss_coefficient):
+    return [1, 1, 0, 0, 0, 0, 0, 0]
+
+
+def solution_1(z, l, cross_coupling_1, self_coupling_1, unitary_loss_coefficient):
+    _x0 = (unitary_loss_coefficient/z)**l
+    return -1j*_x0*cross_coupling_1/(_x0*self_coupling_1 - 1)
+
+
+def fraction_1(z, l, cross_coupling_1, self_coupling_1, unitary_loss_coefficient):
+    _x0 = (unitary_loss_coefficient/z)**l
+    return [-1j*_x0*cross_coupling_1, _x0*self_coupling_1 - 1]
+
+
+def sensitivity_1(z, l, cross_coupling_1, self_coupling_1, unitary_loss_coefficient):
+    _x0 = (unitary_loss_coefficient/z)**l
+    _x1 = 1j*_x0
+    _x2 = _x1*cross_coupling_1
+    _x3 = _x0*self_coupling_1
+    _x4 = l/unitary_loss_coefficient
+    return [-_x2, _x3 - 1, -_x1, 0, -_x2*_x4, 0, _x0, _x3*_x4]
+
+
+def solution_2(z, l, cross_coupling_1, self_coupling_1, unitary_loss_coefficient):
+    _x0 = (unitary_loss_coefficient/z)**l
+    return (_x0*cross_coupling_1**2 + _x0*self_coupling_1**2 - self_coupling_1)/(_x0*self_coupling_1 - 1)
+
+
+def fraction_2(z, l, cross_coupling_1, self_coupling_1, unitary_loss_coefficient):
+    _x0 = (unitary_loss_coefficient/z)**l
+    return [_x0*cross_coupling_1**2 + _x0*self_coupling_1**2 - self_coupling_1, _x0*self_coupling_1 - 1]
+
+
+def sensitivity_2(z, l, cross_coupling_1, self_coupling_1, unitary_loss_coefficient):
+    _x0 = (unitary_loss_coefficient/z)**l
+    _x1 = _x0*cross_coupling_1**2
+    _x2 = _x0*self_coupling_1**2
+    _x3 = _x0*self_coupling_1
+    _x4 = l/unitary_loss_coefficient
+    return [_x1 + _x2 - self_coupling_1, _x3 - 1, 2*_x0*cross_coupling_1, 2*_x3 - 1, _x1*_x4 + _x2*_x4, 0, _x0, _x3*_x4]
+
+
+def solution_3(z, l, cross_coupling_1, self_coupling_1, unitary_loss_coefficient):
+    return -1j*cross_coupling_1/(self_coupling_1*(unitary_loss_coefficient/z)**l - 1)
+
+
+def fraction_3(z, l, cross_coupling_1, self_coupling_1, unitary_loss_coefficient):
+    return [-1j*cross_coupling_1, self_coupling_1*(unitary_loss_coefficient/z)**l - 1]
+
+
+def sensitivity_3(z, l, cross_coupling_1, self_coupling_1, unitary_loss_coefficient):
+    _x0 = (unitary_loss_coefficient/z)**l
+    _x1 = _x0*self_coupling_1
+    return [-1j*cross_coupling_1, _x1 - 1, -1j, 0, 0, 0, _x0, _x1*l/unitary_loss_coefficient]
+
+
+def intrinsic_fwhm(l, cross_coupling_1, self_coupling_1, unitary_loss_coefficient):
+    return 2 - 2*unitary_loss_coefficient
+
+
+SOLUTIONS = (solution_0, solution_1, solution_2, solution_3,)
+FRACTIONS = (fraction_0, fraction_1, fraction_2, fraction_3,)
+SENSITIVITIES = (sensitivity_0, sensitivity_1, sensitivity_2, sensitivity_3,)
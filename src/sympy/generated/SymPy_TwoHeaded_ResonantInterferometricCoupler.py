@@ -0,0 +1,2835 @@
+"""
+Generated by src.sympy.codegen from the solutions of SymPy_TwoHeaded_ResonantInterferometricCoupler, do not edit.
+Regenerate with: python -m src.sympy.warmup SymPy_TwoHeaded_ResonantInterferometricCoupler
+"""
+import numpy
+
+CIRCUIT = 'SymPy_TwoHeaded_ResonantInterferometricCoupler'
+SOLUTION_KEY = 'ba6eed1983dbc92d'
+NUM_PINS = 16
+PARAMETERS = ['unitary_loss_coefficient', 'm_1', 'm_2', 'n_1', 'n_2', 'n_3', 'p_1', 'p_2', 'cross_coupling_1', 'cross_coupling_2', 'cross_coupling_a', 'cross_coupling_b', 'self_coupling_1', 'self_coupling_2', 'self_coupling_a', 'self_coupling_b']
+DELAY_PARAMETERS = ['m_1', 'm_2', 'n_1', 'n_2', 'n_3', 'p_1', 'p_2']
+SOURCE_FILE = 'resonant_interferometric_coupler.py'
+SOURCE_HASH = '1ec2de7695fd68ce'
+
+
+def solution_0(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    return 1
+
+
+def fraction_0(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    return [1, 1]
+
+
+def sensitivity_0(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    return [1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+
+
+def solution_1(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_1
+    _x2 = _x0**m_2
+    _x3 = _x2*self_coupling_2
+    _x4 = _x3*cross_coupling_1
+    _x5 = _x0**p_1
+    _x6 = _x0**p_2
+    _x7 = _x5*self_coupling_a
+    _x8 = _x6*self_coupling_b
+    _x9 = _x7*_x8
+    _x10 = _x0**n_1
+    _x11 = _x0**n_2
+    _x12 = _x0**n_3
+    _x13 = _x10*_x11*_x12*cross_coupling_2
+    _x14 = _x13*self_coupling_a*self_coupling_b
+    _x15 = cross_coupling_a**2
+    _x16 = cross_coupling_b**2
+    _x17 = self_coupling_b**2
+    _x18 = self_coupling_a**2
+    _x19 = _x13*_x5*_x6
+    _x20 = _x19*self_coupling_1
+    _x21 = _x15*_x20
+    _x22 = _x18*_x20
+    _x23 = _x1*_x3*self_coupling_1
+    _x24 = _x1*cross_coupling_1
+    _x25 = _x19*_x24
+    _x26 = _x15*_x25
+    _x27 = _x18*_x25
+    return 1j*_x1*(_x10*_x11*_x12*_x15*_x5*cross_coupling_2*self_coupling_1*self_coupling_b + _x10*_x11*_x12*_x16*_x6*cross_coupling_2*self_coupling_1*self_coupling_a + _x10*_x11*_x12*_x17*_x6*cross_coupling_2*self_coupling_1*self_coupling_a + _x10*_x11*_x12*_x18*_x5*cross_coupling_2*self_coupling_1*self_coupling_b - _x14*self_coupling_1 - _x16*_x21 - _x16*_x22 - _x17*_x21 - _x17*_x22 + _x2*_x5*cross_coupling_1*self_coupling_2*self_coupling_a + _x2*_x6*cross_coupling_1*self_coupling_2*self_coupling_b - _x4*_x9 - _x4)/(_x1*_x10*_x11*_x12*_x15*_x5*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x10*_x11*_x12*_x16*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a + _x1*_x10*_x11*_x12*_x17*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a + _x1*_x10*_x11*_x12*_x18*_x5*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x2*_x5*_x6*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x2*self_coupling_1*self_coupling_2 - _x14*_x24 - _x16*_x26 - _x16*_x27 - _x17*_x26 - _x17*_x27 - _x23*_x7 - _x23*_x8 + _x5*self_coupling_a + _x6*self_coupling_b - _x9 - 1)
+
+
+def fraction_1(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_1
+    _x2 = _x0**m_2
+    _x3 = _x2*self_coupling_2
+    _x4 = _x3*cross_coupling_1
+    _x5 = _x0**p_1
+    _x6 = _x0**p_2
+    _x7 = _x5*self_coupling_a
+    _x8 = _x6*self_coupling_b
+    _x9 = _x7*_x8
+    _x10 = _x0**n_1
+    _x11 = _x0**n_2
+    _x12 = _x0**n_3
+    _x13 = _x10*_x11*_x12*cross_coupling_2
+    _x14 = _x13*self_coupling_1
+    _x15 = cross_coupling_a**2
+    _x16 = cross_coupling_b**2
+    _x17 = self_coupling_b**2
+    _x18 = self_coupling_a**2
+    _x19 = _x14*_x5*_x6
+    _x20 = _x15*_x19
+    _x21 = _x18*_x19
+    _x22 = _x1*_x3*self_coupling_1
+    _x23 = _x1*_x13*cross_coupling_1
+    _x24 = _x23*_x5*_x6
+    _x25 = _x15*_x24
+    _x26 = _x18*_x24
+    return [1j*_x1*(_x10*_x11*_x12*_x15*_x5*cross_coupling_2*self_coupling_1*self_coupling_b + _x10*_x11*_x12*_x16*_x6*cross_coupling_2*self_coupling_1*self_coupling_a + _x10*_x11*_x12*_x17*_x6*cross_coupling_2*self_coupling_1*self_coupling_a + _x10*_x11*_x12*_x18*_x5*cross_coupling_2*self_coupling_1*self_coupling_b - _x14*self_coupling_a*self_coupling_b - _x16*_x20 - _x16*_x21 - _x17*_x20 - _x17*_x21 + _x2*_x5*cross_coupling_1*self_coupling_2*self_coupling_a + _x2*_x6*cross_coupling_1*self_coupling_2*self_coupling_b - _x4*_x9 - _x4), _x1*_x10*_x11*_x12*_x15*_x5*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x10*_x11*_x12*_x16*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a + _x1*_x10*_x11*_x12*_x17*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a + _x1*_x10*_x11*_x12*_x18*_x5*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x2*_x5*_x6*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x2*self_coupling_1*self_coupling_2 - _x16*_x25 - _x16*_x26 - _x17*_x25 - _x17*_x26 - _x22*_x7 - _x22*_x8 - _x23*self_coupling_a*self_coupling_b + _x5*self_coupling_a + _x6*self_coupling_b - _x9 - 1]
+
+
+def sensitivity_1(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x1*self_coupling_2
+    _x3 = _x2*cross_coupling_1
+    _x4 = _x0**p_1
+    _x5 = _x0**p_2
+    _x6 = _x4*self_coupling_a
+    _x7 = _x5*self_coupling_b
+    _x8 = _x6*_x7
+    _x9 = _x0**n_1
+    _x10 = _x0**n_2
+    _x11 = _x0**n_3
+    _x12 = _x10*_x11*_x9
+    _x13 = _x12*self_coupling_a
+    _x14 = _x13*self_coupling_b
+    _x15 = _x14*self_coupling_1
+    _x16 = _x15*cross_coupling_2
+    _x17 = cross_coupling_a**2
+    _x18 = cross_coupling_b**2
+    _x19 = self_coupling_b**2
+    _x20 = self_coupling_a**2
+    _x21 = cross_coupling_2*self_coupling_1
+    _x22 = _x12*_x21
+    _x23 = _x18*_x5
+    _x24 = _x22*_x23
+    _x25 = _x17*_x4
+    _x26 = _x24*_x25
+    _x27 = _x19*_x5
+    _x28 = _x22*_x27
+    _x29 = _x25*_x28
+    _x30 = _x20*_x4
+    _x31 = _x24*_x30
+    _x32 = _x28*_x30
+    _x33 = _x0**m_1
+    _x34 = 1j*_x33
+    _x35 = _x34*(_x1*_x4*cross_coupling_1*self_coupling_2*self_coupling_a + _x1*_x5*cross_coupling_1*self_coupling_2*self_coupling_b + _x10*_x11*_x17*_x4*_x9*cross_coupling_2*self_coupling_1*self_coupling_b + _x10*_x11*_x18*_x5*_x9*cross_coupling_2*self_coupling_1*self_coupling_a + _x10*_x11*_x19*_x5*_x9*cross_coupling_2*self_coupling_1*self_coupling_a + _x10*_x11*_x20*_x4*_x9*cross_coupling_2*self_coupling_1*self_coupling_b - _x16 - _x26 - _x29 - _x3*_x8 - _x3 - _x31 - _x32)
+    _x36 = _x2*_x33
+    _x37 = _x36*self_coupling_1
+    _x38 = _x37*_x6
+    _x39 = _x37*_x7
+    _x40 = _x14*cross_coupling_2
+    _x41 = _x33*_x40
+    _x42 = _x41*cross_coupling_1
+    _x43 = _x33*cross_coupling_1
+    _x44 = _x43*cross_coupling_2
+    _x45 = _x12*_x4
+    _x46 = _x44*_x45
+    _x47 = _x17*_x46
+    _x48 = _x23*_x47
+    _x49 = _x27*_x47
+    _x50 = _x20*_x46
+    _x51 = _x23*_x50
+    _x52 = _x27*_x50
+    _x53 = unitary_loss_coefficient**(-1.0)
+    _x54 = _x53*m_1
+    _x55 = _x53*m_2
+    _x56 = _x3*_x55
+    _x57 = _x53*p_1
+    _x58 = _x57*_x8
+    _x59 = _x53*p_2
+    _x60 = _x59*_x8
+    _x61 = _x16*_x53
+    _x62 = _x53*n_1
+    _x63 = _x53*n_2
+    _x64 = _x53*n_3
+    _x65 = _x45*self_coupling_1
+    _x66 = _x17*_x65
+    _x67 = _x20*_x65
+    _x68 = 2*cross_coupling_a
+    _x69 = _x4*_x68
+    _x70 = _x22*_x4
+    _x71 = 2*_x5*cross_coupling_b
+    _x72 = _x45*cross_coupling_2
+    _x73 = _x17*_x72
+    _x74 = _x23*_x73
+    _x75 = _x27*_x73
+    _x76 = _x20*_x72
+    _x77 = _x23*_x76
+    _x78 = _x27*_x76
+    _x79 = _x1*cross_coupling_1
+    _x80 = _x4*_x7
+    _x81 = _x12*self_coupling_b
+    _x82 = _x5*_x6
+    _x83 = 2*_x22
+    _x84 = _x82*_x83
+    _x85 = _x80*_x83
+    _x86 = _x43*_x45
+    _x87 = _x17*_x86
+    _x88 = _x20*_x86
+    _x89 = _x46*_x68
+    _x90 = _x1*_x33*self_coupling_1
+    _x91 = 2*_x12*_x44
+    _x92 = _x82*_x91
+    _x93 = _x80*_x91
+    return [_x35, _x1*_x33*_x4*_x5*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x33*self_coupling_1*self_coupling_2 + _x10*_x11*_x17*_x33*_x4*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x10*_x11*_x18*_x33*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x10*_x11*_x19*_x33*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x10*_x11*_x20*_x33*_x4*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b - _x38 - _x39 + _x4*self_coupling_a - _x42 - _x48 - _x49 + _x5*self_coupling_b - _x51 - _x52 - _x8 - 1, _x34*(_x1*_x4*_x53*cross_coupling_1*m_2*self_coupling_2*self_coupling_a + _x1*_x4*_x53*cross_coupling_1*p_1*self_coupling_2*self_coupling_a + _x1*_x5*_x53*cross_coupling_1*m_2*self_coupling_2*self_coupling_b + _x1*_x5*_x53*cross_coupling_1*p_2*self_coupling_2*self_coupling_b + _x10*_x11*_x17*_x4*_x53*_x9*cross_coupling_2*n_1*self_coupling_1*self_coupling_b + _x10*_x11*_x17*_x4*_x53*_x9*cross_coupling_2*n_2*self_coupling_1*self_coupling_b + _x10*_x11*_x17*_x4*_x53*_x9*cross_coupling_2*n_3*self_coupling_1*self_coupling_b + _x10*_x11*_x17*_x4*_x53*_x9*cross_coupling_2*p_1*self_coupling_1*self_coupling_b + _x10*_x11*_x18*_x5*_x53*_x9*cross_coupling_2*n_1*self_coupling_1*self_coupling_a + _x10*_x11*_x18*_x5*_x53*_x9*cross_coupling_2*n_2*self_coupling_1*self_coupling_a + _x10*_x11*_x18*_x5*_x53*_x9*cross_coupling_2*n_3*self_coupling_1*self_coupling_a + _x10*_x11*_x18*_x5*_x53*_x9*cross_coupling_2*p_2*self_coupling_1*self_coupling_a + _x10*_x11*_x19*_x5*_x53*_x9*cross_coupling_2*n_1*self_coupling_1*self_coupling_a + _x10*_x11*_x19*_x5*_x53*_x9*cross_coupling_2*n_2*self_coupling_1*self_coupling_a + _x10*_x11*_x19*_x5*_x53*_x9*cross_coupling_2*n_3*self_coupling_1*self_coupling_a + _x10*_x11*_x19*_x5*_x53*_x9*cross_coupling_2*p_2*self_coupling_1*self_coupling_a + _x10*_x11*_x20*_x4*_x53*_x9*cross_coupling_2*n_1*self_coupling_1*self_coupling_b + _x10*_x11*_x20*_x4*_x53*_x9*cross_coupling_2*n_2*self_coupling_1*self_coupling_b + _x10*_x11*_x20*_x4*_x53*_x9*cross_coupling_2*n_3*self_coupling_1*self_coupling_b + _x10*_x11*_x20*_x4*_x53*_x9*cross_coupling_2*p_1*self_coupling_1*self_coupling_b - _x26*_x57 - _x26*_x59 - _x26*_x62 - _x26*_x63 - _x26*_x64 - _x29*_x57 - _x29*_x59 - _x29*_x62 - _x29*_x63 - _x29*_x64 - _x3*_x58 - _x3*_x60 - _x31*_x57 - _x31*_x59 - _x31*_x62 - _x31*_x63 - _x31*_x64 - _x32*_x57 - _x32*_x59 - _x32*_x62 - _x32*_x63 - _x32*_x64 - _x56*_x8 - _x56 - _x61*n_1 - _x61*n_2 - _x61*n_3) + _x35*_x54, _x34*(_x1*_x4*self_coupling_2*self_coupling_a + _x1*_x5*self_coupling_2*self_coupling_b - _x2*_x8 - _x2), _x34*(_x10*_x11*_x17*_x4*_x9*self_coupling_1*self_coupling_b + _x10*_x11*_x18*_x5*_x9*self_coupling_1*self_coupling_a + _x10*_x11*_x19*_x5*_x9*self_coupling_1*self_coupling_a + _x10*_x11*_x20*_x4*_x9*self_coupling_1*self_coupling_b - _x15 - _x23*_x66 - _x23*_x67 - _x27*_x66 - _x27*_x67), _x34*(2*_x10*_x11*_x4*_x9*cross_coupling_2*cross_coupling_a*self_coupling_1*self_coupling_b - _x24*_x69 - _x28*_x69), _x34*(2*_x10*_x11*_x5*_x9*cross_coupling_2*cross_coupling_b*self_coupling_1*self_coupling_a - _x17*_x70*_x71 - _x20*_x70*_x71), _x34*(_x10*_x11*_x17*_x4*_x9*cross_coupling_2*self_coupling_b + _x10*_x11*_x18*_x5*_x9*cross_coupling_2*self_coupling_a + _x10*_x11*_x19*_x5*_x9*cross_coupling_2*self_coupling_a + _x10*_x11*_x20*_x4*_x9*cross_coupling_2*self_coupling_b - _x40 - _x74 - _x75 - _x77 - _x78), _x34*(_x1*_x4*cross_coupling_1*self_coupling_a + _x1*_x5*cross_coupling_1*self_coupling_b - _x79*_x8 - _x79), _x34*(_x1*_x4*cross_coupling_1*self_coupling_2 + _x10*_x11*_x18*_x5*_x9*cross_coupling_2*self_coupling_1 + _x10*_x11*_x19*_x5*_x9*cross_coupling_2*self_coupling_1 + 2*_x10*_x11*_x4*_x9*cross_coupling_2*self_coupling_1*self_coupling_a*self_coupling_b - _x18*_x84 - _x19*_x84 - _x21*_x81 - _x3*_x80), _x34*(_x1*_x5*cross_coupling_1*self_coupling_2 + _x10*_x11*_x17*_x4*_x9*cross_coupling_2*self_coupling_1 + _x10*_x11*_x20*_x4*_x9*cross_coupling_2*self_coupling_1 + 2*_x10*_x11*_x5*_x9*cross_coupling_2*self_coupling_1*self_coupling_a*self_coupling_b - _x13*_x21 - _x17*_x85 - _x20*_x85 - _x3*_x82), _x1*_x33*_x4*_x5*_x53*m_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x33*_x4*_x5*_x53*m_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x33*_x4*_x5*_x53*p_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x33*_x4*_x5*_x53*p_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x33*_x53*m_1*self_coupling_1*self_coupling_2 + _x1*_x33*_x53*m_2*self_coupling_1*self_coupling_2 + _x10*_x11*_x17*_x33*_x4*_x53*_x9*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x10*_x11*_x17*_x33*_x4*_x53*_x9*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x10*_x11*_x17*_x33*_x4*_x53*_x9*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x10*_x11*_x17*_x33*_x4*_x53*_x9*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x10*_x11*_x17*_x33*_x4*_x53*_x9*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b + _x10*_x11*_x18*_x33*_x5*_x53*_x9*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x10*_x11*_x18*_x33*_x5*_x53*_x9*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x10*_x11*_x18*_x33*_x5*_x53*_x9*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x10*_x11*_x18*_x33*_x5*_x53*_x9*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x10*_x11*_x18*_x33*_x5*_x53*_x9*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x10*_x11*_x19*_x33*_x5*_x53*_x9*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x10*_x11*_x19*_x33*_x5*_x53*_x9*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x10*_x11*_x19*_x33*_x5*_x53*_x9*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x10*_x11*_x19*_x33*_x5*_x53*_x9*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x10*_x11*_x19*_x33*_x5*_x53*_x9*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x10*_x11*_x20*_x33*_x4*_x53*_x9*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x10*_x11*_x20*_x33*_x4*_x53*_x9*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x10*_x11*_x20*_x33*_x4*_x53*_x9*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x10*_x11*_x20*_x33*_x4*_x53*_x9*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x10*_x11*_x20*_x33*_x4*_x53*_x9*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b - _x37*_x57*_x6 - _x37*_x59*_x7 - _x38*_x54 - _x38*_x55 - _x39*_x54 - _x39*_x55 + _x4*_x53*p_1*self_coupling_a - _x42*_x54 - _x42*_x62 - _x42*_x63 - _x42*_x64 - _x48*_x54 - _x48*_x57 - _x48*_x59 - _x48*_x62 - _x48*_x63 - _x48*_x64 - _x49*_x54 - _x49*_x57 - _x49*_x59 - _x49*_x62 - _x49*_x63 - _x49*_x64 + _x5*_x53*p_2*self_coupling_b - _x51*_x54 - _x51*_x57 - _x51*_x59 - _x51*_x62 - _x51*_x63 - _x51*_x64 - _x52*_x54 - _x52*_x57 - _x52*_x59 - _x52*_x62 - _x52*_x63 - _x52*_x64 - _x58 - _x60, _x10*_x11*_x17*_x33*_x4*_x9*cross_coupling_2*self_coupling_b + _x10*_x11*_x18*_x33*_x5*_x9*cross_coupling_2*self_coupling_a + _x10*_x11*_x19*_x33*_x5*_x9*cross_coupling_2*self_coupling_a + _x10*_x11*_x20*_x33*_x4*_x9*cross_coupling_2*self_coupling_b - _x33*_x74 - _x33*_x75 - _x33*_x77 - _x33*_x78 - _x41, _x10*_x11*_x17*_x33*_x4*_x9*cross_coupling_1*self_coupling_b + _x10*_x11*_x18*_x33*_x5*_x9*cross_coupling_1*self_coupling_a + _x10*_x11*_x19*_x33*_x5*_x9*cross_coupling_1*self_coupling_a + _x10*_x11*_x20*_x33*_x4*_x9*cross_coupling_1*self_coupling_b - _x14*_x43 - _x23*_x87 - _x23*_x88 - _x27*_x87 - _x27*_x88, 2*_x10*_x11*_x33*_x4*_x9*cross_coupling_1*cross_coupling_2*cross_coupling_a*self_coupling_b - _x23*_x89 - _x27*_x89, 2*_x10*_x11*_x33*_x5*_x9*cross_coupling_1*cross_coupling_2*cross_coupling_b*self_coupling_a - _x47*_x71 - _x50*_x71, -_x36*_x6 - _x36*_x7 + _x36*_x8 + _x36, -_x6*_x90 - _x7*_x90 + _x8*_x90 + _x90, _x1*_x33*_x4*_x5*self_coupling_1*self_coupling_2*self_coupling_b + _x10*_x11*_x18*_x33*_x5*_x9*cross_coupling_1*cross_coupling_2 + _x10*_x11*_x19*_x33*_x5*_x9*cross_coupling_1*cross_coupling_2 + 2*_x10*_x11*_x33*_x4*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b - _x18*_x92 - _x19*_x92 - _x37*_x4 + _x4 - _x44*_x81 - _x80, _x1*_x33*_x4*_x5*self_coupling_1*self_coupling_2*self_coupling_a + _x10*_x11*_x17*_x33*_x4*_x9*cross_coupling_1*cross_coupling_2 + _x10*_x11*_x20*_x33*_x4*_x9*cross_coupling_1*cross_coupling_2 + 2*_x10*_x11*_x33*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b - _x13*_x44 - _x17*_x93 - _x20*_x93 - _x37*_x5 + _x5 - _x82]
+
+
+def solution_2(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p_1
+    _x2 = _x1*self_coupling_a
+    _x3 = _x2*self_coupling_1
+    _x4 = _x0**p_2
+    _x5 = _x4*self_coupling_b
+    _x6 = _x5*self_coupling_1
+    _x7 = _x0**m_1
+    _x8 = _x0**m_2
+    _x9 = _x7*_x8*self_coupling_2
+    _x10 = _x9*cross_coupling_1**2
+    _x11 = _x9*self_coupling_1**2
+    _x12 = _x2*_x5
+    _x13 = _x0**n_1
+    _x14 = _x0**n_2
+    _x15 = _x0**n_3
+    _x16 = _x13*_x14*_x15*_x7*cross_coupling_1*cross_coupling_2
+    _x17 = cross_coupling_a**2
+    _x18 = cross_coupling_b**2
+    _x19 = self_coupling_b**2
+    _x20 = self_coupling_a**2
+    _x21 = _x1*_x16*_x4
+    _x22 = _x17*_x21
+    _x23 = _x20*_x21
+    return (_x10*_x12 - _x10*_x2 - _x10*_x5 + _x10 + _x11*_x12 - _x11*_x2 - _x11*_x5 + _x11 - _x3*_x5 + _x3 + _x6 - self_coupling_1)/(_x1*_x13*_x14*_x15*_x17*_x7*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x13*_x14*_x15*_x20*_x7*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x4*_x7*_x8*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*self_coupling_a - _x12 + _x13*_x14*_x15*_x18*_x4*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a + _x13*_x14*_x15*_x19*_x4*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a - _x16*self_coupling_a*self_coupling_b - _x18*_x22 - _x18*_x23 - _x19*_x22 - _x19*_x23 - _x3*_x9 + _x4*self_coupling_b - _x6*_x9 + _x7*_x8*self_coupling_1*self_coupling_2 - 1)
+
+
+def fraction_2(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p_1
+    _x2 = _x1*self_coupling_a
+    _x3 = _x2*self_coupling_1
+    _x4 = _x0**p_2
+    _x5 = _x4*self_coupling_b
+    _x6 = _x5*self_coupling_1
+    _x7 = _x0**m_1
+    _x8 = _x0**m_2
+    _x9 = _x7*_x8*self_coupling_2
+    _x10 = _x9*cross_coupling_1**2
+    _x11 = _x9*self_coupling_1**2
+    _x12 = _x2*_x5
+    _x13 = _x0**n_1
+    _x14 = _x0**n_2
+    _x15 = _x0**n_3
+    _x16 = _x13*_x14*_x15*_x7*cross_coupling_1*cross_coupling_2
+    _x17 = cross_coupling_a**2
+    _x18 = cross_coupling_b**2
+    _x19 = self_coupling_b**2
+    _x20 = self_coupling_a**2
+    _x21 = _x1*_x16*_x4
+    _x22 = _x17*_x21
+    _x23 = _x20*_x21
+    return [_x10*_x12 - _x10*_x2 - _x10*_x5 + _x10 + _x11*_x12 - _x11*_x2 - _x11*_x5 + _x11 - _x3*_x5 + _x3 + _x6 - self_coupling_1, _x1*_x13*_x14*_x15*_x17*_x7*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x13*_x14*_x15*_x20*_x7*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x4*_x7*_x8*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*self_coupling_a - _x12 + _x13*_x14*_x15*_x18*_x4*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a + _x13*_x14*_x15*_x19*_x4*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a - _x16*self_coupling_a*self_coupling_b - _x18*_x22 - _x18*_x23 - _x19*_x22 - _x19*_x23 - _x3*_x9 + _x4*self_coupling_b - _x6*_x9 + _x7*_x8*self_coupling_1*self_coupling_2 - 1]
+
+
+def sensitivity_2(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p_1
+    _x2 = _x1*self_coupling_a
+    _x3 = _x2*self_coupling_1
+    _x4 = _x0**p_2
+    _x5 = _x4*self_coupling_b
+    _x6 = _x5*self_coupling_1
+    _x7 = _x0**m_1
+    _x8 = _x0**m_2
+    _x9 = _x7*_x8
+    _x10 = _x9*cross_coupling_1**2
+    _x11 = _x10*self_coupling_2
+    _x12 = _x9*self_coupling_1**2
+    _x13 = _x12*self_coupling_2
+    _x14 = _x3*_x5
+    _x15 = _x11*_x2
+    _x16 = _x11*_x5
+    _x17 = _x13*_x2
+    _x18 = _x13*_x5
+    _x19 = _x2*_x5
+    _x20 = _x9*self_coupling_2
+    _x21 = _x20*_x3
+    _x22 = _x20*_x6
+    _x23 = _x0**n_1
+    _x24 = _x0**n_2
+    _x25 = _x0**n_3
+    _x26 = _x23*_x24*_x25*_x7
+    _x27 = _x26*self_coupling_a
+    _x28 = _x27*self_coupling_b
+    _x29 = _x28*cross_coupling_2
+    _x30 = _x29*cross_coupling_1
+    _x31 = cross_coupling_a**2
+    _x32 = cross_coupling_b**2
+    _x33 = self_coupling_b**2
+    _x34 = self_coupling_a**2
+    _x35 = cross_coupling_1*cross_coupling_2
+    _x36 = _x26*_x35
+    _x37 = _x32*_x4
+    _x38 = _x36*_x37
+    _x39 = _x1*_x31
+    _x40 = _x38*_x39
+    _x41 = _x33*_x4
+    _x42 = _x36*_x41
+    _x43 = _x39*_x42
+    _x44 = _x1*_x34
+    _x45 = _x38*_x44
+    _x46 = _x42*_x44
+    _x47 = unitary_loss_coefficient**(-1.0)
+    _x48 = _x47*p_1
+    _x49 = _x3*_x48
+    _x50 = _x47*p_2
+    _x51 = _x50*_x6
+    _x52 = _x47*m_1
+    _x53 = _x11*_x52
+    _x54 = _x47*m_2
+    _x55 = _x11*_x54
+    _x56 = _x13*_x52
+    _x57 = _x13*_x54
+    _x58 = _x5*_x50
+    _x59 = _x2*_x48
+    _x60 = _x19*_x48
+    _x61 = _x19*_x50
+    _x62 = 2*_x20
+    _x63 = _x62*cross_coupling_1
+    _x64 = _x1*self_coupling_1
+    _x65 = _x1*_x5
+    _x66 = _x4*self_coupling_1
+    _x67 = _x2*_x4
+    _x68 = _x30*_x47
+    _x69 = _x47*n_1
+    _x70 = _x47*n_2
+    _x71 = _x47*n_3
+    _x72 = _x1*_x26
+    _x73 = _x72*cross_coupling_2
+    _x74 = _x31*_x73
+    _x75 = _x34*_x73
+    _x76 = _x72*cross_coupling_1
+    _x77 = _x31*_x76
+    _x78 = _x34*_x76
+    _x79 = 2*_x1*cross_coupling_a
+    _x80 = _x1*_x36
+    _x81 = 2*_x4*cross_coupling_b
+    _x82 = 2*_x36
+    _x83 = _x67*_x82
+    _x84 = _x65*_x82
+    return [_x11*_x19 + _x11 + _x13*_x19 + _x13 - _x14 - _x15 - _x16 - _x17 - _x18 + _x3 + _x6 - self_coupling_1, _x1*_x23*_x24*_x25*_x31*_x7*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x23*_x24*_x25*_x34*_x7*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x4*_x7*_x8*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*self_coupling_a - _x19 - _x21 - _x22 + _x23*_x24*_x25*_x32*_x4*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a + _x23*_x24*_x25*_x33*_x4*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a - _x30 + _x4*self_coupling_b - _x40 - _x43 - _x45 - _x46 + _x7*_x8*self_coupling_1*self_coupling_2 - 1, -_x11*_x58 - _x11*_x59 + _x11*_x60 + _x11*_x61 - _x13*_x58 - _x13*_x59 + _x13*_x60 + _x13*_x61 - _x14*_x48 - _x15*_x52 - _x15*_x54 - _x16*_x52 - _x16*_x54 - _x17*_x52 - _x17*_x54 - _x18*_x52 - _x18*_x54 + _x19*_x53 + _x19*_x55 + _x19*_x56 + _x19*_x57 - _x3*_x58 + _x49 + _x51 + _x53 + _x55 + _x56 + _x57, _x19*_x63 - _x2*_x63 - _x5*_x63 + _x63, 0, 0, 0, _x14*_x62 - _x19 + _x2 + 2*_x20*self_coupling_1 - _x3*_x62 + _x5 - _x6*_x62 - 1, _x10*_x19 - _x10*_x2 - _x10*_x5 + _x10 + _x12*_x19 - _x12*_x2 - _x12*_x5 + _x12, -_x1*_x11 - _x1*_x13 + _x11*_x65 + _x13*_x65 - _x5*_x64 + _x64, -_x11*_x4 + _x11*_x67 - _x13*_x4 + _x13*_x67 - _x2*_x66 + _x66, _x1*_x23*_x24*_x25*_x31*_x47*_x7*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x1*_x23*_x24*_x25*_x31*_x47*_x7*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x1*_x23*_x24*_x25*_x31*_x47*_x7*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x1*_x23*_x24*_x25*_x31*_x47*_x7*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x1*_x23*_x24*_x25*_x31*_x47*_x7*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b + _x1*_x23*_x24*_x25*_x34*_x47*_x7*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x1*_x23*_x24*_x25*_x34*_x47*_x7*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x1*_x23*_x24*_x25*_x34*_x47*_x7*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x1*_x23*_x24*_x25*_x34*_x47*_x7*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x1*_x23*_x24*_x25*_x34*_x47*_x7*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b + _x1*_x4*_x47*_x7*_x8*m_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x4*_x47*_x7*_x8*m_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x4*_x47*_x7*_x8*p_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x4*_x47*_x7*_x8*p_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x47*p_1*self_coupling_a - _x20*_x49 - _x20*_x51 - _x21*_x52 - _x21*_x54 - _x22*_x52 - _x22*_x54 + _x23*_x24*_x25*_x32*_x4*_x47*_x7*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x23*_x24*_x25*_x32*_x4*_x47*_x7*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x23*_x24*_x25*_x32*_x4*_x47*_x7*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x23*_x24*_x25*_x32*_x4*_x47*_x7*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x23*_x24*_x25*_x32*_x4*_x47*_x7*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x23*_x24*_x25*_x33*_x4*_x47*_x7*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x23*_x24*_x25*_x33*_x4*_x47*_x7*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x23*_x24*_x25*_x33*_x4*_x47*_x7*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x23*_x24*_x25*_x33*_x4*_x47*_x7*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x23*_x24*_x25*_x33*_x4*_x47*_x7*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a - _x30*_x52 + _x4*_x47*p_2*self_coupling_b - _x40*_x48 - _x40*_x50 - _x40*_x52 - _x40*_x69 - _x40*_x70 - _x40*_x71 - _x43*_x48 - _x43*_x50 - _x43*_x52 - _x43*_x69 - _x43*_x70 - _x43*_x71 - _x45*_x48 - _x45*_x50 - _x45*_x52 - _x45*_x69 - _x45*_x70 - _x45*_x71 - _x46*_x48 - _x46*_x50 - _x46*_x52 - _x46*_x69 - _x46*_x70 - _x46*_x71 + _x47*_x7*_x8*m_1*self_coupling_1*self_coupling_2 + _x47*_x7*_x8*m_2*self_coupling_1*self_coupling_2 - _x60 - _x61 - _x68*n_1 - _x68*n_2 - _x68*n_3, _x1*_x23*_x24*_x25*_x31*_x7*cross_coupling_2*self_coupling_b + _x1*_x23*_x24*_x25*_x34*_x7*cross_coupling_2*self_coupling_b + _x23*_x24*_x25*_x32*_x4*_x7*cross_coupling_2*self_coupling_a + _x23*_x24*_x25*_x33*_x4*_x7*cross_coupling_2*self_coupling_a - _x29 - _x37*_x74 - _x37*_x75 - _x41*_x74 - _x41*_x75, _x1*_x23*_x24*_x25*_x31*_x7*cross_coupling_1*self_coupling_b + _x1*_x23*_x24*_x25*_x34*_x7*cross_coupling_1*self_coupling_b + _x23*_x24*_x25*_x32*_x4*_x7*cross_coupling_1*self_coupling_a + _x23*_x24*_x25*_x33*_x4*_x7*cross_coupling_1*self_coupling_a - _x28*cross_coupling_1 - _x37*_x77 - _x37*_x78 - _x41*_x77 - _x41*_x78, 2*_x1*_x23*_x24*_x25*_x7*cross_coupling_1*cross_coupling_2*cross_coupling_a*self_coupling_b - _x38*_x79 - _x42*_x79, 2*_x23*_x24*_x25*_x4*_x7*cross_coupling_1*cross_coupling_2*cross_coupling_b*self_coupling_a - _x31*_x80*_x81 - _x34*_x80*_x81, _x19*_x20 - _x2*_x20 - _x20*_x5 + _x20, _x14*_x9 - _x3*_x9 - _x6*_x9 + _x9*self_coupling_1, 2*_x1*_x23*_x24*_x25*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b + _x1*_x4*_x7*_x8*self_coupling_1*self_coupling_2*self_coupling_b + _x1 - _x20*_x64 + _x23*_x24*_x25*_x32*_x4*_x7*cross_coupling_1*cross_coupling_2 + _x23*_x24*_x25*_x33*_x4*_x7*cross_coupling_1*cross_coupling_2 - _x26*_x35*self_coupling_b - _x32*_x83 - _x33*_x83 - _x65, _x1*_x23*_x24*_x25*_x31*_x7*cross_coupling_1*cross_coupling_2 + _x1*_x23*_x24*_x25*_x34*_x7*cross_coupling_1*cross_coupling_2 + _x1*_x4*_x7*_x8*self_coupling_1*self_coupling_2*self_coupling_a - _x20*_x66 + 2*_x23*_x24*_x25*_x4*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b - _x27*_x35 - _x31*_x84 - _x34*_x84 + _x4 - _x67]
+
+
+def solution_3(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p_1
+    _x2 = _x0**p_2
+    _x3 = _x1*self_coupling_a
+    _x4 = _x2*self_coupling_b
+    _x5 = _x0**m_1
+    _x6 = _x0**m_2
+    _x7 = _x5*_x6*self_coupling_1*self_coupling_2
+    _x8 = _x0**n_1
+    _x9 = _x0**n_2
+    _x10 = _x0**n_3
+    _x11 = _x10*_x5*_x8*_x9*cross_coupling_2
+    _x12 = _x11*self_coupling_a*self_coupling_b
+    _x13 = cross_coupling_a**2
+    _x14 = cross_coupling_b**2
+    _x15 = self_coupling_b**2
+    _x16 = self_coupling_a**2
+    _x17 = _x1*_x11*_x2
+    _x18 = _x17*cross_coupling_1
+    _x19 = _x13*_x18
+    _x20 = _x16*_x18
+    _x21 = cross_coupling_1**2
+    _x22 = self_coupling_1**2
+    _x23 = _x17*_x21
+    _x24 = _x13*_x23
+    _x25 = _x16*_x23
+    _x26 = _x17*_x22
+    _x27 = _x13*_x26
+    _x28 = _x16*_x26
+    return 1j*(_x1*_x10*_x13*_x21*_x5*_x8*_x9*cross_coupling_2*self_coupling_b + _x1*_x10*_x13*_x22*_x5*_x8*_x9*cross_coupling_2*self_coupling_b + _x1*_x10*_x16*_x21*_x5*_x8*_x9*cross_coupling_2*self_coupling_b + _x1*_x10*_x16*_x22*_x5*_x8*_x9*cross_coupling_2*self_coupling_b + _x1*cross_coupling_1*self_coupling_a + _x10*_x14*_x2*_x21*_x5*_x8*_x9*cross_coupling_2*self_coupling_a + _x10*_x14*_x2*_x22*_x5*_x8*_x9*cross_coupling_2*self_coupling_a + _x10*_x15*_x2*_x21*_x5*_x8*_x9*cross_coupling_2*self_coupling_a + _x10*_x15*_x2*_x22*_x5*_x8*_x9*cross_coupling_2*self_coupling_a - _x12*_x21 - _x12*_x22 - _x14*_x24 - _x14*_x25 - _x14*_x27 - _x14*_x28 - _x15*_x24 - _x15*_x25 - _x15*_x27 - _x15*_x28 + _x2*cross_coupling_1*self_coupling_b - _x3*_x4*cross_coupling_1 - cross_coupling_1)/(_x1*_x10*_x13*_x5*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x10*_x16*_x5*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x2*_x5*_x6*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*self_coupling_a + _x10*_x14*_x2*_x5*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x10*_x15*_x2*_x5*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a - _x12*cross_coupling_1 - _x14*_x19 - _x14*_x20 - _x15*_x19 - _x15*_x20 + _x2*self_coupling_b - _x3*_x4 - _x3*_x7 - _x4*_x7 + _x5*_x6*self_coupling_1*self_coupling_2 - 1)
+
+
+def fraction_3(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p_1
+    _x2 = _x0**p_2
+    _x3 = _x2*self_coupling_b
+    _x4 = _x1*self_coupling_a
+    _x5 = cross_coupling_1**2
+    _x6 = _x0**m_1
+    _x7 = _x0**n_1
+    _x8 = _x0**n_2
+    _x9 = _x0**n_3
+    _x10 = _x6*_x7*_x8*_x9*cross_coupling_2
+    _x11 = _x10*self_coupling_a*self_coupling_b
+    _x12 = self_coupling_1**2
+    _x13 = cross_coupling_a**2
+    _x14 = cross_coupling_b**2
+    _x15 = self_coupling_b**2
+    _x16 = self_coupling_a**2
+    _x17 = _x1*_x10*_x2
+    _x18 = _x17*_x5
+    _x19 = _x13*_x18
+    _x20 = _x16*_x18
+    _x21 = _x12*_x17
+    _x22 = _x13*_x21
+    _x23 = _x16*_x21
+    _x24 = _x0**m_2
+    _x25 = _x24*_x6*self_coupling_1*self_coupling_2
+    _x26 = _x17*cross_coupling_1
+    _x27 = _x13*_x26
+    _x28 = _x16*_x26
+    return [1j*(_x1*_x12*_x13*_x6*_x7*_x8*_x9*cross_coupling_2*self_coupling_b + _x1*_x12*_x16*_x6*_x7*_x8*_x9*cross_coupling_2*self_coupling_b + _x1*_x13*_x5*_x6*_x7*_x8*_x9*cross_coupling_2*self_coupling_b + _x1*_x16*_x5*_x6*_x7*_x8*_x9*cross_coupling_2*self_coupling_b + _x1*cross_coupling_1*self_coupling_a - _x11*_x12 - _x11*_x5 + _x12*_x14*_x2*_x6*_x7*_x8*_x9*cross_coupling_2*self_coupling_a + _x12*_x15*_x2*_x6*_x7*_x8*_x9*cross_coupling_2*self_coupling_a - _x14*_x19 + _x14*_x2*_x5*_x6*_x7*_x8*_x9*cross_coupling_2*self_coupling_a - _x14*_x20 - _x14*_x22 - _x14*_x23 - _x15*_x19 + _x15*_x2*_x5*_x6*_x7*_x8*_x9*cross_coupling_2*self_coupling_a - _x15*_x20 - _x15*_x22 - _x15*_x23 + _x2*cross_coupling_1*self_coupling_b - _x3*_x4*cross_coupling_1 - cross_coupling_1), _x1*_x13*_x6*_x7*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x16*_x6*_x7*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x2*_x24*_x6*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*self_coupling_a - _x11*cross_coupling_1 + _x14*_x2*_x6*_x7*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a - _x14*_x27 - _x14*_x28 + _x15*_x2*_x6*_x7*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a - _x15*_x27 - _x15*_x28 + _x2*self_coupling_b + _x24*_x6*self_coupling_1*self_coupling_2 - _x25*_x3 - _x25*_x4 - _x3*_x4 - 1]
+
+
+def sensitivity_3(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p_1
+    _x2 = _x0**p_2
+    _x3 = _x2*self_coupling_b
+    _x4 = _x1*self_coupling_a
+    _x5 = _x4*cross_coupling_1
+    _x6 = _x3*_x5
+    _x7 = cross_coupling_1**2
+    _x8 = _x0**m_1
+    _x9 = _x0**n_1
+    _x10 = _x0**n_2
+    _x11 = _x0**n_3
+    _x12 = _x10*_x11*_x8*_x9
+    _x13 = _x12*self_coupling_b
+    _x14 = _x13*self_coupling_a
+    _x15 = _x14*_x7
+    _x16 = _x15*cross_coupling_2
+    _x17 = self_coupling_1**2
+    _x18 = _x14*_x17
+    _x19 = _x18*cross_coupling_2
+    _x20 = cross_coupling_a**2
+    _x21 = cross_coupling_b**2
+    _x22 = self_coupling_b**2
+    _x23 = self_coupling_a**2
+    _x24 = _x21*_x7
+    _x25 = _x12*cross_coupling_2
+    _x26 = _x2*_x25
+    _x27 = _x24*_x26
+    _x28 = _x1*_x20
+    _x29 = _x27*_x28
+    _x30 = _x20*_x7
+    _x31 = _x22*_x26
+    _x32 = _x1*_x31
+    _x33 = _x30*_x32
+    _x34 = _x1*_x23
+    _x35 = _x27*_x34
+    _x36 = _x31*_x7
+    _x37 = _x34*_x36
+    _x38 = _x17*_x21
+    _x39 = _x26*_x38
+    _x40 = _x28*_x39
+    _x41 = _x17*_x20
+    _x42 = _x32*_x41
+    _x43 = _x34*_x39
+    _x44 = _x17*_x31
+    _x45 = _x34*_x44
+    _x46 = _x0**m_2
+    _x47 = _x46*_x8
+    _x48 = _x47*self_coupling_2
+    _x49 = _x48*self_coupling_1
+    _x50 = _x4*_x49
+    _x51 = _x3*_x49
+    _x52 = _x14*cross_coupling_2
+    _x53 = _x52*cross_coupling_1
+    _x54 = _x21*_x26
+    _x55 = _x1*cross_coupling_1
+    _x56 = _x20*_x55
+    _x57 = _x54*_x56
+    _x58 = _x31*_x56
+    _x59 = _x23*_x55
+    _x60 = _x54*_x59
+    _x61 = _x31*_x59
+    _x62 = _x3*_x4
+    _x63 = -_x1*self_coupling_a - _x2*self_coupling_b + _x62 + 1
+    _x64 = unitary_loss_coefficient**(-1.0)
+    _x65 = _x64*p_1
+    _x66 = _x64*p_2
+    _x67 = _x3*_x66
+    _x68 = _x64*m_1
+    _x69 = _x64*n_1
+    _x70 = _x64*n_2
+    _x71 = _x64*n_3
+    _x72 = _x12*_x2
+    _x73 = _x24*_x72
+    _x74 = _x1*_x72
+    _x75 = _x22*_x74
+    _x76 = _x23*_x75
+    _x77 = 2*cross_coupling_a
+    _x78 = _x1*_x77
+    _x79 = 2*_x26*cross_coupling_b
+    _x80 = _x1*_x79
+    _x81 = _x34*_x79
+    _x82 = 2*self_coupling_1
+    _x83 = _x28*_x54
+    _x84 = _x28*_x31
+    _x85 = _x34*_x54
+    _x86 = _x31*_x34
+    _x87 = _x3*_x55
+    _x88 = _x13*cross_coupling_2
+    _x89 = _x2*_x4
+    _x90 = 2*_x25
+    _x91 = _x89*_x90
+    _x92 = _x22*_x91
+    _x93 = _x2*_x4*cross_coupling_1
+    _x94 = _x12*cross_coupling_2*self_coupling_a
+    _x95 = _x1*_x3
+    _x96 = _x90*_x95
+    _x97 = _x23*_x96
+    _x98 = _x64*m_2
+    _x99 = _x55*_x72
+    _x100 = _x20*_x99
+    _x101 = _x23*_x99
+    _x102 = _x55*_x77
+    _x103 = _x47*self_coupling_1
+    _x104 = _x90*_x93
+    _x105 = _x87*_x90
+    return [1j*(_x1*_x10*_x11*_x17*_x20*_x8*_x9*cross_coupling_2*self_coupling_b + _x1*_x10*_x11*_x17*_x23*_x8*_x9*cross_coupling_2*self_coupling_b + _x1*_x10*_x11*_x20*_x7*_x8*_x9*cross_coupling_2*self_coupling_b + _x1*_x10*_x11*_x23*_x7*_x8*_x9*cross_coupling_2*self_coupling_b + _x1*cross_coupling_1*self_coupling_a + _x10*_x11*_x17*_x2*_x21*_x8*_x9*cross_coupling_2*self_coupling_a + _x10*_x11*_x17*_x2*_x22*_x8*_x9*cross_coupling_2*self_coupling_a + _x10*_x11*_x2*_x21*_x7*_x8*_x9*cross_coupling_2*self_coupling_a + _x10*_x11*_x2*_x22*_x7*_x8*_x9*cross_coupling_2*self_coupling_a - _x16 - _x19 + _x2*cross_coupling_1*self_coupling_b - _x29 - _x33 - _x35 - _x37 - _x40 - _x42 - _x43 - _x45 - _x6 - cross_coupling_1), _x1*_x10*_x11*_x20*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x10*_x11*_x23*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x2*_x46*_x8*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x10*_x11*_x2*_x21*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x10*_x11*_x2*_x22*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x46*_x8*self_coupling_1*self_coupling_2 - _x50 - _x51 - _x53 - _x57 - _x58 - _x60 - _x61 - _x63, 1j*(_x1*_x10*_x11*_x17*_x20*_x64*_x8*_x9*cross_coupling_2*m_1*self_coupling_b + _x1*_x10*_x11*_x17*_x20*_x64*_x8*_x9*cross_coupling_2*n_1*self_coupling_b + _x1*_x10*_x11*_x17*_x20*_x64*_x8*_x9*cross_coupling_2*n_2*self_coupling_b + _x1*_x10*_x11*_x17*_x20*_x64*_x8*_x9*cross_coupling_2*n_3*self_coupling_b + _x1*_x10*_x11*_x17*_x20*_x64*_x8*_x9*cross_coupling_2*p_1*self_coupling_b + _x1*_x10*_x11*_x17*_x23*_x64*_x8*_x9*cross_coupling_2*m_1*self_coupling_b + _x1*_x10*_x11*_x17*_x23*_x64*_x8*_x9*cross_coupling_2*n_1*self_coupling_b + _x1*_x10*_x11*_x17*_x23*_x64*_x8*_x9*cross_coupling_2*n_2*self_coupling_b + _x1*_x10*_x11*_x17*_x23*_x64*_x8*_x9*cross_coupling_2*n_3*self_coupling_b + _x1*_x10*_x11*_x17*_x23*_x64*_x8*_x9*cross_coupling_2*p_1*self_coupling_b + _x1*_x10*_x11*_x20*_x64*_x7*_x8*_x9*cross_coupling_2*m_1*self_coupling_b + _x1*_x10*_x11*_x20*_x64*_x7*_x8*_x9*cross_coupling_2*n_1*self_coupling_b + _x1*_x10*_x11*_x20*_x64*_x7*_x8*_x9*cross_coupling_2*n_2*self_coupling_b + _x1*_x10*_x11*_x20*_x64*_x7*_x8*_x9*cross_coupling_2*n_3*self_coupling_b + _x1*_x10*_x11*_x20*_x64*_x7*_x8*_x9*cross_coupling_2*p_1*self_coupling_b + _x1*_x10*_x11*_x23*_x64*_x7*_x8*_x9*cross_coupling_2*m_1*self_coupling_b + _x1*_x10*_x11*_x23*_x64*_x7*_x8*_x9*cross_coupling_2*n_1*self_coupling_b + _x1*_x10*_x11*_x23*_x64*_x7*_x8*_x9*cross_coupling_2*n_2*self_coupling_b + _x1*_x10*_x11*_x23*_x64*_x7*_x8*_x9*cross_coupling_2*n_3*self_coupling_b + _x1*_x10*_x11*_x23*_x64*_x7*_x8*_x9*cross_coupling_2*p_1*self_coupling_b + _x1*_x64*cross_coupling_1*p_1*self_coupling_a + _x10*_x11*_x17*_x2*_x21*_x64*_x8*_x9*cross_coupling_2*m_1*self_coupling_a + _x10*_x11*_x17*_x2*_x21*_x64*_x8*_x9*cross_coupling_2*n_1*self_coupling_a + _x10*_x11*_x17*_x2*_x21*_x64*_x8*_x9*cross_coupling_2*n_2*self_coupling_a + _x10*_x11*_x17*_x2*_x21*_x64*_x8*_x9*cross_coupling_2*n_3*self_coupling_a + _x10*_x11*_x17*_x2*_x21*_x64*_x8*_x9*cross_coupling_2*p_2*self_coupling_a + _x10*_x11*_x17*_x2*_x22*_x64*_x8*_x9*cross_coupling_2*m_1*self_coupling_a + _x10*_x11*_x17*_x2*_x22*_x64*_x8*_x9*cross_coupling_2*n_1*self_coupling_a + _x10*_x11*_x17*_x2*_x22*_x64*_x8*_x9*cross_coupling_2*n_2*self_coupling_a + _x10*_x11*_x17*_x2*_x22*_x64*_x8*_x9*cross_coupling_2*n_3*self_coupling_a + _x10*_x11*_x17*_x2*_x22*_x64*_x8*_x9*cross_coupling_2*p_2*self_coupling_a + _x10*_x11*_x2*_x21*_x64*_x7*_x8*_x9*cross_coupling_2*m_1*self_coupling_a + _x10*_x11*_x2*_x21*_x64*_x7*_x8*_x9*cross_coupling_2*n_1*self_coupling_a + _x10*_x11*_x2*_x21*_x64*_x7*_x8*_x9*cross_coupling_2*n_2*self_coupling_a + _x10*_x11*_x2*_x21*_x64*_x7*_x8*_x9*cross_coupling_2*n_3*self_coupling_a + _x10*_x11*_x2*_x21*_x64*_x7*_x8*_x9*cross_coupling_2*p_2*self_coupling_a + _x10*_x11*_x2*_x22*_x64*_x7*_x8*_x9*cross_coupling_2*m_1*self_coupling_a + _x10*_x11*_x2*_x22*_x64*_x7*_x8*_x9*cross_coupling_2*n_1*self_coupling_a + _x10*_x11*_x2*_x22*_x64*_x7*_x8*_x9*cross_coupling_2*n_2*self_coupling_a + _x10*_x11*_x2*_x22*_x64*_x7*_x8*_x9*cross_coupling_2*n_3*self_coupling_a + _x10*_x11*_x2*_x22*_x64*_x7*_x8*_x9*cross_coupling_2*p_2*self_coupling_a - _x16*_x68 - _x16*_x69 - _x16*_x70 - _x16*_x71 - _x19*_x68 - _x19*_x69 - _x19*_x70 - _x19*_x71 + _x2*_x64*cross_coupling_1*p_2*self_coupling_b - _x29*_x65 - _x29*_x66 - _x29*_x68 - _x29*_x69 - _x29*_x70 - _x29*_x71 - _x33*_x65 - _x33*_x66 - _x33*_x68 - _x33*_x69 - _x33*_x70 - _x33*_x71 - _x35*_x65 - _x35*_x66 - _x35*_x68 - _x35*_x69 - _x35*_x70 - _x35*_x71 - _x37*_x65 - _x37*_x66 - _x37*_x68 - _x37*_x69 - _x37*_x70 - _x37*_x71 - _x40*_x65 - _x40*_x66 - _x40*_x68 - _x40*_x69 - _x40*_x70 - _x40*_x71 - _x42*_x65 - _x42*_x66 - _x42*_x68 - _x42*_x69 - _x42*_x70 - _x42*_x71 - _x43*_x65 - _x43*_x66 - _x43*_x68 - _x43*_x69 - _x43*_x70 - _x43*_x71 - _x45*_x65 - _x45*_x66 - _x45*_x68 - _x45*_x69 - _x45*_x70 - _x45*_x71 - _x5*_x67 - _x6*_x65), 1j*(2*_x1*_x10*_x11*_x20*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + 2*_x1*_x10*_x11*_x23*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + 2*_x10*_x11*_x2*_x21*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + 2*_x10*_x11*_x2*_x22*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a - 2*_x53 - 2*_x57 - 2*_x58 - 2*_x60 - 2*_x61 - _x63), 1j*(_x1*_x10*_x11*_x17*_x20*_x8*_x9*self_coupling_b + _x1*_x10*_x11*_x17*_x23*_x8*_x9*self_coupling_b + _x1*_x10*_x11*_x20*_x7*_x8*_x9*self_coupling_b + _x1*_x10*_x11*_x23*_x7*_x8*_x9*self_coupling_b + _x10*_x11*_x17*_x2*_x21*_x8*_x9*self_coupling_a + _x10*_x11*_x17*_x2*_x22*_x8*_x9*self_coupling_a + _x10*_x11*_x2*_x21*_x7*_x8*_x9*self_coupling_a + _x10*_x11*_x2*_x22*_x7*_x8*_x9*self_coupling_a - _x15 - _x17*_x76 - _x18 - _x23*_x38*_x74 - _x28*_x38*_x72 - _x28*_x73 - _x30*_x75 - _x34*_x73 - _x41*_x75 - _x7*_x76), 1j*(2*_x1*_x10*_x11*_x17*_x8*_x9*cross_coupling_2*cross_coupling_a*self_coupling_b + 2*_x1*_x10*_x11*_x7*_x8*_x9*cross_coupling_2*cross_coupling_a*self_coupling_b - _x27*_x78 - _x36*_x78 - _x39*_x78 - _x44*_x78), 1j*(2*_x10*_x11*_x17*_x2*_x8*_x9*cross_coupling_2*cross_coupling_b*self_coupling_a + 2*_x10*_x11*_x2*_x7*_x8*_x9*cross_coupling_2*cross_coupling_b*self_coupling_a - _x17*_x81 - _x30*_x80 - _x41*_x80 - _x7*_x81), 1j*(2*_x1*_x10*_x11*_x20*_x8*_x9*cross_coupling_2*self_coupling_1*self_coupling_b + 2*_x1*_x10*_x11*_x23*_x8*_x9*cross_coupling_2*self_coupling_1*self_coupling_b + 2*_x10*_x11*_x2*_x21*_x8*_x9*cross_coupling_2*self_coupling_1*self_coupling_a + 2*_x10*_x11*_x2*_x22*_x8*_x9*cross_coupling_2*self_coupling_1*self_coupling_a - _x52*_x82 - _x82*_x83 - _x82*_x84 - _x82*_x85 - _x82*_x86), 0, 1j*(2*_x1*_x10*_x11*_x17*_x8*_x9*cross_coupling_2*self_coupling_a*self_coupling_b + 2*_x1*_x10*_x11*_x7*_x8*_x9*cross_coupling_2*self_coupling_a*self_coupling_b + _x1*cross_coupling_1 + _x10*_x11*_x17*_x2*_x21*_x8*_x9*cross_coupling_2 + _x10*_x11*_x17*_x2*_x22*_x8*_x9*cross_coupling_2 + _x10*_x11*_x2*_x21*_x7*_x8*_x9*cross_coupling_2 + _x10*_x11*_x2*_x22*_x7*_x8*_x9*cross_coupling_2 - _x17*_x88 - _x17*_x92 - _x24*_x91 - _x38*_x91 - _x7*_x88 - _x7*_x92 - _x87), 1j*(_x1*_x10*_x11*_x17*_x20*_x8*_x9*cross_coupling_2 + _x1*_x10*_x11*_x17*_x23*_x8*_x9*cross_coupling_2 + _x1*_x10*_x11*_x20*_x7*_x8*_x9*cross_coupling_2 + _x1*_x10*_x11*_x23*_x7*_x8*_x9*cross_coupling_2 + 2*_x10*_x11*_x17*_x2*_x8*_x9*cross_coupling_2*self_coupling_a*self_coupling_b + 2*_x10*_x11*_x2*_x7*_x8*_x9*cross_coupling_2*self_coupling_a*self_coupling_b - _x17*_x94 - _x17*_x97 + _x2*cross_coupling_1 - _x30*_x96 - _x41*_x96 - _x7*_x94 - _x7*_x97 - _x93), _x1*_x10*_x11*_x20*_x64*_x8*_x9*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x1*_x10*_x11*_x20*_x64*_x8*_x9*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x1*_x10*_x11*_x20*_x64*_x8*_x9*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x1*_x10*_x11*_x20*_x64*_x8*_x9*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x1*_x10*_x11*_x20*_x64*_x8*_x9*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b + _x1*_x10*_x11*_x23*_x64*_x8*_x9*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x1*_x10*_x11*_x23*_x64*_x8*_x9*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x1*_x10*_x11*_x23*_x64*_x8*_x9*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x1*_x10*_x11*_x23*_x64*_x8*_x9*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x1*_x10*_x11*_x23*_x64*_x8*_x9*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b + _x1*_x2*_x46*_x64*_x8*m_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x2*_x46*_x64*_x8*m_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x2*_x46*_x64*_x8*p_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x2*_x46*_x64*_x8*p_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x64*p_1*self_coupling_a + _x10*_x11*_x2*_x21*_x64*_x8*_x9*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x10*_x11*_x2*_x21*_x64*_x8*_x9*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x10*_x11*_x2*_x21*_x64*_x8*_x9*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x10*_x11*_x2*_x21*_x64*_x8*_x9*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x10*_x11*_x2*_x21*_x64*_x8*_x9*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x10*_x11*_x2*_x22*_x64*_x8*_x9*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x10*_x11*_x2*_x22*_x64*_x8*_x9*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x10*_x11*_x2*_x22*_x64*_x8*_x9*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x10*_x11*_x2*_x22*_x64*_x8*_x9*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x10*_x11*_x2*_x22*_x64*_x8*_x9*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x2*_x64*p_2*self_coupling_b - _x4*_x49*_x65 + _x46*_x64*_x8*m_1*self_coupling_1*self_coupling_2 + _x46*_x64*_x8*m_2*self_coupling_1*self_coupling_2 - _x49*_x67 - _x50*_x68 - _x50*_x98 - _x51*_x68 - _x51*_x98 - _x53*_x68 - _x53*_x69 - _x53*_x70 - _x53*_x71 - _x57*_x65 - _x57*_x66 - _x57*_x68 - _x57*_x69 - _x57*_x70 - _x57*_x71 - _x58*_x65 - _x58*_x66 - _x58*_x68 - _x58*_x69 - _x58*_x70 - _x58*_x71 - _x60*_x65 - _x60*_x66 - _x60*_x68 - _x60*_x69 - _x60*_x70 - _x60*_x71 - _x61*_x65 - _x61*_x66 - _x61*_x68 - _x61*_x69 - _x61*_x70 - _x61*_x71 - _x62*_x65 - _x62*_x66, _x1*_x10*_x11*_x20*_x8*_x9*cross_coupling_2*self_coupling_b + _x1*_x10*_x11*_x23*_x8*_x9*cross_coupling_2*self_coupling_b + _x10*_x11*_x2*_x21*_x8*_x9*cross_coupling_2*self_coupling_a + _x10*_x11*_x2*_x22*_x8*_x9*cross_coupling_2*self_coupling_a - _x52 - _x83 - _x84 - _x85 - _x86, _x1*_x10*_x11*_x20*_x8*_x9*cross_coupling_1*self_coupling_b + _x1*_x10*_x11*_x23*_x8*_x9*cross_coupling_1*self_coupling_b + _x10*_x11*_x2*_x21*_x8*_x9*cross_coupling_1*self_coupling_a + _x10*_x11*_x2*_x22*_x8*_x9*cross_coupling_1*self_coupling_a - _x100*_x21 - _x100*_x22 - _x101*_x21 - _x101*_x22 - _x14*cross_coupling_1, 2*_x1*_x10*_x11*_x8*_x9*cross_coupling_1*cross_coupling_2*cross_coupling_a*self_coupling_b - _x102*_x31 - _x102*_x54, 2*_x10*_x11*_x2*_x8*_x9*cross_coupling_1*cross_coupling_2*cross_coupling_b*self_coupling_a - _x56*_x79 - _x59*_x79, -_x3*_x48 - _x4*_x48 + _x48*_x62 + _x48, -_x103*_x3 - _x103*_x4 + _x103*_x62 + _x103, 2*_x1*_x10*_x11*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b + _x1*_x2*_x46*_x8*self_coupling_1*self_coupling_2*self_coupling_b - _x1*_x49 + _x1 + _x10*_x11*_x2*_x21*_x8*_x9*cross_coupling_1*cross_coupling_2 + _x10*_x11*_x2*_x22*_x8*_x9*cross_coupling_1*cross_coupling_2 - _x104*_x21 - _x104*_x22 - _x88*cross_coupling_1 - _x95, _x1*_x10*_x11*_x20*_x8*_x9*cross_coupling_1*cross_coupling_2 + _x1*_x10*_x11*_x23*_x8*_x9*cross_coupling_1*cross_coupling_2 + _x1*_x2*_x46*_x8*self_coupling_1*self_coupling_2*self_coupling_a + 2*_x10*_x11*_x2*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b - _x105*_x20 - _x105*_x23 - _x2*_x49 + _x2 - _x89 - _x94*cross_coupling_1]
+
+
+def solution_4(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p_1
+    _x2 = _x0**p_2
+    _x3 = _x1*self_coupling_a
+    _x4 = _x2*self_coupling_b
+    _x5 = _x0**m_1
+    _x6 = _x0**m_2
+    _x7 = _x5*_x6*self_coupling_2
+    _x8 = _x7*self_coupling_1
+    _x9 = _x0**n_1
+    _x10 = _x0**n_2
+    _x11 = _x0**n_3
+    _x12 = _x10*_x11*_x9
+    _x13 = _x12*_x5*cross_coupling_1*cross_coupling_2
+    _x14 = cross_coupling_a**2
+    _x15 = cross_coupling_b**2
+    _x16 = self_coupling_b**2
+    _x17 = self_coupling_a**2
+    _x18 = _x14*_x15
+    _x19 = _x1*_x13*_x2
+    _x20 = _x16*_x19
+    _x21 = _x15*_x17
+    _x22 = self_coupling_1*self_coupling_a
+    _x23 = _x1*self_coupling_1
+    _x24 = _x23*self_coupling_b
+    _x25 = _x2*_x22
+    _x26 = cross_coupling_1**2
+    _x27 = _x7*self_coupling_a
+    _x28 = _x27*self_coupling_b
+    _x29 = self_coupling_1**2
+    _x30 = _x2*_x23
+    _x31 = _x14*_x30
+    _x32 = _x17*_x30
+    _x33 = _x1*_x7
+    _x34 = _x33*self_coupling_b
+    _x35 = _x26*_x34
+    _x36 = _x2*_x27
+    _x37 = _x26*_x36
+    _x38 = _x29*_x34
+    _x39 = _x29*_x36
+    _x40 = _x2*_x33
+    _x41 = _x26*_x40
+    _x42 = _x16*_x41
+    _x43 = _x29*_x40
+    _x44 = _x16*_x43
+    return _x12*(_x14*_x24 - _x14*_x35 - _x14*_x38 + _x14*_x42 + _x14*_x44 + _x15*_x25 - _x15*_x31 - _x15*_x32 - _x15*_x37 - _x15*_x39 + _x16*_x25 - _x16*_x31 - _x16*_x32 - _x16*_x37 - _x16*_x39 + _x17*_x24 - _x17*_x35 - _x17*_x38 + _x17*_x42 + _x17*_x44 + _x18*_x41 + _x18*_x43 + _x21*_x41 + _x21*_x43 - _x22*self_coupling_b + _x26*_x28 + _x28*_x29)/(_x1*_x10*_x11*_x14*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x10*_x11*_x17*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x2*_x5*_x6*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*self_coupling_a + _x10*_x11*_x15*_x2*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x10*_x11*_x16*_x2*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a - _x13*self_coupling_a*self_coupling_b - _x14*_x20 - _x17*_x20 - _x18*_x19 - _x19*_x21 + _x2*self_coupling_b - _x3*_x4 - _x3*_x8 - _x4*_x8 + _x5*_x6*self_coupling_1*self_coupling_2 - 1)
+
+
+def fraction_4(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = self_coupling_1*self_coupling_a
+    _x1 = cross_coupling_a**2
+    _x2 = unitary_loss_coefficient/z
+    _x3 = _x2**p_1
+    _x4 = _x3*self_coupling_1
+    _x5 = _x4*self_coupling_b
+    _x6 = cross_coupling_b**2
+    _x7 = _x2**p_2
+    _x8 = _x0*_x7
+    _x9 = self_coupling_b**2
+    _x10 = self_coupling_a**2
+    _x11 = cross_coupling_1**2
+    _x12 = _x2**m_1
+    _x13 = _x2**m_2
+    _x14 = _x12*_x13*self_coupling_2
+    _x15 = _x14*self_coupling_a
+    _x16 = _x15*self_coupling_b
+    _x17 = self_coupling_1**2
+    _x18 = _x4*_x7
+    _x19 = _x1*_x18
+    _x20 = _x10*_x18
+    _x21 = _x14*_x3
+    _x22 = _x21*self_coupling_b
+    _x23 = _x11*_x22
+    _x24 = _x15*_x7
+    _x25 = _x11*_x24
+    _x26 = _x17*_x22
+    _x27 = _x17*_x24
+    _x28 = _x21*_x7
+    _x29 = _x11*_x28
+    _x30 = _x1*_x6
+    _x31 = _x29*_x9
+    _x32 = _x10*_x6
+    _x33 = _x17*_x28
+    _x34 = _x33*_x9
+    _x35 = _x2**n_1
+    _x36 = _x2**n_2
+    _x37 = _x2**n_3
+    _x38 = _x35*_x36*_x37
+    _x39 = _x3*self_coupling_a
+    _x40 = _x7*self_coupling_b
+    _x41 = _x14*self_coupling_1
+    _x42 = _x12*_x38*cross_coupling_1*cross_coupling_2
+    _x43 = _x3*_x42*_x7
+    _x44 = _x43*_x9
+    return [_x38*(-_x0*self_coupling_b - _x1*_x23 - _x1*_x26 + _x1*_x31 + _x1*_x34 + _x1*_x5 - _x10*_x23 - _x10*_x26 + _x10*_x31 + _x10*_x34 + _x10*_x5 + _x11*_x16 + _x16*_x17 - _x19*_x6 - _x19*_x9 - _x20*_x6 - _x20*_x9 - _x25*_x6 - _x25*_x9 - _x27*_x6 - _x27*_x9 + _x29*_x30 + _x29*_x32 + _x30*_x33 + _x32*_x33 + _x6*_x8 + _x8*_x9), _x1*_x12*_x3*_x35*_x36*_x37*cross_coupling_1*cross_coupling_2*self_coupling_b - _x1*_x44 + _x10*_x12*_x3*_x35*_x36*_x37*cross_coupling_1*cross_coupling_2*self_coupling_b - _x10*_x44 + _x12*_x13*_x3*_x7*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x12*_x13*self_coupling_1*self_coupling_2 + _x12*_x35*_x36*_x37*_x6*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a + _x12*_x35*_x36*_x37*_x7*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x3*self_coupling_a - _x30*_x43 - _x32*_x43 - _x39*_x40 - _x39*_x41 - _x40*_x41 - _x42*self_coupling_a*self_coupling_b + _x7*self_coupling_b - 1]
+
+
+def sensitivity_4(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = self_coupling_a*self_coupling_b
+    _x1 = _x0*self_coupling_1
+    _x2 = cross_coupling_a**2
+    _x3 = unitary_loss_coefficient/z
+    _x4 = _x3**p_1
+    _x5 = self_coupling_1*self_coupling_b
+    _x6 = _x4*_x5
+    _x7 = _x2*_x6
+    _x8 = cross_coupling_b**2
+    _x9 = _x3**p_2
+    _x10 = self_coupling_1*self_coupling_a
+    _x11 = _x10*_x9
+    _x12 = _x11*_x8
+    _x13 = self_coupling_b**2
+    _x14 = _x11*_x13
+    _x15 = self_coupling_a**2
+    _x16 = _x15*_x6
+    _x17 = cross_coupling_1**2
+    _x18 = _x3**m_1
+    _x19 = _x3**m_2
+    _x20 = _x18*_x19
+    _x21 = _x20*self_coupling_2
+    _x22 = _x0*_x21
+    _x23 = _x17*_x22
+    _x24 = self_coupling_1**2
+    _x25 = _x22*_x24
+    _x26 = _x9*self_coupling_1
+    _x27 = _x26*_x8
+    _x28 = _x2*_x4
+    _x29 = _x27*_x28
+    _x30 = _x13*_x26
+    _x31 = _x28*_x30
+    _x32 = _x15*_x4
+    _x33 = _x27*_x32
+    _x34 = _x30*_x32
+    _x35 = _x4*self_coupling_b
+    _x36 = _x2*_x35
+    _x37 = _x17*_x21
+    _x38 = _x36*_x37
+    _x39 = _x9*self_coupling_a
+    _x40 = _x39*_x8
+    _x41 = _x37*_x40
+    _x42 = _x13*_x39
+    _x43 = _x37*_x42
+    _x44 = _x15*_x35
+    _x45 = _x37*_x44
+    _x46 = _x21*_x24
+    _x47 = _x36*_x46
+    _x48 = _x40*_x46
+    _x49 = _x42*_x46
+    _x50 = _x44*_x46
+    _x51 = _x4*_x9
+    _x52 = _x2*_x51
+    _x53 = _x52*_x8
+    _x54 = _x37*_x53
+    _x55 = _x13*_x52
+    _x56 = _x37*_x55
+    _x57 = _x15*_x51
+    _x58 = _x57*_x8
+    _x59 = _x37*_x58
+    _x60 = _x13*_x57
+    _x61 = _x37*_x60
+    _x62 = _x46*_x53
+    _x63 = _x46*_x55
+    _x64 = _x46*_x58
+    _x65 = _x46*_x60
+    _x66 = _x3**n_1
+    _x67 = _x3**n_2
+    _x68 = _x3**n_3
+    _x69 = _x66*_x67*_x68
+    _x70 = _x69*(-_x1 + _x12 + _x14 + _x16 + _x23 + _x25 - _x29 - _x31 - _x33 - _x34 - _x38 - _x41 - _x43 - _x45 - _x47 - _x48 - _x49 - _x50 + _x54 + _x56 + _x59 + _x61 + _x62 + _x63 + _x64 + _x65 + _x7)
+    _x71 = _x4*self_coupling_a
+    _x72 = _x9*self_coupling_b
+    _x73 = _x71*_x72
+    _x74 = _x21*self_coupling_1
+    _x75 = _x71*_x74
+    _x76 = _x72*_x74
+    _x77 = _x18*_x69
+    _x78 = _x0*_x77
+    _x79 = _x78*cross_coupling_2
+    _x80 = _x79*cross_coupling_1
+    _x81 = _x77*cross_coupling_2
+    _x82 = _x81*cross_coupling_1
+    _x83 = _x53*_x82
+    _x84 = _x55*_x82
+    _x85 = _x58*_x82
+    _x86 = _x60*_x82
+    _x87 = unitary_loss_coefficient**(-1.0)
+    _x88 = _x70*_x87
+    _x89 = _x87*p_1
+    _x90 = _x87*p_2
+    _x91 = _x87*m_1
+    _x92 = _x87*m_2
+    _x93 = 2*cross_coupling_1
+    _x94 = _x21*_x93
+    _x95 = 2*cross_coupling_a
+    _x96 = _x4*_x95
+    _x97 = _x35*_x95
+    _x98 = _x51*_x95
+    _x99 = _x37*_x8
+    _x100 = _x13*_x98
+    _x101 = _x46*_x8
+    _x102 = 2*cross_coupling_b
+    _x103 = _x102*_x26
+    _x104 = _x102*_x39
+    _x105 = _x102*_x37
+    _x106 = _x102*_x46
+    _x107 = 2*_x21
+    _x108 = _x0*_x20
+    _x109 = _x17*_x20
+    _x110 = _x20*_x24
+    _x111 = 2*_x71
+    _x112 = _x21*self_coupling_b
+    _x113 = _x112*_x17
+    _x114 = _x112*_x24
+    _x115 = _x21*_x9
+    _x116 = _x115*_x17
+    _x117 = _x115*_x24
+    _x118 = _x71*_x9
+    _x119 = 2*_x118
+    _x120 = _x119*_x13
+    _x121 = _x4*self_coupling_1
+    _x122 = _x121*_x2
+    _x123 = _x121*_x15
+    _x124 = 2*_x72
+    _x125 = _x21*self_coupling_a
+    _x126 = _x125*_x17
+    _x127 = _x125*_x24
+    _x128 = _x4*_x72
+    _x129 = 2*_x128
+    _x130 = _x129*_x37
+    _x131 = _x129*_x46
+    _x132 = _x80*_x87
+    _x133 = _x87*n_1
+    _x134 = _x87*n_2
+    _x135 = _x87*n_3
+    _x136 = _x77*cross_coupling_1
+    _x137 = _x102*_x82
+    _x138 = _x20*self_coupling_1
+    _x139 = _x81*_x93
+    _x140 = _x118*_x139
+    _x141 = _x128*_x139
+    return [_x70, _x13*_x18*_x66*_x67*_x68*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x15*_x18*_x4*_x66*_x67*_x68*cross_coupling_1*cross_coupling_2*self_coupling_b + _x18*_x19*_x4*_x9*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x18*_x19*self_coupling_1*self_coupling_2 + _x18*_x2*_x4*_x66*_x67*_x68*cross_coupling_1*cross_coupling_2*self_coupling_b + _x18*_x66*_x67*_x68*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x4*self_coupling_a - _x73 - _x75 - _x76 - _x80 - _x83 - _x84 - _x85 - _x86 + _x9*self_coupling_b - 1, _x69*(_x12*_x90 + _x14*_x90 + _x16*_x89 + _x23*_x91 + _x23*_x92 + _x25*_x91 + _x25*_x92 - _x29*_x89 - _x29*_x90 - _x31*_x89 - _x31*_x90 - _x33*_x89 - _x33*_x90 - _x34*_x89 - _x34*_x90 - _x38*_x89 - _x38*_x91 - _x38*_x92 - _x41*_x90 - _x41*_x91 - _x41*_x92 - _x43*_x90 - _x43*_x91 - _x43*_x92 - _x45*_x89 - _x45*_x91 - _x45*_x92 - _x47*_x89 - _x47*_x91 - _x47*_x92 - _x48*_x90 - _x48*_x91 - _x48*_x92 - _x49*_x90 - _x49*_x91 - _x49*_x92 - _x50*_x89 - _x50*_x91 - _x50*_x92 + _x54*_x89 + _x54*_x90 + _x54*_x91 + _x54*_x92 + _x56*_x89 + _x56*_x90 + _x56*_x91 + _x56*_x92 + _x59*_x89 + _x59*_x90 + _x59*_x91 + _x59*_x92 + _x61*_x89 + _x61*_x90 + _x61*_x91 + _x61*_x92 + _x62*_x89 + _x62*_x90 + _x62*_x91 + _x62*_x92 + _x63*_x89 + _x63*_x90 + _x63*_x91 + _x63*_x92 + _x64*_x89 + _x64*_x90 + _x64*_x91 + _x64*_x92 + _x65*_x89 + _x65*_x90 + _x65*_x91 + _x65*_x92 + _x7*_x89) + _x88*n_1 + _x88*n_2 + _x88*n_3, _x69*(_x22*_x93 - _x36*_x94 - _x40*_x94 - _x42*_x94 - _x44*_x94 + _x53*_x94 + _x55*_x94 + _x58*_x94 + _x60*_x94), 0, _x69*(_x100*_x37 + _x100*_x46 + _x101*_x98 - _x27*_x96 - _x30*_x96 - _x37*_x97 - _x46*_x97 + _x6*_x95 + _x98*_x99), _x69*(_x102*_x11 - _x103*_x28 - _x103*_x32 - _x104*_x37 - _x104*_x46 + _x105*_x52 + _x105*_x57 + _x106*_x52 + _x106*_x57), _x69*(-_x0 + _x1*_x107 - _x107*_x12 - _x107*_x14 - _x107*_x16 + _x107*_x29 + _x107*_x31 + _x107*_x33 + _x107*_x34 - _x107*_x7 + _x36 + _x40 + _x42 + _x44 - _x53 - _x55 - _x58 - _x60), _x69*(_x108*_x17 + _x108*_x24 - _x109*_x36 - _x109*_x40 - _x109*_x42 - _x109*_x44 + _x109*_x53 + _x109*_x55 + _x109*_x58 + _x109*_x60 - _x110*_x36 - _x110*_x40 - _x110*_x42 - _x110*_x44 + _x110*_x53 + _x110*_x55 + _x110*_x58 + _x110*_x60), _x69*(_x101*_x119 - _x111*_x113 - _x111*_x114 - _x111*_x27 - _x111*_x30 + _x111*_x5 + _x113 + _x114 - _x116*_x13 - _x116*_x8 - _x117*_x13 - _x117*_x8 + _x119*_x99 + _x120*_x37 + _x120*_x46 + _x27 + _x30 - _x5), _x69*(_x10*_x124 - _x10 - _x122*_x124 + _x122 - _x123*_x124 + _x123 - _x124*_x126 - _x124*_x127 + _x126 + _x127 + _x130*_x15 + _x130*_x2 + _x131*_x15 + _x131*_x2 - _x28*_x37 - _x28*_x46 - _x32*_x37 - _x32*_x46), _x13*_x18*_x66*_x67*_x68*_x87*_x9*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x13*_x18*_x66*_x67*_x68*_x87*_x9*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x13*_x18*_x66*_x67*_x68*_x87*_x9*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x13*_x18*_x66*_x67*_x68*_x87*_x9*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x13*_x18*_x66*_x67*_x68*_x87*_x9*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a - _x132*n_1 - _x132*n_2 - _x132*n_3 - _x133*_x83 - _x133*_x84 - _x133*_x85 - _x133*_x86 - _x134*_x83 - _x134*_x84 - _x134*_x85 - _x134*_x86 - _x135*_x83 - _x135*_x84 - _x135*_x85 - _x135*_x86 + _x15*_x18*_x4*_x66*_x67*_x68*_x87*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x15*_x18*_x4*_x66*_x67*_x68*_x87*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x15*_x18*_x4*_x66*_x67*_x68*_x87*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x15*_x18*_x4*_x66*_x67*_x68*_x87*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x15*_x18*_x4*_x66*_x67*_x68*_x87*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b + _x18*_x19*_x4*_x87*_x9*m_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x18*_x19*_x4*_x87*_x9*m_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x18*_x19*_x4*_x87*_x9*p_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x18*_x19*_x4*_x87*_x9*p_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x18*_x19*_x87*m_1*self_coupling_1*self_coupling_2 + _x18*_x19*_x87*m_2*self_coupling_1*self_coupling_2 + _x18*_x2*_x4*_x66*_x67*_x68*_x87*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x18*_x2*_x4*_x66*_x67*_x68*_x87*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x18*_x2*_x4*_x66*_x67*_x68*_x87*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x18*_x2*_x4*_x66*_x67*_x68*_x87*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x18*_x2*_x4*_x66*_x67*_x68*_x87*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b + _x18*_x66*_x67*_x68*_x8*_x87*_x9*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x18*_x66*_x67*_x68*_x8*_x87*_x9*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x18*_x66*_x67*_x68*_x8*_x87*_x9*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x18*_x66*_x67*_x68*_x8*_x87*_x9*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x18*_x66*_x67*_x68*_x8*_x87*_x9*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x4*_x87*p_1*self_coupling_a - _x71*_x74*_x89 - _x72*_x74*_x90 - _x73*_x89 - _x73*_x90 - _x75*_x91 - _x75*_x92 - _x76*_x91 - _x76*_x92 - _x80*_x91 - _x83*_x89 - _x83*_x90 - _x83*_x91 - _x84*_x89 - _x84*_x90 - _x84*_x91 - _x85*_x89 - _x85*_x90 - _x85*_x91 - _x86*_x89 - _x86*_x90 - _x86*_x91 + _x87*_x9*p_2*self_coupling_b, _x13*_x18*_x66*_x67*_x68*_x9*cross_coupling_2*self_coupling_a + _x15*_x18*_x4*_x66*_x67*_x68*cross_coupling_2*self_coupling_b + _x18*_x2*_x4*_x66*_x67*_x68*cross_coupling_2*self_coupling_b + _x18*_x66*_x67*_x68*_x8*_x9*cross_coupling_2*self_coupling_a - _x53*_x81 - _x55*_x81 - _x58*_x81 - _x60*_x81 - _x79, _x13*_x18*_x66*_x67*_x68*_x9*cross_coupling_1*self_coupling_a - _x136*_x53 - _x136*_x55 - _x136*_x58 - _x136*_x60 + _x15*_x18*_x4*_x66*_x67*_x68*cross_coupling_1*self_coupling_b + _x18*_x2*_x4*_x66*_x67*_x68*cross_coupling_1*self_coupling_b + _x18*_x66*_x67*_x68*_x8*_x9*cross_coupling_1*self_coupling_a - _x78*cross_coupling_1, -_x100*_x82 + 2*_x18*_x4*_x66*_x67*_x68*cross_coupling_1*cross_coupling_2*cross_coupling_a*self_coupling_b - _x8*_x82*_x98, -_x137*_x52 - _x137*_x57 + 2*_x18*_x66*_x67*_x68*_x9*cross_coupling_1*cross_coupling_2*cross_coupling_b*self_coupling_a, -_x21*_x71 - _x21*_x72 + _x21*_x73 + _x21, -_x138*_x71 - _x138*_x72 + _x138*_x73 + _x138, -_x121*_x21 - _x128 - _x13*_x140 + _x13*_x18*_x66*_x67*_x68*_x9*cross_coupling_1*cross_coupling_2 - _x140*_x8 + _x18*_x19*_x4*_x9*self_coupling_1*self_coupling_2*self_coupling_b + 2*_x18*_x4*_x66*_x67*_x68*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b + _x18*_x66*_x67*_x68*_x8*_x9*cross_coupling_1*cross_coupling_2 + _x4 - _x82*self_coupling_b, -_x118 - _x141*_x15 - _x141*_x2 + _x15*_x18*_x4*_x66*_x67*_x68*cross_coupling_1*cross_coupling_2 + _x18*_x19*_x4*_x9*self_coupling_1*self_coupling_2*self_coupling_a + _x18*_x2*_x4*_x66*_x67*_x68*cross_coupling_1*cross_coupling_2 + 2*_x18*_x66*_x67*_x68*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b - _x21*_x26 - _x82*self_coupling_a + _x9]
+
+
+def solution_5(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x0**p_1
+    _x3 = _x0**p_2
+    _x4 = _x2*self_coupling_a
+    _x5 = _x3*self_coupling_b
+    _x6 = _x0**m_1
+    _x7 = _x1*_x6*self_coupling_1*self_coupling_2
+    _x8 = _x0**n_1
+    _x9 = _x0**n_2
+    _x10 = _x0**n_3
+    _x11 = _x10*_x6*_x8*_x9*cross_coupling_2
+    _x12 = _x11*self_coupling_a*self_coupling_b
+    _x13 = cross_coupling_a**2
+    _x14 = cross_coupling_b**2
+    _x15 = self_coupling_b**2
+    _x16 = self_coupling_a**2
+    _x17 = _x11*_x2*_x3
+    _x18 = _x17*cross_coupling_1
+    _x19 = _x13*_x18
+    _x20 = _x16*_x18
+    _x21 = cross_coupling_1**2
+    _x22 = self_coupling_1**2
+    _x23 = _x17*_x21
+    _x24 = _x13*_x23
+    _x25 = _x16*_x23
+    _x26 = _x17*_x22
+    _x27 = _x13*_x26
+    _x28 = _x16*_x26
+    return 1j*_x1*(_x10*_x13*_x2*_x21*_x6*_x8*_x9*cross_coupling_2*self_coupling_b + _x10*_x13*_x2*_x22*_x6*_x8*_x9*cross_coupling_2*self_coupling_b + _x10*_x14*_x21*_x3*_x6*_x8*_x9*cross_coupling_2*self_coupling_a + _x10*_x14*_x22*_x3*_x6*_x8*_x9*cross_coupling_2*self_coupling_a + _x10*_x15*_x21*_x3*_x6*_x8*_x9*cross_coupling_2*self_coupling_a + _x10*_x15*_x22*_x3*_x6*_x8*_x9*cross_coupling_2*self_coupling_a + _x10*_x16*_x2*_x21*_x6*_x8*_x9*cross_coupling_2*self_coupling_b + _x10*_x16*_x2*_x22*_x6*_x8*_x9*cross_coupling_2*self_coupling_b - _x12*_x21 - _x12*_x22 - _x14*_x24 - _x14*_x25 - _x14*_x27 - _x14*_x28 - _x15*_x24 - _x15*_x25 - _x15*_x27 - _x15*_x28 + _x2*cross_coupling_1*self_coupling_a + _x3*cross_coupling_1*self_coupling_b - _x4*_x5*cross_coupling_1 - cross_coupling_1)/(_x1*_x2*_x3*_x6*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x6*self_coupling_1*self_coupling_2 + _x10*_x13*_x2*_x6*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x10*_x14*_x3*_x6*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x10*_x15*_x3*_x6*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x10*_x16*_x2*_x6*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b - _x12*cross_coupling_1 - _x14*_x19 - _x14*_x20 - _x15*_x19 - _x15*_x20 + _x2*self_coupling_a + _x3*self_coupling_b - _x4*_x5 - _x4*_x7 - _x5*_x7 - 1)
+
+
+def fraction_5(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x0**p_1
+    _x3 = _x0**p_2
+    _x4 = _x3*self_coupling_b
+    _x5 = _x2*self_coupling_a
+    _x6 = cross_coupling_1**2
+    _x7 = _x0**m_1
+    _x8 = _x0**n_1
+    _x9 = _x0**n_2
+    _x10 = _x0**n_3
+    _x11 = _x10*_x7*_x8*_x9*cross_coupling_2
+    _x12 = _x11*self_coupling_a*self_coupling_b
+    _x13 = self_coupling_1**2
+    _x14 = cross_coupling_a**2
+    _x15 = cross_coupling_b**2
+    _x16 = self_coupling_b**2
+    _x17 = self_coupling_a**2
+    _x18 = _x11*_x2*_x3
+    _x19 = _x18*_x6
+    _x20 = _x14*_x19
+    _x21 = _x17*_x19
+    _x22 = _x13*_x18
+    _x23 = _x14*_x22
+    _x24 = _x17*_x22
+    _x25 = _x1*_x7*self_coupling_1*self_coupling_2
+    _x26 = _x18*cross_coupling_1
+    _x27 = _x14*_x26
+    _x28 = _x17*_x26
+    return [1j*_x1*(_x10*_x13*_x14*_x2*_x7*_x8*_x9*cross_coupling_2*self_coupling_b + _x10*_x13*_x15*_x3*_x7*_x8*_x9*cross_coupling_2*self_coupling_a + _x10*_x13*_x16*_x3*_x7*_x8*_x9*cross_coupling_2*self_coupling_a + _x10*_x13*_x17*_x2*_x7*_x8*_x9*cross_coupling_2*self_coupling_b + _x10*_x14*_x2*_x6*_x7*_x8*_x9*cross_coupling_2*self_coupling_b + _x10*_x15*_x3*_x6*_x7*_x8*_x9*cross_coupling_2*self_coupling_a + _x10*_x16*_x3*_x6*_x7*_x8*_x9*cross_coupling_2*self_coupling_a + _x10*_x17*_x2*_x6*_x7*_x8*_x9*cross_coupling_2*self_coupling_b - _x12*_x13 - _x12*_x6 - _x15*_x20 - _x15*_x21 - _x15*_x23 - _x15*_x24 - _x16*_x20 - _x16*_x21 - _x16*_x23 - _x16*_x24 + _x2*cross_coupling_1*self_coupling_a + _x3*cross_coupling_1*self_coupling_b - _x4*_x5*cross_coupling_1 - cross_coupling_1), _x1*_x2*_x3*_x7*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x7*self_coupling_1*self_coupling_2 + _x10*_x14*_x2*_x7*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x10*_x15*_x3*_x7*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x10*_x16*_x3*_x7*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x10*_x17*_x2*_x7*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b - _x12*cross_coupling_1 - _x15*_x27 - _x15*_x28 - _x16*_x27 - _x16*_x28 + _x2*self_coupling_a - _x25*_x4 - _x25*_x5 + _x3*self_coupling_b - _x4*_x5 - 1]
+
+
+def sensitivity_5(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p_1
+    _x2 = _x0**p_2
+    _x3 = _x2*self_coupling_b
+    _x4 = _x1*self_coupling_a
+    _x5 = _x4*cross_coupling_1
+    _x6 = _x3*_x5
+    _x7 = cross_coupling_1**2
+    _x8 = _x0**m_1
+    _x9 = _x0**n_1
+    _x10 = _x0**n_2
+    _x11 = _x0**n_3
+    _x12 = _x10*_x11*_x8*_x9
+    _x13 = _x12*self_coupling_b
+    _x14 = _x13*self_coupling_a
+    _x15 = _x14*_x7
+    _x16 = _x15*cross_coupling_2
+    _x17 = self_coupling_1**2
+    _x18 = _x14*_x17
+    _x19 = _x18*cross_coupling_2
+    _x20 = cross_coupling_a**2
+    _x21 = cross_coupling_b**2
+    _x22 = self_coupling_b**2
+    _x23 = self_coupling_a**2
+    _x24 = _x21*_x7
+    _x25 = _x12*cross_coupling_2
+    _x26 = _x2*_x25
+    _x27 = _x24*_x26
+    _x28 = _x1*_x20
+    _x29 = _x27*_x28
+    _x30 = _x20*_x7
+    _x31 = _x22*_x26
+    _x32 = _x1*_x31
+    _x33 = _x30*_x32
+    _x34 = _x1*_x23
+    _x35 = _x27*_x34
+    _x36 = _x31*_x7
+    _x37 = _x34*_x36
+    _x38 = _x17*_x21
+    _x39 = _x26*_x38
+    _x40 = _x28*_x39
+    _x41 = _x17*_x20
+    _x42 = _x32*_x41
+    _x43 = _x34*_x39
+    _x44 = _x17*_x31
+    _x45 = _x34*_x44
+    _x46 = _x0**m_2
+    _x47 = 1j*_x46
+    _x48 = _x47*(_x1*_x10*_x11*_x17*_x20*_x8*_x9*cross_coupling_2*self_coupling_b + _x1*_x10*_x11*_x17*_x23*_x8*_x9*cross_coupling_2*self_coupling_b + _x1*_x10*_x11*_x20*_x7*_x8*_x9*cross_coupling_2*self_coupling_b + _x1*_x10*_x11*_x23*_x7*_x8*_x9*cross_coupling_2*self_coupling_b + _x1*cross_coupling_1*self_coupling_a + _x10*_x11*_x17*_x2*_x21*_x8*_x9*cross_coupling_2*self_coupling_a + _x10*_x11*_x17*_x2*_x22*_x8*_x9*cross_coupling_2*self_coupling_a + _x10*_x11*_x2*_x21*_x7*_x8*_x9*cross_coupling_2*self_coupling_a + _x10*_x11*_x2*_x22*_x7*_x8*_x9*cross_coupling_2*self_coupling_a - _x16 - _x19 + _x2*cross_coupling_1*self_coupling_b - _x29 - _x33 - _x35 - _x37 - _x40 - _x42 - _x43 - _x45 - _x6 - cross_coupling_1)
+    _x49 = _x46*_x8
+    _x50 = _x49*self_coupling_2
+    _x51 = _x50*self_coupling_1
+    _x52 = _x4*_x51
+    _x53 = _x3*_x51
+    _x54 = _x14*cross_coupling_2
+    _x55 = _x54*cross_coupling_1
+    _x56 = _x21*_x26
+    _x57 = _x1*cross_coupling_1
+    _x58 = _x20*_x57
+    _x59 = _x56*_x58
+    _x60 = _x31*_x58
+    _x61 = _x23*_x57
+    _x62 = _x56*_x61
+    _x63 = _x31*_x61
+    _x64 = _x3*_x4
+    _x65 = -_x1*self_coupling_a - _x2*self_coupling_b + _x64 + 1
+    _x66 = unitary_loss_coefficient**(-1.0)
+    _x67 = _x66*m_2
+    _x68 = _x66*p_1
+    _x69 = _x66*p_2
+    _x70 = _x3*_x69
+    _x71 = _x66*m_1
+    _x72 = _x66*n_1
+    _x73 = _x66*n_2
+    _x74 = _x66*n_3
+    _x75 = _x12*_x2
+    _x76 = _x24*_x75
+    _x77 = _x1*_x75
+    _x78 = _x22*_x77
+    _x79 = _x23*_x78
+    _x80 = 2*cross_coupling_a
+    _x81 = _x1*_x80
+    _x82 = 2*_x26*cross_coupling_b
+    _x83 = _x1*_x82
+    _x84 = _x34*_x82
+    _x85 = 2*self_coupling_1
+    _x86 = _x28*_x56
+    _x87 = _x28*_x31
+    _x88 = _x34*_x56
+    _x89 = _x31*_x34
+    _x90 = _x3*_x57
+    _x91 = _x13*cross_coupling_2
+    _x92 = _x2*_x4
+    _x93 = 2*_x25
+    _x94 = _x92*_x93
+    _x95 = _x22*_x94
+    _x96 = _x2*_x4*cross_coupling_1
+    _x97 = _x12*cross_coupling_2*self_coupling_a
+    _x98 = _x1*_x3
+    _x99 = _x93*_x98
+    _x100 = _x23*_x99
+    _x101 = _x57*_x75
+    _x102 = _x101*_x20
+    _x103 = _x101*_x23
+    _x104 = _x57*_x80
+    _x105 = _x49*self_coupling_1
+    _x106 = _x93*_x96
+    _x107 = _x90*_x93
+    return [_x48, _x1*_x10*_x11*_x20*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x10*_x11*_x23*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x2*_x46*_x8*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x10*_x11*_x2*_x21*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x10*_x11*_x2*_x22*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x46*_x8*self_coupling_1*self_coupling_2 - _x52 - _x53 - _x55 - _x59 - _x60 - _x62 - _x63 - _x65, _x47*(_x1*_x10*_x11*_x17*_x20*_x66*_x8*_x9*cross_coupling_2*m_1*self_coupling_b + _x1*_x10*_x11*_x17*_x20*_x66*_x8*_x9*cross_coupling_2*n_1*self_coupling_b + _x1*_x10*_x11*_x17*_x20*_x66*_x8*_x9*cross_coupling_2*n_2*self_coupling_b + _x1*_x10*_x11*_x17*_x20*_x66*_x8*_x9*cross_coupling_2*n_3*self_coupling_b + _x1*_x10*_x11*_x17*_x20*_x66*_x8*_x9*cross_coupling_2*p_1*self_coupling_b + _x1*_x10*_x11*_x17*_x23*_x66*_x8*_x9*cross_coupling_2*m_1*self_coupling_b + _x1*_x10*_x11*_x17*_x23*_x66*_x8*_x9*cross_coupling_2*n_1*self_coupling_b + _x1*_x10*_x11*_x17*_x23*_x66*_x8*_x9*cross_coupling_2*n_2*self_coupling_b + _x1*_x10*_x11*_x17*_x23*_x66*_x8*_x9*cross_coupling_2*n_3*self_coupling_b + _x1*_x10*_x11*_x17*_x23*_x66*_x8*_x9*cross_coupling_2*p_1*self_coupling_b + _x1*_x10*_x11*_x20*_x66*_x7*_x8*_x9*cross_coupling_2*m_1*self_coupling_b + _x1*_x10*_x11*_x20*_x66*_x7*_x8*_x9*cross_coupling_2*n_1*self_coupling_b + _x1*_x10*_x11*_x20*_x66*_x7*_x8*_x9*cross_coupling_2*n_2*self_coupling_b + _x1*_x10*_x11*_x20*_x66*_x7*_x8*_x9*cross_coupling_2*n_3*self_coupling_b + _x1*_x10*_x11*_x20*_x66*_x7*_x8*_x9*cross_coupling_2*p_1*self_coupling_b + _x1*_x10*_x11*_x23*_x66*_x7*_x8*_x9*cross_coupling_2*m_1*self_coupling_b + _x1*_x10*_x11*_x23*_x66*_x7*_x8*_x9*cross_coupling_2*n_1*self_coupling_b + _x1*_x10*_x11*_x23*_x66*_x7*_x8*_x9*cross_coupling_2*n_2*self_coupling_b + _x1*_x10*_x11*_x23*_x66*_x7*_x8*_x9*cross_coupling_2*n_3*self_coupling_b + _x1*_x10*_x11*_x23*_x66*_x7*_x8*_x9*cross_coupling_2*p_1*self_coupling_b + _x1*_x66*cross_coupling_1*p_1*self_coupling_a + _x10*_x11*_x17*_x2*_x21*_x66*_x8*_x9*cross_coupling_2*m_1*self_coupling_a + _x10*_x11*_x17*_x2*_x21*_x66*_x8*_x9*cross_coupling_2*n_1*self_coupling_a + _x10*_x11*_x17*_x2*_x21*_x66*_x8*_x9*cross_coupling_2*n_2*self_coupling_a + _x10*_x11*_x17*_x2*_x21*_x66*_x8*_x9*cross_coupling_2*n_3*self_coupling_a + _x10*_x11*_x17*_x2*_x21*_x66*_x8*_x9*cross_coupling_2*p_2*self_coupling_a + _x10*_x11*_x17*_x2*_x22*_x66*_x8*_x9*cross_coupling_2*m_1*self_coupling_a + _x10*_x11*_x17*_x2*_x22*_x66*_x8*_x9*cross_coupling_2*n_1*self_coupling_a + _x10*_x11*_x17*_x2*_x22*_x66*_x8*_x9*cross_coupling_2*n_2*self_coupling_a + _x10*_x11*_x17*_x2*_x22*_x66*_x8*_x9*cross_coupling_2*n_3*self_coupling_a + _x10*_x11*_x17*_x2*_x22*_x66*_x8*_x9*cross_coupling_2*p_2*self_coupling_a + _x10*_x11*_x2*_x21*_x66*_x7*_x8*_x9*cross_coupling_2*m_1*self_coupling_a + _x10*_x11*_x2*_x21*_x66*_x7*_x8*_x9*cross_coupling_2*n_1*self_coupling_a + _x10*_x11*_x2*_x21*_x66*_x7*_x8*_x9*cross_coupling_2*n_2*self_coupling_a + _x10*_x11*_x2*_x21*_x66*_x7*_x8*_x9*cross_coupling_2*n_3*self_coupling_a + _x10*_x11*_x2*_x21*_x66*_x7*_x8*_x9*cross_coupling_2*p_2*self_coupling_a + _x10*_x11*_x2*_x22*_x66*_x7*_x8*_x9*cross_coupling_2*m_1*self_coupling_a + _x10*_x11*_x2*_x22*_x66*_x7*_x8*_x9*cross_coupling_2*n_1*self_coupling_a + _x10*_x11*_x2*_x22*_x66*_x7*_x8*_x9*cross_coupling_2*n_2*self_coupling_a + _x10*_x11*_x2*_x22*_x66*_x7*_x8*_x9*cross_coupling_2*n_3*self_coupling_a + _x10*_x11*_x2*_x22*_x66*_x7*_x8*_x9*cross_coupling_2*p_2*self_coupling_a - _x16*_x71 - _x16*_x72 - _x16*_x73 - _x16*_x74 - _x19*_x71 - _x19*_x72 - _x19*_x73 - _x19*_x74 + _x2*_x66*cross_coupling_1*p_2*self_coupling_b - _x29*_x68 - _x29*_x69 - _x29*_x71 - _x29*_x72 - _x29*_x73 - _x29*_x74 - _x33*_x68 - _x33*_x69 - _x33*_x71 - _x33*_x72 - _x33*_x73 - _x33*_x74 - _x35*_x68 - _x35*_x69 - _x35*_x71 - _x35*_x72 - _x35*_x73 - _x35*_x74 - _x37*_x68 - _x37*_x69 - _x37*_x71 - _x37*_x72 - _x37*_x73 - _x37*_x74 - _x40*_x68 - _x40*_x69 - _x40*_x71 - _x40*_x72 - _x40*_x73 - _x40*_x74 - _x42*_x68 - _x42*_x69 - _x42*_x71 - _x42*_x72 - _x42*_x73 - _x42*_x74 - _x43*_x68 - _x43*_x69 - _x43*_x71 - _x43*_x72 - _x43*_x73 - _x43*_x74 - _x45*_x68 - _x45*_x69 - _x45*_x71 - _x45*_x72 - _x45*_x73 - _x45*_x74 - _x5*_x70 - _x6*_x68) + _x48*_x67, _x47*(2*_x1*_x10*_x11*_x20*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + 2*_x1*_x10*_x11*_x23*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + 2*_x10*_x11*_x2*_x21*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + 2*_x10*_x11*_x2*_x22*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a - 2*_x55 - 2*_x59 - 2*_x60 - 2*_x62 - 2*_x63 - _x65), _x47*(_x1*_x10*_x11*_x17*_x20*_x8*_x9*self_coupling_b + _x1*_x10*_x11*_x17*_x23*_x8*_x9*self_coupling_b + _x1*_x10*_x11*_x20*_x7*_x8*_x9*self_coupling_b + _x1*_x10*_x11*_x23*_x7*_x8*_x9*self_coupling_b + _x10*_x11*_x17*_x2*_x21*_x8*_x9*self_coupling_a + _x10*_x11*_x17*_x2*_x22*_x8*_x9*self_coupling_a + _x10*_x11*_x2*_x21*_x7*_x8*_x9*self_coupling_a + _x10*_x11*_x2*_x22*_x7*_x8*_x9*self_coupling_a - _x15 - _x17*_x79 - _x18 - _x23*_x38*_x77 - _x28*_x38*_x75 - _x28*_x76 - _x30*_x78 - _x34*_x76 - _x41*_x78 - _x7*_x79), _x47*(2*_x1*_x10*_x11*_x17*_x8*_x9*cross_coupling_2*cross_coupling_a*self_coupling_b + 2*_x1*_x10*_x11*_x7*_x8*_x9*cross_coupling_2*cross_coupling_a*self_coupling_b - _x27*_x81 - _x36*_x81 - _x39*_x81 - _x44*_x81), _x47*(2*_x10*_x11*_x17*_x2*_x8*_x9*cross_coupling_2*cross_coupling_b*self_coupling_a + 2*_x10*_x11*_x2*_x7*_x8*_x9*cross_coupling_2*cross_coupling_b*self_coupling_a - _x17*_x84 - _x30*_x83 - _x41*_x83 - _x7*_x84), _x47*(2*_x1*_x10*_x11*_x20*_x8*_x9*cross_coupling_2*self_coupling_1*self_coupling_b + 2*_x1*_x10*_x11*_x23*_x8*_x9*cross_coupling_2*self_coupling_1*self_coupling_b + 2*_x10*_x11*_x2*_x21*_x8*_x9*cross_coupling_2*self_coupling_1*self_coupling_a + 2*_x10*_x11*_x2*_x22*_x8*_x9*cross_coupling_2*self_coupling_1*self_coupling_a - _x54*_x85 - _x85*_x86 - _x85*_x87 - _x85*_x88 - _x85*_x89), 0, _x47*(2*_x1*_x10*_x11*_x17*_x8*_x9*cross_coupling_2*self_coupling_a*self_coupling_b + 2*_x1*_x10*_x11*_x7*_x8*_x9*cross_coupling_2*self_coupling_a*self_coupling_b + _x1*cross_coupling_1 + _x10*_x11*_x17*_x2*_x21*_x8*_x9*cross_coupling_2 + _x10*_x11*_x17*_x2*_x22*_x8*_x9*cross_coupling_2 + _x10*_x11*_x2*_x21*_x7*_x8*_x9*cross_coupling_2 + _x10*_x11*_x2*_x22*_x7*_x8*_x9*cross_coupling_2 - _x17*_x91 - _x17*_x95 - _x24*_x94 - _x38*_x94 - _x7*_x91 - _x7*_x95 - _x90), _x47*(_x1*_x10*_x11*_x17*_x20*_x8*_x9*cross_coupling_2 + _x1*_x10*_x11*_x17*_x23*_x8*_x9*cross_coupling_2 + _x1*_x10*_x11*_x20*_x7*_x8*_x9*cross_coupling_2 + _x1*_x10*_x11*_x23*_x7*_x8*_x9*cross_coupling_2 + 2*_x10*_x11*_x17*_x2*_x8*_x9*cross_coupling_2*self_coupling_a*self_coupling_b + 2*_x10*_x11*_x2*_x7*_x8*_x9*cross_coupling_2*self_coupling_a*self_coupling_b - _x100*_x17 - _x100*_x7 - _x17*_x97 + _x2*cross_coupling_1 - _x30*_x99 - _x41*_x99 - _x7*_x97 - _x96), _x1*_x10*_x11*_x20*_x66*_x8*_x9*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x1*_x10*_x11*_x20*_x66*_x8*_x9*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x1*_x10*_x11*_x20*_x66*_x8*_x9*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x1*_x10*_x11*_x20*_x66*_x8*_x9*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x1*_x10*_x11*_x20*_x66*_x8*_x9*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b + _x1*_x10*_x11*_x23*_x66*_x8*_x9*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x1*_x10*_x11*_x23*_x66*_x8*_x9*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x1*_x10*_x11*_x23*_x66*_x8*_x9*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x1*_x10*_x11*_x23*_x66*_x8*_x9*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x1*_x10*_x11*_x23*_x66*_x8*_x9*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b + _x1*_x2*_x46*_x66*_x8*m_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x2*_x46*_x66*_x8*m_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x2*_x46*_x66*_x8*p_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x2*_x46*_x66*_x8*p_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x66*p_1*self_coupling_a + _x10*_x11*_x2*_x21*_x66*_x8*_x9*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x10*_x11*_x2*_x21*_x66*_x8*_x9*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x10*_x11*_x2*_x21*_x66*_x8*_x9*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x10*_x11*_x2*_x21*_x66*_x8*_x9*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x10*_x11*_x2*_x21*_x66*_x8*_x9*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x10*_x11*_x2*_x22*_x66*_x8*_x9*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x10*_x11*_x2*_x22*_x66*_x8*_x9*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x10*_x11*_x2*_x22*_x66*_x8*_x9*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x10*_x11*_x2*_x22*_x66*_x8*_x9*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x10*_x11*_x2*_x22*_x66*_x8*_x9*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x2*_x66*p_2*self_coupling_b - _x4*_x51*_x68 + _x46*_x66*_x8*m_1*self_coupling_1*self_coupling_2 + _x46*_x66*_x8*m_2*self_coupling_1*self_coupling_2 - _x51*_x70 - _x52*_x67 - _x52*_x71 - _x53*_x67 - _x53*_x71 - _x55*_x71 - _x55*_x72 - _x55*_x73 - _x55*_x74 - _x59*_x68 - _x59*_x69 - _x59*_x71 - _x59*_x72 - _x59*_x73 - _x59*_x74 - _x60*_x68 - _x60*_x69 - _x60*_x71 - _x60*_x72 - _x60*_x73 - _x60*_x74 - _x62*_x68 - _x62*_x69 - _x62*_x71 - _x62*_x72 - _x62*_x73 - _x62*_x74 - _x63*_x68 - _x63*_x69 - _x63*_x71 - _x63*_x72 - _x63*_x73 - _x63*_x74 - _x64*_x68 - _x64*_x69, _x1*_x10*_x11*_x20*_x8*_x9*cross_coupling_2*self_coupling_b + _x1*_x10*_x11*_x23*_x8*_x9*cross_coupling_2*self_coupling_b + _x10*_x11*_x2*_x21*_x8*_x9*cross_coupling_2*self_coupling_a + _x10*_x11*_x2*_x22*_x8*_x9*cross_coupling_2*self_coupling_a - _x54 - _x86 - _x87 - _x88 - _x89, _x1*_x10*_x11*_x20*_x8*_x9*cross_coupling_1*self_coupling_b + _x1*_x10*_x11*_x23*_x8*_x9*cross_coupling_1*self_coupling_b + _x10*_x11*_x2*_x21*_x8*_x9*cross_coupling_1*self_coupling_a + _x10*_x11*_x2*_x22*_x8*_x9*cross_coupling_1*self_coupling_a - _x102*_x21 - _x102*_x22 - _x103*_x21 - _x103*_x22 - _x14*cross_coupling_1, 2*_x1*_x10*_x11*_x8*_x9*cross_coupling_1*cross_coupling_2*cross_coupling_a*self_coupling_b - _x104*_x31 - _x104*_x56, 2*_x10*_x11*_x2*_x8*_x9*cross_coupling_1*cross_coupling_2*cross_coupling_b*self_coupling_a - _x58*_x82 - _x61*_x82, -_x3*_x50 - _x4*_x50 + _x50*_x64 + _x50, -_x105*_x3 - _x105*_x4 + _x105*_x64 + _x105, 2*_x1*_x10*_x11*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b + _x1*_x2*_x46*_x8*self_coupling_1*self_coupling_2*self_coupling_b - _x1*_x51 + _x1 + _x10*_x11*_x2*_x21*_x8*_x9*cross_coupling_1*cross_coupling_2 + _x10*_x11*_x2*_x22*_x8*_x9*cross_coupling_1*cross_coupling_2 - _x106*_x21 - _x106*_x22 - _x91*cross_coupling_1 - _x98, _x1*_x10*_x11*_x20*_x8*_x9*cross_coupling_1*cross_coupling_2 + _x1*_x10*_x11*_x23*_x8*_x9*cross_coupling_1*cross_coupling_2 + _x1*_x2*_x46*_x8*self_coupling_1*self_coupling_2*self_coupling_a + 2*_x10*_x11*_x2*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b - _x107*_x20 - _x107*_x23 - _x2*_x51 + _x2 - _x92 - _x97*cross_coupling_1]
+
+
+def solution_6(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p_1
+    _x2 = _x0**p_2
+    _x3 = _x1*self_coupling_a
+    _x4 = _x2*self_coupling_b
+    _x5 = _x3*_x4
+    _x6 = _x0**m_1
+    _x7 = _x0**m_2
+    _x8 = self_coupling_1*self_coupling_2
+    _x9 = _x6*_x7
+    _x10 = _x8*_x9
+    _x11 = _x0**n_1
+    _x12 = _x0**n_2
+    _x13 = _x0**n_3
+    _x14 = _x11*_x12*_x13
+    _x15 = _x14*self_coupling_a
+    _x16 = _x15*self_coupling_b
+    _x17 = cross_coupling_1*cross_coupling_2
+    _x18 = _x17*_x6
+    _x19 = cross_coupling_a**2
+    _x20 = cross_coupling_b**2
+    _x21 = self_coupling_b**2
+    _x22 = self_coupling_a**2
+    _x23 = _x1*_x14
+    _x24 = _x2*_x23
+    _x25 = _x18*_x24
+    _x26 = _x19*_x25
+    _x27 = _x22*_x25
+    _x28 = _x17*_x7
+    _x29 = _x23*self_coupling_b
+    _x30 = _x29*_x8
+    _x31 = _x15*_x2
+    _x32 = _x31*_x8
+    _x33 = cross_coupling_2**2
+    _x34 = cross_coupling_1**2
+    _x35 = _x16*_x9
+    _x36 = _x34*_x35
+    _x37 = self_coupling_2**2
+    _x38 = self_coupling_1**2
+    _x39 = _x35*_x38
+    _x40 = _x24*_x8
+    _x41 = _x19*_x40
+    _x42 = _x22*_x40
+    _x43 = _x29*_x9
+    _x44 = _x34*_x43
+    _x45 = _x19*_x33
+    _x46 = _x31*_x9
+    _x47 = _x34*_x46
+    _x48 = _x20*_x33
+    _x49 = _x21*_x47
+    _x50 = _x22*_x44
+    _x51 = _x19*_x37
+    _x52 = _x20*_x37
+    _x53 = _x38*_x43
+    _x54 = _x38*_x46
+    _x55 = _x21*_x54
+    _x56 = _x22*_x53
+    _x57 = _x24*_x9
+    _x58 = _x34*_x57
+    _x59 = _x48*_x58
+    _x60 = _x21*_x58
+    _x61 = _x22*_x60
+    _x62 = _x52*_x58
+    _x63 = _x38*_x57
+    _x64 = _x48*_x63
+    _x65 = _x21*_x63
+    _x66 = _x22*_x65
+    _x67 = _x52*_x63
+    return (-_x16*_x8 + _x19*_x30 + _x19*_x59 + _x19*_x62 + _x19*_x64 + _x19*_x67 + _x20*_x32 - _x20*_x41 - _x20*_x42 + _x21*_x32 - _x21*_x41 - _x21*_x42 + _x22*_x30 + _x22*_x59 + _x22*_x62 + _x22*_x64 + _x22*_x67 - _x28*_x3 - _x28*_x4 + _x28*_x5 + _x28 + _x33*_x36 + _x33*_x39 - _x33*_x49 - _x33*_x50 - _x33*_x55 - _x33*_x56 + _x33*_x61 + _x33*_x66 + _x36*_x37 + _x37*_x39 - _x37*_x49 - _x37*_x50 - _x37*_x55 - _x37*_x56 + _x37*_x61 + _x37*_x66 - _x44*_x45 - _x44*_x51 - _x45*_x53 + _x45*_x60 + _x45*_x65 - _x47*_x48 - _x47*_x52 - _x48*_x54 - _x51*_x53 + _x51*_x60 + _x51*_x65 - _x52*_x54)/(_x1*_x11*_x12*_x13*_x19*_x6*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x11*_x12*_x13*_x22*_x6*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x2*_x6*_x7*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*self_coupling_a - _x10*_x3 - _x10*_x4 + _x11*_x12*_x13*_x2*_x20*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a + _x11*_x12*_x13*_x2*_x21*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a - _x16*_x18 + _x2*self_coupling_b - _x20*_x26 - _x20*_x27 - _x21*_x26 - _x21*_x27 - _x5 + _x6*_x7*self_coupling_1*self_coupling_2 - 1)
+
+
+def fraction_6(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = cross_coupling_1*cross_coupling_2
+    _x3 = _x1*_x2
+    _x4 = _x0**p_1
+    _x5 = _x4*self_coupling_a
+    _x6 = _x0**p_2
+    _x7 = _x6*self_coupling_b
+    _x8 = _x5*_x7
+    _x9 = self_coupling_1*self_coupling_2
+    _x10 = _x0**n_1
+    _x11 = _x0**n_2
+    _x12 = _x0**n_3
+    _x13 = _x10*_x11*_x12
+    _x14 = _x13*_x9
+    _x15 = _x14*self_coupling_a
+    _x16 = cross_coupling_a**2
+    _x17 = _x14*_x4
+    _x18 = _x17*self_coupling_b
+    _x19 = cross_coupling_b**2
+    _x20 = _x15*_x6
+    _x21 = self_coupling_b**2
+    _x22 = self_coupling_a**2
+    _x23 = cross_coupling_2**2
+    _x24 = cross_coupling_1**2
+    _x25 = _x0**m_1
+    _x26 = _x1*_x25
+    _x27 = _x13*self_coupling_a
+    _x28 = _x27*self_coupling_b
+    _x29 = _x26*_x28
+    _x30 = _x24*_x29
+    _x31 = self_coupling_2**2
+    _x32 = self_coupling_1**2
+    _x33 = _x29*_x32
+    _x34 = _x17*_x6
+    _x35 = _x16*_x34
+    _x36 = _x22*_x34
+    _x37 = _x13*_x4
+    _x38 = _x26*_x37*self_coupling_b
+    _x39 = _x24*_x38
+    _x40 = _x16*_x23
+    _x41 = _x26*_x27*_x6
+    _x42 = _x24*_x41
+    _x43 = _x19*_x23
+    _x44 = _x21*_x42
+    _x45 = _x22*_x39
+    _x46 = _x16*_x31
+    _x47 = _x19*_x31
+    _x48 = _x32*_x38
+    _x49 = _x32*_x41
+    _x50 = _x21*_x49
+    _x51 = _x22*_x48
+    _x52 = _x37*_x6
+    _x53 = _x26*_x52
+    _x54 = _x24*_x53
+    _x55 = _x43*_x54
+    _x56 = _x21*_x54
+    _x57 = _x22*_x56
+    _x58 = _x47*_x54
+    _x59 = _x32*_x53
+    _x60 = _x43*_x59
+    _x61 = _x21*_x59
+    _x62 = _x22*_x61
+    _x63 = _x47*_x59
+    _x64 = _x26*_x9
+    _x65 = _x2*_x25
+    _x66 = _x52*_x65
+    _x67 = _x16*_x66
+    _x68 = _x22*_x66
+    return [-_x15*self_coupling_b + _x16*_x18 + _x16*_x55 + _x16*_x58 + _x16*_x60 + _x16*_x63 + _x18*_x22 + _x19*_x20 - _x19*_x35 - _x19*_x36 + _x20*_x21 - _x21*_x35 - _x21*_x36 + _x22*_x55 + _x22*_x58 + _x22*_x60 + _x22*_x63 + _x23*_x30 + _x23*_x33 - _x23*_x44 - _x23*_x45 - _x23*_x50 - _x23*_x51 + _x23*_x57 + _x23*_x62 - _x3*_x5 - _x3*_x7 + _x3*_x8 + _x3 + _x30*_x31 + _x31*_x33 - _x31*_x44 - _x31*_x45 - _x31*_x50 - _x31*_x51 + _x31*_x57 + _x31*_x62 - _x39*_x40 - _x39*_x46 - _x40*_x48 + _x40*_x56 + _x40*_x61 - _x42*_x43 - _x42*_x47 - _x43*_x49 - _x46*_x48 + _x46*_x56 + _x46*_x61 - _x47*_x49, _x1*_x25*_x4*_x6*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x25*self_coupling_1*self_coupling_2 + _x10*_x11*_x12*_x16*_x25*_x4*cross_coupling_1*cross_coupling_2*self_coupling_b + _x10*_x11*_x12*_x19*_x25*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a + _x10*_x11*_x12*_x21*_x25*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a + _x10*_x11*_x12*_x22*_x25*_x4*cross_coupling_1*cross_coupling_2*self_coupling_b - _x19*_x67 - _x19*_x68 - _x21*_x67 - _x21*_x68 - _x28*_x65 + _x4*self_coupling_a - _x5*_x64 + _x6*self_coupling_b - _x64*_x7 - _x8 - 1]
+
+
+def sensitivity_6(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x1*cross_coupling_2
+    _x3 = _x2*cross_coupling_1
+    _x4 = _x0**p_1
+    _x5 = _x4*self_coupling_a
+    _x6 = _x3*_x5
+    _x7 = _x0**p_2
+    _x8 = _x7*self_coupling_b
+    _x9 = _x3*_x8
+    _x10 = _x5*_x8
+    _x11 = _x0**n_1
+    _x12 = _x0**n_2
+    _x13 = _x0**n_3
+    _x14 = _x11*_x12*_x13
+    _x15 = _x14*self_coupling_a
+    _x16 = _x15*self_coupling_b
+    _x17 = _x16*self_coupling_2
+    _x18 = _x17*self_coupling_1
+    _x19 = cross_coupling_a**2
+    _x20 = self_coupling_1*self_coupling_2
+    _x21 = _x14*self_coupling_b
+    _x22 = _x20*_x21
+    _x23 = _x22*_x4
+    _x24 = _x19*_x23
+    _x25 = _x15*_x20
+    _x26 = cross_coupling_b**2
+    _x27 = _x26*_x7
+    _x28 = _x25*_x27
+    _x29 = self_coupling_b**2
+    _x30 = _x29*_x7
+    _x31 = _x25*_x30
+    _x32 = self_coupling_a**2
+    _x33 = _x23*_x32
+    _x34 = cross_coupling_2**2
+    _x35 = cross_coupling_1**2
+    _x36 = _x0**m_1
+    _x37 = _x1*_x36
+    _x38 = _x16*_x37
+    _x39 = _x35*_x38
+    _x40 = _x34*_x39
+    _x41 = self_coupling_2**2
+    _x42 = _x39*_x41
+    _x43 = self_coupling_1**2
+    _x44 = _x38*_x43
+    _x45 = _x34*_x44
+    _x46 = _x41*_x44
+    _x47 = _x14*_x20
+    _x48 = _x27*_x47
+    _x49 = _x19*_x4
+    _x50 = _x48*_x49
+    _x51 = _x30*_x47
+    _x52 = _x49*_x51
+    _x53 = _x32*_x4
+    _x54 = _x48*_x53
+    _x55 = _x51*_x53
+    _x56 = _x19*_x34
+    _x57 = _x21*_x4
+    _x58 = _x35*_x37
+    _x59 = _x57*_x58
+    _x60 = _x56*_x59
+    _x61 = _x15*_x7
+    _x62 = _x26*_x61
+    _x63 = _x34*_x62
+    _x64 = _x58*_x63
+    _x65 = _x29*_x61
+    _x66 = _x58*_x65
+    _x67 = _x34*_x66
+    _x68 = _x32*_x59
+    _x69 = _x34*_x68
+    _x70 = _x19*_x41
+    _x71 = _x59*_x70
+    _x72 = _x41*_x62
+    _x73 = _x58*_x72
+    _x74 = _x41*_x66
+    _x75 = _x41*_x68
+    _x76 = _x37*_x43
+    _x77 = _x57*_x76
+    _x78 = _x56*_x77
+    _x79 = _x63*_x76
+    _x80 = _x65*_x76
+    _x81 = _x34*_x80
+    _x82 = _x32*_x77
+    _x83 = _x34*_x82
+    _x84 = _x70*_x77
+    _x85 = _x72*_x76
+    _x86 = _x41*_x80
+    _x87 = _x41*_x82
+    _x88 = _x27*_x34
+    _x89 = _x14*_x4
+    _x90 = _x37*_x89
+    _x91 = _x35*_x90
+    _x92 = _x19*_x91
+    _x93 = _x88*_x92
+    _x94 = _x56*_x91
+    _x95 = _x30*_x94
+    _x96 = _x32*_x91
+    _x97 = _x88*_x96
+    _x98 = _x34*_x96
+    _x99 = _x30*_x98
+    _x100 = _x27*_x41
+    _x101 = _x100*_x92
+    _x102 = _x70*_x91
+    _x103 = _x102*_x30
+    _x104 = _x100*_x96
+    _x105 = _x41*_x96
+    _x106 = _x105*_x30
+    _x107 = _x43*_x90
+    _x108 = _x107*_x19
+    _x109 = _x108*_x88
+    _x110 = _x107*_x56
+    _x111 = _x110*_x30
+    _x112 = _x107*_x32
+    _x113 = _x112*_x88
+    _x114 = _x112*_x34
+    _x115 = _x114*_x30
+    _x116 = _x100*_x108
+    _x117 = _x107*_x70
+    _x118 = _x117*_x30
+    _x119 = _x100*_x112
+    _x120 = _x112*_x41
+    _x121 = _x120*_x30
+    _x122 = _x37*self_coupling_2
+    _x123 = _x122*self_coupling_1
+    _x124 = _x123*_x5
+    _x125 = _x123*_x8
+    _x126 = _x16*_x36
+    _x127 = _x126*cross_coupling_2
+    _x128 = _x127*cross_coupling_1
+    _x129 = _x36*cross_coupling_2
+    _x130 = _x129*cross_coupling_1
+    _x131 = _x130*_x89
+    _x132 = _x131*_x19
+    _x133 = _x132*_x27
+    _x134 = _x132*_x30
+    _x135 = _x131*_x32
+    _x136 = _x135*_x27
+    _x137 = _x135*_x30
+    _x138 = unitary_loss_coefficient**(-1.0)
+    _x139 = _x138*m_2
+    _x140 = _x139*_x3
+    _x141 = _x138*p_1
+    _x142 = _x141*_x5
+    _x143 = _x138*p_2
+    _x144 = _x143*_x8
+    _x145 = _x10*_x141
+    _x146 = _x10*_x143
+    _x147 = _x138*_x18
+    _x148 = _x138*n_1
+    _x149 = _x138*n_2
+    _x150 = _x138*n_3
+    _x151 = _x138*m_1
+    _x152 = _x1*cross_coupling_1
+    _x153 = 2*_x126
+    _x154 = _x152*_x153
+    _x155 = 2*_x36
+    _x156 = _x152*_x155
+    _x157 = _x156*_x57
+    _x158 = _x156*_x65
+    _x159 = _x157*_x32
+    _x160 = _x156*_x89
+    _x161 = _x160*_x88
+    _x162 = _x160*_x30
+    _x163 = _x162*_x32
+    _x164 = _x100*_x160
+    _x165 = _x153*_x2
+    _x166 = _x19*_x57
+    _x167 = _x155*_x2
+    _x168 = _x167*_x35
+    _x169 = _x35*_x62
+    _x170 = _x167*_x65
+    _x171 = _x32*_x57
+    _x172 = _x167*_x43
+    _x173 = _x168*_x89
+    _x174 = _x173*_x19
+    _x175 = _x173*_x32
+    _x176 = _x172*_x89
+    _x177 = _x176*_x19
+    _x178 = _x176*_x32
+    _x179 = 2*cross_coupling_a
+    _x180 = _x179*_x4
+    _x181 = _x179*_x59
+    _x182 = _x179*_x77
+    _x183 = _x179*_x91
+    _x184 = _x183*_x30
+    _x185 = _x107*_x179
+    _x186 = _x185*_x30
+    _x187 = 2*_x25
+    _x188 = _x7*cross_coupling_b
+    _x189 = _x4*_x47
+    _x190 = _x189*_x19
+    _x191 = 2*_x188
+    _x192 = _x189*_x32
+    _x193 = 2*_x61*cross_coupling_b
+    _x194 = _x193*_x58
+    _x195 = _x193*_x76
+    _x196 = _x57*self_coupling_2
+    _x197 = _x61*self_coupling_2
+    _x198 = _x37*self_coupling_1
+    _x199 = 2*_x16
+    _x200 = _x198*_x199
+    _x201 = _x89*self_coupling_2
+    _x202 = _x19*_x201
+    _x203 = _x201*_x32
+    _x204 = 2*_x198
+    _x205 = _x204*_x57
+    _x206 = _x204*_x65
+    _x207 = _x171*_x204
+    _x208 = _x204*_x89
+    _x209 = _x208*_x88
+    _x210 = _x208*_x30
+    _x211 = _x210*_x32
+    _x212 = _x100*_x208
+    _x213 = _x57*self_coupling_1
+    _x214 = _x61*self_coupling_1
+    _x215 = _x122*_x199
+    _x216 = _x89*self_coupling_1
+    _x217 = _x19*_x216
+    _x218 = _x216*_x32
+    _x219 = 2*_x122
+    _x220 = _x219*_x35
+    _x221 = _x219*_x65
+    _x222 = _x219*_x43
+    _x223 = _x220*_x89
+    _x224 = _x19*_x223
+    _x225 = _x223*_x32
+    _x226 = _x222*_x89
+    _x227 = _x19*_x226
+    _x228 = _x226*_x32
+    _x229 = _x4*_x8
+    _x230 = 2*_x5
+    _x231 = _x21*_x37
+    _x232 = _x231*_x35
+    _x233 = _x232*_x34
+    _x234 = _x232*_x41
+    _x235 = _x231*_x43
+    _x236 = _x235*_x34
+    _x237 = _x235*_x41
+    _x238 = _x5*_x7
+    _x239 = 2*_x47
+    _x240 = _x238*_x239
+    _x241 = _x14*_x37
+    _x242 = _x241*_x35
+    _x243 = _x242*_x30
+    _x244 = _x241*_x43
+    _x245 = _x244*_x30
+    _x246 = 2*_x238
+    _x247 = _x242*_x246
+    _x248 = _x247*_x34
+    _x249 = _x247*_x41
+    _x250 = _x244*_x246
+    _x251 = _x250*_x34
+    _x252 = _x250*_x41
+    _x253 = _x15*_x37
+    _x254 = _x253*_x35
+    _x255 = _x254*_x34
+    _x256 = _x254*_x41
+    _x257 = _x253*_x43
+    _x258 = _x257*_x34
+    _x259 = _x257*_x41
+    _x260 = _x229*_x239
+    _x261 = 2*_x8
+    _x262 = 2*_x229
+    _x263 = _x242*_x262
+    _x264 = _x263*_x32
+    _x265 = _x244*_x262
+    _x266 = _x265*_x32
+    _x267 = _x129*_x89
+    _x268 = _x19*_x267
+    _x269 = _x267*_x32
+    _x270 = _x36*_x89*cross_coupling_1
+    _x271 = _x19*_x270
+    _x272 = _x270*_x32
+    _x273 = _x131*_x179
+    _x274 = 2*_x130*_x14
+    _x275 = _x238*_x274
+    _x276 = _x229*_x274
+    return [_x10*_x3 + _x101 + _x103 + _x104 + _x106 + _x109 + _x111 + _x113 + _x115 + _x116 + _x118 + _x119 + _x121 - _x18 + _x24 + _x28 + _x3 + _x31 + _x33 + _x40 + _x42 + _x45 + _x46 - _x50 - _x52 - _x54 - _x55 - _x6 - _x60 - _x64 - _x67 - _x69 - _x71 - _x73 - _x74 - _x75 - _x78 - _x79 - _x81 - _x83 - _x84 - _x85 - _x86 - _x87 - _x9 + _x93 + _x95 + _x97 + _x99, _x1*_x36*_x4*_x7*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x36*self_coupling_1*self_coupling_2 - _x10 + _x11*_x12*_x13*_x19*_x36*_x4*cross_coupling_1*cross_coupling_2*self_coupling_b + _x11*_x12*_x13*_x26*_x36*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a + _x11*_x12*_x13*_x29*_x36*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a + _x11*_x12*_x13*_x32*_x36*_x4*cross_coupling_1*cross_coupling_2*self_coupling_b - _x124 - _x125 - _x128 - _x133 - _x134 - _x136 - _x137 + _x4*self_coupling_a + _x7*self_coupling_b - 1, _x10*_x140 + _x101*_x139 + _x101*_x141 + _x101*_x143 + _x101*_x148 + _x101*_x149 + _x101*_x150 + _x101*_x151 + _x103*_x139 + _x103*_x141 + _x103*_x143 + _x103*_x148 + _x103*_x149 + _x103*_x150 + _x103*_x151 + _x104*_x139 + _x104*_x141 + _x104*_x143 + _x104*_x148 + _x104*_x149 + _x104*_x150 + _x104*_x151 + _x106*_x139 + _x106*_x141 + _x106*_x143 + _x106*_x148 + _x106*_x149 + _x106*_x150 + _x106*_x151 + _x109*_x139 + _x109*_x141 + _x109*_x143 + _x109*_x148 + _x109*_x149 + _x109*_x150 + _x109*_x151 + _x111*_x139 + _x111*_x141 + _x111*_x143 + _x111*_x148 + _x111*_x149 + _x111*_x150 + _x111*_x151 + _x113*_x139 + _x113*_x141 + _x113*_x143 + _x113*_x148 + _x113*_x149 + _x113*_x150 + _x113*_x151 + _x115*_x139 + _x115*_x141 + _x115*_x143 + _x115*_x148 + _x115*_x149 + _x115*_x150 + _x115*_x151 + _x116*_x139 + _x116*_x141 + _x116*_x143 + _x116*_x148 + _x116*_x149 + _x116*_x150 + _x116*_x151 + _x118*_x139 + _x118*_x141 + _x118*_x143 + _x118*_x148 + _x118*_x149 + _x118*_x150 + _x118*_x151 + _x119*_x139 + _x119*_x141 + _x119*_x143 + _x119*_x148 + _x119*_x149 + _x119*_x150 + _x119*_x151 + _x121*_x139 + _x121*_x141 + _x121*_x143 + _x121*_x148 + _x121*_x149 + _x121*_x150 + _x121*_x151 + _x139*_x40 + _x139*_x42 + _x139*_x45 + _x139*_x46 - _x139*_x6 - _x139*_x60 - _x139*_x64 - _x139*_x67 - _x139*_x69 - _x139*_x71 - _x139*_x73 - _x139*_x74 - _x139*_x75 - _x139*_x78 - _x139*_x79 - _x139*_x81 - _x139*_x83 - _x139*_x84 - _x139*_x85 - _x139*_x86 - _x139*_x87 - _x139*_x9 + _x139*_x93 + _x139*_x95 + _x139*_x97 + _x139*_x99 + _x140 + _x141*_x24 + _x141*_x33 - _x141*_x50 - _x141*_x52 - _x141*_x54 - _x141*_x55 - _x141*_x60 - _x141*_x69 - _x141*_x71 - _x141*_x75 - _x141*_x78 - _x141*_x83 - _x141*_x84 - _x141*_x87 + _x141*_x93 + _x141*_x95 + _x141*_x97 + _x141*_x99 - _x142*_x3 + _x143*_x28 + _x143*_x31 - _x143*_x50 - _x143*_x52 - _x143*_x54 - _x143*_x55 - _x143*_x64 - _x143*_x67 - _x143*_x73 - _x143*_x74 - _x143*_x79 - _x143*_x81 - _x143*_x85 - _x143*_x86 + _x143*_x93 + _x143*_x95 + _x143*_x97 + _x143*_x99 - _x144*_x3 + _x145*_x3 + _x146*_x3 - _x147*n_1 - _x147*n_2 - _x147*n_3 + _x148*_x24 + _x148*_x28 + _x148*_x31 + _x148*_x33 + _x148*_x40 + _x148*_x42 + _x148*_x45 + _x148*_x46 - _x148*_x50 - _x148*_x52 - _x148*_x54 - _x148*_x55 - _x148*_x60 - _x148*_x64 - _x148*_x67 - _x148*_x69 - _x148*_x71 - _x148*_x73 - _x148*_x74 - _x148*_x75 - _x148*_x78 - _x148*_x79 - _x148*_x81 - _x148*_x83 - _x148*_x84 - _x148*_x85 - _x148*_x86 - _x148*_x87 + _x148*_x93 + _x148*_x95 + _x148*_x97 + _x148*_x99 + _x149*_x24 + _x149*_x28 + _x149*_x31 + _x149*_x33 + _x149*_x40 + _x149*_x42 + _x149*_x45 + _x149*_x46 - _x149*_x50 - _x149*_x52 - _x149*_x54 - _x149*_x55 - _x149*_x60 - _x149*_x64 - _x149*_x67 - _x149*_x69 - _x149*_x71 - _x149*_x73 - _x149*_x74 - _x149*_x75 - _x149*_x78 - _x149*_x79 - _x149*_x81 - _x149*_x83 - _x149*_x84 - _x149*_x85 - _x149*_x86 - _x149*_x87 + _x149*_x93 + _x149*_x95 + _x149*_x97 + _x149*_x99 + _x150*_x24 + _x150*_x28 + _x150*_x31 + _x150*_x33 + _x150*_x40 + _x150*_x42 + _x150*_x45 + _x150*_x46 - _x150*_x50 - _x150*_x52 - _x150*_x54 - _x150*_x55 - _x150*_x60 - _x150*_x64 - _x150*_x67 - _x150*_x69 - _x150*_x71 - _x150*_x73 - _x150*_x74 - _x150*_x75 - _x150*_x78 - _x150*_x79 - _x150*_x81 - _x150*_x83 - _x150*_x84 - _x150*_x85 - _x150*_x86 - _x150*_x87 + _x150*_x93 + _x150*_x95 + _x150*_x97 + _x150*_x99 + _x151*_x40 + _x151*_x42 + _x151*_x45 + _x151*_x46 - _x151*_x60 - _x151*_x64 - _x151*_x67 - _x151*_x69 - _x151*_x71 - _x151*_x73 - _x151*_x74 - _x151*_x75 - _x151*_x78 - _x151*_x79 - _x151*_x81 - _x151*_x83 - _x151*_x84 - _x151*_x85 - _x151*_x86 - _x151*_x87 + _x151*_x93 + _x151*_x95 + _x151*_x97 + _x151*_x99, _x10*_x2 + _x154*_x34 + _x154*_x41 - _x156*_x63 - _x156*_x72 - _x157*_x56 - _x157*_x70 - _x158*_x34 - _x158*_x41 - _x159*_x34 - _x159*_x41 + _x161*_x19 + _x161*_x32 + _x162*_x56 + _x162*_x70 + _x163*_x34 + _x163*_x41 + _x164*_x19 + _x164*_x32 - _x2*_x5 - _x2*_x8 + _x2, _x10*_x152 - _x152*_x5 - _x152*_x8 + _x152 + _x165*_x35 + _x165*_x43 - _x166*_x168 - _x166*_x172 - _x167*_x169 - _x168*_x171 - _x170*_x35 - _x170*_x43 - _x171*_x172 - _x172*_x62 + _x174*_x27 + _x174*_x30 + _x175*_x27 + _x175*_x30 + _x177*_x27 + _x177*_x30 + _x178*_x27 + _x178*_x30, _x100*_x183 + _x100*_x185 + _x179*_x23 - _x180*_x48 - _x180*_x51 - _x181*_x34 - _x181*_x41 - _x182*_x34 - _x182*_x41 + _x183*_x88 + _x184*_x34 + _x184*_x41 + _x185*_x88 + _x186*_x34 + _x186*_x41, _x102*_x191 + _x105*_x191 + _x110*_x191 + _x114*_x191 + _x117*_x191 + _x120*_x191 + _x187*_x188 - _x190*_x191 - _x191*_x192 + _x191*_x94 + _x191*_x98 - _x194*_x34 - _x194*_x41 - _x195*_x34 - _x195*_x41, -_x17 + _x19*_x196 + _x19*_x209 + _x19*_x212 + _x196*_x32 + _x197*_x26 + _x197*_x29 + _x200*_x34 + _x200*_x41 - _x202*_x27 - _x202*_x30 - _x203*_x27 - _x203*_x30 - _x204*_x63 - _x204*_x72 - _x205*_x56 - _x205*_x70 - _x206*_x34 - _x206*_x41 - _x207*_x34 - _x207*_x41 + _x209*_x32 + _x210*_x56 + _x210*_x70 + _x211*_x34 + _x211*_x41 + _x212*_x32, -_x16*self_coupling_1 - _x166*_x220 - _x166*_x222 - _x169*_x219 - _x171*_x220 - _x171*_x222 + _x19*_x213 + _x213*_x32 + _x214*_x26 + _x214*_x29 + _x215*_x35 + _x215*_x43 - _x217*_x27 - _x217*_x30 - _x218*_x27 - _x218*_x30 - _x221*_x35 - _x221*_x43 - _x222*_x62 + _x224*_x27 + _x224*_x30 + _x225*_x27 + _x225*_x30 + _x227*_x27 + _x227*_x30 + _x228*_x27 + _x228*_x30, -_x100*_x242 - _x100*_x244 + _x22*_x230 - _x22 + _x229*_x3 - _x230*_x233 - _x230*_x234 - _x230*_x236 - _x230*_x237 + _x233 + _x234 + _x236 + _x237 - _x240*_x26 - _x240*_x29 - _x242*_x88 - _x243*_x34 - _x243*_x41 - _x244*_x88 - _x245*_x34 - _x245*_x41 + _x248*_x26 + _x248*_x29 + _x249*_x26 + _x249*_x29 + _x251*_x26 + _x251*_x29 + _x252*_x26 + _x252*_x29 - _x3*_x4 + _x48 + _x51, -_x102 - _x105 - _x110 - _x114 - _x117 - _x120 + _x187*_x8 - _x19*_x260 + _x190 + _x192 + _x238*_x3 - _x25 - _x255*_x261 + _x255 - _x256*_x261 + _x256 - _x258*_x261 + _x258 - _x259*_x261 + _x259 - _x260*_x32 + _x263*_x56 + _x263*_x70 + _x264*_x34 + _x264*_x41 + _x265*_x56 + _x265*_x70 + _x266*_x34 + _x266*_x41 - _x3*_x7 - _x94 - _x98, _x1*_x138*_x36*_x4*_x7*m_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x138*_x36*_x4*_x7*m_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x138*_x36*_x4*_x7*p_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x138*_x36*_x4*_x7*p_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x138*_x36*m_1*self_coupling_1*self_coupling_2 + _x1*_x138*_x36*m_2*self_coupling_1*self_coupling_2 + _x11*_x12*_x13*_x138*_x19*_x36*_x4*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x11*_x12*_x13*_x138*_x19*_x36*_x4*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x11*_x12*_x13*_x138*_x19*_x36*_x4*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x11*_x12*_x13*_x138*_x19*_x36*_x4*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x11*_x12*_x13*_x138*_x19*_x36*_x4*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b + _x11*_x12*_x13*_x138*_x26*_x36*_x7*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x11*_x12*_x13*_x138*_x26*_x36*_x7*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x11*_x12*_x13*_x138*_x26*_x36*_x7*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x11*_x12*_x13*_x138*_x26*_x36*_x7*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x11*_x12*_x13*_x138*_x26*_x36*_x7*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x11*_x12*_x13*_x138*_x29*_x36*_x7*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x11*_x12*_x13*_x138*_x29*_x36*_x7*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x11*_x12*_x13*_x138*_x29*_x36*_x7*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x11*_x12*_x13*_x138*_x29*_x36*_x7*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x11*_x12*_x13*_x138*_x29*_x36*_x7*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x11*_x12*_x13*_x138*_x32*_x36*_x4*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x11*_x12*_x13*_x138*_x32*_x36*_x4*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x11*_x12*_x13*_x138*_x32*_x36*_x4*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x11*_x12*_x13*_x138*_x32*_x36*_x4*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x11*_x12*_x13*_x138*_x32*_x36*_x4*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b - _x123*_x142 - _x123*_x144 - _x124*_x139 - _x124*_x151 - _x125*_x139 - _x125*_x151 - _x128*_x148 - _x128*_x149 - _x128*_x150 - _x128*_x151 - _x133*_x141 - _x133*_x143 - _x133*_x148 - _x133*_x149 - _x133*_x150 - _x133*_x151 - _x134*_x141 - _x134*_x143 - _x134*_x148 - _x134*_x149 - _x134*_x150 - _x134*_x151 - _x136*_x141 - _x136*_x143 - _x136*_x148 - _x136*_x149 - _x136*_x150 - _x136*_x151 - _x137*_x141 - _x137*_x143 - _x137*_x148 - _x137*_x149 - _x137*_x150 - _x137*_x151 + _x138*_x4*p_1*self_coupling_a + _x138*_x7*p_2*self_coupling_b - _x145 - _x146, _x11*_x12*_x13*_x19*_x36*_x4*cross_coupling_2*self_coupling_b + _x11*_x12*_x13*_x26*_x36*_x7*cross_coupling_2*self_coupling_a + _x11*_x12*_x13*_x29*_x36*_x7*cross_coupling_2*self_coupling_a + _x11*_x12*_x13*_x32*_x36*_x4*cross_coupling_2*self_coupling_b - _x127 - _x268*_x27 - _x268*_x30 - _x269*_x27 - _x269*_x30, _x11*_x12*_x13*_x19*_x36*_x4*cross_coupling_1*self_coupling_b + _x11*_x12*_x13*_x26*_x36*_x7*cross_coupling_1*self_coupling_a + _x11*_x12*_x13*_x29*_x36*_x7*cross_coupling_1*self_coupling_a + _x11*_x12*_x13*_x32*_x36*_x4*cross_coupling_1*self_coupling_b - _x126*cross_coupling_1 - _x27*_x271 - _x27*_x272 - _x271*_x30 - _x272*_x30, 2*_x11*_x12*_x13*_x36*_x4*cross_coupling_1*cross_coupling_2*cross_coupling_a*self_coupling_b - _x27*_x273 - _x273*_x30, 2*_x11*_x12*_x13*_x36*_x7*cross_coupling_1*cross_coupling_2*cross_coupling_b*self_coupling_a - _x132*_x191 - _x135*_x191, _x10*_x122 - _x122*_x5 - _x122*_x8 + _x122, _x10*_x198 - _x198*_x5 - _x198*_x8 + _x198, _x1*_x36*_x4*_x7*self_coupling_1*self_coupling_2*self_coupling_b + _x11*_x12*_x13*_x26*_x36*_x7*cross_coupling_1*cross_coupling_2 + _x11*_x12*_x13*_x29*_x36*_x7*cross_coupling_1*cross_coupling_2 + 2*_x11*_x12*_x13*_x36*_x4*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b - _x123*_x4 - _x130*_x21 - _x229 - _x26*_x275 - _x275*_x29 + _x4, _x1*_x36*_x4*_x7*self_coupling_1*self_coupling_2*self_coupling_a + _x11*_x12*_x13*_x19*_x36*_x4*cross_coupling_1*cross_coupling_2 + _x11*_x12*_x13*_x32*_x36*_x4*cross_coupling_1*cross_coupling_2 + 2*_x11*_x12*_x13*_x36*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b - _x123*_x7 - _x130*_x15 - _x19*_x276 - _x238 - _x276*_x32 + _x7]
+
+
+def solution_7(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x1*self_coupling_2
+    _x3 = _x2*cross_coupling_1
+    _x4 = _x0**p_1
+    _x5 = _x0**p_2
+    _x6 = _x4*self_coupling_a
+    _x7 = _x5*self_coupling_b
+    _x8 = _x6*_x7
+    _x9 = _x0**n_1
+    _x10 = _x0**n_2
+    _x11 = _x0**n_3
+    _x12 = _x10*_x11*_x9*cross_coupling_2
+    _x13 = _x12*self_coupling_a*self_coupling_b
+    _x14 = cross_coupling_a**2
+    _x15 = cross_coupling_b**2
+    _x16 = self_coupling_b**2
+    _x17 = self_coupling_a**2
+    _x18 = _x12*_x4*_x5
+    _x19 = _x18*self_coupling_1
+    _x20 = _x14*_x19
+    _x21 = _x17*_x19
+    _x22 = _x0**m_1
+    _x23 = _x2*_x22*self_coupling_1
+    _x24 = _x22*cross_coupling_1
+    _x25 = _x18*_x24
+    _x26 = _x14*_x25
+    _x27 = _x17*_x25
+    return 1j*(_x1*_x4*cross_coupling_1*self_coupling_2*self_coupling_a + _x1*_x5*cross_coupling_1*self_coupling_2*self_coupling_b + _x10*_x11*_x14*_x4*_x9*cross_coupling_2*self_coupling_1*self_coupling_b + _x10*_x11*_x15*_x5*_x9*cross_coupling_2*self_coupling_1*self_coupling_a + _x10*_x11*_x16*_x5*_x9*cross_coupling_2*self_coupling_1*self_coupling_a + _x10*_x11*_x17*_x4*_x9*cross_coupling_2*self_coupling_1*self_coupling_b - _x13*self_coupling_1 - _x15*_x20 - _x15*_x21 - _x16*_x20 - _x16*_x21 - _x3*_x8 - _x3)/(_x1*_x22*_x4*_x5*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x22*self_coupling_1*self_coupling_2 + _x10*_x11*_x14*_x22*_x4*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x10*_x11*_x15*_x22*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x10*_x11*_x16*_x22*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x10*_x11*_x17*_x22*_x4*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b - _x13*_x24 - _x15*_x26 - _x15*_x27 - _x16*_x26 - _x16*_x27 - _x23*_x6 - _x23*_x7 + _x4*self_coupling_a + _x5*self_coupling_b - _x8 - 1)
+
+
+def fraction_7(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x1*self_coupling_2
+    _x3 = _x2*cross_coupling_1
+    _x4 = _x0**p_1
+    _x5 = _x0**p_2
+    _x6 = _x4*self_coupling_a
+    _x7 = _x5*self_coupling_b
+    _x8 = _x6*_x7
+    _x9 = _x0**n_1
+    _x10 = _x0**n_2
+    _x11 = _x0**n_3
+    _x12 = _x10*_x11*_x9*cross_coupling_2
+    _x13 = _x12*self_coupling_1
+    _x14 = cross_coupling_a**2
+    _x15 = cross_coupling_b**2
+    _x16 = self_coupling_b**2
+    _x17 = self_coupling_a**2
+    _x18 = _x13*_x4*_x5
+    _x19 = _x14*_x18
+    _x20 = _x17*_x18
+    _x21 = _x0**m_1
+    _x22 = _x2*_x21*self_coupling_1
+    _x23 = _x12*_x21*cross_coupling_1
+    _x24 = _x23*_x4*_x5
+    _x25 = _x14*_x24
+    _x26 = _x17*_x24
+    return [1j*(_x1*_x4*cross_coupling_1*self_coupling_2*self_coupling_a + _x1*_x5*cross_coupling_1*self_coupling_2*self_coupling_b + _x10*_x11*_x14*_x4*_x9*cross_coupling_2*self_coupling_1*self_coupling_b + _x10*_x11*_x15*_x5*_x9*cross_coupling_2*self_coupling_1*self_coupling_a + _x10*_x11*_x16*_x5*_x9*cross_coupling_2*self_coupling_1*self_coupling_a + _x10*_x11*_x17*_x4*_x9*cross_coupling_2*self_coupling_1*self_coupling_b - _x13*self_coupling_a*self_coupling_b - _x15*_x19 - _x15*_x20 - _x16*_x19 - _x16*_x20 - _x3*_x8 - _x3), _x1*_x21*_x4*_x5*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x21*self_coupling_1*self_coupling_2 + _x10*_x11*_x14*_x21*_x4*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x10*_x11*_x15*_x21*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x10*_x11*_x16*_x21*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x10*_x11*_x17*_x21*_x4*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b - _x15*_x25 - _x15*_x26 - _x16*_x25 - _x16*_x26 - _x22*_x6 - _x22*_x7 - _x23*self_coupling_a*self_coupling_b + _x4*self_coupling_a + _x5*self_coupling_b - _x8 - 1]
+
+
+def sensitivity_7(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**m_2
+    _x2 = _x1*self_coupling_2
+    _x3 = _x2*cross_coupling_1
+    _x4 = _x0**p_1
+    _x5 = _x0**p_2
+    _x6 = _x4*self_coupling_a
+    _x7 = _x5*self_coupling_b
+    _x8 = _x6*_x7
+    _x9 = _x0**n_1
+    _x10 = _x0**n_2
+    _x11 = _x0**n_3
+    _x12 = _x10*_x11*_x9
+    _x13 = _x12*self_coupling_a
+    _x14 = _x13*self_coupling_b
+    _x15 = _x14*self_coupling_1
+    _x16 = _x15*cross_coupling_2
+    _x17 = cross_coupling_a**2
+    _x18 = cross_coupling_b**2
+    _x19 = self_coupling_b**2
+    _x20 = self_coupling_a**2
+    _x21 = cross_coupling_2*self_coupling_1
+    _x22 = _x12*_x21
+    _x23 = _x18*_x5
+    _x24 = _x22*_x23
+    _x25 = _x17*_x4
+    _x26 = _x24*_x25
+    _x27 = _x19*_x5
+    _x28 = _x22*_x27
+    _x29 = _x25*_x28
+    _x30 = _x20*_x4
+    _x31 = _x24*_x30
+    _x32 = _x28*_x30
+    _x33 = _x0**m_1
+    _x34 = _x2*_x33
+    _x35 = _x34*self_coupling_1
+    _x36 = _x35*_x6
+    _x37 = _x35*_x7
+    _x38 = _x14*cross_coupling_2
+    _x39 = _x33*_x38
+    _x40 = _x39*cross_coupling_1
+    _x41 = _x33*cross_coupling_1
+    _x42 = _x41*cross_coupling_2
+    _x43 = _x12*_x4
+    _x44 = _x42*_x43
+    _x45 = _x17*_x44
+    _x46 = _x23*_x45
+    _x47 = _x27*_x45
+    _x48 = _x20*_x44
+    _x49 = _x23*_x48
+    _x50 = _x27*_x48
+    _x51 = unitary_loss_coefficient**(-1.0)
+    _x52 = _x51*m_2
+    _x53 = _x3*_x52
+    _x54 = _x51*p_1
+    _x55 = _x54*_x8
+    _x56 = _x51*p_2
+    _x57 = _x56*_x8
+    _x58 = _x16*_x51
+    _x59 = _x51*n_1
+    _x60 = _x51*n_2
+    _x61 = _x51*n_3
+    _x62 = _x43*self_coupling_1
+    _x63 = _x17*_x62
+    _x64 = _x20*_x62
+    _x65 = 2*cross_coupling_a
+    _x66 = _x4*_x65
+    _x67 = _x22*_x4
+    _x68 = 2*_x5*cross_coupling_b
+    _x69 = _x43*cross_coupling_2
+    _x70 = _x17*_x69
+    _x71 = _x23*_x70
+    _x72 = _x27*_x70
+    _x73 = _x20*_x69
+    _x74 = _x23*_x73
+    _x75 = _x27*_x73
+    _x76 = _x1*cross_coupling_1
+    _x77 = _x4*_x7
+    _x78 = _x12*self_coupling_b
+    _x79 = _x5*_x6
+    _x80 = 2*_x22
+    _x81 = _x79*_x80
+    _x82 = _x77*_x80
+    _x83 = _x51*m_1
+    _x84 = _x41*_x43
+    _x85 = _x17*_x84
+    _x86 = _x20*_x84
+    _x87 = _x44*_x65
+    _x88 = _x1*_x33*self_coupling_1
+    _x89 = 2*_x12*_x42
+    _x90 = _x79*_x89
+    _x91 = _x77*_x89
+    return [1j*(_x1*_x4*cross_coupling_1*self_coupling_2*self_coupling_a + _x1*_x5*cross_coupling_1*self_coupling_2*self_coupling_b + _x10*_x11*_x17*_x4*_x9*cross_coupling_2*self_coupling_1*self_coupling_b + _x10*_x11*_x18*_x5*_x9*cross_coupling_2*self_coupling_1*self_coupling_a + _x10*_x11*_x19*_x5*_x9*cross_coupling_2*self_coupling_1*self_coupling_a + _x10*_x11*_x20*_x4*_x9*cross_coupling_2*self_coupling_1*self_coupling_b - _x16 - _x26 - _x29 - _x3*_x8 - _x3 - _x31 - _x32), _x1*_x33*_x4*_x5*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x33*self_coupling_1*self_coupling_2 + _x10*_x11*_x17*_x33*_x4*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x10*_x11*_x18*_x33*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x10*_x11*_x19*_x33*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x10*_x11*_x20*_x33*_x4*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b - _x36 - _x37 + _x4*self_coupling_a - _x40 - _x46 - _x47 - _x49 + _x5*self_coupling_b - _x50 - _x8 - 1, 1j*(_x1*_x4*_x51*cross_coupling_1*m_2*self_coupling_2*self_coupling_a + _x1*_x4*_x51*cross_coupling_1*p_1*self_coupling_2*self_coupling_a + _x1*_x5*_x51*cross_coupling_1*m_2*self_coupling_2*self_coupling_b + _x1*_x5*_x51*cross_coupling_1*p_2*self_coupling_2*self_coupling_b + _x10*_x11*_x17*_x4*_x51*_x9*cross_coupling_2*n_1*self_coupling_1*self_coupling_b + _x10*_x11*_x17*_x4*_x51*_x9*cross_coupling_2*n_2*self_coupling_1*self_coupling_b + _x10*_x11*_x17*_x4*_x51*_x9*cross_coupling_2*n_3*self_coupling_1*self_coupling_b + _x10*_x11*_x17*_x4*_x51*_x9*cross_coupling_2*p_1*self_coupling_1*self_coupling_b + _x10*_x11*_x18*_x5*_x51*_x9*cross_coupling_2*n_1*self_coupling_1*self_coupling_a + _x10*_x11*_x18*_x5*_x51*_x9*cross_coupling_2*n_2*self_coupling_1*self_coupling_a + _x10*_x11*_x18*_x5*_x51*_x9*cross_coupling_2*n_3*self_coupling_1*self_coupling_a + _x10*_x11*_x18*_x5*_x51*_x9*cross_coupling_2*p_2*self_coupling_1*self_coupling_a + _x10*_x11*_x19*_x5*_x51*_x9*cross_coupling_2*n_1*self_coupling_1*self_coupling_a + _x10*_x11*_x19*_x5*_x51*_x9*cross_coupling_2*n_2*self_coupling_1*self_coupling_a + _x10*_x11*_x19*_x5*_x51*_x9*cross_coupling_2*n_3*self_coupling_1*self_coupling_a + _x10*_x11*_x19*_x5*_x51*_x9*cross_coupling_2*p_2*self_coupling_1*self_coupling_a + _x10*_x11*_x20*_x4*_x51*_x9*cross_coupling_2*n_1*self_coupling_1*self_coupling_b + _x10*_x11*_x20*_x4*_x51*_x9*cross_coupling_2*n_2*self_coupling_1*self_coupling_b + _x10*_x11*_x20*_x4*_x51*_x9*cross_coupling_2*n_3*self_coupling_1*self_coupling_b + _x10*_x11*_x20*_x4*_x51*_x9*cross_coupling_2*p_1*self_coupling_1*self_coupling_b - _x26*_x54 - _x26*_x56 - _x26*_x59 - _x26*_x60 - _x26*_x61 - _x29*_x54 - _x29*_x56 - _x29*_x59 - _x29*_x60 - _x29*_x61 - _x3*_x55 - _x3*_x57 - _x31*_x54 - _x31*_x56 - _x31*_x59 - _x31*_x60 - _x31*_x61 - _x32*_x54 - _x32*_x56 - _x32*_x59 - _x32*_x60 - _x32*_x61 - _x53*_x8 - _x53 - _x58*n_1 - _x58*n_2 - _x58*n_3), 1j*(_x1*_x4*self_coupling_2*self_coupling_a + _x1*_x5*self_coupling_2*self_coupling_b - _x2*_x8 - _x2), 1j*(_x10*_x11*_x17*_x4*_x9*self_coupling_1*self_coupling_b + _x10*_x11*_x18*_x5*_x9*self_coupling_1*self_coupling_a + _x10*_x11*_x19*_x5*_x9*self_coupling_1*self_coupling_a + _x10*_x11*_x20*_x4*_x9*self_coupling_1*self_coupling_b - _x15 - _x23*_x63 - _x23*_x64 - _x27*_x63 - _x27*_x64), 1j*(2*_x10*_x11*_x4*_x9*cross_coupling_2*cross_coupling_a*self_coupling_1*self_coupling_b - _x24*_x66 - _x28*_x66), 1j*(2*_x10*_x11*_x5*_x9*cross_coupling_2*cross_coupling_b*self_coupling_1*self_coupling_a - _x17*_x67*_x68 - _x20*_x67*_x68), 1j*(_x10*_x11*_x17*_x4*_x9*cross_coupling_2*self_coupling_b + _x10*_x11*_x18*_x5*_x9*cross_coupling_2*self_coupling_a + _x10*_x11*_x19*_x5*_x9*cross_coupling_2*self_coupling_a + _x10*_x11*_x20*_x4*_x9*cross_coupling_2*self_coupling_b - _x38 - _x71 - _x72 - _x74 - _x75), 1j*(_x1*_x4*cross_coupling_1*self_coupling_a + _x1*_x5*cross_coupling_1*self_coupling_b - _x76*_x8 - _x76), 1j*(_x1*_x4*cross_coupling_1*self_coupling_2 + _x10*_x11*_x18*_x5*_x9*cross_coupling_2*self_coupling_1 + _x10*_x11*_x19*_x5*_x9*cross_coupling_2*self_coupling_1 + 2*_x10*_x11*_x4*_x9*cross_coupling_2*self_coupling_1*self_coupling_a*self_coupling_b - _x18*_x81 - _x19*_x81 - _x21*_x78 - _x3*_x77), 1j*(_x1*_x5*cross_coupling_1*self_coupling_2 + _x10*_x11*_x17*_x4*_x9*cross_coupling_2*self_coupling_1 + _x10*_x11*_x20*_x4*_x9*cross_coupling_2*self_coupling_1 + 2*_x10*_x11*_x5*_x9*cross_coupling_2*self_coupling_1*self_coupling_a*self_coupling_b - _x13*_x21 - _x17*_x82 - _x20*_x82 - _x3*_x79), _x1*_x33*_x4*_x5*_x51*m_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x33*_x4*_x5*_x51*m_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x33*_x4*_x5*_x51*p_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x33*_x4*_x5*_x51*p_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x33*_x51*m_1*self_coupling_1*self_coupling_2 + _x1*_x33*_x51*m_2*self_coupling_1*self_coupling_2 + _x10*_x11*_x17*_x33*_x4*_x51*_x9*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x10*_x11*_x17*_x33*_x4*_x51*_x9*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x10*_x11*_x17*_x33*_x4*_x51*_x9*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x10*_x11*_x17*_x33*_x4*_x51*_x9*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x10*_x11*_x17*_x33*_x4*_x51*_x9*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b + _x10*_x11*_x18*_x33*_x5*_x51*_x9*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x10*_x11*_x18*_x33*_x5*_x51*_x9*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x10*_x11*_x18*_x33*_x5*_x51*_x9*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x10*_x11*_x18*_x33*_x5*_x51*_x9*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x10*_x11*_x18*_x33*_x5*_x51*_x9*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x10*_x11*_x19*_x33*_x5*_x51*_x9*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x10*_x11*_x19*_x33*_x5*_x51*_x9*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x10*_x11*_x19*_x33*_x5*_x51*_x9*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x10*_x11*_x19*_x33*_x5*_x51*_x9*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x10*_x11*_x19*_x33*_x5*_x51*_x9*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x10*_x11*_x20*_x33*_x4*_x51*_x9*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x10*_x11*_x20*_x33*_x4*_x51*_x9*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x10*_x11*_x20*_x33*_x4*_x51*_x9*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x10*_x11*_x20*_x33*_x4*_x51*_x9*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x10*_x11*_x20*_x33*_x4*_x51*_x9*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b - _x35*_x54*_x6 - _x35*_x56*_x7 - _x36*_x52 - _x36*_x83 - _x37*_x52 - _x37*_x83 + _x4*_x51*p_1*self_coupling_a - _x40*_x59 - _x40*_x60 - _x40*_x61 - _x40*_x83 - _x46*_x54 - _x46*_x56 - _x46*_x59 - _x46*_x60 - _x46*_x61 - _x46*_x83 - _x47*_x54 - _x47*_x56 - _x47*_x59 - _x47*_x60 - _x47*_x61 - _x47*_x83 - _x49*_x54 - _x49*_x56 - _x49*_x59 - _x49*_x60 - _x49*_x61 - _x49*_x83 + _x5*_x51*p_2*self_coupling_b - _x50*_x54 - _x50*_x56 - _x50*_x59 - _x50*_x60 - _x50*_x61 - _x50*_x83 - _x55 - _x57, _x10*_x11*_x17*_x33*_x4*_x9*cross_coupling_2*self_coupling_b + _x10*_x11*_x18*_x33*_x5*_x9*cross_coupling_2*self_coupling_a + _x10*_x11*_x19*_x33*_x5*_x9*cross_coupling_2*self_coupling_a + _x10*_x11*_x20*_x33*_x4*_x9*cross_coupling_2*self_coupling_b - _x33*_x71 - _x33*_x72 - _x33*_x74 - _x33*_x75 - _x39, _x10*_x11*_x17*_x33*_x4*_x9*cross_coupling_1*self_coupling_b + _x10*_x11*_x18*_x33*_x5*_x9*cross_coupling_1*self_coupling_a + _x10*_x11*_x19*_x33*_x5*_x9*cross_coupling_1*self_coupling_a + _x10*_x11*_x20*_x33*_x4*_x9*cross_coupling_1*self_coupling_b - _x14*_x41 - _x23*_x85 - _x23*_x86 - _x27*_x85 - _x27*_x86, 2*_x10*_x11*_x33*_x4*_x9*cross_coupling_1*cross_coupling_2*cross_coupling_a*self_coupling_b - _x23*_x87 - _x27*_x87, 2*_x10*_x11*_x33*_x5*_x9*cross_coupling_1*cross_coupling_2*cross_coupling_b*self_coupling_a - _x45*_x68 - _x48*_x68, -_x34*_x6 - _x34*_x7 + _x34*_x8 + _x34, -_x6*_x88 - _x7*_x88 + _x8*_x88 + _x88, _x1*_x33*_x4*_x5*self_coupling_1*self_coupling_2*self_coupling_b + _x10*_x11*_x18*_x33*_x5*_x9*cross_coupling_1*cross_coupling_2 + _x10*_x11*_x19*_x33*_x5*_x9*cross_coupling_1*cross_coupling_2 + 2*_x10*_x11*_x33*_x4*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b - _x18*_x90 - _x19*_x90 - _x35*_x4 + _x4 - _x42*_x78 - _x77, _x1*_x33*_x4*_x5*self_coupling_1*self_coupling_2*self_coupling_a + _x10*_x11*_x17*_x33*_x4*_x9*cross_coupling_1*cross_coupling_2 + _x10*_x11*_x20*_x33*_x4*_x9*cross_coupling_1*cross_coupling_2 + 2*_x10*_x11*_x33*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b - _x13*_x42 - _x17*_x91 - _x20*_x91 - _x35*_x5 + _x5 - _x79]
+
+
+def solution_8(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n_1
+    _x2 = _x0**p_1
+    _x3 = _x2*self_coupling_a
+    _x4 = _x3*self_coupling_1
+    _x5 = _x0**p_2
+    _x6 = _x5*self_coupling_b
+    _x7 = _x6*self_coupling_1
+    _x8 = _x0**m_1
+    _x9 = _x0**m_2
+    _x10 = _x8*_x9*self_coupling_2
+    _x11 = _x10*cross_coupling_1**2
+    _x12 = _x10*self_coupling_1**2
+    _x13 = _x3*_x6
+    _x14 = _x0**n_2
+    _x15 = _x0**n_3
+    _x16 = _x1*_x14*_x15*_x8*cross_coupling_1*cross_coupling_2
+    _x17 = cross_coupling_a**2
+    _x18 = cross_coupling_b**2
+    _x19 = self_coupling_b**2
+    _x20 = self_coupling_a**2
+    _x21 = _x16*_x2*_x5
+    _x22 = _x17*_x21
+    _x23 = _x20*_x21
+    return _x1*(_x11*_x13 - _x11*_x3 - _x11*_x6 + _x11 + _x12*_x13 - _x12*_x3 - _x12*_x6 + _x12 - _x4*_x6 + _x4 + _x7 - self_coupling_1)/(_x1*_x14*_x15*_x17*_x2*_x8*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x14*_x15*_x18*_x5*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a + _x1*_x14*_x15*_x19*_x5*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a + _x1*_x14*_x15*_x2*_x20*_x8*cross_coupling_1*cross_coupling_2*self_coupling_b - _x10*_x4 - _x10*_x7 - _x13 - _x16*self_coupling_a*self_coupling_b - _x18*_x22 - _x18*_x23 - _x19*_x22 - _x19*_x23 + _x2*_x5*_x8*_x9*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x2*self_coupling_a + _x5*self_coupling_b + _x8*_x9*self_coupling_1*self_coupling_2 - 1)
+
+
+def fraction_8(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n_1
+    _x2 = _x0**p_1
+    _x3 = _x2*self_coupling_a
+    _x4 = _x3*self_coupling_1
+    _x5 = _x0**p_2
+    _x6 = _x5*self_coupling_b
+    _x7 = _x6*self_coupling_1
+    _x8 = _x0**m_1
+    _x9 = _x0**m_2
+    _x10 = _x8*_x9*self_coupling_2
+    _x11 = _x10*cross_coupling_1**2
+    _x12 = _x10*self_coupling_1**2
+    _x13 = _x3*_x6
+    _x14 = _x0**n_2
+    _x15 = _x0**n_3
+    _x16 = _x1*_x14*_x15*_x8*cross_coupling_1*cross_coupling_2
+    _x17 = cross_coupling_a**2
+    _x18 = cross_coupling_b**2
+    _x19 = self_coupling_b**2
+    _x20 = self_coupling_a**2
+    _x21 = _x16*_x2*_x5
+    _x22 = _x17*_x21
+    _x23 = _x20*_x21
+    return [_x1*(_x11*_x13 - _x11*_x3 - _x11*_x6 + _x11 + _x12*_x13 - _x12*_x3 - _x12*_x6 + _x12 - _x4*_x6 + _x4 + _x7 - self_coupling_1), _x1*_x14*_x15*_x17*_x2*_x8*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x14*_x15*_x18*_x5*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a + _x1*_x14*_x15*_x19*_x5*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a + _x1*_x14*_x15*_x2*_x20*_x8*cross_coupling_1*cross_coupling_2*self_coupling_b - _x10*_x4 - _x10*_x7 - _x13 - _x16*self_coupling_a*self_coupling_b - _x18*_x22 - _x18*_x23 - _x19*_x22 - _x19*_x23 + _x2*_x5*_x8*_x9*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x2*self_coupling_a + _x5*self_coupling_b + _x8*_x9*self_coupling_1*self_coupling_2 - 1]
+
+
+def sensitivity_8(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n_1
+    _x2 = _x0**p_1
+    _x3 = _x2*self_coupling_a
+    _x4 = _x3*self_coupling_1
+    _x5 = _x0**p_2
+    _x6 = _x5*self_coupling_b
+    _x7 = _x6*self_coupling_1
+    _x8 = _x0**m_1
+    _x9 = _x0**m_2
+    _x10 = _x8*_x9
+    _x11 = _x10*cross_coupling_1**2
+    _x12 = _x11*self_coupling_2
+    _x13 = _x10*self_coupling_1**2
+    _x14 = _x13*self_coupling_2
+    _x15 = _x4*_x6
+    _x16 = _x12*_x3
+    _x17 = _x12*_x6
+    _x18 = _x14*_x3
+    _x19 = _x14*_x6
+    _x20 = _x3*_x6
+    _x21 = _x1*(_x12*_x20 + _x12 + _x14*_x20 + _x14 - _x15 - _x16 - _x17 - _x18 - _x19 + _x4 + _x7 - self_coupling_1)
+    _x22 = _x10*self_coupling_2
+    _x23 = _x22*_x4
+    _x24 = _x22*_x7
+    _x25 = _x0**n_2
+    _x26 = _x0**n_3
+    _x27 = _x1*_x25*_x26*_x8
+    _x28 = _x27*self_coupling_a
+    _x29 = _x28*self_coupling_b
+    _x30 = _x29*cross_coupling_2
+    _x31 = _x30*cross_coupling_1
+    _x32 = cross_coupling_a**2
+    _x33 = cross_coupling_b**2
+    _x34 = self_coupling_b**2
+    _x35 = self_coupling_a**2
+    _x36 = cross_coupling_1*cross_coupling_2
+    _x37 = _x27*_x36
+    _x38 = _x33*_x5
+    _x39 = _x37*_x38
+    _x40 = _x2*_x32
+    _x41 = _x39*_x40
+    _x42 = _x34*_x5
+    _x43 = _x37*_x42
+    _x44 = _x40*_x43
+    _x45 = _x2*_x35
+    _x46 = _x39*_x45
+    _x47 = _x43*_x45
+    _x48 = unitary_loss_coefficient**(-1.0)
+    _x49 = _x48*n_1
+    _x50 = _x48*p_1
+    _x51 = _x4*_x50
+    _x52 = _x48*p_2
+    _x53 = _x52*_x7
+    _x54 = _x48*m_1
+    _x55 = _x12*_x54
+    _x56 = _x48*m_2
+    _x57 = _x12*_x56
+    _x58 = _x14*_x54
+    _x59 = _x14*_x56
+    _x60 = _x52*_x6
+    _x61 = _x3*_x50
+    _x62 = _x20*_x50
+    _x63 = _x20*_x52
+    _x64 = 2*_x22
+    _x65 = _x64*cross_coupling_1
+    _x66 = _x2*self_coupling_1
+    _x67 = _x2*_x6
+    _x68 = _x5*self_coupling_1
+    _x69 = _x3*_x5
+    _x70 = _x31*_x48
+    _x71 = _x48*n_2
+    _x72 = _x48*n_3
+    _x73 = _x2*_x27
+    _x74 = _x73*cross_coupling_2
+    _x75 = _x32*_x74
+    _x76 = _x35*_x74
+    _x77 = _x73*cross_coupling_1
+    _x78 = _x32*_x77
+    _x79 = _x35*_x77
+    _x80 = 2*_x2*cross_coupling_a
+    _x81 = _x2*_x37
+    _x82 = 2*_x5*cross_coupling_b
+    _x83 = 2*_x37
+    _x84 = _x69*_x83
+    _x85 = _x67*_x83
+    return [_x21, _x1*_x2*_x25*_x26*_x32*_x8*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x2*_x25*_x26*_x35*_x8*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x25*_x26*_x33*_x5*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a + _x1*_x25*_x26*_x34*_x5*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a + _x2*_x5*_x8*_x9*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x2*self_coupling_a - _x20 - _x23 - _x24 - _x31 - _x41 - _x44 - _x46 - _x47 + _x5*self_coupling_b + _x8*_x9*self_coupling_1*self_coupling_2 - 1, _x1*(-_x12*_x60 - _x12*_x61 + _x12*_x62 + _x12*_x63 - _x14*_x60 - _x14*_x61 + _x14*_x62 + _x14*_x63 - _x15*_x50 - _x16*_x54 - _x16*_x56 - _x17*_x54 - _x17*_x56 - _x18*_x54 - _x18*_x56 - _x19*_x54 - _x19*_x56 + _x20*_x55 + _x20*_x57 + _x20*_x58 + _x20*_x59 - _x4*_x60 + _x51 + _x53 + _x55 + _x57 + _x58 + _x59) + _x21*_x49, _x1*(_x20*_x65 - _x3*_x65 - _x6*_x65 + _x65), 0, 0, 0, _x1*(_x15*_x64 - _x20 + 2*_x22*self_coupling_1 + _x3 - _x4*_x64 + _x6 - _x64*_x7 - 1), _x1*(_x11*_x20 - _x11*_x3 - _x11*_x6 + _x11 + _x13*_x20 - _x13*_x3 - _x13*_x6 + _x13), _x1*(-_x12*_x2 + _x12*_x67 - _x14*_x2 + _x14*_x67 - _x6*_x66 + _x66), _x1*(-_x12*_x5 + _x12*_x69 - _x14*_x5 + _x14*_x69 - _x3*_x68 + _x68), _x1*_x2*_x25*_x26*_x32*_x48*_x8*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x1*_x2*_x25*_x26*_x32*_x48*_x8*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x1*_x2*_x25*_x26*_x32*_x48*_x8*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x1*_x2*_x25*_x26*_x32*_x48*_x8*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x1*_x2*_x25*_x26*_x32*_x48*_x8*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b + _x1*_x2*_x25*_x26*_x35*_x48*_x8*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x1*_x2*_x25*_x26*_x35*_x48*_x8*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x1*_x2*_x25*_x26*_x35*_x48*_x8*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x1*_x2*_x25*_x26*_x35*_x48*_x8*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x1*_x2*_x25*_x26*_x35*_x48*_x8*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b + _x1*_x25*_x26*_x33*_x48*_x5*_x8*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x1*_x25*_x26*_x33*_x48*_x5*_x8*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x1*_x25*_x26*_x33*_x48*_x5*_x8*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x1*_x25*_x26*_x33*_x48*_x5*_x8*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x1*_x25*_x26*_x33*_x48*_x5*_x8*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x1*_x25*_x26*_x34*_x48*_x5*_x8*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x1*_x25*_x26*_x34*_x48*_x5*_x8*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x1*_x25*_x26*_x34*_x48*_x5*_x8*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x1*_x25*_x26*_x34*_x48*_x5*_x8*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x1*_x25*_x26*_x34*_x48*_x5*_x8*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x2*_x48*_x5*_x8*_x9*m_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x2*_x48*_x5*_x8*_x9*m_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x2*_x48*_x5*_x8*_x9*p_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x2*_x48*_x5*_x8*_x9*p_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x2*_x48*p_1*self_coupling_a - _x22*_x51 - _x22*_x53 - _x23*_x54 - _x23*_x56 - _x24*_x54 - _x24*_x56 - _x31*_x49 - _x31*_x54 - _x41*_x49 - _x41*_x50 - _x41*_x52 - _x41*_x54 - _x41*_x71 - _x41*_x72 - _x44*_x49 - _x44*_x50 - _x44*_x52 - _x44*_x54 - _x44*_x71 - _x44*_x72 - _x46*_x49 - _x46*_x50 - _x46*_x52 - _x46*_x54 - _x46*_x71 - _x46*_x72 - _x47*_x49 - _x47*_x50 - _x47*_x52 - _x47*_x54 - _x47*_x71 - _x47*_x72 + _x48*_x5*p_2*self_coupling_b + _x48*_x8*_x9*m_1*self_coupling_1*self_coupling_2 + _x48*_x8*_x9*m_2*self_coupling_1*self_coupling_2 - _x62 - _x63 - _x70*n_2 - _x70*n_3, _x1*_x2*_x25*_x26*_x32*_x8*cross_coupling_2*self_coupling_b + _x1*_x2*_x25*_x26*_x35*_x8*cross_coupling_2*self_coupling_b + _x1*_x25*_x26*_x33*_x5*_x8*cross_coupling_2*self_coupling_a + _x1*_x25*_x26*_x34*_x5*_x8*cross_coupling_2*self_coupling_a - _x30 - _x38*_x75 - _x38*_x76 - _x42*_x75 - _x42*_x76, _x1*_x2*_x25*_x26*_x32*_x8*cross_coupling_1*self_coupling_b + _x1*_x2*_x25*_x26*_x35*_x8*cross_coupling_1*self_coupling_b + _x1*_x25*_x26*_x33*_x5*_x8*cross_coupling_1*self_coupling_a + _x1*_x25*_x26*_x34*_x5*_x8*cross_coupling_1*self_coupling_a - _x29*cross_coupling_1 - _x38*_x78 - _x38*_x79 - _x42*_x78 - _x42*_x79, 2*_x1*_x2*_x25*_x26*_x8*cross_coupling_1*cross_coupling_2*cross_coupling_a*self_coupling_b - _x39*_x80 - _x43*_x80, 2*_x1*_x25*_x26*_x5*_x8*cross_coupling_1*cross_coupling_2*cross_coupling_b*self_coupling_a - _x32*_x81*_x82 - _x35*_x81*_x82, _x20*_x22 - _x22*_x3 - _x22*_x6 + _x22, _x10*_x15 - _x10*_x4 - _x10*_x7 + _x10*self_coupling_1, 2*_x1*_x2*_x25*_x26*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b + _x1*_x25*_x26*_x33*_x5*_x8*cross_coupling_1*cross_coupling_2 + _x1*_x25*_x26*_x34*_x5*_x8*cross_coupling_1*cross_coupling_2 + _x2*_x5*_x8*_x9*self_coupling_1*self_coupling_2*self_coupling_b + _x2 - _x22*_x66 - _x27*_x36*self_coupling_b - _x33*_x84 - _x34*_x84 - _x67, _x1*_x2*_x25*_x26*_x32*_x8*cross_coupling_1*cross_coupling_2 + _x1*_x2*_x25*_x26*_x35*_x8*cross_coupling_1*cross_coupling_2 + 2*_x1*_x25*_x26*_x5*_x8*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b + _x2*_x5*_x8*_x9*self_coupling_1*self_coupling_2*self_coupling_a - _x22*_x68 - _x28*_x36 - _x32*_x85 - _x35*_x85 + _x5 - _x69]
+
+
+def solution_9(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p_1
+    _x2 = _x0**p_2
+    _x3 = _x1*self_coupling_a
+    _x4 = _x2*self_coupling_b
+    _x5 = _x0**m_1
+    _x6 = _x0**m_2
+    _x7 = _x5*_x6*self_coupling_2
+    _x8 = _x0**n_2
+    _x9 = _x0**n_3
+    _x10 = _x5*_x8*_x9*cross_coupling_1*cross_coupling_2
+    _x11 = _x0**n_1
+    _x12 = cross_coupling_a**2
+    _x13 = cross_coupling_b**2
+    _x14 = self_coupling_b**2
+    _x15 = self_coupling_a**2
+    _x16 = _x1*_x11
+    _x17 = _x10*_x16*_x2
+    _x18 = _x12*_x17
+    _x19 = _x15*_x17
+    _x20 = cross_coupling_1**2
+    _x21 = self_coupling_1**2
+    return 1j*_x16*cross_coupling_a*(_x2*self_coupling_1*self_coupling_b - _x20*_x4*_x7 + _x20*_x5*_x6*self_coupling_2 - _x21*_x4*_x7 + _x21*_x5*_x6*self_coupling_2 - self_coupling_1)/(_x1*_x11*_x12*_x5*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x11*_x15*_x5*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x2*_x5*_x6*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*self_coupling_a - _x10*_x11*self_coupling_a*self_coupling_b + _x11*_x13*_x2*_x5*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x11*_x14*_x2*_x5*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a - _x13*_x18 - _x13*_x19 - _x14*_x18 - _x14*_x19 + _x2*self_coupling_b - _x3*_x4 - _x3*_x7*self_coupling_1 - _x4*_x7*self_coupling_1 + _x5*_x6*self_coupling_1*self_coupling_2 - 1)
+
+
+def fraction_9(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p_2
+    _x2 = cross_coupling_1**2
+    _x3 = _x0**m_1
+    _x4 = _x0**m_2
+    _x5 = self_coupling_1**2
+    _x6 = _x1*self_coupling_b
+    _x7 = _x3*_x4*self_coupling_2
+    _x8 = _x0**p_1
+    _x9 = _x0**n_1
+    _x10 = _x8*_x9
+    _x11 = _x8*self_coupling_a
+    _x12 = _x0**n_2
+    _x13 = _x0**n_3
+    _x14 = _x12*_x13*_x3*cross_coupling_1*cross_coupling_2
+    _x15 = cross_coupling_a**2
+    _x16 = cross_coupling_b**2
+    _x17 = self_coupling_b**2
+    _x18 = self_coupling_a**2
+    _x19 = _x1*_x10*_x14
+    _x20 = _x15*_x19
+    _x21 = _x18*_x19
+    return [1j*_x10*cross_coupling_a*(_x1*self_coupling_1*self_coupling_b + _x2*_x3*_x4*self_coupling_2 - _x2*_x6*_x7 + _x3*_x4*_x5*self_coupling_2 - _x5*_x6*_x7 - self_coupling_1), _x1*_x12*_x13*_x16*_x3*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x1*_x12*_x13*_x17*_x3*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x1*_x3*_x4*_x8*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*self_coupling_b - _x11*_x6 - _x11*_x7*self_coupling_1 + _x12*_x13*_x15*_x3*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x12*_x13*_x18*_x3*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b - _x14*_x9*self_coupling_a*self_coupling_b - _x16*_x20 - _x16*_x21 - _x17*_x20 - _x17*_x21 + _x3*_x4*self_coupling_1*self_coupling_2 - _x6*_x7*self_coupling_1 + _x8*self_coupling_a - 1]
+
+
+def sensitivity_9(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p_2
+    _x2 = cross_coupling_1**2
+    _x3 = _x0**m_1
+    _x4 = _x0**m_2
+    _x5 = self_coupling_1**2
+    _x6 = _x1*self_coupling_b
+    _x7 = _x3*_x4
+    _x8 = _x2*_x7
+    _x9 = _x8*self_coupling_2
+    _x10 = _x6*_x9
+    _x11 = _x5*_x7
+    _x12 = _x11*self_coupling_2
+    _x13 = _x12*_x6
+    _x14 = _x0**p_1
+    _x15 = _x0**n_1
+    _x16 = _x14*_x15
+    _x17 = 1j*_x16
+    _x18 = _x17*(_x1*self_coupling_1*self_coupling_b - _x10 - _x13 + _x2*_x3*_x4*self_coupling_2 + _x3*_x4*_x5*self_coupling_2 - self_coupling_1)
+    _x19 = _x18*cross_coupling_a
+    _x20 = _x14*self_coupling_a
+    _x21 = _x20*_x6
+    _x22 = _x7*self_coupling_2
+    _x23 = _x22*self_coupling_1
+    _x24 = _x20*_x23
+    _x25 = _x6*self_coupling_1
+    _x26 = _x22*_x25
+    _x27 = _x0**n_2
+    _x28 = _x0**n_3
+    _x29 = _x27*_x28*_x3
+    _x30 = _x29*self_coupling_b
+    _x31 = _x30*cross_coupling_2
+    _x32 = _x15*self_coupling_a
+    _x33 = _x31*_x32
+    _x34 = _x33*cross_coupling_1
+    _x35 = cross_coupling_b**2
+    _x36 = self_coupling_b**2
+    _x37 = cross_coupling_a**2
+    _x38 = self_coupling_a**2
+    _x39 = _x1*_x35
+    _x40 = _x29*cross_coupling_2
+    _x41 = _x16*cross_coupling_1
+    _x42 = _x40*_x41
+    _x43 = _x37*_x42
+    _x44 = _x39*_x43
+    _x45 = _x1*_x36
+    _x46 = _x43*_x45
+    _x47 = _x38*_x42
+    _x48 = _x39*_x47
+    _x49 = _x45*_x47
+    _x50 = -_x1*self_coupling_b + 1
+    _x51 = unitary_loss_coefficient**(-1.0)
+    _x52 = _x51*n_1
+    _x53 = _x51*p_1
+    _x54 = _x51*m_1
+    _x55 = _x51*m_2
+    _x56 = _x51*p_2
+    _x57 = _x56*_x6
+    _x58 = _x17*cross_coupling_a
+    _x59 = 2*_x22
+    _x60 = _x34*_x51
+    _x61 = _x51*n_2
+    _x62 = _x51*n_3
+    _x63 = _x16*_x40
+    _x64 = _x37*_x39
+    _x65 = _x45*_x63
+    _x66 = _x38*_x39
+    _x67 = _x32*cross_coupling_1
+    _x68 = _x29*_x41
+    _x69 = _x45*_x68
+    _x70 = 2*_x42*cross_coupling_a
+    _x71 = 2*_x1*cross_coupling_b
+    _x72 = _x7*self_coupling_1
+    _x73 = _x25*_x7
+    _x74 = _x14*_x6
+    _x75 = _x15*cross_coupling_1
+    _x76 = _x1*_x20
+    _x77 = 2*_x40*_x75
+    _x78 = _x76*_x77
+    _x79 = _x74*_x77
+    return [_x19, _x1*_x14*_x3*_x4*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x15*_x27*_x28*_x3*_x35*cross_coupling_1*cross_coupling_2*self_coupling_a + _x1*_x15*_x27*_x28*_x3*_x36*cross_coupling_1*cross_coupling_2*self_coupling_a + _x14*_x15*_x27*_x28*_x3*_x37*cross_coupling_1*cross_coupling_2*self_coupling_b + _x14*_x15*_x27*_x28*_x3*_x38*cross_coupling_1*cross_coupling_2*self_coupling_b + _x14*self_coupling_a - _x21 - _x24 - _x26 + _x3*_x4*self_coupling_1*self_coupling_2 - _x34 - _x44 - _x46 - _x48 - _x49 - _x50, _x19*_x52 + _x19*_x53 + _x58*(_x1*_x51*p_2*self_coupling_1*self_coupling_b - _x10*_x54 - _x10*_x55 - _x12*_x57 - _x13*_x54 - _x13*_x55 + _x2*_x3*_x4*_x51*m_1*self_coupling_2 + _x2*_x3*_x4*_x51*m_2*self_coupling_2 + _x3*_x4*_x5*_x51*m_1*self_coupling_2 + _x3*_x4*_x5*_x51*m_2*self_coupling_2 - _x57*_x9), _x58*(2*_x3*_x4*cross_coupling_1*self_coupling_2 - _x59*_x6*cross_coupling_1), 0, _x18, 0, _x58*(-_x25*_x59 + 2*_x3*_x4*self_coupling_1*self_coupling_2 - _x50), _x58*(-_x11*_x6 + _x2*_x3*_x4 + _x3*_x4*_x5 - _x6*_x8), 0, _x58*(-_x1*_x12 - _x1*_x9 + _x1*self_coupling_1), _x1*_x14*_x3*_x4*_x51*m_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x14*_x3*_x4*_x51*m_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x14*_x3*_x4*_x51*p_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x14*_x3*_x4*_x51*p_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x15*_x27*_x28*_x3*_x35*_x51*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x1*_x15*_x27*_x28*_x3*_x35*_x51*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x1*_x15*_x27*_x28*_x3*_x35*_x51*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x1*_x15*_x27*_x28*_x3*_x35*_x51*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x1*_x15*_x27*_x28*_x3*_x35*_x51*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x1*_x15*_x27*_x28*_x3*_x36*_x51*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x1*_x15*_x27*_x28*_x3*_x36*_x51*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x1*_x15*_x27*_x28*_x3*_x36*_x51*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x1*_x15*_x27*_x28*_x3*_x36*_x51*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x1*_x15*_x27*_x28*_x3*_x36*_x51*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x1*_x51*p_2*self_coupling_b + _x14*_x15*_x27*_x28*_x3*_x37*_x51*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x14*_x15*_x27*_x28*_x3*_x37*_x51*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x14*_x15*_x27*_x28*_x3*_x37*_x51*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x14*_x15*_x27*_x28*_x3*_x37*_x51*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x14*_x15*_x27*_x28*_x3*_x37*_x51*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b + _x14*_x15*_x27*_x28*_x3*_x38*_x51*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x14*_x15*_x27*_x28*_x3*_x38*_x51*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x14*_x15*_x27*_x28*_x3*_x38*_x51*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x14*_x15*_x27*_x28*_x3*_x38*_x51*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x14*_x15*_x27*_x28*_x3*_x38*_x51*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b + _x14*_x51*p_1*self_coupling_a - _x20*_x23*_x53 - _x21*_x53 - _x21*_x56 - _x22*_x25*_x56 - _x24*_x54 - _x24*_x55 - _x26*_x54 - _x26*_x55 + _x3*_x4*_x51*m_1*self_coupling_1*self_coupling_2 + _x3*_x4*_x51*m_2*self_coupling_1*self_coupling_2 - _x34*_x52 - _x34*_x54 - _x44*_x52 - _x44*_x53 - _x44*_x54 - _x44*_x56 - _x44*_x61 - _x44*_x62 - _x46*_x52 - _x46*_x53 - _x46*_x54 - _x46*_x56 - _x46*_x61 - _x46*_x62 - _x48*_x52 - _x48*_x53 - _x48*_x54 - _x48*_x56 - _x48*_x61 - _x48*_x62 - _x49*_x52 - _x49*_x53 - _x49*_x54 - _x49*_x56 - _x49*_x61 - _x49*_x62 - _x60*n_2 - _x60*n_3, _x1*_x15*_x27*_x28*_x3*_x35*cross_coupling_2*self_coupling_a + _x1*_x15*_x27*_x28*_x3*_x36*cross_coupling_2*self_coupling_a + _x14*_x15*_x27*_x28*_x3*_x37*cross_coupling_2*self_coupling_b + _x14*_x15*_x27*_x28*_x3*_x38*cross_coupling_2*self_coupling_b - _x33 - _x37*_x65 - _x38*_x65 - _x63*_x64 - _x63*_x66, _x1*_x15*_x27*_x28*_x3*_x35*cross_coupling_1*self_coupling_a + _x1*_x15*_x27*_x28*_x3*_x36*cross_coupling_1*self_coupling_a + _x14*_x15*_x27*_x28*_x3*_x37*cross_coupling_1*self_coupling_b + _x14*_x15*_x27*_x28*_x3*_x38*cross_coupling_1*self_coupling_b - _x30*_x67 - _x37*_x69 - _x38*_x69 - _x64*_x68 - _x66*_x68, 2*_x14*_x15*_x27*_x28*_x3*cross_coupling_1*cross_coupling_2*cross_coupling_a*self_coupling_b - _x39*_x70 - _x45*_x70, 2*_x1*_x15*_x27*_x28*_x3*cross_coupling_1*cross_coupling_2*cross_coupling_b*self_coupling_a - _x43*_x71 - _x47*_x71, -_x20*_x22 + _x21*_x22 - _x22*_x6 + _x22, -_x20*_x72 + _x20*_x73 + _x72 - _x73, _x1*_x14*_x3*_x4*self_coupling_1*self_coupling_2*self_coupling_b + _x1*_x15*_x27*_x28*_x3*_x35*cross_coupling_1*cross_coupling_2 + _x1*_x15*_x27*_x28*_x3*_x36*cross_coupling_1*cross_coupling_2 + 2*_x14*_x15*_x27*_x28*_x3*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b - _x14*_x23 + _x14 - _x31*_x75 - _x35*_x78 - _x36*_x78 - _x74, _x1*_x14*_x3*_x4*self_coupling_1*self_coupling_2*self_coupling_a + 2*_x1*_x15*_x27*_x28*_x3*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b - _x1*_x22*self_coupling_1 + _x1 + _x14*_x15*_x27*_x28*_x3*_x37*cross_coupling_1*cross_coupling_2 + _x14*_x15*_x27*_x28*_x3*_x38*cross_coupling_1*cross_coupling_2 - _x37*_x79 - _x38*_x79 - _x40*_x67 - _x76]
+
+
+def solution_10(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n_1
+    _x2 = self_coupling_1*self_coupling_a
+    _x3 = _x0**p_2
+    _x4 = _x3*self_coupling_b
+    _x5 = cross_coupling_a**2
+    _x6 = _x0**p_1
+    _x7 = _x6*self_coupling_1
+    _x8 = _x5*_x7
+    _x9 = self_coupling_a**2
+    _x10 = _x7*_x9
+    _x11 = cross_coupling_1**2
+    _x12 = _x0**m_1
+    _x13 = _x0**m_2
+    _x14 = _x12*_x13*self_coupling_2
+    _x15 = _x14*self_coupling_a
+    _x16 = _x11*_x15
+    _x17 = self_coupling_1**2
+    _x18 = _x15*_x17
+    _x19 = _x14*_x6
+    _x20 = _x11*_x19
+    _x21 = _x20*_x5
+    _x22 = _x20*_x9
+    _x23 = _x17*_x19
+    _x24 = _x23*_x5
+    _x25 = _x23*_x9
+    _x26 = _x6*self_coupling_a
+    _x27 = _x14*self_coupling_1
+    _x28 = _x0**n_2
+    _x29 = _x0**n_3
+    _x30 = _x1*_x12*_x28*_x29*cross_coupling_1*cross_coupling_2
+    _x31 = cross_coupling_b**2
+    _x32 = self_coupling_b**2
+    _x33 = _x3*_x30*_x6
+    _x34 = _x33*_x5
+    _x35 = _x33*_x9
+    return _x1*(-_x10*_x4 + _x10 - _x16*_x4 + _x16 - _x18*_x4 + _x18 + _x2*_x4 - _x2 + _x21*_x4 - _x21 + _x22*_x4 - _x22 + _x24*_x4 - _x24 + _x25*_x4 - _x25 - _x4*_x8 + _x8)/(_x1*_x12*_x28*_x29*_x3*_x31*cross_coupling_1*cross_coupling_2*self_coupling_a + _x1*_x12*_x28*_x29*_x3*_x32*cross_coupling_1*cross_coupling_2*self_coupling_a + _x1*_x12*_x28*_x29*_x5*_x6*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x12*_x28*_x29*_x6*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x12*_x13*_x3*_x6*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x12*_x13*self_coupling_1*self_coupling_2 - _x26*_x27 - _x26*_x4 - _x27*_x4 + _x3*self_coupling_b - _x30*self_coupling_a*self_coupling_b - _x31*_x34 - _x31*_x35 - _x32*_x34 - _x32*_x35 + _x6*self_coupling_a - 1)
+
+
+def fraction_10(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n_1
+    _x2 = self_coupling_1*self_coupling_a
+    _x3 = _x0**p_2
+    _x4 = _x3*self_coupling_b
+    _x5 = cross_coupling_a**2
+    _x6 = _x0**p_1
+    _x7 = _x6*self_coupling_1
+    _x8 = _x5*_x7
+    _x9 = self_coupling_a**2
+    _x10 = _x7*_x9
+    _x11 = cross_coupling_1**2
+    _x12 = _x0**m_1
+    _x13 = _x0**m_2
+    _x14 = _x12*_x13*self_coupling_2
+    _x15 = _x14*self_coupling_a
+    _x16 = _x11*_x15
+    _x17 = self_coupling_1**2
+    _x18 = _x15*_x17
+    _x19 = _x14*_x6
+    _x20 = _x11*_x19
+    _x21 = _x20*_x5
+    _x22 = _x20*_x9
+    _x23 = _x17*_x19
+    _x24 = _x23*_x5
+    _x25 = _x23*_x9
+    _x26 = _x0**n_2
+    _x27 = _x0**n_3
+    _x28 = _x1*_x12*_x26*_x27*cross_coupling_1*cross_coupling_2
+    _x29 = cross_coupling_b**2
+    _x30 = self_coupling_b**2
+    _x31 = _x28*_x3*_x6
+    _x32 = _x31*_x5
+    _x33 = _x31*_x9
+    return [_x1*(-_x10*_x4 + _x10 - _x16*_x4 + _x16 - _x18*_x4 + _x18 + _x2*_x4 - _x2 + _x21*_x4 - _x21 + _x22*_x4 - _x22 + _x24*_x4 - _x24 + _x25*_x4 - _x25 - _x4*_x8 + _x8), _x1*_x12*_x26*_x27*_x29*_x3*cross_coupling_1*cross_coupling_2*self_coupling_a + _x1*_x12*_x26*_x27*_x3*_x30*cross_coupling_1*cross_coupling_2*self_coupling_a + _x1*_x12*_x26*_x27*_x5*_x6*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x12*_x26*_x27*_x6*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x12*_x13*_x3*_x6*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x12*_x13*self_coupling_1*self_coupling_2 - _x14*_x4*self_coupling_1 - _x19*_x2 - _x28*self_coupling_a*self_coupling_b - _x29*_x32 - _x29*_x33 + _x3*self_coupling_b - _x30*_x32 - _x30*_x33 - _x4*_x6*self_coupling_a + _x6*self_coupling_a - 1]
+
+
+def sensitivity_10(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n_1
+    _x2 = self_coupling_1*self_coupling_a
+    _x3 = _x0**p_2
+    _x4 = _x3*self_coupling_b
+    _x5 = _x2*_x4
+    _x6 = cross_coupling_a**2
+    _x7 = _x0**p_1
+    _x8 = _x6*_x7
+    _x9 = _x8*self_coupling_1
+    _x10 = self_coupling_a**2
+    _x11 = _x10*_x7
+    _x12 = _x11*self_coupling_1
+    _x13 = cross_coupling_1**2
+    _x14 = _x0**m_1
+    _x15 = _x0**m_2
+    _x16 = _x14*_x15
+    _x17 = _x16*self_coupling_2
+    _x18 = _x13*_x17
+    _x19 = _x18*self_coupling_a
+    _x20 = self_coupling_1**2
+    _x21 = _x17*_x20
+    _x22 = _x21*self_coupling_a
+    _x23 = _x4*_x9
+    _x24 = _x12*_x4
+    _x25 = _x4*self_coupling_a
+    _x26 = _x18*_x25
+    _x27 = _x21*_x25
+    _x28 = _x18*_x8
+    _x29 = _x11*_x18
+    _x30 = _x21*_x8
+    _x31 = _x11*_x21
+    _x32 = _x4*_x8
+    _x33 = _x18*_x32
+    _x34 = _x11*_x4
+    _x35 = _x18*_x34
+    _x36 = _x21*_x32
+    _x37 = _x21*_x34
+    _x38 = _x1*(_x12 + _x19 - _x2 + _x22 - _x23 - _x24 - _x26 - _x27 - _x28 - _x29 - _x30 - _x31 + _x33 + _x35 + _x36 + _x37 + _x5 + _x9)
+    _x39 = _x7*self_coupling_a
+    _x40 = _x39*_x4
+    _x41 = _x2*_x7
+    _x42 = _x17*_x41
+    _x43 = _x4*self_coupling_1
+    _x44 = _x17*_x43
+    _x45 = cross_coupling_1*self_coupling_a
+    _x46 = _x0**n_2
+    _x47 = _x0**n_3
+    _x48 = _x1*_x14*_x46*_x47
+    _x49 = _x48*self_coupling_b
+    _x50 = _x49*cross_coupling_2
+    _x51 = _x45*_x50
+    _x52 = cross_coupling_b**2
+    _x53 = self_coupling_b**2
+    _x54 = _x3*_x52
+    _x55 = _x48*cross_coupling_2
+    _x56 = _x55*cross_coupling_1
+    _x57 = _x54*_x56
+    _x58 = _x57*_x8
+    _x59 = _x3*_x53
+    _x60 = _x56*_x59
+    _x61 = _x60*_x8
+    _x62 = _x11*_x57
+    _x63 = _x11*_x60
+    _x64 = unitary_loss_coefficient**(-1.0)
+    _x65 = _x64*n_1
+    _x66 = _x64*p_2
+    _x67 = _x64*p_1
+    _x68 = _x64*m_1
+    _x69 = _x64*m_2
+    _x70 = _x4*_x66
+    _x71 = 2*_x17
+    _x72 = _x71*cross_coupling_1
+    _x73 = 2*_x7
+    _x74 = _x73*cross_coupling_a
+    _x75 = 2*_x18
+    _x76 = _x4*_x7
+    _x77 = _x76*cross_coupling_a
+    _x78 = 2*_x21
+    _x79 = _x16*self_coupling_a
+    _x80 = _x13*_x16
+    _x81 = _x16*_x20
+    _x82 = _x2*_x76
+    _x83 = 2*_x39
+    _x84 = _x51*_x64
+    _x85 = _x64*n_2
+    _x86 = _x64*n_3
+    _x87 = _x55*_x8
+    _x88 = _x11*_x55
+    _x89 = _x48*cross_coupling_1
+    _x90 = _x8*_x89
+    _x91 = _x11*_x89
+    _x92 = 2*_x3*cross_coupling_b
+    _x93 = _x17*self_coupling_1
+    _x94 = _x3*_x39
+    _x95 = 2*_x56
+    _x96 = _x94*_x95
+    return [_x38, _x1*_x10*_x14*_x46*_x47*_x7*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x14*_x3*_x46*_x47*_x52*cross_coupling_1*cross_coupling_2*self_coupling_a + _x1*_x14*_x3*_x46*_x47*_x53*cross_coupling_1*cross_coupling_2*self_coupling_a + _x1*_x14*_x46*_x47*_x6*_x7*cross_coupling_1*cross_coupling_2*self_coupling_b + _x14*_x15*_x3*_x7*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x14*_x15*self_coupling_1*self_coupling_2 + _x3*self_coupling_b - _x40 - _x42 - _x44 - _x51 - _x58 - _x61 - _x62 - _x63 + _x7*self_coupling_a - 1, _x1*(_x12*_x67 - _x12*_x70 + _x19*_x68 + _x19*_x69 + _x22*_x68 + _x22*_x69 - _x23*_x67 - _x24*_x67 - _x26*_x66 - _x26*_x68 - _x26*_x69 - _x27*_x66 - _x27*_x68 - _x27*_x69 - _x28*_x67 - _x28*_x68 - _x28*_x69 - _x29*_x67 - _x29*_x68 - _x29*_x69 - _x30*_x67 - _x30*_x68 - _x30*_x69 - _x31*_x67 - _x31*_x68 - _x31*_x69 + _x33*_x66 + _x33*_x67 + _x33*_x68 + _x33*_x69 + _x35*_x66 + _x35*_x67 + _x35*_x68 + _x35*_x69 + _x36*_x66 + _x36*_x67 + _x36*_x68 + _x36*_x69 + _x37*_x66 + _x37*_x67 + _x37*_x68 + _x37*_x69 + _x5*_x66 + _x67*_x9 - _x70*_x9) + _x38*_x65, _x1*(-_x11*_x72 - _x25*_x72 + _x32*_x72 + _x34*_x72 + _x45*_x71 - _x72*_x8), 0, _x1*(-_x18*_x74 - _x21*_x74 - _x43*_x74 + _x74*self_coupling_1 + _x75*_x77 + _x77*_x78), 0, _x1*(_x11 - _x12*_x71 + _x2*_x71 + _x23*_x71 + _x24*_x71 + _x25 - _x32 - _x34 - _x5*_x71 - _x71*_x9 + _x8 - self_coupling_a), _x1*(-_x11*_x80 - _x11*_x81 + _x13*_x79 + _x20*_x79 - _x25*_x80 - _x25*_x81 + _x32*_x80 + _x32*_x81 + _x34*_x80 + _x34*_x81 - _x8*_x80 - _x8*_x81), _x1*(-_x18*_x4 - _x18*_x83 + _x18 + _x2*_x73 - _x21*_x4 - _x21*_x83 + _x21 + _x40*_x75 + _x40*_x78 + _x43 - 2*_x82 - self_coupling_1), _x1*(-_x12*_x3 - _x19*_x3 + _x2*_x3 - _x22*_x3 + _x28*_x3 + _x29*_x3 + _x3*_x30 + _x3*_x31 - _x3*_x9), _x1*_x10*_x14*_x46*_x47*_x64*_x7*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x1*_x10*_x14*_x46*_x47*_x64*_x7*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x1*_x10*_x14*_x46*_x47*_x64*_x7*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x1*_x10*_x14*_x46*_x47*_x64*_x7*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x1*_x10*_x14*_x46*_x47*_x64*_x7*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b + _x1*_x14*_x3*_x46*_x47*_x52*_x64*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x1*_x14*_x3*_x46*_x47*_x52*_x64*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x1*_x14*_x3*_x46*_x47*_x52*_x64*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x1*_x14*_x3*_x46*_x47*_x52*_x64*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x1*_x14*_x3*_x46*_x47*_x52*_x64*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x1*_x14*_x3*_x46*_x47*_x53*_x64*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x1*_x14*_x3*_x46*_x47*_x53*_x64*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x1*_x14*_x3*_x46*_x47*_x53*_x64*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x1*_x14*_x3*_x46*_x47*_x53*_x64*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x1*_x14*_x3*_x46*_x47*_x53*_x64*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x1*_x14*_x46*_x47*_x6*_x64*_x7*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x1*_x14*_x46*_x47*_x6*_x64*_x7*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x1*_x14*_x46*_x47*_x6*_x64*_x7*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x1*_x14*_x46*_x47*_x6*_x64*_x7*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x1*_x14*_x46*_x47*_x6*_x64*_x7*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b + _x14*_x15*_x3*_x64*_x7*m_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x14*_x15*_x3*_x64*_x7*m_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x14*_x15*_x3*_x64*_x7*p_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x14*_x15*_x3*_x64*_x7*p_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x14*_x15*_x64*m_1*self_coupling_1*self_coupling_2 + _x14*_x15*_x64*m_2*self_coupling_1*self_coupling_2 + _x3*_x64*p_2*self_coupling_b - _x40*_x66 - _x40*_x67 - _x42*_x67 - _x42*_x68 - _x42*_x69 - _x44*_x66 - _x44*_x68 - _x44*_x69 - _x51*_x65 - _x51*_x68 - _x58*_x65 - _x58*_x66 - _x58*_x67 - _x58*_x68 - _x58*_x85 - _x58*_x86 - _x61*_x65 - _x61*_x66 - _x61*_x67 - _x61*_x68 - _x61*_x85 - _x61*_x86 - _x62*_x65 - _x62*_x66 - _x62*_x67 - _x62*_x68 - _x62*_x85 - _x62*_x86 - _x63*_x65 - _x63*_x66 - _x63*_x67 - _x63*_x68 - _x63*_x85 - _x63*_x86 + _x64*_x7*p_1*self_coupling_a - _x84*n_2 - _x84*n_3, _x1*_x10*_x14*_x46*_x47*_x7*cross_coupling_2*self_coupling_b + _x1*_x14*_x3*_x46*_x47*_x52*cross_coupling_2*self_coupling_a + _x1*_x14*_x3*_x46*_x47*_x53*cross_coupling_2*self_coupling_a + _x1*_x14*_x46*_x47*_x6*_x7*cross_coupling_2*self_coupling_b - _x50*self_coupling_a - _x54*_x87 - _x54*_x88 - _x59*_x87 - _x59*_x88, _x1*_x10*_x14*_x46*_x47*_x7*cross_coupling_1*self_coupling_b + _x1*_x14*_x3*_x46*_x47*_x52*cross_coupling_1*self_coupling_a + _x1*_x14*_x3*_x46*_x47*_x53*cross_coupling_1*self_coupling_a + _x1*_x14*_x46*_x47*_x6*_x7*cross_coupling_1*self_coupling_b - _x45*_x49 - _x54*_x90 - _x54*_x91 - _x59*_x90 - _x59*_x91, 2*_x1*_x14*_x46*_x47*_x7*cross_coupling_1*cross_coupling_2*cross_coupling_a*self_coupling_b - _x57*_x74 - _x60*_x74, 2*_x1*_x14*_x3*_x46*_x47*cross_coupling_1*cross_coupling_2*cross_coupling_b*self_coupling_a - _x11*_x56*_x92 - _x56*_x8*_x92, -_x17*_x39 - _x17*_x4 + _x17*_x40 + _x17, -_x16*_x41 - _x16*_x43 + _x16*_x82 + _x16*self_coupling_1, _x1*_x14*_x3*_x46*_x47*_x52*cross_coupling_1*cross_coupling_2 + _x1*_x14*_x3*_x46*_x47*_x53*cross_coupling_1*cross_coupling_2 + 2*_x1*_x14*_x46*_x47*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b + _x14*_x15*_x3*_x7*self_coupling_1*self_coupling_2*self_coupling_b - _x50*cross_coupling_1 - _x52*_x96 - _x53*_x96 - _x7*_x93 + _x7 - _x76, _x1*_x10*_x14*_x46*_x47*_x7*cross_coupling_1*cross_coupling_2 + 2*_x1*_x14*_x3*_x46*_x47*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b + _x1*_x14*_x46*_x47*_x6*_x7*cross_coupling_1*cross_coupling_2 + _x14*_x15*_x3*_x7*self_coupling_1*self_coupling_2*self_coupling_a - _x3*_x93 + _x3 - _x32*_x95 - _x34*_x95 - _x45*_x55 - _x94]
+
+
+def solution_11(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n_1
+    _x2 = _x0**p_2
+    _x3 = cross_coupling_1**2
+    _x4 = _x0**m_1
+    _x5 = _x0**m_2
+    _x6 = self_coupling_1**2
+    _x7 = _x2*self_coupling_b
+    _x8 = _x4*_x5*self_coupling_2
+    _x9 = _x0**p_1
+    _x10 = _x9*self_coupling_a
+    _x11 = _x0**n_2
+    _x12 = _x0**n_3
+    _x13 = _x1*_x11*_x12*_x4*cross_coupling_1*cross_coupling_2
+    _x14 = cross_coupling_a**2
+    _x15 = cross_coupling_b**2
+    _x16 = self_coupling_b**2
+    _x17 = self_coupling_a**2
+    _x18 = _x13*_x2*_x9
+    _x19 = _x14*_x18
+    _x20 = _x17*_x18
+    return 1j*_x1*cross_coupling_a*(_x2*self_coupling_1*self_coupling_b + _x3*_x4*_x5*self_coupling_2 - _x3*_x7*_x8 + _x4*_x5*_x6*self_coupling_2 - _x6*_x7*_x8 - self_coupling_1)/(_x1*_x11*_x12*_x14*_x4*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x11*_x12*_x15*_x2*_x4*cross_coupling_1*cross_coupling_2*self_coupling_a + _x1*_x11*_x12*_x16*_x2*_x4*cross_coupling_1*cross_coupling_2*self_coupling_a + _x1*_x11*_x12*_x17*_x4*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b - _x10*_x7 - _x10*_x8*self_coupling_1 - _x13*self_coupling_a*self_coupling_b - _x15*_x19 - _x15*_x20 - _x16*_x19 - _x16*_x20 + _x2*_x4*_x5*_x9*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x2*self_coupling_b + _x4*_x5*self_coupling_1*self_coupling_2 - _x7*_x8*self_coupling_1 + _x9*self_coupling_a - 1)
+
+
+def fraction_11(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**n_1
+    _x2 = _x0**p_2
+    _x3 = cross_coupling_1**2
+    _x4 = _x0**m_1
+    _x5 = _x0**m_2
+    _x6 = self_coupling_1**2
+    _x7 = _x2*self_coupling_b
+    _x8 = _x4*_x5*self_coupling_2
+    _x9 = _x0**p_1
+    _x10 = _x9*self_coupling_a
+    _x11 = _x0**n_2
+    _x12 = _x0**n_3
+    _x13 = _x1*_x11*_x12*_x4*cross_coupling_1*cross_coupling_2
+    _x14 = cross_coupling_a**2
+    _x15 = cross_coupling_b**2
+    _x16 = self_coupling_b**2
+    _x17 = self_coupling_a**2
+    _x18 = _x13*_x2*_x9
+    _x19 = _x14*_x18
+    _x20 = _x17*_x18
+    return [1j*_x1*cross_coupling_a*(_x2*self_coupling_1*self_coupling_b + _x3*_x4*_x5*self_coupling_2 - _x3*_x7*_x8 + _x4*_x5*_x6*self_coupling_2 - _x6*_x7*_x8 - self_coupling_1), _x1*_x11*_x12*_x14*_x4*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x11*_x12*_x15*_x2*_x4*cross_coupling_1*cross_coupling_2*self_coupling_a + _x1*_x11*_x12*_x16*_x2*_x4*cross_coupling_1*cross_coupling_2*self_coupling_a + _x1*_x11*_x12*_x17*_x4*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b - _x10*_x7 - _x10*_x8*self_coupling_1 - _x13*self_coupling_a*self_coupling_b - _x15*_x19 - _x15*_x20 - _x16*_x19 - _x16*_x20 + _x2*_x4*_x5*_x9*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x2*self_coupling_b + _x4*_x5*self_coupling_1*self_coupling_2 - _x7*_x8*self_coupling_1 + _x9*self_coupling_a - 1]
+
+
+def sensitivity_11(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p_2
+    _x2 = cross_coupling_1**2
+    _x3 = _x0**m_1
+    _x4 = _x0**m_2
+    _x5 = self_coupling_1**2
+    _x6 = _x1*self_coupling_b
+    _x7 = _x3*_x4
+    _x8 = _x2*_x7
+    _x9 = _x8*self_coupling_2
+    _x10 = _x6*_x9
+    _x11 = _x5*_x7
+    _x12 = _x11*self_coupling_2
+    _x13 = _x12*_x6
+    _x14 = _x0**n_1
+    _x15 = 1j*_x14
+    _x16 = _x15*(_x1*self_coupling_1*self_coupling_b - _x10 - _x13 + _x2*_x3*_x4*self_coupling_2 + _x3*_x4*_x5*self_coupling_2 - self_coupling_1)
+    _x17 = _x16*cross_coupling_a
+    _x18 = _x0**p_1
+    _x19 = _x18*self_coupling_a
+    _x20 = _x19*_x6
+    _x21 = _x7*self_coupling_2
+    _x22 = _x21*self_coupling_1
+    _x23 = _x19*_x22
+    _x24 = _x6*self_coupling_1
+    _x25 = _x21*_x24
+    _x26 = _x0**n_2
+    _x27 = _x0**n_3
+    _x28 = _x14*_x26*_x27*_x3
+    _x29 = _x28*self_coupling_a
+    _x30 = _x29*self_coupling_b
+    _x31 = _x30*cross_coupling_2
+    _x32 = _x31*cross_coupling_1
+    _x33 = cross_coupling_b**2
+    _x34 = self_coupling_b**2
+    _x35 = cross_coupling_a**2
+    _x36 = self_coupling_a**2
+    _x37 = cross_coupling_1*cross_coupling_2
+    _x38 = _x28*_x37
+    _x39 = _x1*_x33
+    _x40 = _x38*_x39
+    _x41 = _x18*_x35
+    _x42 = _x40*_x41
+    _x43 = _x1*_x34
+    _x44 = _x38*_x43
+    _x45 = _x41*_x44
+    _x46 = _x18*_x36
+    _x47 = _x40*_x46
+    _x48 = _x44*_x46
+    _x49 = -_x1*self_coupling_b + 1
+    _x50 = unitary_loss_coefficient**(-1.0)
+    _x51 = _x50*n_1
+    _x52 = _x50*m_1
+    _x53 = _x50*m_2
+    _x54 = _x50*p_2
+    _x55 = _x54*_x6
+    _x56 = _x15*cross_coupling_a
+    _x57 = 2*_x21
+    _x58 = _x50*p_1
+    _x59 = _x32*_x50
+    _x60 = _x50*n_2
+    _x61 = _x50*n_3
+    _x62 = _x18*_x28
+    _x63 = _x62*cross_coupling_2
+    _x64 = _x35*_x63
+    _x65 = _x36*_x63
+    _x66 = _x62*cross_coupling_1
+    _x67 = _x35*_x66
+    _x68 = _x36*_x66
+    _x69 = 2*_x18*cross_coupling_a
+    _x70 = _x18*_x38
+    _x71 = 2*_x1*cross_coupling_b
+    _x72 = _x7*self_coupling_1
+    _x73 = _x24*_x7
+    _x74 = _x18*_x6
+    _x75 = _x1*_x19
+    _x76 = 2*_x38
+    _x77 = _x75*_x76
+    _x78 = _x74*_x76
+    return [_x17, _x1*_x14*_x26*_x27*_x3*_x33*cross_coupling_1*cross_coupling_2*self_coupling_a + _x1*_x14*_x26*_x27*_x3*_x34*cross_coupling_1*cross_coupling_2*self_coupling_a + _x1*_x18*_x3*_x4*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x14*_x18*_x26*_x27*_x3*_x35*cross_coupling_1*cross_coupling_2*self_coupling_b + _x14*_x18*_x26*_x27*_x3*_x36*cross_coupling_1*cross_coupling_2*self_coupling_b + _x18*self_coupling_a - _x20 - _x23 - _x25 + _x3*_x4*self_coupling_1*self_coupling_2 - _x32 - _x42 - _x45 - _x47 - _x48 - _x49, _x17*_x51 + _x56*(_x1*_x50*p_2*self_coupling_1*self_coupling_b - _x10*_x52 - _x10*_x53 - _x12*_x55 - _x13*_x52 - _x13*_x53 + _x2*_x3*_x4*_x50*m_1*self_coupling_2 + _x2*_x3*_x4*_x50*m_2*self_coupling_2 + _x3*_x4*_x5*_x50*m_1*self_coupling_2 + _x3*_x4*_x5*_x50*m_2*self_coupling_2 - _x55*_x9), _x56*(2*_x3*_x4*cross_coupling_1*self_coupling_2 - _x57*_x6*cross_coupling_1), 0, _x16, 0, _x56*(-_x24*_x57 + 2*_x3*_x4*self_coupling_1*self_coupling_2 - _x49), _x56*(-_x11*_x6 + _x2*_x3*_x4 + _x3*_x4*_x5 - _x6*_x8), 0, _x56*(-_x1*_x12 - _x1*_x9 + _x1*self_coupling_1), _x1*_x14*_x26*_x27*_x3*_x33*_x50*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x1*_x14*_x26*_x27*_x3*_x33*_x50*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x1*_x14*_x26*_x27*_x3*_x33*_x50*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x1*_x14*_x26*_x27*_x3*_x33*_x50*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x1*_x14*_x26*_x27*_x3*_x33*_x50*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x1*_x14*_x26*_x27*_x3*_x34*_x50*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x1*_x14*_x26*_x27*_x3*_x34*_x50*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x1*_x14*_x26*_x27*_x3*_x34*_x50*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x1*_x14*_x26*_x27*_x3*_x34*_x50*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x1*_x14*_x26*_x27*_x3*_x34*_x50*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x1*_x18*_x3*_x4*_x50*m_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x18*_x3*_x4*_x50*m_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x18*_x3*_x4*_x50*p_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x18*_x3*_x4*_x50*p_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*_x50*p_2*self_coupling_b + _x14*_x18*_x26*_x27*_x3*_x35*_x50*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x14*_x18*_x26*_x27*_x3*_x35*_x50*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x14*_x18*_x26*_x27*_x3*_x35*_x50*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x14*_x18*_x26*_x27*_x3*_x35*_x50*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x14*_x18*_x26*_x27*_x3*_x35*_x50*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b + _x14*_x18*_x26*_x27*_x3*_x36*_x50*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x14*_x18*_x26*_x27*_x3*_x36*_x50*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x14*_x18*_x26*_x27*_x3*_x36*_x50*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x14*_x18*_x26*_x27*_x3*_x36*_x50*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x14*_x18*_x26*_x27*_x3*_x36*_x50*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b + _x18*_x50*p_1*self_coupling_a - _x19*_x22*_x58 - _x20*_x54 - _x20*_x58 - _x21*_x24*_x54 - _x23*_x52 - _x23*_x53 - _x25*_x52 - _x25*_x53 + _x3*_x4*_x50*m_1*self_coupling_1*self_coupling_2 + _x3*_x4*_x50*m_2*self_coupling_1*self_coupling_2 - _x32*_x51 - _x32*_x52 - _x42*_x51 - _x42*_x52 - _x42*_x54 - _x42*_x58 - _x42*_x60 - _x42*_x61 - _x45*_x51 - _x45*_x52 - _x45*_x54 - _x45*_x58 - _x45*_x60 - _x45*_x61 - _x47*_x51 - _x47*_x52 - _x47*_x54 - _x47*_x58 - _x47*_x60 - _x47*_x61 - _x48*_x51 - _x48*_x52 - _x48*_x54 - _x48*_x58 - _x48*_x60 - _x48*_x61 - _x59*n_2 - _x59*n_3, _x1*_x14*_x26*_x27*_x3*_x33*cross_coupling_2*self_coupling_a + _x1*_x14*_x26*_x27*_x3*_x34*cross_coupling_2*self_coupling_a + _x14*_x18*_x26*_x27*_x3*_x35*cross_coupling_2*self_coupling_b + _x14*_x18*_x26*_x27*_x3*_x36*cross_coupling_2*self_coupling_b - _x31 - _x39*_x64 - _x39*_x65 - _x43*_x64 - _x43*_x65, _x1*_x14*_x26*_x27*_x3*_x33*cross_coupling_1*self_coupling_a + _x1*_x14*_x26*_x27*_x3*_x34*cross_coupling_1*self_coupling_a + _x14*_x18*_x26*_x27*_x3*_x35*cross_coupling_1*self_coupling_b + _x14*_x18*_x26*_x27*_x3*_x36*cross_coupling_1*self_coupling_b - _x30*cross_coupling_1 - _x39*_x67 - _x39*_x68 - _x43*_x67 - _x43*_x68, 2*_x14*_x18*_x26*_x27*_x3*cross_coupling_1*cross_coupling_2*cross_coupling_a*self_coupling_b - _x40*_x69 - _x44*_x69, 2*_x1*_x14*_x26*_x27*_x3*cross_coupling_1*cross_coupling_2*cross_coupling_b*self_coupling_a - _x35*_x70*_x71 - _x36*_x70*_x71, -_x19*_x21 + _x20*_x21 - _x21*_x6 + _x21, -_x19*_x72 + _x19*_x73 + _x72 - _x73, _x1*_x14*_x26*_x27*_x3*_x33*cross_coupling_1*cross_coupling_2 + _x1*_x14*_x26*_x27*_x3*_x34*cross_coupling_1*cross_coupling_2 + _x1*_x18*_x3*_x4*self_coupling_1*self_coupling_2*self_coupling_b + 2*_x14*_x18*_x26*_x27*_x3*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b - _x18*_x22 + _x18 - _x28*_x37*self_coupling_b - _x33*_x77 - _x34*_x77 - _x74, 2*_x1*_x14*_x26*_x27*_x3*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b + _x1*_x18*_x3*_x4*self_coupling_1*self_coupling_2*self_coupling_a - _x1*_x21*self_coupling_1 + _x1 + _x14*_x18*_x26*_x27*_x3*_x35*cross_coupling_1*cross_coupling_2 + _x14*_x18*_x26*_x27*_x3*_x36*cross_coupling_1*cross_coupling_2 - _x29*_x37 - _x35*_x78 - _x36*_x78 - _x75]
+
+
+def solution_12(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p_1
+    _x2 = _x0**p_2
+    _x3 = _x1*self_coupling_a
+    _x4 = _x2*self_coupling_b
+    _x5 = _x0**m_1
+    _x6 = _x0**m_2
+    _x7 = _x5*_x6*self_coupling_2
+    _x8 = _x7*self_coupling_1
+    _x9 = _x0**n_3
+    _x10 = _x0**n_1
+    _x11 = _x0**n_2
+    _x12 = _x10*_x11
+    _x13 = _x12*_x5*_x9*cross_coupling_1*cross_coupling_2
+    _x14 = cross_coupling_a**2
+    _x15 = cross_coupling_b**2
+    _x16 = self_coupling_b**2
+    _x17 = self_coupling_a**2
+    _x18 = _x1*_x13*_x2
+    _x19 = _x14*_x18
+    _x20 = _x17*_x18
+    _x21 = self_coupling_1*self_coupling_a
+    _x22 = _x1*self_coupling_1
+    _x23 = _x14*_x22
+    _x24 = _x17*_x22
+    _x25 = cross_coupling_1**2
+    _x26 = _x7*self_coupling_a
+    _x27 = _x25*_x26
+    _x28 = self_coupling_1**2
+    _x29 = _x26*_x28
+    _x30 = _x1*_x7
+    _x31 = _x25*_x30
+    _x32 = _x14*_x31
+    _x33 = _x17*_x31
+    _x34 = _x28*_x30
+    _x35 = _x14*_x34
+    _x36 = _x17*_x34
+    return _x12*(_x21*_x4 - _x21 - _x23*_x4 + _x23 - _x24*_x4 + _x24 - _x27*_x4 + _x27 - _x29*_x4 + _x29 + _x32*_x4 - _x32 + _x33*_x4 - _x33 + _x35*_x4 - _x35 + _x36*_x4 - _x36)/(_x1*_x10*_x11*_x14*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x10*_x11*_x17*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x2*_x5*_x6*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*self_coupling_a + _x10*_x11*_x15*_x2*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x10*_x11*_x16*_x2*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a - _x13*self_coupling_a*self_coupling_b - _x15*_x19 - _x15*_x20 - _x16*_x19 - _x16*_x20 + _x2*self_coupling_b - _x3*_x4 - _x3*_x8 - _x4*_x8 + _x5*_x6*self_coupling_1*self_coupling_2 - 1)
+
+
+def fraction_12(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = self_coupling_1*self_coupling_a
+    _x1 = unitary_loss_coefficient/z
+    _x2 = _x1**p_2
+    _x3 = _x2*self_coupling_b
+    _x4 = cross_coupling_a**2
+    _x5 = _x1**p_1
+    _x6 = _x5*self_coupling_1
+    _x7 = _x4*_x6
+    _x8 = self_coupling_a**2
+    _x9 = _x6*_x8
+    _x10 = cross_coupling_1**2
+    _x11 = _x1**m_1
+    _x12 = _x1**m_2
+    _x13 = _x11*_x12*self_coupling_2
+    _x14 = _x13*self_coupling_a
+    _x15 = _x10*_x14
+    _x16 = self_coupling_1**2
+    _x17 = _x14*_x16
+    _x18 = _x13*_x5
+    _x19 = _x10*_x18
+    _x20 = _x19*_x4
+    _x21 = _x19*_x8
+    _x22 = _x16*_x18
+    _x23 = _x22*_x4
+    _x24 = _x22*_x8
+    _x25 = _x1**n_1
+    _x26 = _x1**n_2
+    _x27 = _x25*_x26
+    _x28 = _x1**n_3
+    _x29 = _x11*_x27*_x28*cross_coupling_1*cross_coupling_2
+    _x30 = cross_coupling_b**2
+    _x31 = self_coupling_b**2
+    _x32 = _x2*_x29*_x5
+    _x33 = _x32*_x4
+    _x34 = _x32*_x8
+    return [_x27*(_x0*_x3 - _x0 - _x15*_x3 + _x15 - _x17*_x3 + _x17 + _x20*_x3 - _x20 + _x21*_x3 - _x21 + _x23*_x3 - _x23 + _x24*_x3 - _x24 - _x3*_x7 - _x3*_x9 + _x7 + _x9), -_x0*_x18 + _x11*_x12*_x2*_x5*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x11*_x12*self_coupling_1*self_coupling_2 + _x11*_x2*_x25*_x26*_x28*_x30*cross_coupling_1*cross_coupling_2*self_coupling_a + _x11*_x2*_x25*_x26*_x28*_x31*cross_coupling_1*cross_coupling_2*self_coupling_a + _x11*_x25*_x26*_x28*_x4*_x5*cross_coupling_1*cross_coupling_2*self_coupling_b + _x11*_x25*_x26*_x28*_x5*_x8*cross_coupling_1*cross_coupling_2*self_coupling_b - _x13*_x3*self_coupling_1 + _x2*self_coupling_b - _x29*self_coupling_a*self_coupling_b - _x3*_x5*self_coupling_a - _x30*_x33 - _x30*_x34 - _x31*_x33 - _x31*_x34 + _x5*self_coupling_a - 1]
+
+
+def sensitivity_12(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = self_coupling_1*self_coupling_a
+    _x1 = unitary_loss_coefficient/z
+    _x2 = _x1**p_2
+    _x3 = _x2*self_coupling_b
+    _x4 = _x0*_x3
+    _x5 = cross_coupling_a**2
+    _x6 = _x1**p_1
+    _x7 = _x5*_x6
+    _x8 = _x7*self_coupling_1
+    _x9 = self_coupling_a**2
+    _x10 = _x6*_x9
+    _x11 = _x10*self_coupling_1
+    _x12 = cross_coupling_1**2
+    _x13 = _x1**m_1
+    _x14 = _x1**m_2
+    _x15 = _x13*_x14
+    _x16 = _x15*self_coupling_2
+    _x17 = _x12*_x16
+    _x18 = _x17*self_coupling_a
+    _x19 = self_coupling_1**2
+    _x20 = _x16*_x19
+    _x21 = _x20*self_coupling_a
+    _x22 = _x3*_x8
+    _x23 = _x11*_x3
+    _x24 = _x3*self_coupling_a
+    _x25 = _x17*_x24
+    _x26 = _x20*_x24
+    _x27 = _x17*_x7
+    _x28 = _x10*_x17
+    _x29 = _x20*_x7
+    _x30 = _x10*_x20
+    _x31 = _x3*_x7
+    _x32 = _x17*_x31
+    _x33 = _x10*_x3
+    _x34 = _x17*_x33
+    _x35 = _x20*_x31
+    _x36 = _x20*_x33
+    _x37 = _x1**n_1
+    _x38 = _x1**n_2
+    _x39 = _x37*_x38
+    _x40 = _x39*(-_x0 + _x11 + _x18 + _x21 - _x22 - _x23 - _x25 - _x26 - _x27 - _x28 - _x29 - _x30 + _x32 + _x34 + _x35 + _x36 + _x4 + _x8)
+    _x41 = _x6*self_coupling_a
+    _x42 = _x3*_x41
+    _x43 = _x0*_x6
+    _x44 = _x16*_x43
+    _x45 = _x3*self_coupling_1
+    _x46 = _x16*_x45
+    _x47 = cross_coupling_1*self_coupling_a
+    _x48 = _x1**n_3
+    _x49 = _x13*_x39*_x48
+    _x50 = _x49*self_coupling_b
+    _x51 = _x50*cross_coupling_2
+    _x52 = _x47*_x51
+    _x53 = cross_coupling_b**2
+    _x54 = self_coupling_b**2
+    _x55 = _x2*_x53
+    _x56 = _x49*cross_coupling_2
+    _x57 = _x56*cross_coupling_1
+    _x58 = _x55*_x57
+    _x59 = _x58*_x7
+    _x60 = _x2*_x54
+    _x61 = _x57*_x60
+    _x62 = _x61*_x7
+    _x63 = _x10*_x58
+    _x64 = _x10*_x61
+    _x65 = unitary_loss_coefficient**(-1.0)
+    _x66 = _x40*_x65
+    _x67 = _x65*p_2
+    _x68 = _x65*p_1
+    _x69 = _x65*m_1
+    _x70 = _x65*m_2
+    _x71 = _x3*_x67
+    _x72 = 2*_x16
+    _x73 = _x72*cross_coupling_1
+    _x74 = 2*_x6
+    _x75 = _x74*cross_coupling_a
+    _x76 = 2*_x17
+    _x77 = _x3*_x6
+    _x78 = _x77*cross_coupling_a
+    _x79 = 2*_x20
+    _x80 = _x15*self_coupling_a
+    _x81 = _x12*_x15
+    _x82 = _x15*_x19
+    _x83 = _x0*_x77
+    _x84 = 2*_x41
+    _x85 = _x52*_x65
+    _x86 = _x65*n_1
+    _x87 = _x65*n_2
+    _x88 = _x65*n_3
+    _x89 = _x56*_x7
+    _x90 = _x10*_x56
+    _x91 = _x49*cross_coupling_1
+    _x92 = _x7*_x91
+    _x93 = _x10*_x91
+    _x94 = 2*_x2*cross_coupling_b
+    _x95 = _x16*self_coupling_1
+    _x96 = _x2*_x41
+    _x97 = 2*_x57
+    _x98 = _x96*_x97
+    return [_x40, _x13*_x14*_x2*_x6*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x13*_x14*self_coupling_1*self_coupling_2 + _x13*_x2*_x37*_x38*_x48*_x53*cross_coupling_1*cross_coupling_2*self_coupling_a + _x13*_x2*_x37*_x38*_x48*_x54*cross_coupling_1*cross_coupling_2*self_coupling_a + _x13*_x37*_x38*_x48*_x5*_x6*cross_coupling_1*cross_coupling_2*self_coupling_b + _x13*_x37*_x38*_x48*_x6*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x2*self_coupling_b - _x42 - _x44 - _x46 - _x52 - _x59 + _x6*self_coupling_a - _x62 - _x63 - _x64 - 1, _x39*(_x11*_x68 - _x11*_x71 + _x18*_x69 + _x18*_x70 + _x21*_x69 + _x21*_x70 - _x22*_x68 - _x23*_x68 - _x25*_x67 - _x25*_x69 - _x25*_x70 - _x26*_x67 - _x26*_x69 - _x26*_x70 - _x27*_x68 - _x27*_x69 - _x27*_x70 - _x28*_x68 - _x28*_x69 - _x28*_x70 - _x29*_x68 - _x29*_x69 - _x29*_x70 - _x30*_x68 - _x30*_x69 - _x30*_x70 + _x32*_x67 + _x32*_x68 + _x32*_x69 + _x32*_x70 + _x34*_x67 + _x34*_x68 + _x34*_x69 + _x34*_x70 + _x35*_x67 + _x35*_x68 + _x35*_x69 + _x35*_x70 + _x36*_x67 + _x36*_x68 + _x36*_x69 + _x36*_x70 + _x4*_x67 + _x68*_x8 - _x71*_x8) + _x66*n_1 + _x66*n_2, _x39*(-_x10*_x73 - _x24*_x73 + _x31*_x73 + _x33*_x73 + _x47*_x72 - _x7*_x73), 0, _x39*(-_x17*_x75 - _x20*_x75 - _x45*_x75 + _x75*self_coupling_1 + _x76*_x78 + _x78*_x79), 0, _x39*(_x0*_x72 + _x10 - _x11*_x72 + _x22*_x72 + _x23*_x72 + _x24 - _x31 - _x33 - _x4*_x72 + _x7 - _x72*_x8 - self_coupling_a), _x39*(-_x10*_x81 - _x10*_x82 + _x12*_x80 + _x19*_x80 - _x24*_x81 - _x24*_x82 + _x31*_x81 + _x31*_x82 + _x33*_x81 + _x33*_x82 - _x7*_x81 - _x7*_x82), _x39*(_x0*_x74 - _x17*_x3 - _x17*_x84 + _x17 - _x20*_x3 - _x20*_x84 + _x20 + _x42*_x76 + _x42*_x79 + _x45 - 2*_x83 - self_coupling_1), _x39*(_x0*_x2 - _x11*_x2 - _x18*_x2 - _x2*_x21 + _x2*_x27 + _x2*_x28 + _x2*_x29 + _x2*_x30 - _x2*_x8), _x13*_x14*_x2*_x6*_x65*m_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x13*_x14*_x2*_x6*_x65*m_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x13*_x14*_x2*_x6*_x65*p_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x13*_x14*_x2*_x6*_x65*p_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x13*_x14*_x65*m_1*self_coupling_1*self_coupling_2 + _x13*_x14*_x65*m_2*self_coupling_1*self_coupling_2 + _x13*_x2*_x37*_x38*_x48*_x53*_x65*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x13*_x2*_x37*_x38*_x48*_x53*_x65*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x13*_x2*_x37*_x38*_x48*_x53*_x65*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x13*_x2*_x37*_x38*_x48*_x53*_x65*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x13*_x2*_x37*_x38*_x48*_x53*_x65*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x13*_x2*_x37*_x38*_x48*_x54*_x65*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x13*_x2*_x37*_x38*_x48*_x54*_x65*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x13*_x2*_x37*_x38*_x48*_x54*_x65*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x13*_x2*_x37*_x38*_x48*_x54*_x65*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x13*_x2*_x37*_x38*_x48*_x54*_x65*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x13*_x37*_x38*_x48*_x5*_x6*_x65*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x13*_x37*_x38*_x48*_x5*_x6*_x65*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x13*_x37*_x38*_x48*_x5*_x6*_x65*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x13*_x37*_x38*_x48*_x5*_x6*_x65*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x13*_x37*_x38*_x48*_x5*_x6*_x65*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b + _x13*_x37*_x38*_x48*_x6*_x65*_x9*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x13*_x37*_x38*_x48*_x6*_x65*_x9*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x13*_x37*_x38*_x48*_x6*_x65*_x9*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x13*_x37*_x38*_x48*_x6*_x65*_x9*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x13*_x37*_x38*_x48*_x6*_x65*_x9*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b + _x2*_x65*p_2*self_coupling_b - _x42*_x67 - _x42*_x68 - _x44*_x68 - _x44*_x69 - _x44*_x70 - _x46*_x67 - _x46*_x69 - _x46*_x70 - _x52*_x69 - _x59*_x67 - _x59*_x68 - _x59*_x69 - _x59*_x86 - _x59*_x87 - _x59*_x88 + _x6*_x65*p_1*self_coupling_a - _x62*_x67 - _x62*_x68 - _x62*_x69 - _x62*_x86 - _x62*_x87 - _x62*_x88 - _x63*_x67 - _x63*_x68 - _x63*_x69 - _x63*_x86 - _x63*_x87 - _x63*_x88 - _x64*_x67 - _x64*_x68 - _x64*_x69 - _x64*_x86 - _x64*_x87 - _x64*_x88 - _x85*n_1 - _x85*n_2 - _x85*n_3, _x13*_x2*_x37*_x38*_x48*_x53*cross_coupling_2*self_coupling_a + _x13*_x2*_x37*_x38*_x48*_x54*cross_coupling_2*self_coupling_a + _x13*_x37*_x38*_x48*_x5*_x6*cross_coupling_2*self_coupling_b + _x13*_x37*_x38*_x48*_x6*_x9*cross_coupling_2*self_coupling_b - _x51*self_coupling_a - _x55*_x89 - _x55*_x90 - _x60*_x89 - _x60*_x90, _x13*_x2*_x37*_x38*_x48*_x53*cross_coupling_1*self_coupling_a + _x13*_x2*_x37*_x38*_x48*_x54*cross_coupling_1*self_coupling_a + _x13*_x37*_x38*_x48*_x5*_x6*cross_coupling_1*self_coupling_b + _x13*_x37*_x38*_x48*_x6*_x9*cross_coupling_1*self_coupling_b - _x47*_x50 - _x55*_x92 - _x55*_x93 - _x60*_x92 - _x60*_x93, 2*_x13*_x37*_x38*_x48*_x6*cross_coupling_1*cross_coupling_2*cross_coupling_a*self_coupling_b - _x58*_x75 - _x61*_x75, -_x10*_x57*_x94 + 2*_x13*_x2*_x37*_x38*_x48*cross_coupling_1*cross_coupling_2*cross_coupling_b*self_coupling_a - _x57*_x7*_x94, -_x16*_x3 - _x16*_x41 + _x16*_x42 + _x16, -_x15*_x43 - _x15*_x45 + _x15*_x83 + _x15*self_coupling_1, _x13*_x14*_x2*_x6*self_coupling_1*self_coupling_2*self_coupling_b + _x13*_x2*_x37*_x38*_x48*_x53*cross_coupling_1*cross_coupling_2 + _x13*_x2*_x37*_x38*_x48*_x54*cross_coupling_1*cross_coupling_2 + 2*_x13*_x37*_x38*_x48*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b - _x51*cross_coupling_1 - _x53*_x98 - _x54*_x98 - _x6*_x95 + _x6 - _x77, _x13*_x14*_x2*_x6*self_coupling_1*self_coupling_2*self_coupling_a + 2*_x13*_x2*_x37*_x38*_x48*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b + _x13*_x37*_x38*_x48*_x5*_x6*cross_coupling_1*cross_coupling_2 + _x13*_x37*_x38*_x48*_x6*_x9*cross_coupling_1*cross_coupling_2 - _x2*_x95 + _x2 - _x31*_x97 - _x33*_x97 - _x47*_x56 - _x96]
+
+
+def solution_13(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p_1
+    _x2 = _x0**p_2
+    _x3 = _x1*self_coupling_a
+    _x4 = _x2*self_coupling_b
+    _x5 = _x0**m_1
+    _x6 = _x0**m_2
+    _x7 = _x5*_x6*self_coupling_2
+    _x8 = _x7*self_coupling_1
+    _x9 = _x0**n_3
+    _x10 = _x5*_x9*cross_coupling_1*cross_coupling_2
+    _x11 = _x0**n_1
+    _x12 = _x0**n_2
+    _x13 = _x11*_x12
+    _x14 = cross_coupling_a**2
+    _x15 = cross_coupling_b**2
+    _x16 = self_coupling_b**2
+    _x17 = self_coupling_a**2
+    _x18 = _x13*_x2
+    _x19 = _x1*_x10*_x18
+    _x20 = _x14*_x19
+    _x21 = _x17*_x19
+    _x22 = cross_coupling_1**2
+    _x23 = self_coupling_1**2
+    _x24 = _x1*_x7
+    _x25 = _x22*_x24
+    _x26 = _x23*_x24
+    return 1j*_x18*cross_coupling_b*(_x1*_x14*self_coupling_1 + _x1*_x17*self_coupling_1 - _x14*_x25 - _x14*_x26 - _x17*_x25 - _x17*_x26 + _x22*_x5*_x6*self_coupling_2*self_coupling_a + _x23*_x5*_x6*self_coupling_2*self_coupling_a - self_coupling_1*self_coupling_a)/(_x1*_x11*_x12*_x14*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x11*_x12*_x17*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x2*_x5*_x6*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*self_coupling_a - _x10*_x13*self_coupling_a*self_coupling_b + _x11*_x12*_x15*_x2*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x11*_x12*_x16*_x2*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a - _x15*_x20 - _x15*_x21 - _x16*_x20 - _x16*_x21 + _x2*self_coupling_b - _x3*_x4 - _x3*_x8 - _x4*_x8 + _x5*_x6*self_coupling_1*self_coupling_2 - 1)
+
+
+def fraction_13(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = self_coupling_1*self_coupling_a
+    _x1 = cross_coupling_a**2
+    _x2 = unitary_loss_coefficient/z
+    _x3 = _x2**p_1
+    _x4 = self_coupling_a**2
+    _x5 = cross_coupling_1**2
+    _x6 = _x2**m_1
+    _x7 = _x2**m_2
+    _x8 = self_coupling_1**2
+    _x9 = _x6*_x7*self_coupling_2
+    _x10 = _x3*_x9
+    _x11 = _x10*_x5
+    _x12 = _x10*_x8
+    _x13 = _x2**p_2
+    _x14 = _x2**n_1
+    _x15 = _x2**n_2
+    _x16 = _x14*_x15
+    _x17 = _x13*_x16
+    _x18 = _x13*self_coupling_b
+    _x19 = _x2**n_3
+    _x20 = _x19*_x6*cross_coupling_1*cross_coupling_2
+    _x21 = cross_coupling_b**2
+    _x22 = self_coupling_b**2
+    _x23 = _x17*_x20*_x3
+    _x24 = _x1*_x23
+    _x25 = _x23*_x4
+    return [1j*_x17*cross_coupling_b*(-_x0 - _x1*_x11 - _x1*_x12 + _x1*_x3*self_coupling_1 - _x11*_x4 - _x12*_x4 + _x3*_x4*self_coupling_1 + _x5*_x6*_x7*self_coupling_2*self_coupling_a + _x6*_x7*_x8*self_coupling_2*self_coupling_a), -_x0*_x10 + _x1*_x14*_x15*_x19*_x3*_x6*cross_coupling_1*cross_coupling_2*self_coupling_b + _x13*_x14*_x15*_x19*_x21*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a + _x13*_x14*_x15*_x19*_x22*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a + _x13*_x3*_x6*_x7*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x13*self_coupling_b + _x14*_x15*_x19*_x3*_x4*_x6*cross_coupling_1*cross_coupling_2*self_coupling_b - _x16*_x20*self_coupling_a*self_coupling_b - _x18*_x3*self_coupling_a - _x18*_x9*self_coupling_1 - _x21*_x24 - _x21*_x25 - _x22*_x24 - _x22*_x25 + _x3*self_coupling_a + _x6*_x7*self_coupling_1*self_coupling_2 - 1]
+
+
+def sensitivity_13(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = self_coupling_1*self_coupling_a
+    _x1 = cross_coupling_a**2
+    _x2 = unitary_loss_coefficient/z
+    _x3 = _x2**p_1
+    _x4 = self_coupling_a**2
+    _x5 = cross_coupling_1**2
+    _x6 = _x2**m_1
+    _x7 = _x2**m_2
+    _x8 = self_coupling_1**2
+    _x9 = _x1*_x3
+    _x10 = _x6*_x7
+    _x11 = _x10*self_coupling_2
+    _x12 = _x11*_x5
+    _x13 = _x12*_x9
+    _x14 = _x3*_x4
+    _x15 = _x12*_x14
+    _x16 = _x11*_x8
+    _x17 = _x16*_x9
+    _x18 = _x14*_x16
+    _x19 = _x2**p_2
+    _x20 = _x2**n_1
+    _x21 = _x2**n_2
+    _x22 = _x20*_x21
+    _x23 = _x19*_x22
+    _x24 = 1j*_x23
+    _x25 = _x24*(-_x0 + _x1*_x3*self_coupling_1 - _x13 - _x15 - _x17 - _x18 + _x3*_x4*self_coupling_1 + _x5*_x6*_x7*self_coupling_2*self_coupling_a + _x6*_x7*_x8*self_coupling_2*self_coupling_a)
+    _x26 = _x25*cross_coupling_b
+    _x27 = _x3*self_coupling_a
+    _x28 = _x19*self_coupling_b
+    _x29 = _x27*_x28
+    _x30 = _x0*_x3
+    _x31 = _x11*_x30
+    _x32 = _x11*self_coupling_1
+    _x33 = _x28*_x32
+    _x34 = _x2**n_3
+    _x35 = _x34*_x6
+    _x36 = _x35*cross_coupling_2
+    _x37 = cross_coupling_1*self_coupling_a
+    _x38 = _x22*self_coupling_b
+    _x39 = _x37*_x38
+    _x40 = _x36*_x39
+    _x41 = cross_coupling_b**2
+    _x42 = self_coupling_b**2
+    _x43 = _x23*_x41
+    _x44 = _x9*cross_coupling_1
+    _x45 = _x36*_x44
+    _x46 = _x43*_x45
+    _x47 = _x23*_x42
+    _x48 = _x45*_x47
+    _x49 = _x14*cross_coupling_1
+    _x50 = _x36*_x49
+    _x51 = _x43*_x50
+    _x52 = _x47*_x50
+    _x53 = unitary_loss_coefficient**(-1.0)
+    _x54 = _x26*_x53
+    _x55 = _x53*p_2
+    _x56 = _x53*m_1
+    _x57 = _x53*m_2
+    _x58 = _x53*p_1
+    _x59 = _x24*cross_coupling_b
+    _x60 = 2*_x11
+    _x61 = _x60*cross_coupling_1
+    _x62 = 2*_x3*cross_coupling_a
+    _x63 = _x10*_x5
+    _x64 = _x10*_x8
+    _x65 = 2*_x27
+    _x66 = _x40*_x53
+    _x67 = _x53*n_1
+    _x68 = _x53*n_2
+    _x69 = _x53*n_3
+    _x70 = _x36*_x9
+    _x71 = _x14*_x36
+    _x72 = _x35*_x44
+    _x73 = _x35*_x49
+    _x74 = _x36*cross_coupling_1
+    _x75 = 2*_x23*cross_coupling_b
+    _x76 = _x10*self_coupling_1
+    _x77 = _x28*_x3
+    _x78 = _x19*_x27
+    _x79 = _x22*_x36
+    _x80 = 2*_x78*_x79*cross_coupling_1
+    _x81 = 2*_x28
+    return [_x26, _x1*_x20*_x21*_x3*_x34*_x6*cross_coupling_1*cross_coupling_2*self_coupling_b + _x19*_x20*_x21*_x34*_x41*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a + _x19*_x20*_x21*_x34*_x42*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a + _x19*_x3*_x6*_x7*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x19*self_coupling_b + _x20*_x21*_x3*_x34*_x4*_x6*cross_coupling_1*cross_coupling_2*self_coupling_b - _x29 + _x3*self_coupling_a - _x31 - _x33 - _x40 - _x46 - _x48 - _x51 - _x52 + _x6*_x7*self_coupling_1*self_coupling_2 - 1, _x26*_x55 + _x54*n_1 + _x54*n_2 + _x59*(_x1*_x3*_x53*p_1*self_coupling_1 - _x13*_x56 - _x13*_x57 - _x13*_x58 - _x15*_x56 - _x15*_x57 - _x15*_x58 - _x17*_x56 - _x17*_x57 - _x17*_x58 - _x18*_x56 - _x18*_x57 - _x18*_x58 + _x3*_x4*_x53*p_1*self_coupling_1 + _x5*_x53*_x6*_x7*m_1*self_coupling_2*self_coupling_a + _x5*_x53*_x6*_x7*m_2*self_coupling_2*self_coupling_a + _x53*_x6*_x7*_x8*m_1*self_coupling_2*self_coupling_a + _x53*_x6*_x7*_x8*m_2*self_coupling_2*self_coupling_a), _x59*(-_x14*_x61 + 2*_x6*_x7*cross_coupling_1*self_coupling_2*self_coupling_a - _x61*_x9), 0, _x59*(-_x12*_x62 - _x16*_x62 + 2*_x3*cross_coupling_a*self_coupling_1), _x25, _x59*(_x1*_x3 - _x14*_x60*self_coupling_1 + _x3*_x4 + 2*_x6*_x7*self_coupling_1*self_coupling_2*self_coupling_a - _x60*_x9*self_coupling_1 - self_coupling_a), _x59*(-_x14*_x63 - _x14*_x64 + _x5*_x6*_x7*self_coupling_a + _x6*_x7*_x8*self_coupling_a - _x63*_x9 - _x64*_x9), _x59*(-_x12*_x65 - _x16*_x65 + 2*_x3*self_coupling_1*self_coupling_a + _x5*_x6*_x7*self_coupling_2 + _x6*_x7*_x8*self_coupling_2 - self_coupling_1), 0, _x1*_x20*_x21*_x3*_x34*_x53*_x6*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x1*_x20*_x21*_x3*_x34*_x53*_x6*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x1*_x20*_x21*_x3*_x34*_x53*_x6*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x1*_x20*_x21*_x3*_x34*_x53*_x6*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x1*_x20*_x21*_x3*_x34*_x53*_x6*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b + _x19*_x20*_x21*_x34*_x41*_x53*_x6*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x19*_x20*_x21*_x34*_x41*_x53*_x6*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x19*_x20*_x21*_x34*_x41*_x53*_x6*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x19*_x20*_x21*_x34*_x41*_x53*_x6*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x19*_x20*_x21*_x34*_x41*_x53*_x6*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x19*_x20*_x21*_x34*_x42*_x53*_x6*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x19*_x20*_x21*_x34*_x42*_x53*_x6*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x19*_x20*_x21*_x34*_x42*_x53*_x6*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x19*_x20*_x21*_x34*_x42*_x53*_x6*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x19*_x20*_x21*_x34*_x42*_x53*_x6*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x19*_x3*_x53*_x6*_x7*m_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x19*_x3*_x53*_x6*_x7*m_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x19*_x3*_x53*_x6*_x7*p_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x19*_x3*_x53*_x6*_x7*p_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x19*_x53*p_2*self_coupling_b + _x20*_x21*_x3*_x34*_x4*_x53*_x6*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x20*_x21*_x3*_x34*_x4*_x53*_x6*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x20*_x21*_x3*_x34*_x4*_x53*_x6*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x20*_x21*_x3*_x34*_x4*_x53*_x6*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x20*_x21*_x3*_x34*_x4*_x53*_x6*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b - _x28*_x32*_x55 - _x29*_x55 - _x29*_x58 + _x3*_x53*p_1*self_coupling_a - _x31*_x56 - _x31*_x57 - _x31*_x58 - _x33*_x56 - _x33*_x57 - _x40*_x56 - _x46*_x55 - _x46*_x56 - _x46*_x58 - _x46*_x67 - _x46*_x68 - _x46*_x69 - _x48*_x55 - _x48*_x56 - _x48*_x58 - _x48*_x67 - _x48*_x68 - _x48*_x69 - _x51*_x55 - _x51*_x56 - _x51*_x58 - _x51*_x67 - _x51*_x68 - _x51*_x69 - _x52*_x55 - _x52*_x56 - _x52*_x58 - _x52*_x67 - _x52*_x68 - _x52*_x69 + _x53*_x6*_x7*m_1*self_coupling_1*self_coupling_2 + _x53*_x6*_x7*m_2*self_coupling_1*self_coupling_2 - _x66*n_1 - _x66*n_2 - _x66*n_3, _x1*_x20*_x21*_x3*_x34*_x6*cross_coupling_2*self_coupling_b + _x19*_x20*_x21*_x34*_x41*_x6*cross_coupling_2*self_coupling_a + _x19*_x20*_x21*_x34*_x42*_x6*cross_coupling_2*self_coupling_a + _x20*_x21*_x3*_x34*_x4*_x6*cross_coupling_2*self_coupling_b - _x36*_x38*self_coupling_a - _x43*_x70 - _x43*_x71 - _x47*_x70 - _x47*_x71, _x1*_x20*_x21*_x3*_x34*_x6*cross_coupling_1*self_coupling_b + _x19*_x20*_x21*_x34*_x41*_x6*cross_coupling_1*self_coupling_a + _x19*_x20*_x21*_x34*_x42*_x6*cross_coupling_1*self_coupling_a + _x20*_x21*_x3*_x34*_x4*_x6*cross_coupling_1*self_coupling_b - _x35*_x39 - _x43*_x72 - _x43*_x73 - _x47*_x72 - _x47*_x73, 2*_x20*_x21*_x3*_x34*_x6*cross_coupling_1*cross_coupling_2*cross_coupling_a*self_coupling_b - _x43*_x62*_x74 - _x47*_x62*_x74, 2*_x19*_x20*_x21*_x34*_x6*cross_coupling_1*cross_coupling_2*cross_coupling_b*self_coupling_a - _x45*_x75 - _x50*_x75, -_x11*_x27 - _x11*_x28 + _x11*_x29 + _x11, _x0*_x10*_x77 - _x10*_x30 - _x28*_x76 + _x76, _x19*_x20*_x21*_x34*_x41*_x6*cross_coupling_1*cross_coupling_2 + _x19*_x20*_x21*_x34*_x42*_x6*cross_coupling_1*cross_coupling_2 + _x19*_x3*_x6*_x7*self_coupling_1*self_coupling_2*self_coupling_b + 2*_x20*_x21*_x3*_x34*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b - _x3*_x32 + _x3 - _x36*_x38*cross_coupling_1 - _x41*_x80 - _x42*_x80 - _x77, _x1*_x20*_x21*_x3*_x34*_x6*cross_coupling_1*cross_coupling_2 + 2*_x19*_x20*_x21*_x34*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b + _x19*_x3*_x6*_x7*self_coupling_1*self_coupling_2*self_coupling_a - _x19*_x32 + _x19 + _x20*_x21*_x3*_x34*_x4*_x6*cross_coupling_1*cross_coupling_2 - _x37*_x79 - _x44*_x79*_x81 - _x49*_x79*_x81 - _x78]
+
+
+def solution_14(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p_1
+    _x2 = _x0**p_2
+    _x3 = _x1*self_coupling_a
+    _x4 = _x2*self_coupling_b
+    _x5 = _x0**m_1
+    _x6 = _x0**m_2
+    _x7 = _x5*_x6*self_coupling_2
+    _x8 = _x7*self_coupling_1
+    _x9 = _x0**n_3
+    _x10 = _x0**n_1
+    _x11 = _x0**n_2
+    _x12 = _x10*_x11
+    _x13 = _x12*_x5*_x9*cross_coupling_1*cross_coupling_2
+    _x14 = cross_coupling_a**2
+    _x15 = cross_coupling_b**2
+    _x16 = self_coupling_b**2
+    _x17 = self_coupling_a**2
+    _x18 = _x14*_x15
+    _x19 = _x1*_x13*_x2
+    _x20 = _x16*_x19
+    _x21 = _x15*_x17
+    _x22 = self_coupling_1*self_coupling_a
+    _x23 = _x1*self_coupling_1
+    _x24 = _x23*self_coupling_b
+    _x25 = _x2*_x22
+    _x26 = cross_coupling_1**2
+    _x27 = _x7*self_coupling_a
+    _x28 = _x27*self_coupling_b
+    _x29 = self_coupling_1**2
+    _x30 = _x2*_x23
+    _x31 = _x14*_x30
+    _x32 = _x17*_x30
+    _x33 = _x1*_x7
+    _x34 = _x33*self_coupling_b
+    _x35 = _x26*_x34
+    _x36 = _x2*_x27
+    _x37 = _x26*_x36
+    _x38 = _x29*_x34
+    _x39 = _x29*_x36
+    _x40 = _x2*_x33
+    _x41 = _x26*_x40
+    _x42 = _x16*_x41
+    _x43 = _x29*_x40
+    _x44 = _x16*_x43
+    return _x12*(_x14*_x24 - _x14*_x35 - _x14*_x38 + _x14*_x42 + _x14*_x44 + _x15*_x25 - _x15*_x31 - _x15*_x32 - _x15*_x37 - _x15*_x39 + _x16*_x25 - _x16*_x31 - _x16*_x32 - _x16*_x37 - _x16*_x39 + _x17*_x24 - _x17*_x35 - _x17*_x38 + _x17*_x42 + _x17*_x44 + _x18*_x41 + _x18*_x43 + _x21*_x41 + _x21*_x43 - _x22*self_coupling_b + _x26*_x28 + _x28*_x29)/(_x1*_x10*_x11*_x14*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x10*_x11*_x17*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x2*_x5*_x6*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*self_coupling_a + _x10*_x11*_x15*_x2*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x10*_x11*_x16*_x2*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a - _x13*self_coupling_a*self_coupling_b - _x14*_x20 - _x17*_x20 - _x18*_x19 - _x19*_x21 + _x2*self_coupling_b - _x3*_x4 - _x3*_x8 - _x4*_x8 + _x5*_x6*self_coupling_1*self_coupling_2 - 1)
+
+
+def fraction_14(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = self_coupling_1*self_coupling_a
+    _x1 = cross_coupling_a**2
+    _x2 = unitary_loss_coefficient/z
+    _x3 = _x2**p_1
+    _x4 = _x3*self_coupling_1
+    _x5 = _x4*self_coupling_b
+    _x6 = cross_coupling_b**2
+    _x7 = _x2**p_2
+    _x8 = _x0*_x7
+    _x9 = self_coupling_b**2
+    _x10 = self_coupling_a**2
+    _x11 = cross_coupling_1**2
+    _x12 = _x2**m_1
+    _x13 = _x2**m_2
+    _x14 = _x12*_x13*self_coupling_2
+    _x15 = _x14*self_coupling_a
+    _x16 = _x15*self_coupling_b
+    _x17 = self_coupling_1**2
+    _x18 = _x4*_x7
+    _x19 = _x1*_x18
+    _x20 = _x10*_x18
+    _x21 = _x14*_x3
+    _x22 = _x21*self_coupling_b
+    _x23 = _x11*_x22
+    _x24 = _x15*_x7
+    _x25 = _x11*_x24
+    _x26 = _x17*_x22
+    _x27 = _x17*_x24
+    _x28 = _x21*_x7
+    _x29 = _x11*_x28
+    _x30 = _x1*_x6
+    _x31 = _x29*_x9
+    _x32 = _x10*_x6
+    _x33 = _x17*_x28
+    _x34 = _x33*_x9
+    _x35 = _x2**n_1
+    _x36 = _x2**n_2
+    _x37 = _x35*_x36
+    _x38 = _x3*self_coupling_a
+    _x39 = _x7*self_coupling_b
+    _x40 = _x14*self_coupling_1
+    _x41 = _x2**n_3
+    _x42 = _x12*_x37*_x41*cross_coupling_1*cross_coupling_2
+    _x43 = _x3*_x42*_x7
+    _x44 = _x43*_x9
+    return [_x37*(-_x0*self_coupling_b - _x1*_x23 - _x1*_x26 + _x1*_x31 + _x1*_x34 + _x1*_x5 - _x10*_x23 - _x10*_x26 + _x10*_x31 + _x10*_x34 + _x10*_x5 + _x11*_x16 + _x16*_x17 - _x19*_x6 - _x19*_x9 - _x20*_x6 - _x20*_x9 - _x25*_x6 - _x25*_x9 - _x27*_x6 - _x27*_x9 + _x29*_x30 + _x29*_x32 + _x30*_x33 + _x32*_x33 + _x6*_x8 + _x8*_x9), _x1*_x12*_x3*_x35*_x36*_x41*cross_coupling_1*cross_coupling_2*self_coupling_b - _x1*_x44 + _x10*_x12*_x3*_x35*_x36*_x41*cross_coupling_1*cross_coupling_2*self_coupling_b - _x10*_x44 + _x12*_x13*_x3*_x7*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x12*_x13*self_coupling_1*self_coupling_2 + _x12*_x35*_x36*_x41*_x6*_x7*cross_coupling_1*cross_coupling_2*self_coupling_a + _x12*_x35*_x36*_x41*_x7*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x3*self_coupling_a - _x30*_x43 - _x32*_x43 - _x38*_x39 - _x38*_x40 - _x39*_x40 - _x42*self_coupling_a*self_coupling_b + _x7*self_coupling_b - 1]
+
+
+def sensitivity_14(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = self_coupling_a*self_coupling_b
+    _x1 = _x0*self_coupling_1
+    _x2 = cross_coupling_a**2
+    _x3 = unitary_loss_coefficient/z
+    _x4 = _x3**p_1
+    _x5 = self_coupling_1*self_coupling_b
+    _x6 = _x4*_x5
+    _x7 = _x2*_x6
+    _x8 = cross_coupling_b**2
+    _x9 = _x3**p_2
+    _x10 = self_coupling_1*self_coupling_a
+    _x11 = _x10*_x9
+    _x12 = _x11*_x8
+    _x13 = self_coupling_b**2
+    _x14 = _x11*_x13
+    _x15 = self_coupling_a**2
+    _x16 = _x15*_x6
+    _x17 = cross_coupling_1**2
+    _x18 = _x3**m_1
+    _x19 = _x3**m_2
+    _x20 = _x18*_x19
+    _x21 = _x20*self_coupling_2
+    _x22 = _x0*_x21
+    _x23 = _x17*_x22
+    _x24 = self_coupling_1**2
+    _x25 = _x22*_x24
+    _x26 = _x9*self_coupling_1
+    _x27 = _x26*_x8
+    _x28 = _x2*_x4
+    _x29 = _x27*_x28
+    _x30 = _x13*_x26
+    _x31 = _x28*_x30
+    _x32 = _x15*_x4
+    _x33 = _x27*_x32
+    _x34 = _x30*_x32
+    _x35 = _x4*self_coupling_b
+    _x36 = _x2*_x35
+    _x37 = _x17*_x21
+    _x38 = _x36*_x37
+    _x39 = _x9*self_coupling_a
+    _x40 = _x39*_x8
+    _x41 = _x37*_x40
+    _x42 = _x13*_x39
+    _x43 = _x37*_x42
+    _x44 = _x15*_x35
+    _x45 = _x37*_x44
+    _x46 = _x21*_x24
+    _x47 = _x36*_x46
+    _x48 = _x40*_x46
+    _x49 = _x42*_x46
+    _x50 = _x44*_x46
+    _x51 = _x4*_x9
+    _x52 = _x2*_x51
+    _x53 = _x52*_x8
+    _x54 = _x37*_x53
+    _x55 = _x13*_x52
+    _x56 = _x37*_x55
+    _x57 = _x15*_x51
+    _x58 = _x57*_x8
+    _x59 = _x37*_x58
+    _x60 = _x13*_x57
+    _x61 = _x37*_x60
+    _x62 = _x46*_x53
+    _x63 = _x46*_x55
+    _x64 = _x46*_x58
+    _x65 = _x46*_x60
+    _x66 = _x3**n_1
+    _x67 = _x3**n_2
+    _x68 = _x66*_x67
+    _x69 = _x68*(-_x1 + _x12 + _x14 + _x16 + _x23 + _x25 - _x29 - _x31 - _x33 - _x34 - _x38 - _x41 - _x43 - _x45 - _x47 - _x48 - _x49 - _x50 + _x54 + _x56 + _x59 + _x61 + _x62 + _x63 + _x64 + _x65 + _x7)
+    _x70 = _x4*self_coupling_a
+    _x71 = _x9*self_coupling_b
+    _x72 = _x70*_x71
+    _x73 = _x21*self_coupling_1
+    _x74 = _x70*_x73
+    _x75 = _x71*_x73
+    _x76 = _x3**n_3
+    _x77 = _x18*_x68*_x76
+    _x78 = _x0*_x77
+    _x79 = _x78*cross_coupling_2
+    _x80 = _x79*cross_coupling_1
+    _x81 = _x77*cross_coupling_2
+    _x82 = _x81*cross_coupling_1
+    _x83 = _x53*_x82
+    _x84 = _x55*_x82
+    _x85 = _x58*_x82
+    _x86 = _x60*_x82
+    _x87 = unitary_loss_coefficient**(-1.0)
+    _x88 = _x69*_x87
+    _x89 = _x87*p_1
+    _x90 = _x87*p_2
+    _x91 = _x87*m_1
+    _x92 = _x87*m_2
+    _x93 = 2*cross_coupling_1
+    _x94 = _x21*_x93
+    _x95 = 2*cross_coupling_a
+    _x96 = _x4*_x95
+    _x97 = _x35*_x95
+    _x98 = _x51*_x95
+    _x99 = _x37*_x8
+    _x100 = _x13*_x98
+    _x101 = _x46*_x8
+    _x102 = 2*cross_coupling_b
+    _x103 = _x102*_x26
+    _x104 = _x102*_x39
+    _x105 = _x102*_x37
+    _x106 = _x102*_x46
+    _x107 = 2*_x21
+    _x108 = _x0*_x20
+    _x109 = _x17*_x20
+    _x110 = _x20*_x24
+    _x111 = 2*_x70
+    _x112 = _x21*self_coupling_b
+    _x113 = _x112*_x17
+    _x114 = _x112*_x24
+    _x115 = _x21*_x9
+    _x116 = _x115*_x17
+    _x117 = _x115*_x24
+    _x118 = _x70*_x9
+    _x119 = 2*_x118
+    _x120 = _x119*_x13
+    _x121 = _x4*self_coupling_1
+    _x122 = _x121*_x2
+    _x123 = _x121*_x15
+    _x124 = 2*_x71
+    _x125 = _x21*self_coupling_a
+    _x126 = _x125*_x17
+    _x127 = _x125*_x24
+    _x128 = _x4*_x71
+    _x129 = 2*_x128
+    _x130 = _x129*_x37
+    _x131 = _x129*_x46
+    _x132 = _x80*_x87
+    _x133 = _x87*n_1
+    _x134 = _x87*n_2
+    _x135 = _x87*n_3
+    _x136 = _x77*cross_coupling_1
+    _x137 = _x102*_x82
+    _x138 = _x20*self_coupling_1
+    _x139 = _x81*_x93
+    _x140 = _x118*_x139
+    _x141 = _x128*_x139
+    return [_x69, _x13*_x18*_x66*_x67*_x76*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x15*_x18*_x4*_x66*_x67*_x76*cross_coupling_1*cross_coupling_2*self_coupling_b + _x18*_x19*_x4*_x9*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x18*_x19*self_coupling_1*self_coupling_2 + _x18*_x2*_x4*_x66*_x67*_x76*cross_coupling_1*cross_coupling_2*self_coupling_b + _x18*_x66*_x67*_x76*_x8*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x4*self_coupling_a - _x72 - _x74 - _x75 - _x80 - _x83 - _x84 - _x85 - _x86 + _x9*self_coupling_b - 1, _x68*(_x12*_x90 + _x14*_x90 + _x16*_x89 + _x23*_x91 + _x23*_x92 + _x25*_x91 + _x25*_x92 - _x29*_x89 - _x29*_x90 - _x31*_x89 - _x31*_x90 - _x33*_x89 - _x33*_x90 - _x34*_x89 - _x34*_x90 - _x38*_x89 - _x38*_x91 - _x38*_x92 - _x41*_x90 - _x41*_x91 - _x41*_x92 - _x43*_x90 - _x43*_x91 - _x43*_x92 - _x45*_x89 - _x45*_x91 - _x45*_x92 - _x47*_x89 - _x47*_x91 - _x47*_x92 - _x48*_x90 - _x48*_x91 - _x48*_x92 - _x49*_x90 - _x49*_x91 - _x49*_x92 - _x50*_x89 - _x50*_x91 - _x50*_x92 + _x54*_x89 + _x54*_x90 + _x54*_x91 + _x54*_x92 + _x56*_x89 + _x56*_x90 + _x56*_x91 + _x56*_x92 + _x59*_x89 + _x59*_x90 + _x59*_x91 + _x59*_x92 + _x61*_x89 + _x61*_x90 + _x61*_x91 + _x61*_x92 + _x62*_x89 + _x62*_x90 + _x62*_x91 + _x62*_x92 + _x63*_x89 + _x63*_x90 + _x63*_x91 + _x63*_x92 + _x64*_x89 + _x64*_x90 + _x64*_x91 + _x64*_x92 + _x65*_x89 + _x65*_x90 + _x65*_x91 + _x65*_x92 + _x7*_x89) + _x88*n_1 + _x88*n_2, _x68*(_x22*_x93 - _x36*_x94 - _x40*_x94 - _x42*_x94 - _x44*_x94 + _x53*_x94 + _x55*_x94 + _x58*_x94 + _x60*_x94), 0, _x68*(_x100*_x37 + _x100*_x46 + _x101*_x98 - _x27*_x96 - _x30*_x96 - _x37*_x97 - _x46*_x97 + _x6*_x95 + _x98*_x99), _x68*(_x102*_x11 - _x103*_x28 - _x103*_x32 - _x104*_x37 - _x104*_x46 + _x105*_x52 + _x105*_x57 + _x106*_x52 + _x106*_x57), _x68*(-_x0 + _x1*_x107 - _x107*_x12 - _x107*_x14 - _x107*_x16 + _x107*_x29 + _x107*_x31 + _x107*_x33 + _x107*_x34 - _x107*_x7 + _x36 + _x40 + _x42 + _x44 - _x53 - _x55 - _x58 - _x60), _x68*(_x108*_x17 + _x108*_x24 - _x109*_x36 - _x109*_x40 - _x109*_x42 - _x109*_x44 + _x109*_x53 + _x109*_x55 + _x109*_x58 + _x109*_x60 - _x110*_x36 - _x110*_x40 - _x110*_x42 - _x110*_x44 + _x110*_x53 + _x110*_x55 + _x110*_x58 + _x110*_x60), _x68*(_x101*_x119 - _x111*_x113 - _x111*_x114 - _x111*_x27 - _x111*_x30 + _x111*_x5 + _x113 + _x114 - _x116*_x13 - _x116*_x8 - _x117*_x13 - _x117*_x8 + _x119*_x99 + _x120*_x37 + _x120*_x46 + _x27 + _x30 - _x5), _x68*(_x10*_x124 - _x10 - _x122*_x124 + _x122 - _x123*_x124 + _x123 - _x124*_x126 - _x124*_x127 + _x126 + _x127 + _x130*_x15 + _x130*_x2 + _x131*_x15 + _x131*_x2 - _x28*_x37 - _x28*_x46 - _x32*_x37 - _x32*_x46), _x13*_x18*_x66*_x67*_x76*_x87*_x9*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x13*_x18*_x66*_x67*_x76*_x87*_x9*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x13*_x18*_x66*_x67*_x76*_x87*_x9*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x13*_x18*_x66*_x67*_x76*_x87*_x9*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x13*_x18*_x66*_x67*_x76*_x87*_x9*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a - _x132*n_1 - _x132*n_2 - _x132*n_3 - _x133*_x83 - _x133*_x84 - _x133*_x85 - _x133*_x86 - _x134*_x83 - _x134*_x84 - _x134*_x85 - _x134*_x86 - _x135*_x83 - _x135*_x84 - _x135*_x85 - _x135*_x86 + _x15*_x18*_x4*_x66*_x67*_x76*_x87*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x15*_x18*_x4*_x66*_x67*_x76*_x87*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x15*_x18*_x4*_x66*_x67*_x76*_x87*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x15*_x18*_x4*_x66*_x67*_x76*_x87*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x15*_x18*_x4*_x66*_x67*_x76*_x87*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b + _x18*_x19*_x4*_x87*_x9*m_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x18*_x19*_x4*_x87*_x9*m_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x18*_x19*_x4*_x87*_x9*p_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x18*_x19*_x4*_x87*_x9*p_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x18*_x19*_x87*m_1*self_coupling_1*self_coupling_2 + _x18*_x19*_x87*m_2*self_coupling_1*self_coupling_2 + _x18*_x2*_x4*_x66*_x67*_x76*_x87*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x18*_x2*_x4*_x66*_x67*_x76*_x87*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x18*_x2*_x4*_x66*_x67*_x76*_x87*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x18*_x2*_x4*_x66*_x67*_x76*_x87*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x18*_x2*_x4*_x66*_x67*_x76*_x87*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b + _x18*_x66*_x67*_x76*_x8*_x87*_x9*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x18*_x66*_x67*_x76*_x8*_x87*_x9*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x18*_x66*_x67*_x76*_x8*_x87*_x9*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x18*_x66*_x67*_x76*_x8*_x87*_x9*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x18*_x66*_x67*_x76*_x8*_x87*_x9*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x4*_x87*p_1*self_coupling_a - _x70*_x73*_x89 - _x71*_x73*_x90 - _x72*_x89 - _x72*_x90 - _x74*_x91 - _x74*_x92 - _x75*_x91 - _x75*_x92 - _x80*_x91 - _x83*_x89 - _x83*_x90 - _x83*_x91 - _x84*_x89 - _x84*_x90 - _x84*_x91 - _x85*_x89 - _x85*_x90 - _x85*_x91 - _x86*_x89 - _x86*_x90 - _x86*_x91 + _x87*_x9*p_2*self_coupling_b, _x13*_x18*_x66*_x67*_x76*_x9*cross_coupling_2*self_coupling_a + _x15*_x18*_x4*_x66*_x67*_x76*cross_coupling_2*self_coupling_b + _x18*_x2*_x4*_x66*_x67*_x76*cross_coupling_2*self_coupling_b + _x18*_x66*_x67*_x76*_x8*_x9*cross_coupling_2*self_coupling_a - _x53*_x81 - _x55*_x81 - _x58*_x81 - _x60*_x81 - _x79, _x13*_x18*_x66*_x67*_x76*_x9*cross_coupling_1*self_coupling_a - _x136*_x53 - _x136*_x55 - _x136*_x58 - _x136*_x60 + _x15*_x18*_x4*_x66*_x67*_x76*cross_coupling_1*self_coupling_b + _x18*_x2*_x4*_x66*_x67*_x76*cross_coupling_1*self_coupling_b + _x18*_x66*_x67*_x76*_x8*_x9*cross_coupling_1*self_coupling_a - _x78*cross_coupling_1, -_x100*_x82 + 2*_x18*_x4*_x66*_x67*_x76*cross_coupling_1*cross_coupling_2*cross_coupling_a*self_coupling_b - _x8*_x82*_x98, -_x137*_x52 - _x137*_x57 + 2*_x18*_x66*_x67*_x76*_x9*cross_coupling_1*cross_coupling_2*cross_coupling_b*self_coupling_a, -_x21*_x70 - _x21*_x71 + _x21*_x72 + _x21, -_x138*_x70 - _x138*_x71 + _x138*_x72 + _x138, -_x121*_x21 - _x128 - _x13*_x140 + _x13*_x18*_x66*_x67*_x76*_x9*cross_coupling_1*cross_coupling_2 - _x140*_x8 + _x18*_x19*_x4*_x9*self_coupling_1*self_coupling_2*self_coupling_b + 2*_x18*_x4*_x66*_x67*_x76*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b + _x18*_x66*_x67*_x76*_x8*_x9*cross_coupling_1*cross_coupling_2 + _x4 - _x82*self_coupling_b, -_x118 - _x141*_x15 - _x141*_x2 + _x15*_x18*_x4*_x66*_x67*_x76*cross_coupling_1*cross_coupling_2 + _x18*_x19*_x4*_x9*self_coupling_1*self_coupling_2*self_coupling_a + _x18*_x2*_x4*_x66*_x67*_x76*cross_coupling_1*cross_coupling_2 + 2*_x18*_x66*_x67*_x76*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b - _x21*_x26 - _x82*self_coupling_a + _x9]
+
+
+def solution_15(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = unitary_loss_coefficient/z
+    _x1 = _x0**p_1
+    _x2 = _x0**p_2
+    _x3 = _x1*self_coupling_a
+    _x4 = _x2*self_coupling_b
+    _x5 = _x0**m_1
+    _x6 = _x0**m_2
+    _x7 = _x5*_x6*self_coupling_2
+    _x8 = _x7*self_coupling_1
+    _x9 = _x0**n_3
+    _x10 = _x0**n_1
+    _x11 = _x0**n_2
+    _x12 = _x10*_x11
+    _x13 = _x12*_x5*_x9*cross_coupling_1*cross_coupling_2
+    _x14 = cross_coupling_a**2
+    _x15 = cross_coupling_b**2
+    _x16 = self_coupling_b**2
+    _x17 = self_coupling_a**2
+    _x18 = _x1*_x13*_x2
+    _x19 = _x14*_x18
+    _x20 = _x17*_x18
+    _x21 = cross_coupling_1**2
+    _x22 = self_coupling_1**2
+    _x23 = _x1*_x7
+    _x24 = _x21*_x23
+    _x25 = _x22*_x23
+    return 1j*_x12*cross_coupling_b*(_x1*_x14*self_coupling_1 + _x1*_x17*self_coupling_1 - _x14*_x24 - _x14*_x25 - _x17*_x24 - _x17*_x25 + _x21*_x5*_x6*self_coupling_2*self_coupling_a + _x22*_x5*_x6*self_coupling_2*self_coupling_a - self_coupling_1*self_coupling_a)/(_x1*_x10*_x11*_x14*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x10*_x11*_x17*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_b + _x1*_x2*_x5*_x6*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x1*self_coupling_a + _x10*_x11*_x15*_x2*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a + _x10*_x11*_x16*_x2*_x5*_x9*cross_coupling_1*cross_coupling_2*self_coupling_a - _x13*self_coupling_a*self_coupling_b - _x15*_x19 - _x15*_x20 - _x16*_x19 - _x16*_x20 + _x2*self_coupling_b - _x3*_x4 - _x3*_x8 - _x4*_x8 + _x5*_x6*self_coupling_1*self_coupling_2 - 1)
+
+
+def fraction_15(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = self_coupling_1*self_coupling_a
+    _x1 = cross_coupling_a**2
+    _x2 = unitary_loss_coefficient/z
+    _x3 = _x2**p_1
+    _x4 = self_coupling_a**2
+    _x5 = cross_coupling_1**2
+    _x6 = _x2**m_1
+    _x7 = _x2**m_2
+    _x8 = self_coupling_1**2
+    _x9 = _x6*_x7*self_coupling_2
+    _x10 = _x3*_x9
+    _x11 = _x10*_x5
+    _x12 = _x10*_x8
+    _x13 = _x2**n_1
+    _x14 = _x2**n_2
+    _x15 = _x13*_x14
+    _x16 = _x2**p_2
+    _x17 = _x16*self_coupling_b
+    _x18 = _x2**n_3
+    _x19 = _x15*_x18*_x6*cross_coupling_1*cross_coupling_2
+    _x20 = cross_coupling_b**2
+    _x21 = self_coupling_b**2
+    _x22 = _x16*_x19*_x3
+    _x23 = _x1*_x22
+    _x24 = _x22*_x4
+    return [1j*_x15*cross_coupling_b*(-_x0 - _x1*_x11 - _x1*_x12 + _x1*_x3*self_coupling_1 - _x11*_x4 - _x12*_x4 + _x3*_x4*self_coupling_1 + _x5*_x6*_x7*self_coupling_2*self_coupling_a + _x6*_x7*_x8*self_coupling_2*self_coupling_a), -_x0*_x10 + _x1*_x13*_x14*_x18*_x3*_x6*cross_coupling_1*cross_coupling_2*self_coupling_b + _x13*_x14*_x16*_x18*_x20*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a + _x13*_x14*_x16*_x18*_x21*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a + _x13*_x14*_x18*_x3*_x4*_x6*cross_coupling_1*cross_coupling_2*self_coupling_b + _x16*_x3*_x6*_x7*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x16*self_coupling_b - _x17*_x3*self_coupling_a - _x17*_x9*self_coupling_1 - _x19*self_coupling_a*self_coupling_b - _x20*_x23 - _x20*_x24 - _x21*_x23 - _x21*_x24 + _x3*self_coupling_a + _x6*_x7*self_coupling_1*self_coupling_2 - 1]
+
+
+def sensitivity_15(z, unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    _x0 = self_coupling_1*self_coupling_a
+    _x1 = cross_coupling_a**2
+    _x2 = unitary_loss_coefficient/z
+    _x3 = _x2**p_1
+    _x4 = self_coupling_a**2
+    _x5 = cross_coupling_1**2
+    _x6 = _x2**m_1
+    _x7 = _x2**m_2
+    _x8 = self_coupling_1**2
+    _x9 = _x1*_x3
+    _x10 = _x6*_x7
+    _x11 = _x10*self_coupling_2
+    _x12 = _x11*_x5
+    _x13 = _x12*_x9
+    _x14 = _x3*_x4
+    _x15 = _x12*_x14
+    _x16 = _x11*_x8
+    _x17 = _x16*_x9
+    _x18 = _x14*_x16
+    _x19 = _x2**n_1
+    _x20 = _x2**n_2
+    _x21 = _x19*_x20
+    _x22 = 1j*_x21
+    _x23 = _x22*(-_x0 + _x1*_x3*self_coupling_1 - _x13 - _x15 - _x17 - _x18 + _x3*_x4*self_coupling_1 + _x5*_x6*_x7*self_coupling_2*self_coupling_a + _x6*_x7*_x8*self_coupling_2*self_coupling_a)
+    _x24 = _x23*cross_coupling_b
+    _x25 = _x2**p_2
+    _x26 = _x3*self_coupling_a
+    _x27 = _x25*self_coupling_b
+    _x28 = _x26*_x27
+    _x29 = _x0*_x3
+    _x30 = _x11*_x29
+    _x31 = _x11*self_coupling_1
+    _x32 = _x27*_x31
+    _x33 = cross_coupling_1*self_coupling_a
+    _x34 = _x2**n_3
+    _x35 = _x21*_x34*_x6
+    _x36 = _x35*self_coupling_b
+    _x37 = _x36*cross_coupling_2
+    _x38 = _x33*_x37
+    _x39 = cross_coupling_b**2
+    _x40 = self_coupling_b**2
+    _x41 = _x25*_x39
+    _x42 = _x35*cross_coupling_2
+    _x43 = _x42*cross_coupling_1
+    _x44 = _x41*_x43
+    _x45 = _x44*_x9
+    _x46 = _x25*_x40
+    _x47 = _x43*_x46
+    _x48 = _x47*_x9
+    _x49 = _x14*_x44
+    _x50 = _x14*_x47
+    _x51 = unitary_loss_coefficient**(-1.0)
+    _x52 = _x24*_x51
+    _x53 = _x51*m_1
+    _x54 = _x51*m_2
+    _x55 = _x51*p_1
+    _x56 = _x22*cross_coupling_b
+    _x57 = 2*_x11
+    _x58 = _x57*cross_coupling_1
+    _x59 = 2*_x3*cross_coupling_a
+    _x60 = _x10*_x5
+    _x61 = _x10*_x8
+    _x62 = 2*_x26
+    _x63 = _x51*p_2
+    _x64 = _x38*_x51
+    _x65 = _x51*n_1
+    _x66 = _x51*n_2
+    _x67 = _x51*n_3
+    _x68 = _x42*_x9
+    _x69 = _x14*_x42
+    _x70 = _x35*cross_coupling_1
+    _x71 = _x70*_x9
+    _x72 = _x14*_x70
+    _x73 = _x43*_x9
+    _x74 = 2*_x25*cross_coupling_b
+    _x75 = _x14*_x43
+    _x76 = _x10*self_coupling_1
+    _x77 = _x27*_x3
+    _x78 = _x25*_x26
+    _x79 = 2*_x43*_x78
+    _x80 = 2*_x27
+    return [_x24, _x1*_x19*_x20*_x3*_x34*_x6*cross_coupling_1*cross_coupling_2*self_coupling_b + _x19*_x20*_x25*_x34*_x39*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a + _x19*_x20*_x25*_x34*_x40*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a + _x19*_x20*_x3*_x34*_x4*_x6*cross_coupling_1*cross_coupling_2*self_coupling_b + _x25*_x3*_x6*_x7*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x25*self_coupling_b - _x28 + _x3*self_coupling_a - _x30 - _x32 - _x38 - _x45 - _x48 - _x49 - _x50 + _x6*_x7*self_coupling_1*self_coupling_2 - 1, _x52*n_1 + _x52*n_2 + _x56*(_x1*_x3*_x51*p_1*self_coupling_1 - _x13*_x53 - _x13*_x54 - _x13*_x55 - _x15*_x53 - _x15*_x54 - _x15*_x55 - _x17*_x53 - _x17*_x54 - _x17*_x55 - _x18*_x53 - _x18*_x54 - _x18*_x55 + _x3*_x4*_x51*p_1*self_coupling_1 + _x5*_x51*_x6*_x7*m_1*self_coupling_2*self_coupling_a + _x5*_x51*_x6*_x7*m_2*self_coupling_2*self_coupling_a + _x51*_x6*_x7*_x8*m_1*self_coupling_2*self_coupling_a + _x51*_x6*_x7*_x8*m_2*self_coupling_2*self_coupling_a), _x56*(-_x14*_x58 - _x58*_x9 + 2*_x6*_x7*cross_coupling_1*self_coupling_2*self_coupling_a), 0, _x56*(-_x12*_x59 - _x16*_x59 + 2*_x3*cross_coupling_a*self_coupling_1), _x23, _x56*(_x1*_x3 - _x14*_x57*self_coupling_1 + _x3*_x4 - _x57*_x9*self_coupling_1 + 2*_x6*_x7*self_coupling_1*self_coupling_2*self_coupling_a - self_coupling_a), _x56*(-_x14*_x60 - _x14*_x61 + _x5*_x6*_x7*self_coupling_a + _x6*_x7*_x8*self_coupling_a - _x60*_x9 - _x61*_x9), _x56*(-_x12*_x62 - _x16*_x62 + 2*_x3*self_coupling_1*self_coupling_a + _x5*_x6*_x7*self_coupling_2 + _x6*_x7*_x8*self_coupling_2 - self_coupling_1), 0, _x1*_x19*_x20*_x3*_x34*_x51*_x6*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x1*_x19*_x20*_x3*_x34*_x51*_x6*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x1*_x19*_x20*_x3*_x34*_x51*_x6*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x1*_x19*_x20*_x3*_x34*_x51*_x6*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x1*_x19*_x20*_x3*_x34*_x51*_x6*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b + _x19*_x20*_x25*_x34*_x39*_x51*_x6*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x19*_x20*_x25*_x34*_x39*_x51*_x6*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x19*_x20*_x25*_x34*_x39*_x51*_x6*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x19*_x20*_x25*_x34*_x39*_x51*_x6*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x19*_x20*_x25*_x34*_x39*_x51*_x6*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x19*_x20*_x25*_x34*_x40*_x51*_x6*cross_coupling_1*cross_coupling_2*m_1*self_coupling_a + _x19*_x20*_x25*_x34*_x40*_x51*_x6*cross_coupling_1*cross_coupling_2*n_1*self_coupling_a + _x19*_x20*_x25*_x34*_x40*_x51*_x6*cross_coupling_1*cross_coupling_2*n_2*self_coupling_a + _x19*_x20*_x25*_x34*_x40*_x51*_x6*cross_coupling_1*cross_coupling_2*n_3*self_coupling_a + _x19*_x20*_x25*_x34*_x40*_x51*_x6*cross_coupling_1*cross_coupling_2*p_2*self_coupling_a + _x19*_x20*_x3*_x34*_x4*_x51*_x6*cross_coupling_1*cross_coupling_2*m_1*self_coupling_b + _x19*_x20*_x3*_x34*_x4*_x51*_x6*cross_coupling_1*cross_coupling_2*n_1*self_coupling_b + _x19*_x20*_x3*_x34*_x4*_x51*_x6*cross_coupling_1*cross_coupling_2*n_2*self_coupling_b + _x19*_x20*_x3*_x34*_x4*_x51*_x6*cross_coupling_1*cross_coupling_2*n_3*self_coupling_b + _x19*_x20*_x3*_x34*_x4*_x51*_x6*cross_coupling_1*cross_coupling_2*p_1*self_coupling_b + _x25*_x3*_x51*_x6*_x7*m_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x25*_x3*_x51*_x6*_x7*m_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x25*_x3*_x51*_x6*_x7*p_1*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x25*_x3*_x51*_x6*_x7*p_2*self_coupling_1*self_coupling_2*self_coupling_a*self_coupling_b + _x25*_x51*p_2*self_coupling_b - _x27*_x31*_x63 - _x28*_x55 - _x28*_x63 + _x3*_x51*p_1*self_coupling_a - _x30*_x53 - _x30*_x54 - _x30*_x55 - _x32*_x53 - _x32*_x54 - _x38*_x53 - _x45*_x53 - _x45*_x55 - _x45*_x63 - _x45*_x65 - _x45*_x66 - _x45*_x67 - _x48*_x53 - _x48*_x55 - _x48*_x63 - _x48*_x65 - _x48*_x66 - _x48*_x67 - _x49*_x53 - _x49*_x55 - _x49*_x63 - _x49*_x65 - _x49*_x66 - _x49*_x67 - _x50*_x53 - _x50*_x55 - _x50*_x63 - _x50*_x65 - _x50*_x66 - _x50*_x67 + _x51*_x6*_x7*m_1*self_coupling_1*self_coupling_2 + _x51*_x6*_x7*m_2*self_coupling_1*self_coupling_2 - _x64*n_1 - _x64*n_2 - _x64*n_3, _x1*_x19*_x20*_x3*_x34*_x6*cross_coupling_2*self_coupling_b + _x19*_x20*_x25*_x34*_x39*_x6*cross_coupling_2*self_coupling_a + _x19*_x20*_x25*_x34*_x40*_x6*cross_coupling_2*self_coupling_a + _x19*_x20*_x3*_x34*_x4*_x6*cross_coupling_2*self_coupling_b - _x37*self_coupling_a - _x41*_x68 - _x41*_x69 - _x46*_x68 - _x46*_x69, _x1*_x19*_x20*_x3*_x34*_x6*cross_coupling_1*self_coupling_b + _x19*_x20*_x25*_x34*_x39*_x6*cross_coupling_1*self_coupling_a + _x19*_x20*_x25*_x34*_x40*_x6*cross_coupling_1*self_coupling_a + _x19*_x20*_x3*_x34*_x4*_x6*cross_coupling_1*self_coupling_b - _x33*_x36 - _x41*_x71 - _x41*_x72 - _x46*_x71 - _x46*_x72, 2*_x19*_x20*_x3*_x34*_x6*cross_coupling_1*cross_coupling_2*cross_coupling_a*self_coupling_b - _x44*_x59 - _x47*_x59, 2*_x19*_x20*_x25*_x34*_x6*cross_coupling_1*cross_coupling_2*cross_coupling_b*self_coupling_a - _x73*_x74 - _x74*_x75, -_x11*_x26 - _x11*_x27 + _x11*_x28 + _x11, _x0*_x10*_x77 - _x10*_x29 - _x27*_x76 + _x76, _x19*_x20*_x25*_x34*_x39*_x6*cross_coupling_1*cross_coupling_2 + _x19*_x20*_x25*_x34*_x40*_x6*cross_coupling_1*cross_coupling_2 + 2*_x19*_x20*_x3*_x34*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b + _x25*_x3*_x6*_x7*self_coupling_1*self_coupling_2*self_coupling_b - _x3*_x31 + _x3 - _x37*cross_coupling_1 - _x39*_x79 - _x40*_x79 - _x77, _x1*_x19*_x20*_x3*_x34*_x6*cross_coupling_1*cross_coupling_2 + 2*_x19*_x20*_x25*_x34*_x6*cross_coupling_1*cross_coupling_2*self_coupling_a*self_coupling_b + _x19*_x20*_x3*_x34*_x4*_x6*cross_coupling_1*cross_coupling_2 + _x25*_x3*_x6*_x7*self_coupling_1*self_coupling_2*self_coupling_a - _x25*_x31 + _x25 - _x33*_x42 - _x73*_x80 - _x75*_x80 - _x78]
+
+
+def intrinsic_fwhm(unitary_loss_coefficient, m_1, m_2, n_1, n_2, n_3, p_1, p_2, cross_coupling_1, cross_coupling_2, cross_coupling_a, cross_coupling_b, self_coupling_1, self_coupling_2, self_coupling_a, self_coupling_b):
+    return 2 - 2*unitary_loss_coefficient**(m_1 + m_2)
+
+
+SOLUTIONS = (solution_0, solution_1, solution_2, solution_3, solution_4, solution_5, solution_6, solution_7, solution_8, solution_9, solution_10, solution_11, solution_12, solution_13, solution_14, solution_15,)
+FRACTIONS = (fraction_0, fraction_1, fraction_2, fraction_3, fraction_4, fraction_5, fraction_6, fraction_7, fraction_8, fraction_9, fraction_10, fraction_11, fraction_12, fraction_13, fraction_14, fraction_15,)
+SENSITIVITIES = (sensitivity_0, sensitivity_1, sensitivity_2, sensitivity_3, sensitivity_4, sensitivity_5, sensitivity_6, sensitivity_7, sensitivity_8, sensitivity_9, sensitivity_10, sensitivity_11, sensitivity_12, sensitivity_13, sensitivity_14, sensitivity_15,)
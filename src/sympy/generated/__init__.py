@@ -0,0 +1 @@
+""" NumPy modules generated by src.sympy.codegen, loaded by src.sympy.runtime. """
@@ -0,0 +1,232 @@
+# third party imports
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+
+# local imports
+from src.sympy.numeric import NumericCircuit
+from src.sympy.utils import batch_polynomial_roots, lossless_self_couplings
+
+# type hinting
+from collections.abc import Sequence
+
+
+def _rows_horner(coefficients: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """ Evaluate the polynomial of each row of coefficients, in increasing powers, at the point of the same row. """
+    result = np.zeros(len(x), dtype=np.complex128)
+    for coefficient in coefficients.T[::-1]:
+        result = result * x + coefficient
+    return result
+
+
+def batch_resonance_fwhm(
+        numerators: np.ndarray,
+        denominators: np.ndarray,
+        omega: float = np.pi,
+        refine: bool = True,
+        num_iterations: int = 60,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the center, FWHM and peak intensity of the resonance closest to ω of a batch of transfer functions, as
+    NumericCircuit.resonance_fwhm does for one: from the dominant pole, with an optional refinement on the
+    actual response. The poles are the eigenvalues of the batched companion matrices, and the refinement runs a
+    golden section search of the peak and bisections of the half maximum crossings on all the designs at once.
+
+    Args:
+        numerators (np.ndarray): The numerator coefficients in z^-1, with dimensions
+            (num_designs, num_numerator_coefficients).
+        denominators (np.ndarray): The denominator coefficients in z^-1, with a_0 = 1, with dimensions
+            (num_designs, num_denominator_coefficients).
+        omega (float): The normalized angular frequency near the resonance.
+        refine (bool): Whether to refine the pole estimate on the actual response.
+        num_iterations (int): The number of iterations of the golden section search and of the bisections.
+
+    Returns:
+        np.ndarray: The centers, with dimensions (num_designs,).
+        np.ndarray: The FWHMs, nan where the response does not fall to half maximum within half a turn.
+        np.ndarray: The peak intensities.
+    """
+    num_designs = len(denominators)
+    designs = np.arange(num_designs)
+
+    # poles as roots of z^(K-1) sum_n a_n z^-n, the trailing zero coefficients give poles at 0
+    poles = batch_polynomial_roots(denominators)
+    distances = np.where(np.abs(poles) > 0, np.abs(poles - np.exp(1j * omega)), np.inf)
+    dominant_poles = poles[designs, np.argmin(distances, axis=1)]
+    radii = np.abs(dominant_poles)
+    centers = np.angle(dominant_poles) % (2 * np.pi)
+    fwhms = 2 * np.arccos(np.clip(1 - (1 - radii) ** 2 / (2 * radii), -1, 1))
+
+    def intensity(w):
+        inverse_z = np.exp(-1j * w)
+        return np.square(np.abs(_rows_horner(numerators, inverse_z) / _rows_horner(denominators, inverse_z)))
+
+    if not refine:
+        return centers, fwhms, intensity(centers)
+
+    # golden section search of the peak within one estimated FWHM of the pole
+    ratio = (np.sqrt(5) - 1) / 2
+    low, high = centers - fwhms, centers + fwhms
+    for _ in range(num_iterations):
+        left, right = high - ratio * (high - low), low + ratio * (high - low)
+        move_right = intensity(left) < intensity(right)
+        low = np.where(move_right, left, low)
+        high = np.where(move_right, high, right)
+    centers = (low + high) / 2
+    peaks = intensity(centers)
+    half_maxima = peaks / 2
+
+    def crossing(direction):
+        # the bracket is widened until the intensity falls below half maximum, within half a turn
+        widths = fwhms.copy()
+        above = intensity(centers + direction * widths) > half_maxima
+        while np.any(above & (widths <= np.pi)):
+            widths = np.where(above, 2 * widths, widths)
+            above = intensity(centers + direction * widths) > half_maxima
+        inner, outer = np.zeros(num_designs), widths
+        for _ in range(num_iterations):
+            middle = (inner + outer) / 2
+            is_above = intensity(centers + direction * middle) > half_maxima
+            inner, outer = np.where(is_above, middle, inner), np.where(is_above, outer, middle)
+        return np.where(above, np.nan, (inner + outer) / 2)
+
+    return centers, crossing(1) + crossing(-1), peaks
+
+
+class ExtractionEfficiencyMap:
+    """ Extraction efficiency, center, FWHM and peak intensity of the main resonance over a grid of parameters.
+    Each array has the dimensions of the grid, (len(grid_1), len(grid_2), ...), in the order of grids. """
+
+    def __init__(
+            self,
+            grids: dict,
+            efficiencies: np.ndarray,
+            centers: np.ndarray,
+            fwhms: np.ndarray,
+            peaks: np.ndarray,
+    ):
+        """ Initialize the class. """
+        self.grids = grids
+        self.efficiencies = efficiencies
+        self.centers = centers
+        self.fwhms = fwhms
+        self.peaks = peaks
+
+    def __str__(self):
+        """ Return a string representation of the object. """
+        return f"ExtractionEfficiencyMap over {', '.join(self.grids)} {self.efficiencies.shape}"
+
+    @property
+    def best(self) -> dict:
+        """ Return the grid parameters of the highest extraction efficiency. """
+        if np.all(np.isnan(self.efficiencies)):
+            raise ValueError(f"In {self} no design has a resolved resonance.")
+        index = np.unravel_index(np.nanargmax(self.efficiencies), self.efficiencies.shape)
+        return {key: grid[i] for (key, grid), i in zip(self.grids.items(), index)}
+
+
+def _efficiency_chunk(
+        circuit: NumericCircuit,
+        parameters: dict,
+        pin: int,
+        omega: float,
+        refine: bool,
+        max_fwhm_fraction: float,
+        min_contrast: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """ Evaluate the extraction efficiency of a chunk of designs, given as a dict of (num_designs,) arrays, nan for
+    the designs without a resolved resonance. """
+    num_designs = len(next(iter(parameters.values())))
+    delays = np.stack([parameters[key] for key in circuit.delay_parameters], axis=1) if circuit.delay_parameters \
+        else np.zeros((num_designs, 0))
+    centers, fwhms, peaks = np.zeros(num_designs), np.zeros(num_designs), np.zeros(num_designs)
+    contrasts = np.zeros(num_designs)
+    samples = np.linspace(0, 2 * np.pi, 256, endpoint=False)
+
+    # the designs are grouped by delays, which fix the degree of the polynomials
+    _, groups = np.unique(delays, axis=0, return_inverse=True)
+    for group in np.unique(groups):
+        indices = np.flatnonzero(groups.reshape(-1) == group)
+        group_parameters = {key: values[indices] for key, values in parameters.items()}
+        circuit.numeric_parameters = group_parameters
+        numerators, denominators = circuit.batch_polynomial_coefficients(pin)
+        centers[indices], fwhms[indices], peaks[indices] = batch_resonance_fwhm(
+            numerators, denominators, omega, refine)
+        # the peak over the off-resonance level, the minimum of the intensity sampled on the unit circle
+        powers = np.exp(-1j * np.outer(np.arange(max(numerators.shape[1], denominators.shape[1])), samples))
+        intensities = np.square(np.abs((numerators @ powers[:numerators.shape[1]])
+                                       / (denominators @ powers[:denominators.shape[1]])))
+        with np.errstate(divide='ignore'):
+            contrasts[indices] = peaks[indices] / np.min(intensities, axis=1)
+    # the intrinsic FWHM only involves arithmetic on the parameters, which broadcasts over the designs
+    circuit.numeric_parameters = parameters
+    efficiencies = 1 - circuit._intrinsic_fwhm / fwhms
+    resolved = (fwhms <= max_fwhm_fraction * 2 * np.pi) & (contrasts >= min_contrast)
+    return np.where(resolved, efficiencies, np.nan), centers, fwhms, peaks
+
+
+def extraction_efficiency_map(
+        circuit: NumericCircuit,
+        grids: dict[str, Sequence],
+        pin: int = 1,
+        omega: float = np.pi,
+        refine: bool = True,
+        max_fwhm_fraction: float = 0.1,
+        min_contrast: float = 10,
+        lossless_couplers: bool = True,
+        max_workers: int = None,
+        chunk_size: int = 10000,
+) -> ExtractionEfficiencyMap:
+    """
+    Computes the extraction efficiency of the main resonance, as main_extraction_efficiency, over the Cartesian
+    product of grids of some parameters, the others being the numeric parameters of the circuit.
+
+    The designs are processed in chunks: in each chunk the polynomial coefficients are computed with the compiled
+    kernels for all the designs sharing the same delays at once, and the resonances are analyzed with
+    batch_resonance_fwhm. The chunks are distributed to a pool of processes. The efficiency is nan for the designs
+    without a resolved resonance: a FWHM above max_fwhm_fraction of a turn, not found, or a peak less than min_contrast
+    times the off-resonance intensity, the minimum of the intensity sampled on the unit circle. The broad and shallow
+    resonances of strongly overcoupled designs, with an efficiency close to 1, are excluded this way.
+
+    Args:
+        circuit (NumericCircuit): The circuit, whose numeric parameters are used outside of the grids.
+        grids (dict[str, Sequence]): The values of the mapped parameters, e.g. {"cross_coupling_1": ...,
+            "cross_coupling_2": ...}.
+        pin (int): The pin of the resonance.
+        omega (float): The normalized angular frequency near the resonance.
+        refine (bool): Whether to refine the pole estimate on the actual response.
+        max_fwhm_fraction (float): The largest FWHM of a resolved resonance, as a fraction of 2π.
+        min_contrast (float): The smallest ratio of the peak intensity to the off-resonance intensity of a resolved
+            resonance, 10 dB by default.
+        lossless_couplers (bool): Whether the self coupling of each mapped cross coupling is set to
+            sqrt(1 - cross_coupling^2), as in the dashboard pages.
+        max_workers (int): The number of worker processes, 1 to compute in this process.
+        chunk_size (int): The number of designs of each chunk.
+
+    Returns:
+        ExtractionEfficiencyMap: The maps, with the dimensions of the grids.
+    """
+    unknown = set(grids) - set(circuit.parameter_names)
+    if unknown:
+        raise ValueError(f"Grid parameters {sorted(unknown)} are not parameters of {circuit}")
+    grids = {key: np.asarray(values) for key, values in grids.items()}
+    shape = tuple(len(values) for values in grids.values())
+    mesh = np.meshgrid(*grids.values(), indexing="ij")
+    parameters = {key: np.broadcast_to(value, shape).reshape(-1) for key, value in circuit.numeric_parameters.items()}
+    parameters.update({key: values.reshape(-1) for key, values in zip(grids, mesh)})
+    if lossless_couplers:
+        parameters = lossless_self_couplings(parameters, grids)
+    missing = set(circuit.parameter_names) - set(parameters)
+    if missing:
+        raise ValueError(f"Numeric parameters {sorted(missing)} must be set before calling extraction_efficiency_map")
+
+    num_designs = int(np.prod(shape))
+    chunks = [{key: values[start:start + chunk_size] for key, values in parameters.items()}
+              for start in range(0, num_designs, chunk_size)]
+    arguments = [(circuit.copy(), chunk, pin, omega, refine, max_fwhm_fraction, min_contrast) for chunk in chunks]
+    if max_workers == 1 or len(chunks) == 1:
+        results = [_efficiency_chunk(*argument) for argument in arguments]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_efficiency_chunk, *zip(*arguments)))
+    efficiencies, centers, fwhms, peaks = (np.concatenate(result).reshape(shape) for result in zip(*results))
+    return ExtractionEfficiencyMap(grids, efficiencies, centers, fwhms, peaks)
@@ -0,0 +1,785 @@
+""" Numeric methods of the z-domain circuits, shared by the SymPy and the generated circuits, without sympy. """
+# third party imports
+import numpy as np
+import plotly.graph_objects as go
+from abc import ABC, abstractmethod
+from scipy.optimize import brentq, minimize_scalar
+from scipy.signal import find_peaks
+
+# local imports
+from src.sympy.utils import pole_zero_plot, compute_fwhm, polynomial_roots, chirp_z_arc
+from src.sympy.filters import polynomial_sos, StreamingIIRFilter
+from src.sympy.root_locus import root_locus, RootLocus
+from src.rational import horner
+
+# type hinting
+from typing import Any, Callable
+from collections.abc import Sequence
+from numpy import ndarray, dtype, floating
+from numpy._typing import _64Bit
+
+def _merge_bands(bands: list[tuple[ndarray, ndarray]]) -> tuple[ndarray, ndarray]:
+    """ Merge the angular frequencies and values of bands, e.g. a coarse band and finer zooms, in increasing angular
+    frequency, to plot them as one line. """
+    omega = np.concatenate([band[0] for band in bands])
+    order = np.argsort(omega, kind="stable")
+    return omega[order], np.concatenate([band[1] for band in bands])[order]
+
+
+class NumericCircuit(ABC):
+    num_pins = 1
+
+    def __init__(self, numeric_parameters=None):
+        if numeric_parameters is None:
+            numeric_parameters = {}
+        self._numeric_parameters = numeric_parameters
+        # numeric results (polynomial coefficients, poles and zeros) keyed by (kind, pin, parameter values)
+        self._numeric_cache = {}
+
+    @property
+    @abstractmethod
+    def parameter_names(self) -> list[str]:
+        """
+        Returns the names of the parameters, in the order of the arguments of the kernels.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def delay_parameters(self) -> list[str]:
+        """
+        Returns the names of the integer delay parameters, the exponents of (γ z^-1) in the equations.
+        """
+        pass
+
+    @abstractmethod
+    def kernel(
+            self,
+            pin
+    ) -> Callable:
+        """
+        Returns the function kernel(z, *parameters) evaluating the solution for a given pin, of z and of the
+        parameters in the order of parameter_names, broadcast against each other.
+        """
+        pass
+
+    @abstractmethod
+    def specialized_kernel(
+            self,
+            pin,
+            delays: tuple[int, ...],
+            part: str = "solution"
+    ) -> Callable:
+        """
+        Returns the function kernel(z, *parameters) evaluating the solution for a given pin ("solution") or the list
+        [numerator, denominator] of its fraction ("fraction"), for the given integer delays, of z and of the
+        continuous parameters in the order of continuous_parameters.
+        """
+        pass
+
+    @abstractmethod
+    def sensitivity_kernel(
+            self,
+            pin
+    ) -> Callable:
+        """
+        Returns the function kernel(z, *parameters) of z and of the parameters in the order of parameter_names,
+        returning the list [N, D, ∂N/∂θ_1, ..., ∂N/∂θ_P, ∂D/∂θ_1, ..., ∂D/∂θ_P] of the numerator N and denominator D
+        of the solution for a given pin and of their derivatives, θ being the continuous parameters in the order of
+        continuous_parameters.
+        """
+        pass
+
+    def copy(self) -> "NumericCircuit":
+        """
+        Returns a new instance of the circuit with a copy of the numeric parameters and an empty numeric cache.
+        """
+        return self.__class__(dict(self.numeric_parameters))
+
+    @property
+    def numeric_parameters(self) -> dict:
+        return self._numeric_parameters
+
+    @numeric_parameters.setter
+    def numeric_parameters(self, value: dict):
+        if not set(value.keys()) == set(self.parameter_names):
+            raise ValueError("Keys of numeric_parameters must match parameter_names")
+        self._numeric_parameters = value
+
+    def evaluate(
+            self,
+            pin,
+            z,
+            parameters: dict = None
+    ) -> ndarray:
+        """
+        Evaluates the solution for a given pin with the compiled kernel specialized to the delays, or with the
+        general kernel if the delays are arrays.
+
+        Args:
+            pin (int): The pin for which the solution is evaluated.
+            z (np.ndarray): The values of z.
+            parameters (dict): Values overriding the numeric parameters, e.g. arrays of values over a parameter grid,
+                broadcast against z and against each other.
+
+        Returns:
+            np.ndarray: The solution, with the broadcast dimensions of z and of the parameters.
+        """
+        values = {**self.numeric_parameters, **(parameters or {})}
+        missing = set(self.parameter_names) - set(values)
+        if missing:
+            raise ValueError(f"Numeric parameters {sorted(missing)} must be set before calling evaluate")
+        delays = [values[key] for key in self.delay_parameters]
+        if all(np.ndim(delay) == 0 for delay in delays):
+            kernel = self.specialized_kernel(pin, delays)
+            return kernel(z, *(values[key] for key in self.continuous_parameters))
+        return self.kernel(pin)(z, *(values[key] for key in self.parameter_names))
+
+    def intensity_sensitivities(
+            self,
+            pin,
+            omega: np.ndarray[Any, np.dtype[np.float64]] = np.linspace(0, 2 * np.pi, 10000),
+            parameters: dict = None
+    ) -> dict[str, ndarray]:
+        """
+        Returns the derivatives ∂|H(ω)|^2/∂θ of the intensity response for a given pin with respect to every continuous
+        parameter θ, from one evaluation of the sensitivity kernel: with H = N / D,
+        ∂H/∂θ = (∂N/∂θ D - N ∂D/∂θ) / D^2 and ∂|H|^2/∂θ = 2 Re(conj(H) ∂H/∂θ), the parameters being real. The self
+        and cross couplings are independent parameters, the derivatives do not follow sqrt(1 - cross_coupling^2).
+
+        Args:
+            pin (int): The pin for which the sensitivities are returned.
+            omega (np.ndarray[Any, np.dtype[np.float64]]): The angular frequency vector.
+            parameters (dict): Values overriding the numeric parameters, broadcast against omega and against each
+                other.
+
+        Returns:
+            dict[str, np.ndarray]: The derivatives, keyed by the names of the continuous parameters, with the
+                broadcast dimensions of omega and of the parameters.
+        """
+        values = {**self.numeric_parameters, **(parameters or {})}
+        missing = set(self.parameter_names) - set(values)
+        if missing:
+            raise ValueError(f"Numeric parameters {sorted(missing)} must be set before calling intensity_sensitivities")
+        z = np.exp(1j * np.asarray(omega))
+        arguments = [z, *(values[key] for key in self.parameter_names)]
+        outputs = self.sensitivity_kernel(pin)(*arguments)
+        # constant outputs, e.g. vanishing derivatives, are broadcast to the dimensions of the arguments
+        shape = np.broadcast_shapes(*(np.shape(value) for value in arguments + list(outputs)))
+        numerator, denominator, *derivatives = (np.broadcast_to(output, shape) for output in outputs)
+        num_parameters = len(self.continuous_parameters)
+        response = numerator / denominator
+        return {
+            key: 2 * np.real(np.conj(response) * (numerator_derivative * denominator
+                                                   - numerator * denominator_derivative) / denominator ** 2)
+            for key, numerator_derivative, denominator_derivative in
+            zip(self.continuous_parameters, derivatives[:num_parameters], derivatives[num_parameters:])
+        }
+
+    @property
+    def _parameter_values(self) -> tuple:
+        """
+        Returns the numeric parameter values in the order of parameter_names, the key of the numeric cache.
+        """
+        return tuple(self.numeric_parameters[key] for key in self.parameter_names)
+
+    @property
+    def continuous_parameters(self) -> list[str]:
+        """
+        Returns the names of the parameters that are not delays, in the order of parameter_names.
+        """
+        return [key for key in self.parameter_names if key not in self.delay_parameters]
+
+    def batch_polynomial_coefficients(
+            self,
+            pin,
+            parameters: dict = None
+    ) -> tuple[ndarray, ndarray]:
+        """
+        Returns the polynomial coefficients in z^-1 of the solution for a given pin for a batch of parameter sets
+        with the same delays, see polynomial_coefficients. They are not cached, only the trailing coefficients that are
+        zero for all the designs are trimmed.
+
+        Args:
+            pin (int): The pin for which the coefficients are returned.
+            parameters (dict): Values overriding the numeric parameters, (num_designs,) arrays or scalars. The delay
+                parameters must be the same for all the designs.
+
+        Returns:
+            np.ndarray: The numerator coefficients, with dimensions (num_designs, num_numerator_coefficients).
+            np.ndarray: The denominator coefficients normalized so that a_0 = 1, with dimensions
+                (num_designs, num_denominator_coefficients).
+        """
+        values = {**self.numeric_parameters, **(parameters or {})}
+        missing = set(self.parameter_names) - set(values)
+        if missing:
+            raise ValueError(f"Numeric parameters {sorted(missing)} must be set before calling polynomial_coefficients")
+        delays = [np.unique(values[key]) for key in self.delay_parameters]
+        if any(len(delay) != 1 for delay in delays):
+            raise ValueError(f"Delay parameters {self.delay_parameters} must be the same for all the designs")
+        delays = [delay[0] for delay in delays]
+        if any(delay != int(delay) or delay < 0 for delay in delays):
+            raise ValueError(f"Delay parameters {self.delay_parameters} must be non-negative integers, got {delays}")
+        values = np.broadcast_arrays(*(np.atleast_1d(values[key]) for key in self.continuous_parameters))
+        fraction_kernel = self.specialized_kernel(pin, delays, "fraction")
+
+        # each delay appears once in the equations, bounding the degree by the total delay
+        num_points = 1 << int(sum(delays)).bit_length()
+        test_point = 0.9 * np.exp(0.7j)
+        while True:
+            inverse_z = np.append(np.exp(2j * np.pi * np.arange(num_points) / num_points), test_point)[:, np.newaxis]
+            shape = (len(inverse_z), len(values[0]))
+            samples = [np.broadcast_to(sample, shape) for sample in fraction_kernel(1 / inverse_z, *values)]
+            numerator, denominator = (np.fft.fft(sample[:-1], axis=0).T / num_points for sample in samples)
+            interpolated = horner(np.stack((numerator, denominator)), [test_point])[0]
+            if np.allclose(interpolated, [samples[0][-1], samples[1][-1]], rtol=1e-8, atol=0):
+                break
+            if num_points >= 1 << 20:
+                raise ValueError(f"The solution for pin {pin} is not a polynomial fraction of degree below {num_points}")
+            num_points *= 2
+
+        # the denominator is normalized by its first non-zero coefficient
+        scale = np.maximum(np.max(np.abs(numerator), axis=1), np.max(np.abs(denominator), axis=1))[:, np.newaxis]
+        numerator, denominator = (np.where(np.abs(c) > 1e-13 * scale, c, 0) for c in (numerator, denominator))
+        first = np.argmax(denominator != 0, axis=1)
+        normalization = denominator[np.arange(len(first)), first][:, np.newaxis]
+        lengths = [max(np.flatnonzero(np.any(c != 0, axis=0)), default=0) + 1 for c in (numerator, denominator)]
+        return numerator[:, :lengths[0]] / normalization, denominator[:, :lengths[1]] / normalization
+
+    def polynomial_coefficients(
+            self,
+            pin
+    ) -> tuple[ndarray, ndarray]:
+        """
+        Returns the numerator and denominator polynomial coefficients in z^-1 of the solution for a given pin, for the
+        current numeric parameters: H(z) = sum_n b_n z^-n / sum_n a_n z^-n, normalized so that a_0 = 1.
+
+        The numerator and denominator of the solution are sampled on the roots of unity and interpolated by an FFT,
+        whose size is doubled until the polynomials match the solution off the unit circle. The coefficients are
+        cached for each set of parameter values.
+
+        Args:
+            pin (int): The pin for which the coefficients are returned.
+
+        Returns:
+            np.ndarray: The numerator coefficients b_n.
+            np.ndarray: The denominator coefficients a_n.
+        """
+        if not self.numeric_parameters:
+            raise ValueError("Numeric parameters must be set before calling polynomial_coefficients")
+        key = ("polynomial", pin, self._parameter_values)
+        if key not in self._numeric_cache:
+            numerator, denominator = (c[0] for c in self.batch_polynomial_coefficients(pin))
+            # trailing zero coefficients are trimmed
+            numerator = np.trim_zeros(numerator, 'b')
+            numerator = numerator if len(numerator) else np.zeros(1, dtype=complex)
+            self._numeric_cache[key] = numerator, np.trim_zeros(denominator, 'b')
+        return self._numeric_cache[key]
+
+    def poles_zeros(
+            self,
+            pin
+    ) -> tuple[ndarray, ndarray]:
+        """
+        Returns the zeros and poles in the z-plane of the solution for a given pin, for the current numeric
+        parameters, computed from its polynomial coefficients as eigenvalues of balanced companion matrices, without
+        sympy. The difference between the numerator and denominator degrees is placed at the origin. The result is
+        cached for each set of parameter values.
+
+        Args:
+            pin (int): The pin for which the zeros and poles are returned.
+
+        Returns:
+            np.ndarray: The zeros.
+            np.ndarray: The poles.
+        """
+        if not self.numeric_parameters:
+            raise ValueError("Numeric parameters must be set before calling poles_zeros")
+        key = ("poles_zeros", pin, self._parameter_values)
+        if key not in self._numeric_cache:
+            numerator, denominator = self.polynomial_coefficients(pin)
+            # in z, H(z) = z^(len(a) - len(b)) sum_n b_n z^(len(b) - 1 - n) / sum_n a_n z^(len(a) - 1 - n)
+            origin = np.zeros(abs(len(denominator) - len(numerator)), dtype=complex)
+            zeros, poles = polynomial_roots(numerator), polynomial_roots(denominator)
+            if len(denominator) > len(numerator):
+                zeros = np.concatenate((zeros, origin))
+            else:
+                poles = np.concatenate((poles, origin))
+            self._numeric_cache[key] = zeros, poles
+        return self._numeric_cache[key]
+
+    def frequency_response(
+            self,
+            pin: int,
+            omega: np.ndarray[Any, np.dtype[np.float64]] | int = 10000,
+    ) -> tuple[ndarray, ndarray]:
+        """
+        Evaluates the solution for a given pin on the unit circle z = exp(iω) from its polynomial coefficients.
+
+        Args:
+            pin (int): The pin for which the frequency response is returned.
+            omega (np.ndarray[Any, np.dtype[np.float64]] | int): The angular frequencies, evaluated with Horner's
+                rule, or a number of points uniformly spaced in [0, 2π), evaluated with an FFT.
+
+        Returns:
+            np.ndarray: The angular frequency vector.
+            np.ndarray: The complex frequency response.
+        """
+        numerator, denominator = self.polynomial_coefficients(pin)
+        if np.ndim(omega) == 0:
+            num_points = max(int(omega), len(numerator), len(denominator))
+            omega = 2 * np.pi * np.arange(num_points) / num_points
+            response = np.fft.fft(numerator, num_points) / np.fft.fft(denominator, num_points)
+        else:
+            inverse_z = np.exp(-1j * np.asarray(omega))
+            response = horner(numerator, inverse_z) / horner(denominator, inverse_z)
+        return omega, response
+
+    def zoom_frequency_response(
+            self,
+            pin: int,
+            bands: Sequence[tuple[float, float, int]],
+    ) -> list[tuple[ndarray, ndarray]]:
+        """
+        Evaluates the solution for a given pin on arcs of the unit circle z = exp(iω), from its polynomial
+        coefficients, with one chirp-z transform of the numerator and one of the denominator per band (see
+        chirp_z_arc): each band costs O(N log N), so that narrow bands can be sampled at a very high resolution.
+
+        Args:
+            pin (int): The pin for which the frequency response is returned.
+            bands (Sequence[tuple[float, float, int]]): The bands (start, stop, num_points), each sampled on
+                num_points angular frequencies from start to stop included, as np.linspace(start, stop, num_points).
+
+        Returns:
+            list[tuple[np.ndarray, np.ndarray]]: The angular frequency vector and the complex frequency response of
+                each band, in the order of bands.
+        """
+        numerator, denominator = self.polynomial_coefficients(pin)
+        responses = []
+        for start, stop, num_points in bands:
+            omega, numerator_values = chirp_z_arc(numerator, start, stop, int(num_points))
+            _, denominator_values = chirp_z_arc(denominator, start, stop, int(num_points))
+            responses.append((omega, numerator_values / denominator_values))
+        return responses
+
+    def numeric_lambda_solution(
+            self,
+            pin
+    ) -> Any:
+
+        # check if numeric parameters are set
+        if not self.numeric_parameters:
+            raise ValueError("Numeric parameters must be set before calling numeric_solution_lambdified")
+        return lambda z: self.evaluate(pin, z)
+
+    def plotly_pole_zero_plot(
+            self,
+            pin: int,
+            fig: go.Figure = go.Figure(),
+    ) -> go.Figure:
+
+        # check if numeric parameters are set
+        if not self.numeric_parameters:
+            raise ValueError("Numeric parameters must be set before calling plotly_pole_zero_plot")
+
+        # plot
+        omega = np.linspace(0, 2 * np.pi, 5000)
+        pole_zero_plot(self.poles_zeros(pin), fig=fig, show=False)
+        fig.add_trace(
+            go.Scatter(x=np.cos(omega), y=np.sin(omega), mode='lines', name='unit circle', line=dict(color='black')))
+
+        # set layout
+        fig.update_layout(
+            title='Pole-zero plot',
+            xaxis_title="Real Axis",
+            yaxis_title="Imaginary Axis",
+            autosize=False,
+            width=900,
+            height=900,
+            margin=dict(l=50, r=50, b=100, t=100, pad=4),
+        )
+
+        return fig
+
+    def root_locus(
+            self,
+            pin: int,
+            parameter: str,
+            values: np.ndarray[Any, np.dtype[np.float64]],
+    ) -> RootLocus:
+        """
+        Returns the trajectories of the poles and zeros of the solution for a given pin when sweeping one continuous
+        parameter over values, the others being the numeric parameters (see root_locus in src.sympy.root_locus).
+        """
+        if not self.numeric_parameters:
+            raise ValueError("Numeric parameters must be set before calling root_locus")
+        return root_locus(self, pin, parameter, values)
+
+    def plotly_root_locus_plot(
+            self,
+            pin: int,
+            parameter: str,
+            values: np.ndarray[Any, np.dtype[np.float64]],
+            fig: go.Figure = None,
+    ) -> go.Figure:
+
+        # check if numeric parameters are set
+        if not self.numeric_parameters:
+            raise ValueError("Numeric parameters must be set before calling plotly_root_locus_plot")
+        fig = go.Figure() if fig is None else fig
+
+        # one line per root, the markers colored by the parameter value
+        locus = self.root_locus(pin, parameter, values)
+        for roots, name, symbol in ((locus.poles, 'Poles', 'x'), (locus.zeros, 'Zeros', 'circle')):
+            for i, trajectory in enumerate(roots.T):
+                fig.add_trace(go.Scatter(
+                    x=np.real(trajectory), y=np.imag(trajectory), mode='lines+markers', name=name,
+                    legendgroup=name, showlegend=i == 0, marker_symbol=symbol,
+                    marker=dict(size=5, color=locus.values, colorscale='Viridis',
+                                showscale=i == 0 and name == 'Poles', colorbar=dict(title=parameter)),
+                    line=dict(color='red' if name == 'Poles' else 'blue', width=1),
+                ))
+        omega = np.linspace(0, 2 * np.pi, 5000)
+        fig.add_trace(
+            go.Scatter(x=np.cos(omega), y=np.sin(omega), mode='lines', name='unit circle', line=dict(color='black')))
+
+        # set layout
+        fig.update_layout(
+            title=f'Root locus over {parameter}',
+            xaxis_title="Real Axis",
+            yaxis_title="Imaginary Axis",
+            autosize=False,
+            width=900,
+            height=900,
+            margin=dict(l=50, r=50, b=100, t=100, pad=4),
+        )
+
+        return fig
+
+    def plotly_magnitude_response_plot(
+            self,
+            pin: int,
+            label: str = None,
+            omega: np.ndarray[Any, np.dtype[np.float64]] = np.linspace(0, 2 * np.pi, 10000),
+            fig: go.Figure = go.Figure(),
+            is_reference: bool = False,
+            bands: Sequence[tuple[float, float, int]] = None,
+    ) -> go.Figure:
+
+        # check if numeric parameters are set
+        if not self.numeric_parameters:
+            raise ValueError("Numeric parameters must be set before calling magnitude_response_plot")
+
+        # plot
+        omega, magnitude_response = self.magnitude_response_data(pin, omega, bands)
+
+        # add trace, dashed for a reference circuit
+        line = dict(dash='dash') if is_reference else None
+        fig.add_trace(go.Scatter(x=omega, y=magnitude_response, mode='lines', name=label, line=line))
+
+        # set layout
+        fig.update_layout(
+            title='Magnitude response',
+            xaxis_title="Normalized ω [rad/s]",
+            yaxis_title=f"H_{pin}(ω)",
+            autosize=False,
+            width=1200,
+            height=900,
+            margin=dict(l=50, r=50, b=100, t=100, pad=4),
+        )
+
+        return fig
+
+    def magnitude_response_data(
+            self,
+            pin: int,
+            omega: np.ndarray[Any, np.dtype[np.float64]] = np.linspace(0, 2 * np.pi, 10000),
+            bands: Sequence[tuple[float, float, int]] = None,
+    ) -> tuple[ndarray[Any, dtype[floating[_64Bit]]], Any]:
+        """
+        Returns the magnitude response data for a given pin.
+        
+        Args:
+            pin (int): The pin for which the magnitude response data is returned.
+            omega (np.ndarray[Any, np.dtype[np.float64]]): The angular frequency vector.
+            bands (Sequence[tuple[float, float, int]]): Bands (start, stop, num_points) evaluated with
+                zoom_frequency_response instead of omega, merged in increasing angular frequency.
+            
+        Returns:
+            np.ndarray[Any, np.dtype[np.float64]]: The angular frequency vector.
+            np.ndarray[Any, np.dtype[np.float64]]: The magnitude response vector.
+            """
+
+        # check if numeric parameters are set
+        if not self.numeric_parameters:
+            raise ValueError("Numeric parameters must be set before calling magnitude_response_data")
+
+        if bands is not None:
+            omega, frequency_response = _merge_bands(self.zoom_frequency_response(pin, bands))
+        else:
+            omega, frequency_response = self.frequency_response(pin, omega)
+        return omega, np.abs(frequency_response)
+    
+    def group_delay_data(
+            self,
+            pin: int,
+            omega: np.ndarray[Any, np.dtype[np.float64]] = np.linspace(0, 2 * np.pi, 10000),
+            bands: Sequence[tuple[float, float, int]] = None,
+    ) -> tuple[ndarray, ndarray]:
+        """
+        Returns the group delay -d arg H(ω) / dω for a given pin, in unit delays, computed exactly from the
+        polynomial coefficients: for a polynomial P(z^-1) = sum_n c_n z^-n, -d arg P / dω = Re(sum_n n c_n z^-n / P),
+        and the group delay of H = B / A is the difference of the ones of B and A. The coefficients n c_n are cached
+        with the polynomial coefficients.
+
+        Args:
+            pin (int): The pin for which the group delay data is returned.
+            omega (np.ndarray[Any, np.dtype[np.float64]]): The angular frequency vector.
+            bands (Sequence[tuple[float, float, int]]): Bands (start, stop, num_points) evaluated with
+                zoom_group_delay_data instead of omega, merged in increasing angular frequency.
+
+        Returns:
+            np.ndarray[Any, np.dtype[np.float64]]: The angular frequency vector.
+            np.ndarray[Any, np.dtype[np.float64]]: The group delay vector.
+        """
+
+        # check if numeric parameters are set
+        if not self.numeric_parameters:
+            raise ValueError("Numeric parameters must be set before calling group_delay_data")
+
+        if bands is not None:
+            return _merge_bands(self.zoom_group_delay_data(pin, bands))
+        polynomials = self._group_delay_polynomials(pin)
+        inverse_z = np.exp(-1j * np.asarray(omega))
+        numerator, numerator_derivative, denominator, denominator_derivative = (
+            horner(c, inverse_z) for c in polynomials)
+        return omega, np.real(numerator_derivative / numerator) - np.real(denominator_derivative / denominator)
+
+    def zoom_group_delay_data(
+            self,
+            pin: int,
+            bands: Sequence[tuple[float, float, int]],
+    ) -> list[tuple[ndarray, ndarray]]:
+        """
+        Returns the group delay for a given pin on bands of angular frequencies, as group_delay_data, the four
+        polynomials being evaluated with chirp-z transforms (see zoom_frequency_response).
+
+        Args:
+            pin (int): The pin for which the group delay data is returned.
+            bands (Sequence[tuple[float, float, int]]): The bands (start, stop, num_points), each sampled as
+                np.linspace(start, stop, num_points).
+
+        Returns:
+            list[tuple[np.ndarray, np.ndarray]]: The angular frequency vector and the group delay vector of each
+                band, in the order of bands.
+        """
+        if not self.numeric_parameters:
+            raise ValueError("Numeric parameters must be set before calling zoom_group_delay_data")
+        polynomials = self._group_delay_polynomials(pin)
+        group_delays = []
+        for start, stop, num_points in bands:
+            values = [chirp_z_arc(c, start, stop, int(num_points))[1] for c in polynomials]
+            omega = np.linspace(start, stop, int(num_points))
+            group_delays.append((omega, np.real(values[1] / values[0]) - np.real(values[3] / values[2])))
+        return group_delays
+
+    def _group_delay_polynomials(
+            self,
+            pin: int
+    ) -> tuple[ndarray, ndarray, ndarray, ndarray]:
+        """
+        Returns the numerator b_n, n b_n, the denominator a_n and n a_n, the coefficients n c_n being cached with the
+        polynomial coefficients.
+        """
+        numerator, denominator = self.polynomial_coefficients(pin)
+        key = ("group_delay", pin, self._parameter_values)
+        if key not in self._numeric_cache:
+            self._numeric_cache[key] = tuple(np.arange(len(c)) * c for c in (numerator, denominator))
+        numerator_derivative, denominator_derivative = self._numeric_cache[key]
+        return numerator, numerator_derivative, denominator, denominator_derivative
+
+    def plotly_group_delay_plot(
+            self,
+            pin: int,
+            label: str = None,
+            omega: np.ndarray[Any, np.dtype[np.float64]] = np.linspace(0, 2 * np.pi, 10000),
+            fig: go.Figure = None,
+            bands: Sequence[tuple[float, float, int]] = None,
+    ) -> go.Figure:
+
+        # check if numeric parameters are set
+        if not self.numeric_parameters:
+            raise ValueError("Numeric parameters must be set before calling plotly_group_delay_plot")
+        fig = go.Figure() if fig is None else fig
+
+        # plot
+        omega, group_delay = self.group_delay_data(pin, omega, bands)
+
+        # add trace
+        fig.add_trace(go.Scatter(x=omega, y=group_delay, mode='lines', name=label))
+
+        # set layout
+        fig.update_layout(
+            title='Group delay',
+            xaxis_title="Normalized ω [rad/s]",
+            yaxis_title=f"τ_{pin}(ω) [unit delays]",
+            margin=dict(l=50, r=50, b=100, t=100, pad=4),
+        )
+
+        return fig
+
+    @property
+    def _intrinsic_fwhm(self) -> float:
+        """
+        Returns the intrinsic FWHM of the magnitude response of the first pin.
+        """
+        if not self.numeric_parameters:
+            raise ValueError("Numeric parameters must be set before calling intrinsic_fwhm")
+        gamma = self.numeric_parameters["unitary_loss_coefficient"]
+        return 2 * (1 - gamma)
+    
+    def second_order_sections(
+            self,
+            pin
+    ) -> ndarray:
+        """
+        Returns the solution for a given pin, for the current numeric parameters, as a cascade of second-order
+        sections with complex coefficients (see polynomial_sos), cached for each set of parameter values.
+
+        Args:
+            pin (int): The pin for which the sections are returned.
+
+        Returns:
+            np.ndarray: The sections, with dimensions (num_sections, 6), in the layout of scipy.signal.sosfilt.
+        """
+        if not self.numeric_parameters:
+            raise ValueError("Numeric parameters must be set before calling second_order_sections")
+        key = ("sos", pin, self._parameter_values)
+        if key not in self._numeric_cache:
+            self._numeric_cache[key] = polynomial_sos(*self.polynomial_coefficients(pin))
+        return self._numeric_cache[key]
+
+    def iir_filter(
+            self,
+            pin
+    ) -> StreamingIIRFilter:
+        """
+        Returns a streaming digital filter realizing the solution for a given pin, for the current numeric parameters:
+        its process(block) method pushes blocks of an input stream at the source (pin 0) through the circuit, one
+        sample per unit delay, keeping the state between blocks.
+
+        Args:
+            pin (int): The pin for which the filter is returned.
+
+        Returns:
+            StreamingIIRFilter: The filter, with a cleared state.
+        """
+        return StreamingIIRFilter(self.second_order_sections(pin))
+
+    def dominant_pole(
+            self,
+            pin: int = 1,
+            omega: float = np.pi,
+    ) -> complex:
+        """
+        Returns the pole of the solution for a given pin closest to the unit circle point exp(iω), the pole of the
+        resonance at ω.
+        """
+        _, poles = self.poles_zeros(pin)
+        poles = poles[np.abs(poles) > 0]
+        return poles[np.argmin(np.abs(poles - np.exp(1j * omega)))]
+
+    def resonance_fwhm(
+            self,
+            pin: int = 1,
+            omega: float = np.pi,
+            refine: bool = False,
+    ) -> tuple[float, float]:
+        """
+        Returns the center and the FWHM of the intensity |H(ω)|^2 of the resonance closest to ω.
+
+        The center is the angle of the dominant pole p and the FWHM is the one of a single-pole resonance
+        1 / (1 - |p| exp(i(ω - arg p))), 2 arccos(1 - (1 - |p|)^2 / (2 |p|)), determined by the distance of the pole
+        to the unit circle. With refine the peak and half maximum crossings of the actual response are then found by
+        local root finding around this estimate, from the polynomial coefficients.
+
+        Args:
+            pin (int): The pin of the resonance.
+            omega (float): The normalized angular frequency near the resonance.
+            refine (bool): Whether to refine the pole estimate on the actual response.
+
+        Returns:
+            float: The center of the resonance.
+            float: The FWHM of the resonance.
+        """
+        pole = self.dominant_pole(pin, omega)
+        radius = np.abs(pole)
+        center = np.angle(pole) % (2 * np.pi)
+        fwhm = 2 * np.arccos(np.clip(1 - (1 - radius) ** 2 / (2 * radius), -1, 1))
+        if not refine:
+            return center, fwhm
+
+        numerator, denominator = self.polynomial_coefficients(pin)
+
+        def intensity(w):
+            inverse_z = np.exp(-1j * np.atleast_1d(w))
+            return np.square(np.abs(horner(numerator, inverse_z) / horner(denominator, inverse_z)))[0]
+
+        peak = minimize_scalar(lambda w: -intensity(w), bounds=(center - fwhm, center + fwhm), method="bounded",
+                               options={"xatol": 1e-12 * max(fwhm, 1e-12)})
+        center, half_maximum = peak.x, -peak.fun / 2
+
+        def crossing(direction):
+            # the bracket is widened until the intensity falls below half maximum, within half a turn
+            width = fwhm
+            while intensity(center + direction * width) > half_maximum:
+                width *= 2
+                if width > np.pi:
+                    return np.nan
+            return brentq(lambda w: intensity(w) - half_maximum, *sorted((center, center + direction * width)),
+                          xtol=1e-15)
+
+        return center, crossing(1) - crossing(-1)
+
+    def extraction_efficiency(
+            self,
+            method: str = "pole",
+            refine: bool = True,
+    ) -> float:
+        """
+        Returns the extraction efficiency of the main resonance, the one closest to ω = π at pin 1:
+        1 - intrinsic FWHM / FWHM.
+
+        Args:
+            method (str): "pole" to get the FWHM from the dominant pole (see resonance_fwhm), "sampled" to measure it
+                on the magnitude response sampled on 10000 points.
+            refine (bool): Whether to refine the pole estimate on the actual response, for the "pole" method.
+
+        Returns:
+            float: The extraction efficiency.
+        """
+        if method == "pole":
+            _, peak_fwhm = self.resonance_fwhm(1, np.pi, refine)
+        elif method == "sampled":
+            omega, magnitude_response = self.magnitude_response_data(1)
+            intensity_response = np.square(magnitude_response)
+            peak_indices, _ = find_peaks(intensity_response)
+            peak_index = min(peak_indices, key=lambda x: np.abs(omega[x] - np.pi))
+            peak_heigth = intensity_response[peak_index]
+            peak_fwhm = compute_fwhm(peak_index, peak_heigth, omega, intensity_response)
+        else:
+            raise ValueError(f"Unknown method {method!r}, must be 'pole' or 'sampled'")
+        return 1 - self._intrinsic_fwhm / peak_fwhm
+
+    @property
+    def main_extraction_efficiency(self) -> float:
+        """
+        Returns the extraction efficiency of the main resonance, from its dominant pole refined on the response.
+        """
+        return self.extraction_efficiency()
+
+    def __str__(self):
+        return f"{self.__class__.__name__} object"
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} object"
@@ -142,7 +142,7 @@ class SymPy_ResonantInterferometricCoupler_withAdditionalMZIphase(SymPy_Photonic
             Eq(a11, I * self.parameter_symbols["cross_coupling_a"] * a8 + self.parameter_symbols["self_coupling_a"] * a9),
             Eq(a5, a3 * (self.parameter_symbols["unitary_loss_coefficient"] * z ** (-1)) ** self.parameter_symbols["m_2"]),
             Eq(a1, a7 * (self.parameter_symbols["unitary_loss_coefficient"] * z ** (-1)) ** self.parameter_symbols["m_1"]),
-            Eq(a4, a10 * (self.parameter_symbols["unitary_loss_coefficient"] * z ** (-1)) ** self.parameter_symbols["n_2"]) * exp(I * self.parameter_symbols["additional_MZI_phase"]),
+            Eq(a4, a10 * (self.parameter_symbols["unitary_loss_coefficient"] * z ** (-1)) ** self.parameter_symbols["n_2"] * exp(I * self.parameter_symbols["additional_MZI_phase"])),
             Eq(a8, a2 * (self.parameter_symbols["unitary_loss_coefficient"] * z ** (-1)) ** self.parameter_symbols["n_1"]),
             Eq(a9, a11 * (self.parameter_symbols["unitary_loss_coefficient"] * z ** (-1)) ** self.parameter_symbols["p"])
         ]
\ No newline at end of file
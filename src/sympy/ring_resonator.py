@@ -8,6 +8,7 @@ from src.sympy.base import SymPy_PhotonicCircuit
 
 # type hinting
 from typing import Any
+from collections.abc import Sequence
 
 class SymPy_RingResonator(SymPy_PhotonicCircuit):
     num_pins = 4
@@ -42,6 +43,7 @@ class SymPy_RingResonator(SymPy_PhotonicCircuit):
             is_reference: bool = False,
             omega: np.ndarray[Any, np.dtype[np.float64]] = np.linspace(0, 2*np.pi, 10000),
             fig: go.Figure = go.Figure(),
+            bands: Sequence[tuple[float, float, int]] = None,
     ) -> go.Figure:
         
         # check if numeric parameters are set
@@ -49,8 +51,7 @@ class SymPy_RingResonator(SymPy_PhotonicCircuit):
             raise ValueError("Numeric parameters must be set before calling magnitude_response_plot")
         
         # plot
-        magnitude_response_lambda = self.numeric_lambda_solution(pin)
-        magnitude_response = np.abs(magnitude_response_lambda(np.exp(1j * omega)))
+        omega, magnitude_response = self.magnitude_response_data(pin, omega, bands)
 
         if is_reference:
             fig.add_trace(go.Scatter(x=omega, y=magnitude_response, mode='lines', name='Reference Ring Resonator', line=dict(dash='dash')))
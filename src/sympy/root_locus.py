@@ -0,0 +1,91 @@
+# third party imports
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
+# local imports
+from src.sympy.utils import batch_polynomial_roots, lossless_self_couplings
+
+# type hinting
+from collections.abc import Sequence
+
+
+def match_roots(roots: np.ndarray) -> np.ndarray:
+    """
+    Reorders the roots of each step of a sweep so that each column follows one root: the roots of a step are
+    assigned to the ones of the previous step by minimizing the total distance (Hungarian algorithm).
+
+    Args:
+        roots (np.ndarray): The roots, with dimensions (num_steps, num_roots), in any order within each step.
+
+    Returns:
+        np.ndarray: The roots with the same dimensions, each column being a trajectory.
+    """
+    roots = np.array(roots, dtype=complex)
+    for step in range(1, len(roots)):
+        previous, current = roots[step - 1], roots[step]
+        distances = np.abs(previous[:, np.newaxis] - current[np.newaxis, :])
+        # non-finite roots (degenerate steps) are matched last
+        distances = np.where(np.isfinite(distances), distances, 1e300)
+        _, order = linear_sum_assignment(distances)
+        roots[step] = current[order]
+    return roots
+
+
+class RootLocus:
+    """ Trajectories of the poles and zeros of a transfer function in the z-plane over the values of a swept
+    parameter. The poles and zeros have dimensions (num_values, num_roots), each column follows one root. Roots at
+    the origin due to the different degrees of the numerator and denominator are omitted. """
+
+    def __init__(self, parameter: str, values: np.ndarray, poles: np.ndarray, zeros: np.ndarray):
+        """ Initialize the class. """
+        self.parameter = parameter
+        self.values = values
+        self.poles = poles
+        self.zeros = zeros
+
+    def __str__(self):
+        """ Return a string representation of the object. """
+        return f"RootLocus over {self.parameter} ({len(self.values)} values, {self.poles.shape[1]} poles)"
+
+
+def root_locus(
+        circuit,
+        pin: int,
+        parameter: str,
+        values: Sequence[float],
+        lossless_couplers: bool = True,
+) -> RootLocus:
+    """
+    Computes the root locus of the solution for a given pin of a circuit, sweeping one continuous
+    parameter with the others fixed to the numeric parameters of the circuit. The polynomial coefficients of all the
+    steps are computed with one batched kernel evaluation, their roots with one batched eigenvalue computation, and
+    the roots are matched between consecutive steps.
+
+    Args:
+        circuit (NumericCircuit): The circuit.
+        pin (int): The pin of the transfer function.
+        parameter (str): The swept parameter, e.g. "cross_coupling_a" or "unitary_loss_coefficient".
+        values (Sequence[float]): The values of the parameter.
+        lossless_couplers (bool): Whether the self coupling of a swept cross coupling is set to
+            sqrt(1 - cross_coupling^2).
+
+    Returns:
+        RootLocus: The trajectories of the poles and zeros.
+    """
+    if parameter not in circuit.parameter_names:
+        raise ValueError(f"{parameter} is not a parameter of {circuit}")
+    if parameter in circuit.delay_parameters:
+        raise ValueError(f"The delay parameter {parameter} changes the number of roots and cannot be swept")
+    values = np.asarray(values, dtype=float)
+    parameters = {parameter: values}
+    if lossless_couplers:
+        parameters = lossless_self_couplings({**circuit.numeric_parameters, **parameters}, [parameter])
+    numerators, denominators = circuit.batch_polynomial_coefficients(pin, parameters)
+
+    # roots in z of z^(K-1) sum_n c_n z^-n: leading zero columns are zeros at infinity, trailing ones roots at 0
+    def roots(coefficients):
+        leading = np.any(coefficients != 0, axis=0)
+        coefficients = coefficients[:, np.argmax(leading):len(leading) - np.argmax(leading[::-1])]
+        return match_roots(batch_polynomial_roots(coefficients))
+
+    return RootLocus(parameter, values, roots(denominators), roots(numerators))
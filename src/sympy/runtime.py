@@ -0,0 +1,143 @@
+""" Circuits evaluated from the generated NumPy modules, without importing sympy. """
+# third party imports
+import hashlib
+import importlib
+import os
+
+# local imports
+from src.config import SYMPY_PATH
+from src.sympy.numeric import NumericCircuit
+
+# type hinting
+from types import ModuleType
+from typing import Callable
+
+
+class GeneratedCircuit(NumericCircuit):
+    """ Circuit evaluated from the generated module of a SymPy_PhotonicCircuit subclass. The kernels are the
+    generated functions, the delays being bound to them for the specialized kernels. """
+
+    def __init__(self, module: ModuleType, numeric_parameters=None):
+        """ Initialize the class. """
+        super().__init__(numeric_parameters=numeric_parameters)
+        self.module = module
+        self.num_pins = module.NUM_PINS
+
+    @property
+    def name(self) -> str:
+        return self.module.CIRCUIT
+
+    @property
+    def solution_key(self) -> str:
+        return self.module.SOLUTION_KEY
+
+    @property
+    def parameter_names(self) -> list[str]:
+        return list(self.module.PARAMETERS)
+
+    @property
+    def delay_parameters(self) -> list[str]:
+        return list(self.module.DELAY_PARAMETERS)
+
+    def kernel(
+            self,
+            pin
+    ) -> Callable:
+        return self.module.SOLUTIONS[pin]
+
+    def specialized_kernel(
+            self,
+            pin,
+            delays: tuple[int, ...],
+            part: str = "solution"
+    ) -> Callable:
+        if part not in ("solution", "fraction"):
+            raise ValueError(f"Unknown part {part!r}, must be 'solution' or 'fraction'")
+        function = self.module.SOLUTIONS[pin] if part == "solution" else self.module.FRACTIONS[pin]
+        delays = dict(zip(self.delay_parameters, (int(delay) for delay in delays)))
+        names = self.parameter_names
+        continuous_parameters = self.continuous_parameters
+
+        def kernel(z, *parameters):
+            values = {**dict(zip(continuous_parameters, parameters)), **delays}
+            return function(z, *(values[name] for name in names))
+
+        return kernel
+
+    def sensitivity_kernel(
+            self,
+            pin
+    ) -> Callable:
+        return self.module.SENSITIVITIES[pin]
+
+    @property
+    def _intrinsic_fwhm(self) -> float:
+        if not self.numeric_parameters:
+            raise ValueError("Numeric parameters must be set before calling intrinsic_fwhm")
+        return self.module.intrinsic_fwhm(**self.numeric_parameters)
+
+    def copy(self) -> "GeneratedCircuit":
+        return GeneratedCircuit(self.module, dict(self.numeric_parameters))
+
+    def __reduce__(self):
+        # the module is imported again by name, in worker processes
+        return load_circuit, (self.name, self.numeric_parameters)
+
+    def __str__(self):
+        return f"{self.name} object"
+
+    def __repr__(self):
+        return f"{self.name} object"
+
+
+def source_fingerprint(source_file: str) -> str:
+    """ Returns the hash of the module of src/sympy defining a circuit, given by its path relative to src/sympy,
+    stored in the generated module as SOURCE_HASH. """
+    with open(os.path.join(SYMPY_PATH, source_file), "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()[:16]
+
+
+def _is_stale(module: ModuleType) -> bool:
+    """ Return whether the source of the circuit changed since its module was generated. """
+    source_file = getattr(module, "SOURCE_FILE", None)
+    if source_file is None:
+        return True
+    # without the source, the module cannot be regenerated and is used as is
+    if not os.path.exists(os.path.join(SYMPY_PATH, source_file)):
+        return False
+    return source_fingerprint(source_file) != getattr(module, "SOURCE_HASH", None)
+
+
+def load_circuit(
+        name: str,
+        numeric_parameters: dict = None,
+) -> GeneratedCircuit:
+    """
+    Returns the generated circuit of a SymPy_PhotonicCircuit subclass. If its module has not been generated yet, or
+    the module defining the circuit changed since (see source_fingerprint), it is generated from the solutions, which
+    is the only case where sympy is imported.
+
+    Args:
+        name (str): The name of the SymPy_PhotonicCircuit subclass, e.g. "SymPy_RingResonator".
+        numeric_parameters (dict): The numeric parameters of the circuit.
+
+    Returns:
+        GeneratedCircuit: The circuit.
+    """
+    module_name = f"src.sympy.generated.{name}"
+    try:
+        module = importlib.import_module(module_name)
+    except ModuleNotFoundError as error:
+        if error.name != module_name:
+            raise
+        module = None
+    if module is None or _is_stale(module):
+        from src.sympy.codegen import generate_module
+        from src.sympy.warmup import discover_circuits
+        circuits = {circuit.__name__: circuit for circuit in discover_circuits()}
+        if name not in circuits:
+            raise ValueError(f"Unknown circuit {name!r}, must be one of {sorted(circuits)}")
+        generate_module(circuits[name])
+        importlib.invalidate_caches()
+        module = importlib.import_module(module_name) if module is None else importlib.reload(module)
+    return GeneratedCircuit(module, numeric_parameters)
@@ -1,16 +1,16 @@
 # third party imports
 import plotly.graph_objects as go
 import numpy as np
-from scipy.signal import find_peaks
-
-# local imports
-from sympy.physics.control.control_plots import pole_zero_numerical_data
+from scipy.linalg import eigvals, matrix_balance
+from scipy.signal import czt, find_peaks
 
 # type hinting
-from sympy.physics.control.lti import TransferFunction
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from sympy.physics.control.lti import TransferFunction
 
 def pole_zero_plot(
-        system: TransferFunction, 
+        system: "TransferFunction | tuple[np.ndarray, np.ndarray]", 
         pole_color: str = 'red', 
         pole_markersize: float  = 12, 
         zero_color: str = 'blue', 
@@ -28,8 +28,8 @@ def pole_zero_plot(
 
     Parameters
     ----------
-    system : TransferFunction
-        The system for which the Pole-Zero plot is to be generated.
+    system : TransferFunction | tuple[np.ndarray, np.ndarray]
+        The system for which the Pole-Zero plot is to be generated, or its numeric (zeros, poles).
     pole_color : str, optional
         The color of the pole markers. The default is 'red'.
     pole_markersize : float, optional
@@ -50,7 +50,12 @@ def pole_zero_plot(
     fig : go.Figure
         The Pole-Zero plot of the system.
     """
-    zeros, poles = pole_zero_numerical_data(system)
+    if isinstance(system, tuple):
+        zeros, poles = system
+    else:
+        # sympy is only imported for symbolic transfer functions
+        from sympy.physics.control.control_plots import pole_zero_numerical_data
+        zeros, poles = pole_zero_numerical_data(system)
 
     zero_real = np.real(zeros)
     zero_imag = np.imag(zeros)
@@ -81,6 +86,71 @@ def pole_zero_plot(
 
     return fig
 
+def polynomial_roots(coefficients):
+    """
+    Returns the roots of the polynomial sum_n coefficients[n] x^(N - n), highest degree first as in np.roots, as
+    the eigenvalues of its companion matrix, balanced to reduce the sensitivity of the eigenvalues for high degrees.
+    Leading zero coefficients lower the degree, trailing ones give roots at zero.
+    """
+    coefficients = np.trim_zeros(np.asarray(coefficients, dtype=complex), 'f')
+    if len(coefficients) < 2:
+        return np.zeros(0, dtype=complex)
+    degree = len(coefficients) - 1
+    companion = np.diag(np.ones(degree - 1, dtype=complex), -1)
+    companion[0, :] = -coefficients[1:] / coefficients[0]
+    balanced, _ = matrix_balance(companion)
+    return eigvals(balanced, overwrite_a=True, check_finite=False)
+
+def chirp_z_arc(coefficients, start, stop, num_points):
+    """
+    Evaluates the polynomial sum_n coefficients[n] z^-n on num_points points z = exp(iω) of the arc of the unit circle
+    ω in [start, stop], endpoints included as in np.linspace, with the chirp-z transform: the points are
+    z_k = A W^-k, with A = exp(i start) and W = exp(-i Δω), which costs O((N + M) log(N + M)) for N coefficients and
+    M points, whatever the width of the arc.
+
+    Returns:
+        np.ndarray: The angular frequencies of the arc.
+        np.ndarray: The values of the polynomial.
+    """
+    omega = np.linspace(start, stop, num_points)
+    step = omega[1] - omega[0] if num_points > 1 else 0
+    values = czt(np.asarray(coefficients, dtype=complex), num_points, np.exp(-1j * step), np.exp(1j * start))
+    return omega, values
+
+def batch_polynomial_roots(coefficients):
+    """
+    Returns the roots of a batch of polynomials, the rows of coefficients with the highest degree first, as the
+    eigenvalues of their companion matrices computed in one batched call, with dimensions
+    (num_polynomials, degree). Rows with a zero leading coefficient get non-finite roots.
+    The companion matrices are not balanced here: np.linalg.eigvals calls LAPACK geev, which balances each matrix by
+    powers of two (gebal) before the QR iterations, as matrix_balance does in polynomial_roots, so that both give the
+    same accuracy for high degrees and widely spread roots.
+    """
+    coefficients = np.asarray(coefficients, dtype=complex)
+    num_polynomials, degree = coefficients.shape[0], coefficients.shape[1] - 1
+    if degree < 1:
+        return np.zeros((num_polynomials, 0), dtype=complex)
+    companion = np.zeros((num_polynomials, degree, degree), dtype=complex)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        companion[:, 0, :] = -coefficients[:, 1:] / coefficients[:, :1]
+    companion[:, np.arange(1, degree), np.arange(degree - 1)] = 1
+    finite = np.all(np.isfinite(companion), axis=(1, 2))
+    roots = np.full((num_polynomials, degree), np.nan, dtype=complex)
+    roots[finite] = np.linalg.eigvals(companion[finite])
+    return roots
+
+def lossless_self_couplings(parameters, varied):
+    """
+    Returns the parameters with the self coupling of each varied cross coupling set to sqrt(1 - cross_coupling^2),
+    unless it is varied itself.
+    """
+    parameters = dict(parameters)
+    for key in varied:
+        self_key = key.replace("cross_coupling", "self_coupling")
+        if key.startswith("cross_coupling") and self_key in parameters and self_key not in varied:
+            parameters[self_key] = np.sqrt(1 - np.square(parameters[key]))
+    return parameters
+
 def peak_height(magnitude_response):
     peaks, _ = find_peaks(magnitude_response)
     peak_heights = magnitude_response[peaks]
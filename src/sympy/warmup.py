@@ -0,0 +1,84 @@
+""" Precompute the solutions, kernels and generated modules of the SymPy circuits:
+python -m src.sympy.warmup [CircuitClassName ...] [--workers N] """
+# third party imports
+import argparse
+import importlib
+import inspect
+import pkgutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# local imports
+from src.config import SYMPY_PATH
+from src.sympy.base import SymPy_PhotonicCircuit
+from src.sympy.codegen import generate_module
+
+
+def discover_circuits() -> list[type[SymPy_PhotonicCircuit]]:
+    """
+    Imports all the modules of the src.sympy package and returns the concrete subclasses of SymPy_PhotonicCircuit,
+    sorted by name.
+    """
+    for module in pkgutil.iter_modules([SYMPY_PATH]):
+        if module.name != "warmup":
+            importlib.import_module(f"src.sympy.{module.name}")
+    circuits, stack = set(), [SymPy_PhotonicCircuit]
+    while stack:
+        for subclass in stack.pop().__subclasses__():
+            stack.append(subclass)
+            if not inspect.isabstract(subclass):
+                circuits.add(subclass)
+    return sorted(circuits, key=lambda circuit: circuit.__name__)
+
+
+def warm_up(circuit_class: type[SymPy_PhotonicCircuit]) -> tuple[str, str, float]:
+    """
+    Derives (or loads) the solutions of a circuit, writing them to the solution cache, compiles the kernels of all
+    its pins and writes its generated module.
+
+    Returns:
+        str: The name of the circuit.
+        str: The solution key.
+        float: The elapsed time in seconds.
+    """
+    start = time.perf_counter()
+    circuit = circuit_class()
+    circuit.solutions
+    for pin in range(circuit.num_pins):
+        circuit.kernel(pin)
+    generate_module(circuit_class)
+    return circuit_class.__name__, circuit.solution_key, time.perf_counter() - start
+
+
+def main(arguments: list[str] = None) -> int:
+    """ Run the warm-up from the command line, returning the exit status: 1 if any circuit failed. """
+    parser = argparse.ArgumentParser(description="Precompute the solutions, kernels and generated modules of the SymPy circuits.")
+    parser.add_argument("circuits", nargs="*", help="names of the circuit classes, all of them by default")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes")
+    options = parser.parse_args(arguments)
+
+    circuits = discover_circuits()
+    if options.circuits:
+        unknown = set(options.circuits) - {circuit.__name__ for circuit in circuits}
+        if unknown:
+            parser.error(f"unknown circuits {sorted(unknown)}")
+        circuits = [circuit for circuit in circuits if circuit.__name__ in options.circuits]
+
+    failures = 0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=options.workers) as executor:
+        futures = {executor.submit(warm_up, circuit): circuit for circuit in circuits}
+        for future in as_completed(futures):
+            try:
+                name, key, elapsed = future.result()
+                print(f"{name} ({key}): {elapsed:.1f} s")
+            except Exception as error:
+                failures += 1
+                print(f"{futures[future].__name__} failed: {type(error).__name__}: {error}", file=sys.stderr)
+    print(f"Warmed up {len(circuits) - failures} of {len(circuits)} circuits in {time.perf_counter() - start:.1f} s")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
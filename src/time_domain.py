@@ -0,0 +1,107 @@
+from collections.abc import Sequence
+import warnings
+import numpy as np
+
+from src.base import CompositeStructure, wavelength_to_frequency
+
+
+def transfer_function(
+        structure: CompositeStructure,
+        angular_frequencies: Sequence[float],
+        pin=1,
+) -> np.ndarray:
+    """ Return the field at a pin of the structure evaluated at the given angular frequencies, i.e. the transfer
+    function from the sources to the pin. The original frequency grid of the structure is restored afterwards. """
+    return structure.solve_at(angular_frequencies)[pin]
+
+
+class PulsePropagator:
+    """ Propagates the slowly varying envelope of a signal through a structure in the time domain. All the sources
+    of the structure are modulated by the same envelope, centred at the carrier frequency.
+
+    The impulse response of the structure is obtained from its transfer function sampled on an FFT grid of twice
+    impulse_response_length samples matching the time step, and truncated to its first impulse_response_length
+    samples. The fraction of its energy beyond the cut, which would alias onto the kept samples on a grid of
+    impulse_response_length samples, is stored in truncation_error, with a warning above truncation_tolerance: the
+    impulse response must be long enough to contain the ringing of the resonators. It is applied to the input with
+    overlap-add: input signals of any length can be streamed through process() in blocks of block_size samples with
+    bounded memory. """
+    truncation_tolerance = 1e-6
+
+    def __init__(
+            self,
+            structure: CompositeStructure,
+            time_step: float,
+            impulse_response_length: int = 4096,
+            block_size: int = 4096,
+            pin=1,
+            carrier_frequency: float = None,
+    ):
+        """ Initialize the class. """
+        self.structure = structure
+        self.time_step = time_step
+        self.impulse_response_length = impulse_response_length
+        self.block_size = block_size
+        self.pin = pin
+        if carrier_frequency is None:
+            carrier_frequency = wavelength_to_frequency(structure.central_wavelength)
+        self.carrier_frequency = carrier_frequency
+
+        # the envelope frequencies are subtracted from the carrier, since the fields evolve as exp(-i omega t)
+        # while numpy's FFT synthesizes signals as exp(+i Omega t)
+        envelope_frequencies = 2 * np.pi * np.fft.fftfreq(2 * impulse_response_length, d=time_step)
+        impulse_response = np.fft.ifft(
+            transfer_function(structure, self.carrier_frequency - envelope_frequencies, pin)
+        )
+        self.impulse_response = impulse_response[:impulse_response_length]
+        energy = np.sum(np.abs(impulse_response) ** 2)
+        self.truncation_error = np.sum(np.abs(impulse_response[impulse_response_length:]) ** 2) / energy \
+            if energy > 0 else 0.0
+        if self.truncation_error > self.truncation_tolerance:
+            warnings.warn(f"In {self} {self.truncation_error:.1e} of the impulse response energy lies beyond "
+                          f"{impulse_response_length} samples, increase impulse_response_length.")
+
+        # overlap-add: each block is convolved with the impulse response through an FFT long enough to avoid aliasing
+        self.fft_size = 1 << int(np.ceil(np.log2(block_size + impulse_response_length - 1)))
+        self._transfer_function = np.fft.fft(self.impulse_response, self.fft_size)
+        self._overlap = np.zeros(impulse_response_length - 1, dtype=np.complex128)
+
+    def __str__(self):
+        """ Return a string representation of the object. """
+        return f"PulsePropagator of {self.structure}"
+
+    @property
+    def times(self) -> np.ndarray:
+        """ Return the time axis of the impulse response. """
+        return self.time_step * np.arange(self.impulse_response_length)
+
+    def reset(self):
+        """ Clear the tail of the previous blocks, to start propagating a new signal. """
+        self._overlap[:] = 0
+
+    def process(self, block: Sequence[complex]) -> np.ndarray:
+        """ Propagate a block of at most block_size samples of the input envelope and return the output envelope
+        samples of the same length. The tail of the convolution is carried over to the next call. """
+        block = np.asarray(block, dtype=np.complex128)
+        if len(block) > self.block_size:
+            raise ValueError(f"In {self} blocks must have at most {self.block_size} samples, got {len(block)}.")
+        convolution = np.fft.ifft(np.fft.fft(block, self.fft_size) * self._transfer_function)
+        convolution = convolution[:len(block) + self.impulse_response_length - 1]
+        convolution[:len(self._overlap)] += self._overlap
+        self._overlap = convolution[len(block):].copy()
+        return convolution[:len(block)]
+
+    def flush(self) -> np.ndarray:
+        """ Return the remaining tail of the output envelope, i.e. the ringing after the end of the input. """
+        tail = self._overlap.copy()
+        self.reset()
+        return tail
+
+    def propagate(self, envelope: Sequence[complex]) -> np.ndarray:
+        """ Propagate a whole input envelope in blocks and return the output envelope, including the tail. The
+        output has len(envelope) + impulse_response_length - 1 samples. """
+        envelope = np.asarray(envelope, dtype=np.complex128)
+        self.reset()
+        output = [self.process(envelope[i:i + self.block_size]) for i in range(0, len(envelope), self.block_size)]
+        output.append(self.flush())
+        return np.concatenate(output)